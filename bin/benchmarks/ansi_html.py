@@ -0,0 +1,138 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Cost of turning Web UI subprocess output into HTML: ansi_to_html against AnsiHtmlStream.
+
+Builds an upload-style log: coloured status lines and tables rendered by rich,
+interleaved with carriage-return progress updates. It is then converted three
+ways:
+
+  per line        ansi_to_html on every line or 512 characters, as the
+                  per-character reader flushed before the output pump
+  ansi_to_html    ansi_to_html on each 16 KiB frame of complete lines
+  AnsiHtmlStream  one AnsiHtmlStream fed the same frames
+
+For the first two the carriage returns become newlines, as the text-mode pipes
+made them; AnsiHtmlStream gets them as the pump passes them on. The visible
+text of the status lines is compared between the first and last.
+
+    python -m bin.benchmarks.ansi_html [--lines 1140] [--updates 30000] [--rounds 3]
+"""
+import argparse
+import contextlib
+import html
+import io
+import os
+import re
+import time
+from collections.abc import Iterable
+from typing import Callable
+
+from rich.console import Console
+from rich.table import Table
+
+from src.console import AnsiHtmlStream, ansi_to_html
+
+FRAME_SIZE = 16 * 1024
+PROGRESS_PREFIX = "Hashing"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def build_log(lines: int, updates: int) -> str:
+    buffer = io.StringIO()
+    console = Console(file=buffer, force_terminal=True, color_system="truecolor", width=120)
+    every = max(1, updates // max(1, lines))
+    written = 0
+    for i in range(updates):
+        buffer.write(f"\r\x1b[36m{PROGRESS_PREFIX}\x1b[0m {i * 100 // updates:3d}% |{'#' * (i * 40 // updates):<40}| {i}/{updates}")
+        if i % every or written >= lines:
+            continue
+        buffer.write("\n")
+        if written % 40 == 0:
+            table = Table(title=f"Tracker status {written}")
+            for column in ("Tracker", "Status", "Dupes", "Message"):
+                table.add_column(column)
+            for row in range(6):
+                table.add_row(f"T{row}", "[green]OK[/green]" if row % 2 else "[red]FAILED[/red]", str(row * 3), f"message {row} for line {written}")
+            console.print(table)
+            written += 1
+        else:
+            console.print(f"[bold cyan]Processing[/bold cyan] piece [yellow]{i}[/yellow] of [magenta]{updates}[/magenta] — [dim]status line {written}[/dim]")
+            written += 1
+    buffer.write("\ndone\n")
+    return buffer.getvalue()
+
+
+def frames(text: str) -> list[str]:
+    # The pump sends frames of complete lines, FRAME_SIZE at most
+    result: list[str] = []
+    start = 0
+    while start < len(text):
+        end = text.rfind("\n", start, start + FRAME_SIZE) + 1
+        if end <= start:
+            end = min(len(text), start + FRAME_SIZE)
+        result.append(text[start:end])
+        start = end
+    return result
+
+
+def per_line(text: str) -> list[str]:
+    result: list[str] = []
+    buffer = ""
+    for char in text:
+        buffer += char
+        if char == "\n" or len(buffer) > 512:
+            result.append(buffer)
+            buffer = ""
+    if buffer:
+        result.append(buffer)
+    return result
+
+
+def with_ansi_to_html(chunks: Iterable[str]) -> list[str]:
+    # Its recording Console also writes to stdout, which the server discards
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return [ansi_to_html(chunk) for chunk in chunks]
+
+
+def with_stream(chunks: Iterable[str]) -> list[str]:
+    stream = AnsiHtmlStream()
+    return [fragment for chunk in chunks for fragment, _replace in stream.feed(chunk)]
+
+
+def visible_status_lines(fragments: list[str]) -> list[str]:
+    text = html.unescape(_TAG_RE.sub("", "\n".join(fragments)))
+    return [line.rstrip() for line in text.splitlines() if line.strip() and PROGRESS_PREFIX not in line]
+
+
+def run(label: str, convert: Callable[[Iterable[str]], list[str]], chunks: list[str], rounds: int) -> list[str]:
+    times: list[float] = []
+    fragments: list[str] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fragments = convert(chunks)
+        times.append(time.perf_counter() - started)
+    size = sum(len(fragment.encode()) for fragment in fragments)
+    print(f"  {label:<15} {min(times) * 1000:8.0f} ms  {len(fragments):>6} fragments  {size / 1024:7.0f} KiB HTML")
+    return fragments
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=1140)
+    parser.add_argument("--updates", type=int, default=30000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    log = build_log(args.lines, args.updates)
+    translated = log.replace("\r", "\n")
+    print(f"log: {len(log.encode()) / 1024 / 1024:.2f} MiB, {args.lines} status lines, {args.updates} progress updates, best of {args.rounds}")
+    before = run("per line", with_ansi_to_html, per_line(translated), args.rounds)
+    run("ansi_to_html", with_ansi_to_html, frames(translated), args.rounds)
+    after = run("AnsiHtmlStream", with_stream, frames(log), args.rounds)
+    same = visible_status_lines(before) == visible_status_lines(after)
+    print("  status lines " + ("identical" if same else "DIFFER"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Time filter_dupes on large dupe lists: the per-entry closure against the precomputed path.
+
+Builds a synthetic TV season pack and a dupe list the size trackers return for
+long-running shows: packs and single episodes across seasons, resolutions,
+sources and groups, each pack carrying its full file list. The old
+filter_dupes, from the frozen copy in dupe_filter_baseline, and the current
+one filter the same list with debug off. Their results are compared, so a
+speed-up that changes the outcome shows up.
+
+    python -m bin.benchmarks.dupe_filter [--entries 1000 5000] [--rounds 5] [--tracker AITHER]
+"""
+import argparse
+import asyncio
+import copy
+import time
+from types import ModuleType
+from typing import Any
+
+from bin.benchmarks import dupe_filter_baseline
+from src import dupe_checking
+
+RESOLUTIONS = ["2160p", "1080p", "720p", "576p", "480p"]
+SOURCES = [("WEB-DL", "WEBDL"), ("WEBRip", "WEBRIP"), ("BluRay", "ENCODE"), ("BluRay REMUX", "REMUX"), ("HDTV", "HDTV")]
+GROUPS = ["NTb", "FLUX", "GROUP", "CiNEFiLE", "BTN", "KiNGS", "playWEB"]
+HDRS = ["", "DV ", "HDR ", "DV HDR "]
+
+
+def build_meta() -> dict[str, Any]:
+    name = "Some Show S03 1080p WEB-DL DDP 5.1 H.264-GROUP"
+    return {
+        "debug": False,
+        "uuid": name.replace(" ", "."),
+        "name": name,
+        "category": "TV",
+        "type": "WEBDL",
+        "source": "WEB",
+        "resolution": "1080p",
+        "video_encode": "H.264",
+        "hdr": "",
+        "tag": "-GROUP",
+        "season": "S03",
+        "episode": "",
+        "tv_pack": 1,
+        "sd": 0,
+        "is_disc": None,
+        "source_size": 48_000_000_000,
+        "filelist": [f"/data/tv/Some.Show.S03/Some.Show.S03E{e:02}.1080p.WEB-DL.DDP5.1.H.264-GROUP.mkv" for e in range(1, 25)],
+        "mediainfo": {"media": {"track": [{"@type": "General", "FileSize": "2000000000"}]}},
+    }
+
+
+def build_dupes(count: int) -> list[dict[str, Any]]:
+    dupes: list[dict[str, Any]] = []
+    for i in range(count):
+        season = i % 12 + 1
+        resolution = RESOLUTIONS[i % len(RESOLUTIONS)]
+        source, type_name = SOURCES[(i // len(RESOLUTIONS)) % len(SOURCES)]
+        group = GROUPS[i % len(GROUPS)]
+        hdr = HDRS[i % len(HDRS)] if resolution == "2160p" else ""
+        if i % 3:
+            episode = i % 24 + 1
+            name = f"Some Show S{season:02}E{episode:02} {resolution} {source} {hdr}DDP 5.1 H.264-{group}"
+            files = [name.replace(" ", ".") + ".mkv"]
+        else:
+            name = f"Some Show S{season:02} {resolution} {source} {hdr}DDP 5.1 H.264-{group}"
+            files = [f"Some.Show.S{season:02}E{e:02}.{resolution}.{source.replace(' ', '.')}.H.264-{group}.mkv" for e in range(1, 25)]
+        dupes.append({
+            "name": name,
+            "size": 2_000_000_000 * len(files),
+            "files": files,
+            "file_count": len(files),
+            "trumpable": False,
+            "link": f"https://tracker.example/torrents/{i}",
+            "download": f"https://tracker.example/torrent/download/{i}",
+            "flags": [flag for flag in hdr.split() if flag],
+            "id": i,
+            "type": type_name,
+            "res": resolution,
+            "internal": 0,
+        })
+    return dupes
+
+
+def run(module: ModuleType, dupes: list[dict[str, Any]], meta: dict[str, Any], tracker: str, rounds: int) -> tuple[float, list[Any]]:
+    times: list[float] = []
+    result: list[Any] = []
+    for _ in range(rounds):
+        local_meta = copy.deepcopy(meta)
+        started = time.perf_counter()
+        result = asyncio.run(module.filter_dupes(dupes, local_meta, tracker, {}))
+        times.append(time.perf_counter() - started)
+    return min(times), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--tracker", default="AITHER")
+    args = parser.parse_args()
+
+    meta = build_meta()
+    print(f"target: {meta['name']} on {args.tracker}, debug off, best of {args.rounds}")
+    for count in args.entries:
+        dupes = build_dupes(count)
+        old_time, old_result = run(dupe_filter_baseline, dupes, meta, args.tracker, args.rounds)
+        new_time, new_result = run(dupe_checking, dupes, meta, args.tracker, args.rounds)
+        same = "same result" if old_result == new_result else "RESULTS DIFFER"
+        print(f"  {count:>6} entries  old {old_time * 1000:8.1f} ms  new {new_time * 1000:8.1f} ms  ({len(new_result)} kept, {same})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Time and memory of per-tracker meta copies: copy.deepcopy against MetaOverlay.
+
+Builds a synthetic meta of about 1 MB of JSON (MediaInfo tracks, BDInfo text,
+image lists, descriptions) and gives every tracker its own copy, the way
+process_all_trackers does. The copies are kept alive together, as the tracker
+tasks run concurrently, and each reads a few keys and writes its status, as
+the checks do. Peak memory is measured with tracemalloc.
+
+    python -m bin.benchmarks.meta_overlay [--trackers 25] [--rounds 5]
+"""
+import argparse
+import copy
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from src.meta_overlay import MetaOverlay
+
+
+def build_meta(trackers: list[str]) -> dict[str, Any]:
+    tracks: list[dict[str, Any]] = [
+        {"@type": "General", "Format": "Matroska", "Duration": "7260.512", "extra": {f"tag{i}": f"value {i}" * 4 for i in range(200)}},
+        {"@type": "Video", "Format": "HEVC", "Width": "3840", "Height": "2160", "HDR_Format": "Dolby Vision / SMPTE ST 2086"},
+    ]
+    tracks += [{"@type": "Audio", "Format": "E-AC-3", "Language": f"l{i}", "Title": f"Commentary track {i}" * 3} for i in range(30)]
+    tracks += [{"@type": "Text", "Format": "PGS", "Language": f"l{i}", "Title": f"Subtitle {i}" * 3} for i in range(120)]
+    return {
+        "name": "Some Movie 2023 2160p UHD BluRay REMUX DV HDR HEVC TrueHD 7.1 Atmos-GROUP",
+        "imdb": "1234567",
+        "tmdb": 98765,
+        "resolution": "2160p",
+        "type": "REMUX",
+        "category": "MOVIE",
+        "mediainfo": {"media": {"track": json.loads(json.dumps(tracks * 25))}},
+        "bdinfo": {"summary": "DISC INFO:\n" + "Playlist: 00800.MPLS\n" * 6000, "files": [{"file": f"{i:05}.m2ts", "size": i * 1000} for i in range(400)]},
+        "image_list": [{"img_url": f"https://img.example/{i}.png", "raw_url": f"https://img.example/raw/{i}.png", "web_url": f"https://img.example/v/{i}"} for i in range(60)],
+        "overview": "An overview. " * 400,
+        "description": "[center]Description line[/center]\n" * 2000,
+        "filelist": [f"/data/movies/Some Movie/file{i}.mkv" for i in range(50)],
+        "tracker_status": {tracker: {} for tracker in trackers},
+    }
+
+
+def check_tracker(meta: Any, tracker: str) -> None:
+    # What a typical check touches: a few scalars, its own status and one image list lookup
+    _ = (meta["name"], meta["resolution"], meta["type"], meta["imdb"], meta.get("category"))
+    _ = meta["image_list"][0]["img_url"]
+    meta["tracker_status"][tracker]["upload"] = True
+    meta[f"{tracker}_cross_seed"] = None
+
+
+def run(label: str, make_copy: Callable[[dict[str, Any]], Any], meta: dict[str, Any], trackers: list[str], rounds: int) -> None:
+    times: list[float] = []
+    peaks: list[int] = []
+    for _ in range(rounds):
+        tracemalloc.start()
+        started = time.perf_counter()
+        copies = [make_copy(meta) for _ in trackers]
+        for local_meta, tracker in zip(copies, trackers):
+            check_tracker(local_meta, tracker)
+        times.append(time.perf_counter() - started)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del copies
+    print(f"  {label:<9} {min(times):7.3f} s  {min(peaks) / 1024 / 1024:6.2f} MB peak  (best of {rounds})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trackers", type=int, default=25)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    trackers = [f"T{i}" for i in range(args.trackers)]
+    meta = build_meta(trackers)
+    print(f"meta: {len(json.dumps(meta)) / 1024 / 1024:.2f} MB of JSON, {len(trackers)} trackers")
+    run("deepcopy", copy.deepcopy, meta, trackers, args.rounds)
+    run("overlay", MetaOverlay, meta, trackers, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
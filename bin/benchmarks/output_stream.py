@@ -0,0 +1,126 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Throughput of Web UI subprocess output: per-character reading against OutputPump.
+
+Runs a child that writes a noisy session (carriage-return progress updates
+mixed with coloured lines on stdout, a few lines on stderr) and streams it
+the way execute_command does, counting the SSE events that would be sent.
+The old path is reproduced here: one thread per pipe reading a character at
+a time into a queue, polled every 0.1 s, flushed on each newline or after
+512 characters. Bare carriage returns, which OutputPump passes on to the
+renderer, are counted as the newlines the text-mode pipes made of them when
+comparing the text. HTML conversion is left out so only the streaming is timed.
+Server CPU covers this process and its reader threads, not the child.
+
+    python -m bin.benchmarks.output_stream [--updates 60000] [--lines 2000]
+"""
+import argparse
+import queue
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from typing import Optional
+
+from web_ui.output_stream import OutputPump
+
+CHILD = r"""
+import sys
+updates, lines = int(sys.argv[1]), int(sys.argv[2])
+every = max(1, updates // max(1, lines))
+for i in range(updates):
+    sys.stdout.write(f"\r\x1b[36mHashing\x1b[0m {i * 100 // updates:3d}% |{'#' * (i * 40 // updates):<40}| {i}/{updates}")
+    if i % every == 0:
+        sys.stdout.write(f"\n\x1b[1;32mProcessed piece {i}\x1b[0m of \x1b[33m{updates}\x1b[0m\n")
+    if i % (every * 50) == 0:
+        sys.stderr.write(f"warning: slow read at piece {i}\n")
+sys.stdout.write("\ndone\n")
+"""
+
+
+def spawn(updates: int, lines: int) -> "subprocess.Popen[str]":
+    return subprocess.Popen(
+        [sys.executable, "-c", CHILD, str(updates), str(lines)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=0,
+        universal_newlines=True,
+    )
+
+
+def per_character(process: "subprocess.Popen[str]") -> Iterator[Optional[tuple[str, str]]]:
+    output_queue: queue.Queue[tuple[str, str]] = queue.Queue()
+
+    def read(origin: str) -> None:
+        stream = process.stdout if origin == "stdout" else process.stderr
+        if stream is None:
+            return
+        while True:
+            char = stream.read(1)
+            if not char:
+                break
+            output_queue.put((origin, char))
+
+    for origin in ("stdout", "stderr"):
+        threading.Thread(target=read, args=(origin,), daemon=True).start()
+
+    buffers: dict[str, str] = {"stdout": "", "stderr": ""}
+    while process.poll() is None or not output_queue.empty():
+        try:
+            origin, char = output_queue.get(timeout=0.1)
+        except queue.Empty:
+            yield None
+            continue
+        buffers[origin] += char
+        if char == "\n" or len(buffers[origin]) > 512:
+            yield origin, buffers[origin]
+            buffers[origin] = ""
+    for origin, remaining in buffers.items():
+        if remaining:
+            yield origin, remaining
+
+
+def pumped(process: "subprocess.Popen[str]") -> Iterator[Optional[tuple[str, str]]]:
+    pump = OutputPump({"stdout": process.stdout, "stderr": process.stderr}, process)
+    pump.start()
+    yield from pump.frames()
+
+
+def run(label: str, stream: str, updates: int, lines: int) -> dict[str, str]:
+    process = spawn(updates, lines)
+    delivered: dict[str, list[str]] = {"stdout": [], "stderr": []}
+    events = 0
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    for frame in (per_character if stream == "old" else pumped)(process):
+        events += 1
+        if frame is not None:
+            delivered[frame[0]].append(frame[1])
+    wall = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    process.wait()
+    text = {origin: "".join(parts) for origin, parts in delivered.items()}
+    chars = sum(len(value) for value in text.values())
+    print(f"  {label:<14} {wall:6.2f} s wall  {cpu:6.2f} s server CPU  {events:>7} SSE events  {chars} chars")
+    return text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--updates", type=int, default=60000)
+    parser.add_argument("--lines", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"child: {args.updates} progress updates, {args.lines} coloured lines")
+    old = run("per-character", "old", args.updates, args.lines)
+    new = run("OutputPump", "new", args.updates, args.lines)
+    # OutputPump keeps bare carriage returns for the renderer; the text-mode pipes turned them into newlines
+    new = {origin: text.replace("\r", "\n") for origin, text in new.items()}
+    print("  delivered text " + ("identical" if old == new else "DIFFERS"))
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,33 @@ config = {
         # If less than the number of trackers pass the checking, exit immediately.
         "tracker_pass_checks": 1,
 
+        # How many queue items (--queue / --site-upload) to process at the same time. Only used with --unattended.
+        # Each kind of work is limited separately by queue_budgets: "disk" (torrent hashing), "cpu" (screenshots)
+        # and "network" (tracker checks and uploads), so concurrent items overlap on different resources.
+        "queue_workers": 1,
+        "queue_budgets": {"disk": 1, "cpu": 1, "network": 2},
+
+        # Minimum seconds between uploads to the same tracker host
+        "queue_tracker_interval": 0,
+
+        # Most tracker uploads running at once (0 = all trackers of a release at once)
+        "upload_concurrency": 0,
+        # Retries per tracker for uploads the tracker cannot have accepted (connection failures, 429/503 responses)
+        "upload_retries": 2,
+        # Total retries allowed across all trackers of one release
+        "upload_retry_budget": 6,
+        # Per-tracker overrides: "concurrency", "interval" (seconds per upload), "burst", "retries",
+        # and "settle" (seconds to wait after an upload before adding the torrent to the client)
+        # Built in: {"PTP": {"settle": 5}, "SN": {"settle": 16}}
+        "upload_tracker_limits": {},
+
+        # Seconds to reuse a tracker's dupe search results for the same title, category, resolution, type and season
+        # Shared by the tracker checks, the cross-seed pass and other queue items (0 = only share concurrent searches)
+        "dupe_search_cache_ttl": 300,
+
+        # Use HTTP/2 for pooled connections to servers that support it. Needs the h2 package (pip install httpx[http2])
+        "http2": False,
+
         # Set true to suppress config warnings on startup
         "suppress_warnings": False,
 
@@ -71,6 +98,13 @@ config = {
         # Set to true to always just use the largest playlist on a blu-ray, without selection prompt.
         "use_largest_playlist": False,
 
+        # BDInfo scans of the selected Blu-ray playlists that may run at once, across all discs of a release
+        "bdinfo_parallel_scans": 2,
+
+        # BDInfo scans that may run at once on one storage device. Keep 1 for spinning disks, where parallel reads
+        # slow each other down; discs on different devices are still scanned in parallel.
+        "bdinfo_scans_per_device": 1,
+
         # Set False to skip getting images from tracker descriptions
         "keep_images": True,
 
@@ -104,6 +138,13 @@ config = {
         # If there is only a single release on bluray.com, you may wish to relax the score a little
         "bluray_single_score": 89.5,
 
+        # Most bluray.com pages fetched at once
+        "bluray_concurrency": 3,
+
+        # Pacing of bluray.com requests: seconds per request, and requests that may be sent at once
+        "bluray_request_interval": 1.5,
+        "bluray_request_burst": 3,
+
         # Set true to also try searching predb for scene release
         # predb is not consistent, can timeout, but can find some releases not found on SRRDB
         "check_predb": False,
@@ -124,6 +165,10 @@ config = {
         # Overlay Frame number/type and "Tonemapped" if applicable to screenshots
         "frame_overlay": False,
 
+        # Before capturing, score low resolution thumbnails of a few frames around each screenshot time
+        # and capture the best one, skipping black, flat and credits frames (needs NumPy, from requirements.txt)
+        "screens_prescan": True,
+
         # Overlay text size (scales with resolution)
         "overlay_text_size": "18",
 
@@ -135,6 +180,10 @@ config = {
         # This places an additional limitation on ffmpeg to reduce CPU usage
         "ffmpeg_limit": False,
 
+        # Capture each worker's screenshots with a single ffmpeg run (one seeked input per frame)
+        # instead of starting ffmpeg for every screenshot. Frames that fail are retried one at a time.
+        "ffmpeg_batch_screens": True,
+
         # Tonemap HDR - DV+HDR screenshots
         "tone_map": True,
 
@@ -154,6 +203,11 @@ config = {
         # 6 is a good balance between compression and speed
         "ffmpeg_compression": "6",
 
+        # Losslessly recompress screenshots before uploading them. Uses oxipng (pyoxipng, from requirements.txt).
+        # Results are cached by content hash, so reused or recaptured identical screenshots are not compressed again.
+        "optimize_images": True,
+        "optimize_images_cache_mb": 512,
+
         # Tonemap screenshots with the following settings (doesn't apply when using libplacebo)
         # See https://ayosec.github.io/ffmpeg-filters-docs/7.1/Filters/Video/tonemap.html
         "algorithm": "mobius",
@@ -293,6 +347,36 @@ config = {
         # this path for TV shows
         # "emby_tv_dir": None,
 
+        # METADATA CACHE
+
+        # Cache TMDb/IMDb/TVDB/TVmaze responses on disk between runs, so queued episodes of the same series
+        # only look the series up once. Use --no-metadata-cache to bypass and --purge-metadata-cache to empty it.
+        "metadata_cache": True,
+
+        # Directory for the cache database (default: data/cache)
+        # "metadata_cache_dir": "",
+
+        # Hours each source's responses are considered fresh
+        "metadata_cache_ttl_hours": {"tmdb": 72, "imdb": 168, "tvdb": 24, "tvmaze": 24, "bluray": 168, "bluray_search": 12},
+
+        # Hours an expired response may still be used while it is refreshed in the background
+        "metadata_cache_stale_hours": 168,
+
+        # Maximum size of the cache database in MiB, least recently used entries are evicted first
+        "metadata_cache_max_mb": 256,
+
+        # Keep MediaInfo and BDInfo results in the cache directory, keyed by the identity of the files they describe
+        # (path, size, modification time, inode and a partial hash), so processing the same files again skips the scans.
+        # Use --purge-media-cache to empty it.
+        "media_report_cache": True,
+
+        # Maximum size of the MediaInfo/BDInfo cache in MiB, least recently used reports are evicted first
+        "media_report_cache_max_mb": 512,
+
+        # Seconds between background refreshes of the file name index used by the Discord and Web UI searches.
+        # Only directories that changed since the last refresh are listed again. 0 refreshes before every search.
+        "search_index_interval": 300,
+
         # TORRENT CREATION
 
         # set true to use mkbrr for torrent creation
@@ -303,6 +387,11 @@ config = {
         # Conversely, you can set a lower amount such as 1 to protect system resources (default "0" (auto))
         "mkbrr_threads": "0",
 
+        # Keep an index of torrents read from clients or created by UA, and reuse their piece hashes
+        # when creating a torrent with the same piece size over the same files (e.g. a different file selection).
+        # Reused hashes are spot checked against the files on disk, the rest are trusted
+        "piece_hash_reuse": False,
+
         # Set true to prefer torrents with piece size <= 16 MiB when searching for existing torrents in clients
         # Does not override MTV preference for small pieces
         "prefer_max_16_torrent": False,
@@ -968,6 +1057,8 @@ config = {
             "qui_proxy_url": "",
             # enable_search to True will automatically try and find a suitable hash to save having to rehash when creating torrents
             "enable_search": True,
+            # Keep a local copy of the client's torrent list, updated from qBittorrent's sync deltas, for searches
+            "qbit_state_mirror": True,
             "qbit_url": "http://127.0.0.1",
             "qbit_port": "8080",
             "qbit_user": "",
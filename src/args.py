@@ -85,6 +85,7 @@ class Args:
         parser.add_argument('path', nargs='*', help="Path to file/directory (in single/double quotes is best)")
         parser.add_argument('--queue', nargs=1, required=False, help="(--queue queue_name) Process an entire folder (files/subfolders) in a queue")
         parser.add_argument('-lq', '--limit-queue', dest='limit_queue', nargs=1, required=False, help="Limit the amount of queue files processed", type=int, default=0)
+        parser.add_argument('-qw', '--queue-workers', dest='queue_workers', nargs=1, required=False, help="Process this many queue items at once (requires --unattended)", type=int, default=0)
         parser.add_argument('-sc', '--site-check', dest='site_check', action='store_true', required=False, help="Just search sites for suitable uploads and create log file, no uploading", default=False)
         parser.add_argument('-su', '--site-upload', dest='site_upload', nargs=1, required=False, help="Specify a single tracker, and it will process the site searches and upload.", type=str, default=None)
         parser.add_argument('--unit3d', action='store_true', required=False, help="[parse a txt output file from UNIT3D-Upload-Checker]")
@@ -190,6 +191,10 @@ class Args:
         parser.add_argument('-dm', '--delete-meta', action='store_true', required=False, dest='delete_meta', help="Delete only meta.json from tmp directory")
         parser.add_argument('-dtmp', '--delete-tmp', action='store_true', required=False, dest='delete_tmp', help="Delete tmp directory for the working file/folder")
         parser.add_argument('-cleanup', '--cleanup', action='store_true', required=False, help="Clean up tmp directory")
+        parser.add_argument('-nmc', '--no-metadata-cache', action='store_true', required=False, dest='no_metadata_cache', help="Bypass the persistent TMDb/IMDb/TVDB/TVmaze response cache for this run")
+        parser.add_argument('-pmc', '--purge-metadata-cache', action='store_true', required=False, dest='purge_metadata_cache', help="Empty the persistent TMDb/IMDb/TVDB/TVmaze response cache")
+        parser.add_argument('-pmr', '--purge-media-cache', action='store_true', required=False, dest='purge_media_cache', help="Empty the persistent MediaInfo/BDInfo result cache")
+        parser.add_argument('--import-profile', action='store_true', required=False, dest='import_profile', help="Report how long each module took to import when the program exits")
         parser.add_argument('-fl', '--freeleech', nargs=1, required=False, help="Freeleech Percentage. Any value 1-100 works, but site search is limited to certain values", default=0, dest="freeleech")
         parser.add_argument('--infohash', nargs=1, required=False, help="V1 Info Hash")
         parser.add_argument('-emby', '--emby', action='store_true', required=False, help="Create an Emby-compliant NFO file and optionally symlink the content")
@@ -2,18 +2,20 @@
 import asyncio
 import json
 import os
-import random
 import re
 from collections.abc import Mapping, MutableMapping, Sequence
 from pathlib import Path
 from typing import Any, Optional, cast
 
 import cli_ui
-import httpx
 from bs4 import BeautifulSoup
 from bs4.element import AttributeValueList
 from rich.console import Console
 
+from src.bluray_fetch import bluray_fetcher
+from src.http_pool import http_pool
+from src.metadata_cache import metadata_cache
+
 console = Console()
 
 Meta = MutableMapping[str, Any]
@@ -79,72 +81,15 @@ async def search_bluray(meta: Meta) -> Optional[str]:
         "Cache-Control": "max-age=0"
     }
 
-    max_retries = 2
-    retry_count = 0
-    backoff_time = 3.0
-
-    while retry_count <= max_retries:
+    response_text = await bluray_fetcher.fetch(url, headers, meta, cache_key=metadata_cache.make_key("bluray_search", imdb_id), source="bluray_search", timeout=10.0)
+    if response_text:
         try:
-            delay = random.uniform(1, 3)  # nosec B311 - Rate limiting delay, not cryptographic
-            if meta.get('debug'):
-                console.print(f"[dim]Waiting {delay:.2f} seconds before request (attempt {retry_count + 1}/{max_retries + 1})...[/dim]")
-            await asyncio.sleep(delay)
-
+            debug_path = Path(base_dir) / "tmp" / uuid / f"debug_bluray_search_{imdb_id}.html"
+            await asyncio.to_thread(debug_path.write_text, response_text, encoding="utf-8")
             if meta.get('debug'):
-                console.print(f"[yellow]Sending request to blu-ray.com (attempt {retry_count + 1}/{max_retries + 1})...[/yellow]")
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                response = await client.get(url, headers=headers)
-
-                if response.status_code == 200 and "No index" not in response.text:
-                    response_text = response.text
-
-                    try:
-                        debug_path = Path(base_dir) / "tmp" / uuid / f"debug_bluray_search_{imdb_id}.html"
-                        await asyncio.to_thread(debug_path.write_text, response_text, encoding="utf-8")
-                        if meta.get('debug'):
-                            console.print(f"[dim]Saved search response to debug_bluray_search_{imdb_id}.html[/dim]")
-                    except Exception as e:
-                        console.print(f"[dim]Could not save debug file: {str(e)}[/dim]")
-
-                    break
-
-                elif "No index" in response.text:
-                    console.print(f"[red]Blocked by blu-ray.com (Anti-scraping protection) (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                    console.print(f"[dim]Response preview: {response.text[:150]}...[/dim]")
-
-                    # use less retries for blocked requests since it's probably just borked
-                    if retry_count < 2:
-                        backoff_time *= 2
-                        console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on search[/red]")
-                        break
-                else:
-                    console.print(f"[red]Failed with status code: {response.status_code} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-
-                    if retry_count < max_retries:
-                        backoff_time *= 2
-                        if meta['debug']:
-                            console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on search[/red]")
-                        break
-
-        except httpx.RequestError as e:
-            console.print(f"[red]HTTP request error when accessing {url} (attempt {retry_count + 1}/{max_retries + 1}): {str(e)}[/red]")
-            if retry_count < max_retries:
-                backoff_time *= 2
-                if meta.get('debug'):
-                    console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                await asyncio.sleep(backoff_time)
-                retry_count += 1
-            else:
-                console.print("[red]Maximum retries reached, giving up on search[/red]")
-                break
+                console.print(f"[dim]Saved search response to debug_bluray_search_{imdb_id}.html[/dim]")
+        except Exception as e:
+            console.print(f"[dim]Could not save debug file: {str(e)}[/dim]")
 
     if not response_text:
         console.print("[red]Failed to retrieve search results after all attempts[/red]")
@@ -197,7 +142,12 @@ def extract_bluray_links(html_content: Optional[str]) -> Optional[list[MovieLink
         return None
 
 
-async def extract_bluray_release_info(html_content: str, meta: Meta) -> list[Release]:
+def release_debug_filename(meta: Meta, release_type: str, product_id: str) -> str:
+    # One file per product, as the release lists of several movies are fetched at once
+    return f"{meta.get('base_dir', '')}/tmp/{meta.get('uuid', '')}/debug_bluray_{product_id}_{release_type}.html"
+
+
+async def extract_bluray_release_info(html_content: str, meta: Meta, product_id: str) -> list[Release]:
     if not html_content:
         console.print("[red]No HTML content to extract release info from[/red]")
         return []
@@ -220,12 +170,10 @@ async def extract_bluray_release_info(html_content: str, meta: Meta) -> list[Rel
         console.print("[blue]Looking for standard Blu-ray releases[/blue]")
 
     try:
-        base_dir = str(meta.get('base_dir', ''))
-        uuid = str(meta.get('uuid', ''))
-        debug_path = Path(base_dir) / "tmp" / uuid / f"debug_bluray_{release_type}.html"
+        debug_path = Path(release_debug_filename(meta, release_type, product_id))
         await asyncio.to_thread(debug_path.write_text, html_content, encoding="utf-8")
         if meta.get('debug'):
-            console.print(f"[dim]Saved releases response to debug_bluray_{release_type}.html[/dim]")
+            console.print(f"[dim]Saved releases response to {debug_path.name}[/dim]")
     except Exception as e:
         console.print(f"[dim]Could not save debug file: {str(e)}[/dim]")
 
@@ -334,6 +282,71 @@ async def extract_product_id(url: str, meta: Meta) -> Optional[str]:
     return None
 
 
+async def fetch_movie_releases(movie: MovieLink, idx: int, total: int, meta: Meta) -> list[Release]:
+    if meta.get('debug'):
+        console.print(f"[blue]Processing movie {idx}/{total}: {movie['title']} ({movie['year']})[/blue]")
+    releases_url = movie['releases_url']
+    product_id = await extract_product_id(releases_url, meta)
+    if not product_id:
+        console.print(f"[red]Could not extract product ID from {releases_url}[/red]")
+        return []
+
+    ajax_url = f"https://www.blu-ray.com/products/menu_ajax.php?p={product_id}&c=20&action=showreleasesall"
+    console.print(f"[dim]Releases URL: {ajax_url}[/dim]")
+
+    is_3d = str(meta.get('3D', '')).lower() == 'yes'
+    resolution = str(meta.get('resolution', '')).lower()
+    is_4k = '2160p' in resolution or '4k' in resolution
+    is_dvd = str(meta.get('is_disc', '')).upper() == "DVD"
+    release_type = "4K" if is_4k else "3D" if is_3d else "DVD" if is_dvd else "BD"
+    debug_filename = release_debug_filename(meta, release_type, product_id)
+
+    response_text: Optional[str] = None
+    try:
+        if os.path.exists(debug_filename):
+            if meta.get('debug'):
+                console.print(f"[green]Found existing release data for product ID {product_id}[/green]")
+            response_text = await asyncio.to_thread(Path(debug_filename).read_text, encoding="utf-8")
+
+            if not response_text or "No index" in response_text:
+                console.print("[yellow]Cached file exists but appears to be invalid, will fetch fresh data[/yellow]")
+                response_text = None
+    except Exception as e:
+        console.print(f"[yellow]Error reading cached file: {str(e)}[/yellow]")
+
+    try:
+        if response_text is None:
+            # If we're here, we need to make a request
+            headers = {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+                "Accept-Encoding": "gzip, deflate, br",
+                "Connection": "keep-alive",
+                "Referer": releases_url,
+                "X-Requested-With": "XMLHttpRequest",
+            }
+            response_text = await bluray_fetcher.fetch(ajax_url, headers, meta, cache_key=metadata_cache.make_key("bluray", "releases", product_id))
+            if not response_text:
+                return []
+            fetched = True
+        else:
+            fetched = False
+
+        movie_releases = await extract_bluray_release_info(response_text, meta, product_id)
+        for release in movie_releases:
+            release['movie_title'] = movie['title']
+            release['movie_year'] = movie['year']
+        if fetched:
+            console.print(f"[green]Found {len(movie_releases)} matching releases for this movie[/green]")
+        return movie_releases
+
+    except Exception as e:
+        console.print(f"[red]Error fetching release details from {ajax_url}: {str(e)}[/red]")
+        console.print_exception()
+        return []
+
+
 async def get_bluray_releases(meta: Meta) -> list[Release]:
     console.print("[blue]===== Starting blu-ray.com release search =====[/blue]")
     imdb_id_value = int(meta.get('imdb_id', 0) or 0)
@@ -352,117 +365,11 @@ async def get_bluray_releases(meta: Meta) -> list[Release]:
             console.print(f"[red]No movies found for IMDB ID: tt{meta['imdb_id']:07d}[/red]")
         return []
 
-    matching_releases: list[Release] = []
-
-    for idx, movie in enumerate(movie_links, 1):
-        if meta.get('debug'):
-            console.print(f"[blue]Processing movie {idx}/{len(movie_links)}: {movie['title']} ({movie['year']})[/blue]")
-        releases_url = movie['releases_url']
-        product_id = await extract_product_id(releases_url, meta)
-        if not product_id:
-            console.print(f"[red]Could not extract product ID from {releases_url}[/red]")
-            continue
-
-        ajax_url = f"https://www.blu-ray.com/products/menu_ajax.php?p={product_id}&c=20&action=showreleasesall"
-        console.print(f"[dim]Releases URL: {ajax_url}[/dim]")
-
-        is_3d = str(meta.get('3D', '')).lower() == 'yes'
-        resolution = str(meta.get('resolution', '')).lower()
-        is_4k = '2160p' in resolution or '4k' in resolution
-        release_type = "4K" if is_4k else "3D" if is_3d else "BD"
-        release_debug_filename = f"{meta.get('base_dir', '')}/tmp/{meta.get('uuid', '')}/debug_bluray_{release_type}.html"
-
-        try:
-            if os.path.exists(release_debug_filename):
-                if meta.get('debug'):
-                    console.print(f"[green]Found existing release data for product ID {product_id}[/green]")
-                response_text = await asyncio.to_thread(Path(release_debug_filename).read_text, encoding="utf-8")
-
-                if response_text and "No index" not in response_text:
-                    movie_releases = await extract_bluray_release_info(response_text, meta)
-
-                    for release in movie_releases:
-                        release['movie_title'] = movie['title']
-                        release['movie_year'] = movie['year']
-
-                    matching_releases.extend(movie_releases)
-                    continue
-                else:
-                    console.print("[yellow]Cached file exists but appears to be invalid, will fetch fresh data[/yellow]")
-        except Exception as e:
-            console.print(f"[yellow]Error reading cached file: {str(e)}[/yellow]")
-
-        # If we're here, we need to make a request
-        delay = random.uniform(2, 4)  # nosec B311 - Rate limiting delay, not cryptographic
-        if meta.get('debug'):
-            console.print(f"[dim]Waiting {delay:.2f} seconds before request...[/dim]")
-        await asyncio.sleep(delay)
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Referer": releases_url,
-            "X-Requested-With": "XMLHttpRequest",
-        }
-
-        try:
-            max_retries = 2
-            retry_count = 0
-            backoff_time = 3.0
-
-            while retry_count <= max_retries:
-                try:  # noqa: PERF203
-                    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                        response = await client.get(ajax_url, headers=headers)
-
-                        if response.status_code == 200 and "No index" not in response.text:
-                            movie_releases = await extract_bluray_release_info(response.text, meta)
-
-                            for release in movie_releases:
-                                release['movie_title'] = movie['title']
-                                release['movie_year'] = movie['year']
-
-                            console.print(f"[green]Found {len(movie_releases)} matching releases for this movie[/green]")
-                            matching_releases.extend(movie_releases)
-                            break
-                        elif "No index" in response.text:
-                            console.print(f"[red]Blocked by blu-ray.com when accessing {ajax_url} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                            if retry_count < max_retries:
-                                backoff_time *= 2
-                                console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                                await asyncio.sleep(backoff_time)
-                                retry_count += 1
-                            else:
-                                console.print("[red]Maximum retries reached, giving up on this URL[/red]")
-                                break
-                        else:
-                            console.print(f"[red]Failed to get release information from {ajax_url}, status code: {response.status_code} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                            if retry_count < max_retries:
-                                backoff_time *= 2
-                                console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                                await asyncio.sleep(backoff_time)
-                                retry_count += 1
-                            else:
-                                console.print("[red]Maximum retries reached, giving up on this URL[/red]")
-                                break
-
-                except httpx.RequestError as e:
-                    console.print(f"[red]HTTP request error when accessing {ajax_url} (attempt {retry_count + 1}/{max_retries + 1}): {str(e)}[/red]")
-                    if retry_count < max_retries:
-                        backoff_time *= 2
-                        console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on this URL[/red]")
-                        break
-
-        except Exception as e:
-            console.print(f"[red]Error fetching release details from {ajax_url}: {str(e)}[/red]")
-            console.print_exception()
+    # The release lists of all movies are fetched concurrently; the results keep the search order
+    movie_results = await asyncio.gather(*(
+        fetch_movie_releases(movie, idx, len(movie_links), meta) for idx, movie in enumerate(movie_links, 1)
+    ))
+    matching_releases: list[Release] = [release for movie_releases in movie_results for release in movie_releases]
 
     console.print("[yellow]===== BluRay.com search results summary =====[/yellow]")
 
@@ -780,7 +687,7 @@ async def download_cover_images(meta: Meta) -> bool:
     downloaded_images: dict[str, str] = {}
     console.print("[blue]Downloading cover images...[/blue]")
 
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+    async with http_pool.session("bluray", timeout=30.0, follow_redirects=True) as client:
         cover_images = cast(Mapping[str, str], meta.get('cover_images', {}))
         for img_type, url in cover_images.items():
             file_ext = os.path.splitext(url)[1]
@@ -919,11 +826,6 @@ async def fetch_release_details(release: Release, meta: Meta) -> Release:
         console.print(f"[yellow]Error reading cached file: {str(e)}[/yellow]")
 
     # If we're here, we need to make a request
-    delay = random.uniform(2, 4)  # nosec B311 - Rate limiting delay, not cryptographic
-    if meta.get('debug'):
-        console.print(f"[dim]Waiting {delay:.2f} seconds before request...[/dim]")
-    await asyncio.sleep(delay)
-
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
@@ -936,63 +838,15 @@ async def fetch_release_details(release: Release, meta: Meta) -> Release:
         "Sec-Fetch-Site": "same-origin"
     }
 
-    max_retries = 2
-    retry_count = 0
-    backoff_time = 3.0
-
-    while retry_count <= max_retries:
+    response_text = await bluray_fetcher.fetch(release_url, headers, meta, cache_key=metadata_cache.make_key("bluray", "release", release_id))
+    if response_text:
         try:
+            debug_path = Path(str(meta.get('base_dir', ''))) / "tmp" / str(meta.get('uuid', '')) / f"debug_release_{release_id}.html"
+            await asyncio.to_thread(debug_path.write_text, response_text, encoding="utf-8")
             if meta.get('debug'):
-                console.print(f"[yellow]Sending request to {release_url} (attempt {retry_count + 1}/{max_retries + 1})...[/yellow]")
-
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                response = await client.get(release_url, headers=headers)
-
-                if response.status_code == 200 and "No index" not in response.text:
-                    response_text = response.text
-
-                    try:
-                        release_id = release.get('release_id', '0000000')
-                        debug_path = Path(str(meta.get('base_dir', ''))) / "tmp" / str(meta.get('uuid', '')) / f"debug_release_{release_id}.html"
-                        await asyncio.to_thread(debug_path.write_text, response_text, encoding="utf-8")
-                        if meta.get('debug'):
-                            console.print(f"[dim]Saved release page to debug_release_{release_id}.html[/dim]")
-                    except Exception as e:
-                        console.print(f"[dim]Could not save debug file: {str(e)}[/dim]")
-
-                    break
-
-                elif "No index" in response.text:
-                    console.print(f"[red]Blocked by blu-ray.com when accessing {release_url} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                    if retry_count < 2:
-                        backoff_time *= 2
-                        console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on this release[/red]")
-                        break
-                else:
-                    console.print(f"[red]Failed to get release details, status code: {response.status_code} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                    if retry_count < max_retries:
-                        backoff_time *= 2
-                        console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on this release[/red]")
-                        break
-
-        except httpx.RequestError as e:
-            console.print(f"[red]HTTP request error when accessing {release_url} (attempt {retry_count + 1}/{max_retries + 1}): {str(e)}[/red]")
-            if retry_count < max_retries:
-                backoff_time *= 2
-                console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                await asyncio.sleep(backoff_time)
-                retry_count += 1
-            else:
-                console.print("[red]Maximum retries reached, giving up on this release[/red]")
-                break
+                console.print(f"[dim]Saved release page to debug_release_{release_id}.html[/dim]")
+        except Exception as e:
+            console.print(f"[dim]Could not save debug file: {str(e)}[/dim]")
 
     if not response_text:
         console.print("[red]Failed to retrieve release details after all attempts[/red]")
@@ -1107,394 +961,414 @@ async def process_all_releases(releases: Sequence[Release], meta: Meta) -> list[
         else:
             console.print(f"[red]BD_SUMMARY file not found: {bd_summary_path}[/red]")
 
-    detailed_releases: list[Release] = []
-    for idx, release in enumerate(releases, 1):
-        console.print(f"[cyan]Processing release {idx}/{len(releases)}: {release['title']} ({release['country']})")
-        detailed_release = await fetch_release_details(release, meta)
-        detailed_releases.append(detailed_release)
-
-    if meta.get('debug'):
-        console.print()
-        cli_ui.info_section("Processing Complete")
-    cli_ui.info(f"Successfully processed {len(detailed_releases)} releases")
-
     logs: list[tuple[Release, list[str]]] = []  # Initialize a list to store logs for each release
+    scored_releases: list[tuple[float, Release]] = []
 
     def log_and_print(message: str, log_list: list[str]) -> None:
         if meta.get('debug'):
             console.print(message)
         log_list.append(message)
 
-    if detailed_releases:
-        scored_releases: list[tuple[float, Release]] = []
-        for idx, release in enumerate(detailed_releases, 1):
-            release_logs: list[str] = []
-            if meta.get('debug'):
-                console.print(f"\n[bold blue]=== Release {idx}/{len(detailed_releases)}: {release['title']} ({release['country']}) ===[/bold blue]")
-            log_and_print(f"[blue]Release URL: {release['url']}[/blue]", release_logs)
-            score = 100.0
+    def score_release(idx: int, total: int, release: Release) -> float:
+        release_logs: list[str] = []
+        if meta.get('debug'):
+            console.print(f"\n[bold blue]=== Release {idx}/{total}: {release['title']} ({release['country']}) ===[/bold blue]")
+        log_and_print(f"[blue]Release URL: {release['url']}[/blue]", release_logs)
+        score = 100.0
 
-            specs_missing = True
-            generic_format = False
-            if 'specs' in release:
-                specs = cast(Mapping[str, Any], release.get('specs', {}))
-
-                specs_missing = False
-                generic_format = False
-                # Check for completeness of data (penalty for missing info)
-                if not specs.get('video', {}):
-                    score -= 5  # Missing video info
-                    specs_missing = True
-                    log_and_print("[red]✗[/red] Missing video info", release_logs)
-                    log_and_print("[dim]Penalty for missing video info: 5.0[/dim]", release_logs)
-                if not specs.get('audio', []):
-                    score -= 5  # Missing audio info
-                    specs_missing = True
-                    log_and_print("[red]✗[/red] Missing audio info", release_logs)
-                    log_and_print("[dim]Penalty for missing audio info: 5.0[/dim]", release_logs)
-                if meta_subtitles and not specs.get('subtitles', []):
-                    score -= 5  # Missing subtitle info when bdinfo has subtitles
-                    specs_missing = True
-                    log_and_print("[red]✗[/red] Missing subtitle info", release_logs)
-                    log_and_print("[dim]Penalty for missing subtitle info: 5.0[/dim]", release_logs)
-                if not specs.get('discs', {}):
-                    score -= 5  # Missing disc info
-                    specs_missing = True
-                    log_and_print("[red]✗[/red] Missing disc info", release_logs)
-                    log_and_print("[dim]Penalty for missing disc info: 5.0[/dim]", release_logs)
-
-                # Disc format check
-                if 'discs' in specs and 'format' in specs['discs'] and 'discs' in meta and meta['discs'] and 'bdinfo' in meta['discs'][0]:
-                    release_format = str(specs['discs']['format']).lower()
-                    disc_size_gb = float(meta['discs'][0]['bdinfo'].get('size', 0) or 0)
-
-                    expected_format = ""
-                    if disc_size_gb < 25:
-                        expected_format = "bd-25"
-                    elif disc_size_gb < 50:
-                        expected_format = "bd-50"
-                    elif disc_size_gb < 66:
-                        expected_format = "bd-66"
-                    else:
-                        expected_format = "bd-100"
-
-                    format_match = False
-                    if expected_format and expected_format in release_format:
-                        format_match = True
-                        log_and_print(f"[green]✓[/green] Disc format match: {specs['discs']['format']} matches size {disc_size_gb:.2f} GB", release_logs)
-                    elif "bd" in release_format and not any(char.isdigit() for char in release_format):
-                        generic_format = True
-                        log_and_print(f"[yellow]⚠[/yellow] Generic BD format found: {specs['discs']['format']} for size {disc_size_gb:.2f} GB", release_logs)
-                    elif expected_format:
-                        score -= 50
-                        log_and_print(f"[yellow]⚠[/yellow] Disc format mismatch: {specs['discs']['format']} vs expected {expected_format.upper()} (size: {disc_size_gb:.2f} GB)", release_logs)
-                        if meta['debug']:
-                            log_and_print("[dim]Penalty for disc format mismatch: 50.0[/dim]", release_logs)
+        specs_missing = True
+        generic_format = False
+        if 'specs' in release:
+            specs = cast(Mapping[str, Any], release.get('specs', {}))
 
-                    if generic_format:
-                        score -= 5
-                        if meta.get('debug'):
-                            log_and_print("[dim]Reduced penalty for generic BD format: 5.0[/dim]", release_logs)
-
-                # Video format checks
-                if 'video' in specs and meta_video_specs:
-                    release_codec = str(specs['video'].get('codec', '')).lower()
-                    meta_codec = str(meta_video_specs.get('codec', '')).lower()
-
-                    codec_match = False
-                    if ('avc' in release_codec and 'avc' in meta_codec) or \
-                       ('h.264' in release_codec and ('avc' in meta_codec or 'h.264' in meta_codec)):
-                        codec_match = True
-                        log_and_print("[green]✓[/green] Video codec match: AVC/H.264", release_logs)
-                    elif ('hevc' in release_codec and 'hevc' in meta_codec) or \
-                         ('h.265' in release_codec and ('hevc' in meta_codec or 'h.265' in meta_codec)):
-                        codec_match = True
-                        log_and_print("[green]✓[/green] Video codec match: HEVC/H.265", release_logs)
-                    elif ('vc-1' in release_codec and 'vc-1' in meta_codec) or \
-                         ('vc1' in release_codec and 'vc1' in meta_codec):
-                        codec_match = True
-                        log_and_print("[green]✓[/green] Video codec match: VC-1", release_logs)
-                    elif ('mpeg-2' in release_codec and 'mpeg-2' in meta_codec) or \
-                         ('mpeg2' in release_codec and 'mpeg2' in meta_codec):
-                        codec_match = True
-                        log_and_print("[green]✓[/green] Video codec match: MPEG-2", release_logs)
-
-                    if not codec_match:
-                        score -= 80
-                        log_and_print(f"[red]✗[/red] Video codec mismatch: {release_codec} vs {meta_codec}", release_logs)
-                        if meta.get('debug'):
-                            log_and_print("[dim]Penalty for video codec mismatch 80.0[/dim]", release_logs)
-
-                    # Resolution match check
-                    release_res = str(specs['video'].get('resolution', '')).lower()
-                    meta_res = str(meta_video_specs.get('res', '')).lower()
-
-                    res_match = False
-                    if '1080' in release_res and '1080' in meta_res:
-                        res_match = True
-                        log_and_print("[green]✓[/green] Resolution match: 1080p", release_logs)
-                    elif ('2160' in release_res or '4k' in release_res) and ('2160' in meta_res or '4k' in meta_res):
-                        res_match = True
-                        log_and_print("[green]✓[/green] Resolution match: 4K/2160p", release_logs)
-
-                    if not res_match:
-                        score -= 80
-                        log_and_print(f"[red]✗[/red] Resolution mismatch: {release_res} vs {meta_res}", release_logs)
-                        if meta.get('debug'):
-                            log_and_print("[dim]Penalty for resolution mismatch 80.0[/dim]", release_logs)
+            specs_missing = False
+            generic_format = False
+            # Check for completeness of data (penalty for missing info)
+            if not specs.get('video', {}):
+                score -= 5  # Missing video info
+                specs_missing = True
+                log_and_print("[red]✗[/red] Missing video info", release_logs)
+                log_and_print("[dim]Penalty for missing video info: 5.0[/dim]", release_logs)
+            if not specs.get('audio', []):
+                score -= 5  # Missing audio info
+                specs_missing = True
+                log_and_print("[red]✗[/red] Missing audio info", release_logs)
+                log_and_print("[dim]Penalty for missing audio info: 5.0[/dim]", release_logs)
+            if meta_subtitles and not specs.get('subtitles', []):
+                score -= 5  # Missing subtitle info when bdinfo has subtitles
+                specs_missing = True
+                log_and_print("[red]✗[/red] Missing subtitle info", release_logs)
+                log_and_print("[dim]Penalty for missing subtitle info: 5.0[/dim]", release_logs)
+            if not specs.get('discs', {}):
+                score -= 5  # Missing disc info
+                specs_missing = True
+                log_and_print("[red]✗[/red] Missing disc info", release_logs)
+                log_and_print("[dim]Penalty for missing disc info: 5.0[/dim]", release_logs)
+
+            # Disc format check
+            if 'discs' in specs and 'format' in specs['discs'] and 'discs' in meta and meta['discs'] and 'bdinfo' in meta['discs'][0]:
+                release_format = str(specs['discs']['format']).lower()
+                disc_size_gb = float(meta['discs'][0]['bdinfo'].get('size', 0) or 0)
+
+                expected_format = ""
+                if disc_size_gb < 25:
+                    expected_format = "bd-25"
+                elif disc_size_gb < 50:
+                    expected_format = "bd-50"
+                elif disc_size_gb < 66:
+                    expected_format = "bd-66"
                 else:
+                    expected_format = "bd-100"
+
+                format_match = False
+                if expected_format and expected_format in release_format:
+                    format_match = True
+                    log_and_print(f"[green]✓[/green] Disc format match: {specs['discs']['format']} matches size {disc_size_gb:.2f} GB", release_logs)
+                elif "bd" in release_format and not any(char.isdigit() for char in release_format):
+                    generic_format = True
+                    log_and_print(f"[yellow]⚠[/yellow] Generic BD format found: {specs['discs']['format']} for size {disc_size_gb:.2f} GB", release_logs)
+                elif expected_format:
+                    score -= 50
+                    log_and_print(f"[yellow]⚠[/yellow] Disc format mismatch: {specs['discs']['format']} vs expected {expected_format.upper()} (size: {disc_size_gb:.2f} GB)", release_logs)
+                    if meta['debug']:
+                        log_and_print("[dim]Penalty for disc format mismatch: 50.0[/dim]", release_logs)
+
+                if generic_format:
                     score -= 5
-                    log_and_print("[yellow]?[/yellow] Cannot compare video formats", release_logs)
-
-                # Audio track checks
-                if 'audio' in specs and meta_audio_specs:
-                    audio_matches = 0
-                    partial_audio_matches = 0
-                    missing_audio_tracks = 0
-                    available_release_tracks = list(cast(list[str], specs.get('audio', [])))
-                    reduced_penalty_count = 0
-                    for meta_idx, meta_track in enumerate(meta_audio_specs):
-                        meta_lang = str(meta_track.get('language', '')).lower()
-                        meta_format = str(meta_track.get('codec', '')).lower().replace('audio', '')
-                        meta_channels = str(meta_track.get('channels', '')).lower().replace('audio', '')
-                        meta_sample_rate = str(meta_track.get('sample_rate', '')).lower()
-                        meta_bit_depth = str(meta_track.get('bit_depth', '')).lower()
-                        meta_bitrate = str(meta_track.get('bitrate', '')).lower()
-
-                        # Special handling for Atmos tracks
-                        if str(meta_track.get('atmos_why_you_be_like_this', '')).lower() == 'atmos' or 'atmos' in meta_channels:
-                            if 'truehd' in meta_format:
-                                meta_format = 'dolby truehd atmos'
-                            elif 'dolby' in meta_format:
-                                meta_format = 'dolby atmos'
-                            if meta_channels.strip() in ['atmos audio', 'atmos', '']:
-                                meta_channels = meta_sample_rate if meta_sample_rate in ['7.1', '5.1', '2.0', '1.0'] else '7.1'
-
-                            if 'khz' in meta_bitrate and 'khz' not in meta_sample_rate:
-                                meta_sample_rate = meta_bitrate
-                                meta_bitrate = ""
-
-                            if 'kbps' in meta_bit_depth:
-                                bitrate_part = re.search(r'(\d+\s*kbps)', meta_bit_depth)
-                                if bitrate_part:
-                                    meta_bitrate = bitrate_part.group(1)
-                                    bit_depth_part = re.search(r'(\d+)-bit', meta_bit_depth)
-                                    meta_bit_depth = bit_depth_part.group(1) + "-bit" if bit_depth_part else ""
-
-                        # Skip bit depth if it contains "DN -" (Dolby Digital Normalization)
-                        if 'dn -' in meta_bit_depth:
-                            meta_bit_depth = ""
-
-                        reduced_penalty = False
-                        if meta_idx > 0 and meta_bitrate and "kbps" in meta_bitrate:
-                            bitrate_value = int(meta_bitrate.replace("kbps", "").strip())
-                            if bitrate_value <= 258:
-                                reduced_penalty = True
-
-                        best_match_score = 0
-                        best_match_core_score = 0
-                        best_match_idx = -1
-                        track_found = False
-
-                        for idx, release_track in enumerate(available_release_tracks):
-                            release_track_lower = release_track.lower()
-                            current_match_score = 0
-                            core_match_score = 0
-
-                            lang_match = False
-                            if meta_lang and meta_lang in release_track_lower:
-                                lang_match = True
+                    if meta.get('debug'):
+                        log_and_print("[dim]Reduced penalty for generic BD format: 5.0[/dim]", release_logs)
+
+            # Video format checks
+            if 'video' in specs and meta_video_specs:
+                release_codec = str(specs['video'].get('codec', '')).lower()
+                meta_codec = str(meta_video_specs.get('codec', '')).lower()
+
+                codec_match = False
+                if ('avc' in release_codec and 'avc' in meta_codec) or \
+                   ('h.264' in release_codec and ('avc' in meta_codec or 'h.264' in meta_codec)):
+                    codec_match = True
+                    log_and_print("[green]✓[/green] Video codec match: AVC/H.264", release_logs)
+                elif ('hevc' in release_codec and 'hevc' in meta_codec) or \
+                     ('h.265' in release_codec and ('hevc' in meta_codec or 'h.265' in meta_codec)):
+                    codec_match = True
+                    log_and_print("[green]✓[/green] Video codec match: HEVC/H.265", release_logs)
+                elif ('vc-1' in release_codec and 'vc-1' in meta_codec) or \
+                     ('vc1' in release_codec and 'vc1' in meta_codec):
+                    codec_match = True
+                    log_and_print("[green]✓[/green] Video codec match: VC-1", release_logs)
+                elif ('mpeg-2' in release_codec and 'mpeg-2' in meta_codec) or \
+                     ('mpeg2' in release_codec and 'mpeg2' in meta_codec):
+                    codec_match = True
+                    log_and_print("[green]✓[/green] Video codec match: MPEG-2", release_logs)
+
+                if not codec_match:
+                    score -= 80
+                    log_and_print(f"[red]✗[/red] Video codec mismatch: {release_codec} vs {meta_codec}", release_logs)
+                    if meta.get('debug'):
+                        log_and_print("[dim]Penalty for video codec mismatch 80.0[/dim]", release_logs)
+
+                # Resolution match check
+                release_res = str(specs['video'].get('resolution', '')).lower()
+                meta_res = str(meta_video_specs.get('res', '')).lower()
+
+                res_match = False
+                if '1080' in release_res and '1080' in meta_res:
+                    res_match = True
+                    log_and_print("[green]✓[/green] Resolution match: 1080p", release_logs)
+                elif ('2160' in release_res or '4k' in release_res) and ('2160' in meta_res or '4k' in meta_res):
+                    res_match = True
+                    log_and_print("[green]✓[/green] Resolution match: 4K/2160p", release_logs)
+
+                if not res_match:
+                    score -= 80
+                    log_and_print(f"[red]✗[/red] Resolution mismatch: {release_res} vs {meta_res}", release_logs)
+                    if meta.get('debug'):
+                        log_and_print("[dim]Penalty for resolution mismatch 80.0[/dim]", release_logs)
+            else:
+                score -= 5
+                log_and_print("[yellow]?[/yellow] Cannot compare video formats", release_logs)
+
+            # Audio track checks
+            if 'audio' in specs and meta_audio_specs:
+                audio_matches = 0
+                partial_audio_matches = 0
+                missing_audio_tracks = 0
+                available_release_tracks = list(cast(list[str], specs.get('audio', [])))
+                reduced_penalty_count = 0
+                for meta_idx, meta_track in enumerate(meta_audio_specs):
+                    meta_lang = str(meta_track.get('language', '')).lower()
+                    meta_format = str(meta_track.get('codec', '')).lower().replace('audio', '')
+                    meta_channels = str(meta_track.get('channels', '')).lower().replace('audio', '')
+                    meta_sample_rate = str(meta_track.get('sample_rate', '')).lower()
+                    meta_bit_depth = str(meta_track.get('bit_depth', '')).lower()
+                    meta_bitrate = str(meta_track.get('bitrate', '')).lower()
+
+                    # Special handling for Atmos tracks
+                    if str(meta_track.get('atmos_why_you_be_like_this', '')).lower() == 'atmos' or 'atmos' in meta_channels:
+                        if 'truehd' in meta_format:
+                            meta_format = 'dolby truehd atmos'
+                        elif 'dolby' in meta_format:
+                            meta_format = 'dolby atmos'
+                        if meta_channels.strip() in ['atmos audio', 'atmos', '']:
+                            meta_channels = meta_sample_rate if meta_sample_rate in ['7.1', '5.1', '2.0', '1.0'] else '7.1'
+
+                        if 'khz' in meta_bitrate and 'khz' not in meta_sample_rate:
+                            meta_sample_rate = meta_bitrate
+                            meta_bitrate = ""
+
+                        if 'kbps' in meta_bit_depth:
+                            bitrate_part = re.search(r'(\d+\s*kbps)', meta_bit_depth)
+                            if bitrate_part:
+                                meta_bitrate = bitrate_part.group(1)
+                                bit_depth_part = re.search(r'(\d+)-bit', meta_bit_depth)
+                                meta_bit_depth = bit_depth_part.group(1) + "-bit" if bit_depth_part else ""
+
+                    # Skip bit depth if it contains "DN -" (Dolby Digital Normalization)
+                    if 'dn -' in meta_bit_depth:
+                        meta_bit_depth = ""
+
+                    reduced_penalty = False
+                    if meta_idx > 0 and meta_bitrate and "kbps" in meta_bitrate:
+                        bitrate_value = int(meta_bitrate.replace("kbps", "").strip())
+                        if bitrate_value <= 258:
+                            reduced_penalty = True
+
+                    best_match_score = 0
+                    best_match_core_score = 0
+                    best_match_idx = -1
+                    track_found = False
+
+                    for idx, release_track in enumerate(available_release_tracks):
+                        release_track_lower = release_track.lower()
+                        current_match_score = 0
+                        core_match_score = 0
+
+                        lang_match = False
+                        if meta_lang and meta_lang in release_track_lower:
+                            lang_match = True
+                            current_match_score += 1
+                            core_match_score += 1
+
+                        if not lang_match:
+                            continue
+
+                        format_match = False
+                        if 'lpcm' in meta_format and ('pcm' in release_track_lower or 'lpcm' in release_track_lower) or 'dts-hd' in meta_format and 'dts-hd' in release_track_lower or 'dts' in meta_format and 'dts' in release_track_lower or 'dolby' in meta_format and 'dolby' in release_track_lower or 'truehd' in meta_format and 'truehd' in release_track_lower or 'atmos' in meta_format and 'atmos' in release_track_lower:
+                            format_match = True
+                            current_match_score += 1
+                            core_match_score += 1
+
+                        channel_match = False
+                        if meta_channels:
+                            if '5.1' in meta_channels and '5.1' in release_track_lower or '7.1' in meta_channels and '7.1' in release_track_lower or '2.0' in meta_channels and '2.0' in release_track_lower or '2.0' in meta_channels and 'stereo' in release_track_lower or '1.0' in meta_channels and '1.0' in release_track_lower or '1.0' in meta_channels and 'mono' in release_track_lower:
+                                channel_match = True
                                 current_match_score += 1
                                 core_match_score += 1
+                            elif '2.0' in meta_channels and 'mono' in release_track_lower or '1.0' in meta_channels and ('2.0' in release_track_lower or 'stereo' in release_track_lower):
+                                channel_match = False
 
-                            if not lang_match:
-                                continue
+                        # Check sample rate and bit depth in the release track (may be in notes)
+                        if meta_sample_rate:
+                            sample_rate_str = meta_sample_rate.replace(' ', '').lower()
+                            if sample_rate_str in release_track_lower.replace(' ', '') or "note:" in release_track_lower and sample_rate_str in release_track_lower:
+                                current_match_score += 1
 
-                            format_match = False
-                            if 'lpcm' in meta_format and ('pcm' in release_track_lower or 'lpcm' in release_track_lower) or 'dts-hd' in meta_format and 'dts-hd' in release_track_lower or 'dts' in meta_format and 'dts' in release_track_lower or 'dolby' in meta_format and 'dolby' in release_track_lower or 'truehd' in meta_format and 'truehd' in release_track_lower or 'atmos' in meta_format and 'atmos' in release_track_lower:
-                                format_match = True
+                        if meta_bit_depth and meta_bit_depth != "":
+                            bit_depth_str = meta_bit_depth.lower()
+                            if bit_depth_str in release_track_lower or bit_depth_str.replace('-', '') in release_track_lower.replace(' ', '') or "note:" in release_track_lower and bit_depth_str.replace('-', '') in release_track_lower.replace(' ', ''):
                                 current_match_score += 1
-                                core_match_score += 1
 
-                            channel_match = False
-                            if meta_channels:
-                                if '5.1' in meta_channels and '5.1' in release_track_lower or '7.1' in meta_channels and '7.1' in release_track_lower or '2.0' in meta_channels and '2.0' in release_track_lower or '2.0' in meta_channels and 'stereo' in release_track_lower or '1.0' in meta_channels and '1.0' in release_track_lower or '1.0' in meta_channels and 'mono' in release_track_lower:
-                                    channel_match = True
-                                    current_match_score += 1
-                                    core_match_score += 1
-                                elif '2.0' in meta_channels and 'mono' in release_track_lower or '1.0' in meta_channels and ('2.0' in release_track_lower or 'stereo' in release_track_lower):
-                                    channel_match = False
-
-                            # Check sample rate and bit depth in the release track (may be in notes)
-                            if meta_sample_rate:
-                                sample_rate_str = meta_sample_rate.replace(' ', '').lower()
-                                if sample_rate_str in release_track_lower.replace(' ', '') or "note:" in release_track_lower and sample_rate_str in release_track_lower:
-                                    current_match_score += 1
-
-                            if meta_bit_depth and meta_bit_depth != "":
-                                bit_depth_str = meta_bit_depth.lower()
-                                if bit_depth_str in release_track_lower or bit_depth_str.replace('-', '') in release_track_lower.replace(' ', '') or "note:" in release_track_lower and bit_depth_str.replace('-', '') in release_track_lower.replace(' ', ''):
-                                    current_match_score += 1
-
-                            if meta_bitrate and meta_bitrate != "":
-                                bitrate_str = meta_bitrate.lower()
-                                if bitrate_str in release_track_lower or "note:" in release_track_lower and bitrate_str in release_track_lower:
-                                    current_match_score += 1
-
-                            if current_match_score > best_match_score:
-                                best_match_score = current_match_score
-                                best_match_core_score = core_match_score
-                                best_match_idx = idx
-
-                            if lang_match and (format_match or channel_match):
-                                track_found = True
-
-                        if track_found and best_match_idx >= 0:
-                            # Calculate matches based on core fields (language, format, channels)
-                            # Maximum core score: language (1) + format (1) + channels (1) = 3
-                            core_match_quality = best_match_core_score / 3.0
-                            matched_track = available_release_tracks[best_match_idx]
-
-                            if core_match_quality >= 1:
-                                audio_matches += 1
-                                log_and_print(f"[green]✓[/green] Found good match for {meta_lang} {meta_format} {meta_channels} track: '{matched_track}' (match quality: 100%)", release_logs)
-                            else:
-                                partial_audio_matches += 1
-                                percent = int(core_match_quality * 100)
-                                log_and_print(f"[yellow]⚠[/yellow] Found partial match for {meta_lang} {meta_format} {meta_channels} track: '{matched_track}' (match quality: {percent}%)", release_logs)
+                        if meta_bitrate and meta_bitrate != "":
+                            bitrate_str = meta_bitrate.lower()
+                            if bitrate_str in release_track_lower or "note:" in release_track_lower and bitrate_str in release_track_lower:
+                                current_match_score += 1
+
+                        if current_match_score > best_match_score:
+                            best_match_score = current_match_score
+                            best_match_core_score = core_match_score
+                            best_match_idx = idx
 
-                            available_release_tracks.pop(best_match_idx)
+                        if lang_match and (format_match or channel_match):
+                            track_found = True
 
+                    if track_found and best_match_idx >= 0:
+                        # Calculate matches based on core fields (language, format, channels)
+                        # Maximum core score: language (1) + format (1) + channels (1) = 3
+                        core_match_quality = best_match_core_score / 3.0
+                        matched_track = available_release_tracks[best_match_idx]
+
+                        if core_match_quality >= 1:
+                            audio_matches += 1
+                            log_and_print(f"[green]✓[/green] Found good match for {meta_lang} {meta_format} {meta_channels} track: '{matched_track}' (match quality: 100%)", release_logs)
                         else:
-                            missing_audio_tracks += 1
-                            if reduced_penalty:
-                                reduced_penalty_count += 1
-                                log_and_print(f"[red]✗[/red] No match found for {meta_lang} {meta_format} {meta_channels} track (Low bitrate, half penalty)", release_logs)
-                            else:
-                                log_and_print(f"[red]✗[/red] No match found for {meta_lang} {meta_format} {meta_channels} {meta_bitrate} track", release_logs)
+                            partial_audio_matches += 1
+                            percent = int(core_match_quality * 100)
+                            log_and_print(f"[yellow]⚠[/yellow] Found partial match for {meta_lang} {meta_format} {meta_channels} track: '{matched_track}' (match quality: {percent}%)", release_logs)
 
-                    total_tracks = len(meta_audio_specs)
-                    if total_tracks > 0:
-                        full_match_percentage = (audio_matches / total_tracks) * 100
-                        partial_match_percentage = (partial_audio_matches / total_tracks) * 100
+                        available_release_tracks.pop(best_match_idx)
 
-                        if audio_matches == total_tracks:
-                            audio_penalty = 0.0
-                        # Single bdinfo track penalty adjustment
-                        elif total_tracks == 1:
-                            if audio_matches == 1:
-                                audio_penalty = 0.0
-                            elif partial_audio_matches == 1:
-                                audio_penalty = 5.0
-                            else:
-                                audio_penalty = 10.0
-                        # Multiple bdinfo tracks penalty adjustment
+                    else:
+                        missing_audio_tracks += 1
+                        if reduced_penalty:
+                            reduced_penalty_count += 1
+                            log_and_print(f"[red]✗[/red] No match found for {meta_lang} {meta_format} {meta_channels} track (Low bitrate, half penalty)", release_logs)
                         else:
+                            log_and_print(f"[red]✗[/red] No match found for {meta_lang} {meta_format} {meta_channels} {meta_bitrate} track", release_logs)
+
+                total_tracks = len(meta_audio_specs)
+                if total_tracks > 0:
+                    full_match_percentage = (audio_matches / total_tracks) * 100
+                    partial_match_percentage = (partial_audio_matches / total_tracks) * 100
+
+                    if audio_matches == total_tracks:
+                        audio_penalty = 0.0
+                    # Single bdinfo track penalty adjustment
+                    elif total_tracks == 1:
+                        if audio_matches == 1:
                             audio_penalty = 0.0
-                            audio_penalty += partial_audio_matches * 2.5
-                            missing_tracks = total_tracks - (audio_matches + partial_audio_matches)
-                            normal_missing = missing_audio_tracks - reduced_penalty_count
-                            audio_penalty += normal_missing * 5.0
-                            audio_penalty += reduced_penalty_count * 2.5
+                        elif partial_audio_matches == 1:
+                            audio_penalty = 5.0
+                        else:
+                            audio_penalty = 10.0
+                    # Multiple bdinfo tracks penalty adjustment
+                    else:
+                        audio_penalty = 0.0
+                        audio_penalty += partial_audio_matches * 2.5
+                        missing_tracks = total_tracks - (audio_matches + partial_audio_matches)
+                        normal_missing = missing_audio_tracks - reduced_penalty_count
+                        audio_penalty += normal_missing * 5.0
+                        audio_penalty += reduced_penalty_count * 2.5
 
+                    if meta.get('debug'):
+                        log_and_print(f"[dim]Audio penalty: {audio_penalty:.1f}[/dim]", release_logs)
+                    score -= audio_penalty
+
+                    if audio_matches > 0:
+                        log_and_print(f"[green]✓[/green] Audio tracks with good matches: {audio_matches}/{total_tracks} ({full_match_percentage:.1f}% of tracks)", release_logs)
+                        if partial_audio_matches > 0:
+                            log_and_print(f"[yellow]⚠[/yellow] Audio tracks with partial matches: {partial_audio_matches}/{total_tracks} ({partial_match_percentage:.1f}% of tracks)", release_logs)
+                    elif partial_audio_matches > 0:
+                        log_and_print(f"[yellow]⚠[/yellow] There were only partial audio track matches: {partial_audio_matches}/{total_tracks}", release_logs)
+                    else:
+                        log_and_print("[red]✗[/red] No audio tracks match!", release_logs)
+
+                    extra_audio_tracks: list[str] = []
+                    if available_release_tracks:
+                        for release_track in available_release_tracks:
+                            extra_audio_tracks.append(release_track)
+                            log_and_print(f"[yellow]⚠[/yellow] Release has extra audio track not in BDInfo: {release_track}", release_logs)
+
+                    if extra_audio_tracks:
+                        extra_penalty = len(extra_audio_tracks) * 5
+                        score -= extra_penalty
+                        log_and_print(f"[red]-[/red] Found {len(extra_audio_tracks)} additional audio tracks in release not in BDInfo", release_logs)
                         if meta.get('debug'):
-                            log_and_print(f"[dim]Audio penalty: {audio_penalty:.1f}[/dim]", release_logs)
-                        score -= audio_penalty
-
-                        if audio_matches > 0:
-                            log_and_print(f"[green]✓[/green] Audio tracks with good matches: {audio_matches}/{total_tracks} ({full_match_percentage:.1f}% of tracks)", release_logs)
-                            if partial_audio_matches > 0:
-                                log_and_print(f"[yellow]⚠[/yellow] Audio tracks with partial matches: {partial_audio_matches}/{total_tracks} ({partial_match_percentage:.1f}% of tracks)", release_logs)
-                        elif partial_audio_matches > 0:
-                            log_and_print(f"[yellow]⚠[/yellow] There were only partial audio track matches: {partial_audio_matches}/{total_tracks}", release_logs)
-                        else:
-                            log_and_print("[red]✗[/red] No audio tracks match!", release_logs)
-
-                        extra_audio_tracks: list[str] = []
-                        if available_release_tracks:
-                            for release_track in available_release_tracks:
-                                extra_audio_tracks.append(release_track)
-                                log_and_print(f"[yellow]⚠[/yellow] Release has extra audio track not in BDInfo: {release_track}", release_logs)
-
-                        if extra_audio_tracks:
-                            extra_penalty = len(extra_audio_tracks) * 5
-                            score -= extra_penalty
-                            log_and_print(f"[red]-[/red] Found {len(extra_audio_tracks)} additional audio tracks in release not in BDInfo", release_logs)
-                            if meta.get('debug'):
-                                log_and_print(f"[dim]Extra audio tracks penalty: {extra_penalty:.1f} points[/dim]", release_logs)
+                            log_and_print(f"[dim]Extra audio tracks penalty: {extra_penalty:.1f} points[/dim]", release_logs)
 
-                else:
-                    score -= 5
-                    log_and_print("[yellow]?[/yellow] Cannot compare audio tracks", release_logs)
-
-                # Subtitle checks
-                if 'subtitles' in specs and meta_subtitles:
-                    sub_matches = 0
-                    missing_subs = 0
-                    available_release_subs = list(cast(list[str], specs.get('subtitles', [])))
-
-                    for meta_sub in meta_subtitles:
-                        meta_sub_lower = meta_sub.lower()
-                        sub_found = False
-                        matched_idx = -1
-
-                        for idx, release_sub in enumerate(available_release_subs):
-                            release_sub_lower = release_sub.lower()
-                            if meta_sub_lower in release_sub_lower or release_sub_lower in meta_sub_lower:
-                                sub_found = True
-                                matched_idx = idx
-                                break
+            else:
+                score -= 5
+                log_and_print("[yellow]?[/yellow] Cannot compare audio tracks", release_logs)
+
+            # Subtitle checks
+            if 'subtitles' in specs and meta_subtitles:
+                sub_matches = 0
+                missing_subs = 0
+                available_release_subs = list(cast(list[str], specs.get('subtitles', [])))
+
+                for meta_sub in meta_subtitles:
+                    meta_sub_lower = meta_sub.lower()
+                    sub_found = False
+                    matched_idx = -1
+
+                    for idx, release_sub in enumerate(available_release_subs):
+                        release_sub_lower = release_sub.lower()
+                        if meta_sub_lower in release_sub_lower or release_sub_lower in meta_sub_lower:
+                            sub_found = True
+                            matched_idx = idx
+                            break
 
-                        if sub_found and matched_idx >= 0:
-                            matched_sub = available_release_subs[matched_idx]
-                            sub_matches += 1
-                            log_and_print(f"[green]✓[/green] Subtitle match found: {meta_sub} -> {matched_sub}", release_logs)
-                            available_release_subs.pop(matched_idx)
-                        else:
-                            missing_subs += 1
-                            log_and_print(f"[red]✗[/red] No match found for subtitle: {meta_sub}", release_logs)
-
-                    total_subs = len(meta_subtitles)
-                    if total_subs > 0:
-                        match_percentage = (sub_matches / total_subs) * 100
-                        missing_tracks = total_subs - sub_matches
-                        sub_penalty = 10.0 if total_subs == 1 and sub_matches == 0 else 5.0 * missing_tracks
-                        if meta.get('debug'):
-                            log_and_print(f"[dim]Subtitle penalty: {sub_penalty:.1f}[/dim]", release_logs)
-                        score -= sub_penalty
+                    if sub_found and matched_idx >= 0:
+                        matched_sub = available_release_subs[matched_idx]
+                        sub_matches += 1
+                        log_and_print(f"[green]✓[/green] Subtitle match found: {meta_sub} -> {matched_sub}", release_logs)
+                        available_release_subs.pop(matched_idx)
+                    else:
+                        missing_subs += 1
+                        log_and_print(f"[red]✗[/red] No match found for subtitle: {meta_sub}", release_logs)
+
+                total_subs = len(meta_subtitles)
+                if total_subs > 0:
+                    match_percentage = (sub_matches / total_subs) * 100
+                    missing_tracks = total_subs - sub_matches
+                    sub_penalty = 10.0 if total_subs == 1 and sub_matches == 0 else 5.0 * missing_tracks
+                    if meta.get('debug'):
+                        log_and_print(f"[dim]Subtitle penalty: {sub_penalty:.1f}[/dim]", release_logs)
+                    score -= sub_penalty
 
-                        if sub_matches > 0:
-                            log_and_print(f"[green]✓[/green] Subtitle matches: {sub_matches}/{total_subs} ({match_percentage:.1f}%)", release_logs)
-                        else:
-                            log_and_print("[red]✗[/red] No subtitle tracks match!", release_logs)
-
-                        extra_subtitles: list[str] = []
-                        if available_release_subs:
-                            for release_sub in available_release_subs:
-                                extra_subtitles.append(release_sub)
-                                log_and_print(f"[yellow]⚠[/yellow] Release has extra subtitle not in BDInfo: {release_sub}", release_logs)
-
-                        if extra_subtitles:
-                            extra_penalty = len(extra_subtitles) * 5
-                            score -= extra_penalty
-                            log_and_print(f"[red]-[/red] Found {len(extra_subtitles)} additional subtitles in release not in BDInfo", release_logs)
-                            if meta.get('debug'):
-                                log_and_print(f"[dim]Extra subtitles penalty: {extra_penalty:.1f} points[/dim]", release_logs)
+                    if sub_matches > 0:
+                        log_and_print(f"[green]✓[/green] Subtitle matches: {sub_matches}/{total_subs} ({match_percentage:.1f}%)", release_logs)
+                    else:
+                        log_and_print("[red]✗[/red] No subtitle tracks match!", release_logs)
+
+                    extra_subtitles: list[str] = []
+                    if available_release_subs:
+                        for release_sub in available_release_subs:
+                            extra_subtitles.append(release_sub)
+                            log_and_print(f"[yellow]⚠[/yellow] Release has extra subtitle not in BDInfo: {release_sub}", release_logs)
+
+                    if extra_subtitles:
+                        extra_penalty = len(extra_subtitles) * 5
+                        score -= extra_penalty
+                        log_and_print(f"[red]-[/red] Found {len(extra_subtitles)} additional subtitles in release not in BDInfo", release_logs)
+                        if meta.get('debug'):
+                            log_and_print(f"[dim]Extra subtitles penalty: {extra_penalty:.1f} points[/dim]", release_logs)
 
-                else:
-                    score -= 5
-                    log_and_print("[yellow]?[/yellow] Cannot compare subtitles", release_logs)
             else:
-                score -= 80
-                log_and_print("[red]✗[/red] No specifications available for this release", release_logs)
-
-            log_and_print(f"[blue]Final score: {score:.1f}/100 for {release['title']} ({release['country']})[/blue]", release_logs)
-            log_and_print("", release_logs)
-            # Store flags on the release for later reference
-            release['_generic_format'] = generic_format if 'specs' in release and 'discs' in cast(Mapping[str, Any], release['specs']) else False
-            release['_specs_missing'] = specs_missing if 'specs' in release else True
-            scored_releases.append((score, release))
-            logs.append((release, release_logs))
+                score -= 5
+                log_and_print("[yellow]?[/yellow] Cannot compare subtitles", release_logs)
+        else:
+            score -= 80
+            log_and_print("[red]✗[/red] No specifications available for this release", release_logs)
+
+        log_and_print(f"[blue]Final score: {score:.1f}/100 for {release['title']} ({release['country']})[/blue]", release_logs)
+        log_and_print("", release_logs)
+        # Store flags on the release for later reference
+        release['_generic_format'] = generic_format if 'specs' in release and 'discs' in cast(Mapping[str, Any], release['specs']) else False
+        release['_specs_missing'] = specs_missing if 'specs' in release else True
+        scored_releases.append((score, release))
+        logs.append((release, release_logs))
+        return score
+
+    # Without anyone to confirm a choice, the first perfect match is the one that will be used,
+    # so the remaining releases need not be fetched
+    stop_at_perfect = (
+        bool(meta.get('unattended')) and not meta.get('unattended_confirm', False)
+        and float(meta.get('bluray_score', 100) or 100) < 100
+    )
+
+    # Release pages are fetched concurrently, but scored in order as they become available
+    detailed_releases: list[Release] = []
+    fetches = [asyncio.create_task(fetch_release_details(release, meta)) for release in releases]
+    try:
+        for idx, (release, fetch) in enumerate(zip(releases, fetches), 1):
+            console.print(f"[cyan]Processing release {idx}/{len(releases)}: {release['title']} ({release['country']})")
+            detailed_release = await fetch
+            detailed_releases.append(detailed_release)
+            score = score_release(idx, len(releases), detailed_release)
+            if stop_at_perfect and score >= 100 and idx < len(releases):
+                console.print(f"[green]Perfect match found, skipping the remaining {len(releases) - idx} releases[/green]")
+                break
+    finally:
+        for fetch in fetches:
+            fetch.cancel()
+        await asyncio.gather(*fetches, return_exceptions=True)
+
+    if meta.get('debug'):
+        console.print()
+        cli_ui.info_section("Processing Complete")
+    cli_ui.info(f"Successfully processed {len(detailed_releases)} releases")
+
+    if detailed_releases:
 
         scored_releases.sort(reverse=True, key=lambda x: x[0])
 
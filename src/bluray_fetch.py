@@ -0,0 +1,156 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Paced, cached fetching of blu-ray.com pages.
+
+Every request to blu-ray.com (search, the release list of each movie and the
+page of each release) goes through one fetcher. Up to ``bluray_concurrency``
+requests run at once, and they share the host's allowance
+(``bluray_request_interval`` seconds per request, ``bluray_request_burst`` at
+once after a pause), so titles with many releases use the whole allowance
+without exceeding it. Request slots are handed out in the order they were
+asked for, so release pages arrive roughly in list order and can be processed
+as they come. When the site answers with its anti-scraping page, every
+request waits out the backoff, not just the one that was blocked.
+
+Pages that loaded are stored in the metadata cache, keyed by IMDb or product
+id, so a re-run doesn't fetch them again. Release lists and release pages use
+the ``bluray`` source; search results, which change as releases are added,
+use ``bluray_search`` and expire sooner.
+"""
+import asyncio
+import time
+from collections.abc import Mapping
+from typing import Any, Optional, cast
+
+import httpx
+
+from src.console import console
+from src.http_pool import http_pool
+from src.loop_bound import LoopBound
+from src.metadata_cache import metadata_cache
+
+DEFAULT_CONCURRENCY = 3
+DEFAULT_INTERVAL = 1.5
+DEFAULT_BURST = 3
+
+MAX_RETRIES = 2
+BACKOFF_BASE = 3.0
+
+# Shown by blu-ray.com instead of the page when it blocks a client
+BLOCKED_MARKER = "No index"
+
+
+class BlurayFetcher(LoopBound):
+    def __init__(self) -> None:
+        self.concurrency = DEFAULT_CONCURRENCY
+        self.interval = DEFAULT_INTERVAL
+        self.burst = DEFAULT_BURST
+        self.requests = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+
+    def configure(self, config: dict[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get("DEFAULT", {}))
+        try:
+            self.concurrency = max(1, int(default_cfg.get("bluray_concurrency", DEFAULT_CONCURRENCY)))
+            self.interval = max(0.0, float(default_cfg.get("bluray_request_interval", DEFAULT_INTERVAL)))
+            self.burst = max(1, int(default_cfg.get("bluray_request_burst", DEFAULT_BURST)))
+        except (TypeError, ValueError):
+            self.concurrency, self.interval, self.burst = DEFAULT_CONCURRENCY, DEFAULT_INTERVAL, DEFAULT_BURST
+        self._reset()
+
+    def _reset(self) -> None:
+        self._semaphore = None
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+
+    def _cached(self, cache_key: Optional[str], source: str) -> Optional[str]:
+        if cache_key is None:
+            return None
+        cached = metadata_cache.get(cache_key)
+        if cached is None:
+            return None
+        page, age = cached
+        if age > metadata_cache.ttl_for(source) or not isinstance(page, str) or BLOCKED_MARKER in page:
+            return None
+        return page
+
+    def _reserve_slot(self) -> float:
+        """Claim the next request slot and return the seconds until it starts."""
+        now = time.monotonic()
+        # Up to burst requests may start together once the allowance has built up
+        start = max(now, self._next_slot - self.interval * (self.burst - 1))
+        self._next_slot = max(self._next_slot, now) + self.interval
+        return start - now
+
+    async def fetch(
+        self,
+        url: str,
+        headers: dict[str, str],
+        meta: Mapping[str, Any],
+        cache_key: Optional[str] = None,
+        source: str = "bluray",
+        timeout: float = 15.0,
+    ) -> Optional[str]:
+        """Return the page at url, from the cache when possible; None if every attempt failed."""
+        self._check_loop()
+        if cache_key is not None and metadata_cache.enabled:
+            page = await asyncio.to_thread(self._cached, cache_key, source)
+            if page is not None:
+                metadata_cache.hits += 1
+                if meta.get('debug'):
+                    console.print(f"[green]Using cached blu-ray.com page for {url}[/green]")
+                return page
+            metadata_cache.misses += 1
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        backoff_time = BACKOFF_BASE
+        async with self._semaphore:
+            for attempt in range(1, MAX_RETRIES + 2):
+                blocked_for = self._blocked_until - time.monotonic()
+                if blocked_for > 0:
+                    await asyncio.sleep(blocked_for)
+                wait = self._reserve_slot()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                if meta.get('debug'):
+                    console.print(f"[yellow]Sending request to {url} (attempt {attempt}/{MAX_RETRIES + 1})...[/yellow]")
+                self.requests += 1
+                try:
+                    async with http_pool.session("bluray", timeout=timeout, follow_redirects=True) as client:
+                        response = await client.get(url, headers=headers)
+                except httpx.RequestError as e:
+                    console.print(f"[red]HTTP request error when accessing {url} (attempt {attempt}/{MAX_RETRIES + 1}): {str(e)}[/red]")
+                else:
+                    if response.status_code == 200 and BLOCKED_MARKER not in response.text:
+                        if cache_key is not None:
+                            await asyncio.to_thread(metadata_cache.set, source, cache_key, response.text)
+                        return response.text
+                    if BLOCKED_MARKER in response.text:
+                        console.print(f"[red]Blocked by blu-ray.com when accessing {url} (attempt {attempt}/{MAX_RETRIES + 1})[/red]")
+                        if meta.get('debug'):
+                            console.print(f"[dim]Response preview: {response.text[:150]}...[/dim]")
+                        # Back off every request to the site, not only this one
+                        self._blocked_until = max(self._blocked_until, time.monotonic() + backoff_time * 2)
+                    else:
+                        console.print(f"[red]Failed to get {url}, status code: {response.status_code} (attempt {attempt}/{MAX_RETRIES + 1})[/red]")
+
+                if attempt > MAX_RETRIES:
+                    break
+                backoff_time *= 2
+                if meta.get('debug'):
+                    console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
+                await asyncio.sleep(backoff_time)
+
+        console.print(f"[red]Maximum retries reached, giving up on {url}[/red]")
+        return None
+
+    def summary(self) -> str:
+        return f"{self.requests} requests"
+
+
+bluray_fetcher = BlurayFetcher()
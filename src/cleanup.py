@@ -8,6 +8,7 @@ import re
 import subprocess
 import sys
 import threading
+from collections.abc import AsyncIterator
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
@@ -30,8 +31,32 @@ erase_key: Optional[str] = None
 
 
 class CleanupManager:
+    def __init__(self) -> None:
+        self._defer_depth = 0
+        self._cleanup_requested = False
+
+    @contextlib.asynccontextmanager
+    async def deferred(self) -> AsyncIterator[None]:
+        """Hold cleanup() calls made inside the block and run a single cleanup when it exits.
+
+        cleanup() cancels every other task and kills child processes, which would tear
+        down concurrently running stages (e.g. torrent hashing next to screenshots).
+        """
+        self._defer_depth += 1
+        try:
+            yield
+        finally:
+            self._defer_depth -= 1
+            if self._defer_depth == 0 and self._cleanup_requested:
+                self._cleanup_requested = False
+                await self.cleanup()
+
     async def cleanup(self) -> None:
         """Ensure all running tasks, threads, and subprocesses are properly cleaned up before exiting."""
+        if self._defer_depth:
+            self._cleanup_requested = True
+            return
+
         # console.print("[yellow]Cleaning up tasks before exiting...[/yellow]")
 
         # Step 1: Shutdown ThreadPoolExecutor **before checking for threads**
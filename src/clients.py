@@ -13,6 +13,7 @@ import qbittorrentapi
 from torf import Torrent
 
 from src.console import console
+from src.piece_layout import layout_index
 from src.torrent_clients import DelugeClientMixin, QbittorrentClientMixin, RtorrentClientMixin, TransmissionClientMixin
 
 # Secure XML-RPC client using defusedxml to prevent XML attacks
@@ -545,6 +546,8 @@ class Clients(QbittorrentClientMixin, RtorrentClientMixin, DelugeClientMixin, Tr
             except Exception as e:
                 console.print(f'[bold red]Error reading torrent file: {e}')
                 return valid, torrent_path
+            # Remember the layout even if it is rejected here, its pieces may still be reused
+            layout_index.record(torrent)
 
             # Reuse if disc and basename matches or --keep-folder was specified
             if (meta.get('is_disc') and meta.get('is_disc') != '') or (meta.get('keep_folder', False) and meta.get('isdir', False)):
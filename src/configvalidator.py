@@ -37,6 +37,7 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "cutoff_screens": (str, int),
     "thumbnail_size": (str, int),
     "frame_overlay": (bool,),
+    "screens_prescan": (bool,),
     "tone_map": (bool,),
     "use_libplacebo": (bool,),
     "ffmpeg_is_good": (bool,),
@@ -45,6 +46,9 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "process_limit": (str, int),
     "threads": (str, int),
     "ffmpeg_limit": (bool,),
+    "optimize_images": (bool,),
+    "optimize_images_cache_mb": (int,),
+    "ffmpeg_batch_screens": (bool,),
     "multiScreens": (str, int),
     "pack_thumb_size": (str, int),
     "charLimit": (str, int),
@@ -54,13 +58,25 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "skip_auto_torrent": (bool,),
     "sfx_on_prompt": (bool,),
     "tracker_pass_checks": (str, int),
+    "queue_workers": (int,),
+    "queue_budgets": (dict,),
+    "queue_tracker_interval": (int, float),
+    "upload_concurrency": (int,),
+    "upload_retries": (int,),
+    "upload_retry_budget": (int,),
+    "upload_tracker_limits": (dict,),
+    "dupe_search_cache_ttl": (int, float),
+    "http2": (bool,),
     "use_largest_playlist": (bool,),
+    "bdinfo_parallel_scans": (int,),
+    "bdinfo_scans_per_device": (int,),
     "keep_images": (bool,),
     "only_id": (bool,),
     "use_sonarr": (bool,),
     "use_radarr": (bool,),
     "mkbrr": (bool,),
     "mkbrr_threads": (str, int),
+    "piece_hash_reuse": (bool,),
     "user_overrides": (bool,),
     "ping_unit3d": (bool,),
     "get_bluray_info": (bool,),
@@ -69,6 +85,9 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "bluray_image_size": (str, int),
     "bluray_score": (float, int),
     "bluray_single_score": (float, int),
+    "bluray_concurrency": (int,),
+    "bluray_request_interval": (float, int),
+    "bluray_request_burst": (int,),
     "keep_meta": (bool,),
     "show_upload_duration": (bool,),
     "print_tracker_messages": (bool,),
@@ -81,6 +100,14 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "cross_seeding": (bool,),
     "cross_seed_check_everything": (bool,),
     "auto_mode": (bool, str),
+    "metadata_cache": (bool,),
+    "metadata_cache_dir": (str,),
+    "search_index_interval": (int, float),
+    "metadata_cache_ttl_hours": (dict,),
+    "metadata_cache_stale_hours": (int, float),
+    "metadata_cache_max_mb": (int, float),
+    "media_report_cache": (bool,),
+    "media_report_cache_max_mb": (int, float),
 }
 
 # Valid image hosts
@@ -1,7 +1,14 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import contextlib
+import html
+import re
+from functools import lru_cache
+from typing import Optional
 
+from rich.color import Color
 from rich.console import Console
+from rich.style import Style
+from rich.terminal_theme import DEFAULT_TERMINAL_THEME
 from rich.text import Text
 
 
@@ -48,6 +55,175 @@ def ansi_to_html(ansi_chunk: str, width: int = 120) -> str:
         return f"<div>{_html.escape(ansi_chunk)}</div>"
 
 
+# CSI sequences (SGR and cursor/erase codes), OSC sequences (hyperlinks, titles), other escapes, CR and LF
+_ANSI_TOKEN_RE = re.compile(r"\x1b\[([0-?]*)[ -/]*([@-~])|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-Z\\-_]|\r|\n")
+# An escape sequence cut off at the end of a chunk
+_PARTIAL_ANSI_RE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*\x1b?)?$")
+_SGR_PARAMS_RE = re.compile(r"[0-9;:]*")
+# Control characters other than tab, which have no place in the HTML
+_CONTROL_RE = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+
+_HTML_PRE = "<pre style=\"font-family:Menlo,'DejaVu Sans Mono',consolas,'Courier New',monospace\"><code style=\"font-family:inherit\">"
+_HTML_POST = "</code></pre>"
+
+# SGR attribute codes: code -> (attribute, value)
+_SGR_ATTRIBUTES: dict[int, tuple[str, bool]] = {
+    1: ("bold", True), 2: ("dim", True), 3: ("italic", True), 4: ("underline", True),
+    5: ("blink", True), 6: ("blink", True), 7: ("reverse", True), 8: ("conceal", True),
+    9: ("strike", True), 53: ("overline", True),
+    21: ("bold", False), 23: ("italic", False), 24: ("underline", False), 25: ("blink", False),
+    27: ("reverse", False), 28: ("conceal", False), 29: ("strike", False), 55: ("overline", False),
+}
+_SGR_FLAGS = ("bold", "dim", "italic", "underline", "blink", "reverse", "conceal", "strike", "overline")
+
+
+@lru_cache(maxsize=1024)
+def _sgr_css(color: Optional[Color], bgcolor: Optional[Color], flags: frozenset[str]) -> str:
+    # The same CSS Rich's HTML export produces for this style
+    style = Style(color=color, bgcolor=bgcolor, **{flag: flag in flags for flag in _SGR_FLAGS})
+    return style.get_html_style(DEFAULT_TERMINAL_THEME)
+
+
+class AnsiHtmlStream:
+    """Incremental ANSI -> HTML conversion for one output stream of a Web UI session.
+
+    Unlike ansi_to_html, no Console is created: escape sequences are parsed
+    directly and SGR state carries over from one chunk to the next, as does an
+    escape sequence split between chunks. Text rewritten after a carriage
+    return (progress bars) replaces what came before it on the line, so only
+    the final state of each line is sent.
+
+    feed() returns (fragment, replace) pairs. A line left open at the end of a
+    chunk is sent as a fragment of its own; when a later chunk continues or
+    rewrites that line, its first fragment has replace set and should take the
+    open line's place instead of being appended.
+    """
+
+    def __init__(self) -> None:
+        self._color: Optional[Color] = None
+        self._bgcolor: Optional[Color] = None
+        self._flags: set[str] = set()
+        self._css = ""
+        self._runs: list[tuple[str, str]] = []  # (css, text) of the current line
+        self._rewind = False  # a carriage return was seen; the next text starts the line again
+        self._open = False  # the last fragment returned ended with this line, unfinished
+        self._dirty = False  # text was added to the current line by this feed
+        self._carry = ""
+
+    def feed(self, chunk: str) -> list[tuple[str, bool]]:
+        text = self._carry + chunk
+        self._carry = ""
+        partial = _PARTIAL_ANSI_RE.search(text)
+        if partial:
+            self._carry = text[partial.start():]
+            text = text[:partial.start()]
+
+        fragments: list[tuple[str, bool]] = []
+        replace = self._open
+        self._dirty = False
+        lines: list[str] = []
+        pos = 0
+        for token in _ANSI_TOKEN_RE.finditer(text):
+            self._add_text(text[pos:token.start()])
+            pos = token.end()
+            value = token.group(0)
+            if value == "\n":
+                if replace:
+                    fragments.append((self._wrap([self._render_line()]), True))
+                    replace = False
+                else:
+                    lines.append(self._render_line())
+                self._runs = []
+                self._rewind = False
+            elif value == "\r":
+                self._rewind = True
+            elif token.group(2) == "m":
+                self._apply_sgr(token.group(1))
+            # Other sequences (cursor movement, erasing, hyperlinks) are dropped
+        self._add_text(text[pos:])
+
+        if lines:
+            fragments.append((self._wrap(lines), False))
+        if self._runs and self._dirty:
+            fragments.append((self._wrap([self._render_line()]), replace))
+            self._open = True
+        else:
+            # An open line that has not changed, or was rewound but not yet rewritten, stays on screen as it is
+            self._open = replace
+        return fragments
+
+    def _add_text(self, text: str) -> None:
+        text = _CONTROL_RE.sub("", text)
+        if not text:
+            return
+        if self._rewind:
+            self._runs = []
+            self._rewind = False
+        self._dirty = True
+        if self._runs and self._runs[-1][0] == self._css:
+            self._runs[-1] = (self._css, self._runs[-1][1] + text)
+        else:
+            self._runs.append((self._css, text))
+
+    def _render_line(self) -> str:
+        return "".join(
+            f'<span style="{css}">{html.escape(text, quote=False)}</span>' if css else html.escape(text, quote=False)
+            for css, text in self._runs
+        )
+
+    @staticmethod
+    def _wrap(lines: list[str]) -> str:
+        return _HTML_PRE + "\n".join(lines) + _HTML_POST
+
+    def _apply_sgr(self, params: str) -> None:
+        if not _SGR_PARAMS_RE.fullmatch(params):
+            return
+        codes = [int(param) if param else 0 for param in params.replace(":", ";").split(";")]
+        i = 0
+        while i < len(codes):
+            code = codes[i]
+            if code == 0:
+                self._color = None
+                self._bgcolor = None
+                self._flags.clear()
+            elif code == 22:
+                self._flags.difference_update(("bold", "dim"))
+            elif code in _SGR_ATTRIBUTES:
+                attribute, enabled = _SGR_ATTRIBUTES[code]
+                if enabled:
+                    self._flags.add(attribute)
+                else:
+                    self._flags.discard(attribute)
+            elif 30 <= code <= 37:
+                self._color = Color.from_ansi(code - 30)
+            elif 90 <= code <= 97:
+                self._color = Color.from_ansi(code - 82)
+            elif code == 39:
+                self._color = None
+            elif 40 <= code <= 47:
+                self._bgcolor = Color.from_ansi(code - 40)
+            elif 100 <= code <= 107:
+                self._bgcolor = Color.from_ansi(code - 92)
+            elif code == 49:
+                self._bgcolor = None
+            elif code in (38, 48):
+                color: Optional[Color] = None
+                if i + 2 < len(codes) and codes[i + 1] == 5:
+                    color = Color.from_ansi(codes[i + 2] & 0xFF)
+                    i += 2
+                elif i + 4 < len(codes) and codes[i + 1] == 2:
+                    color = Color.from_rgb(codes[i + 2] & 0xFF, codes[i + 3] & 0xFF, codes[i + 4] & 0xFF)
+                    i += 4
+                else:
+                    break
+                if code == 38:
+                    self._color = color
+                else:
+                    self._bgcolor = color
+            i += 1
+        self._css = _sgr_css(self._color, self._bgcolor, frozenset(self._flags))
+
+
 # Create a shared Console instance used throughout the project.
 # Force terminal mode so that when other processes import `src.console.console`
 # they will emit ANSI color codes to stdout even when not attached to a real TTY.
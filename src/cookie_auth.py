@@ -17,6 +17,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from src.console import console
+from src.http_pool import http_pool
 from src.trackers.COMMON import COMMON
 
 
@@ -115,7 +116,7 @@ class CookieValidator:
         }
 
         try:
-            async with httpx.AsyncClient(headers=headers, timeout=30.0, follow_redirects=True) as client:
+            async with http_pool.session(tracker, headers=headers, timeout=30.0, follow_redirects=True) as client:
                 # Perform login
                 login_data = {
                     "username": username,
@@ -237,7 +238,7 @@ class CookieValidator:
         }
 
         try:
-            async with httpx.AsyncClient(headers=headers, timeout=20.0, cookies=cookie_jar) as session:
+            async with http_pool.session(tracker, bind_cookies=True, headers=headers, timeout=20.0, cookies=cookie_jar) as session:
                 response = await session.get(test_url)
                 text = response.text
                 # if meta.get('debug', False):
@@ -538,7 +539,7 @@ class CookieAuthUploader:
         else:
             success = False
             try:
-                async with httpx.AsyncClient(headers=headers, timeout=30.0, cookies=upload_cookies, follow_redirects=True) as session:
+                async with http_pool.session(tracker, bind_cookies=True, headers=headers, timeout=30.0, cookies=upload_cookies, follow_redirects=True) as session:
                     response = await session.post(upload_url, data=data, files=files)
 
                     if success_text and success_text in response.text:
@@ -1,10 +1,13 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import contextlib
+import itertools
 import json
 import os
 import platform
 import re
 import shutil
+import time
 import traceback
 from collections import OrderedDict, defaultdict
 from glob import glob
@@ -19,15 +22,32 @@ from pymediainfo import MediaInfo
 from bin.get_playlist import MplsParser
 from src.console import console
 from src.exportmi import setup_mediainfo_library
+from src.media_report_cache import media_report_cache
 
 PlaylistItem = dict[str, Any]
 PlaylistInfo = dict[str, Any]
 
+# BDInfo scans running at once, across all discs
+DEFAULT_PARALLEL_SCANS = 2
+# Scans running at once on one device; discs that share a device are scanned one after another
+DEFAULT_SCANS_PER_DEVICE = 1
+# Seconds between progress lines of a scan whose output is captured
+PROGRESS_INTERVAL = 10.0
+
 
 class DiscParse:
     def __init__(self, config: dict[str, Any]) -> None:
         self.config = config
         self.mediainfo_config: Optional[dict[str, Any]] = None
+        default_cfg = cast(dict[str, Any], config.get('DEFAULT', {}))
+        try:
+            self.parallel_scans = max(1, int(default_cfg.get('bdinfo_parallel_scans', DEFAULT_PARALLEL_SCANS)))
+        except (TypeError, ValueError):
+            self.parallel_scans = DEFAULT_PARALLEL_SCANS
+        try:
+            self.scans_per_device = max(1, int(default_cfg.get('bdinfo_scans_per_device', DEFAULT_SCANS_PER_DEVICE)))
+        except (TypeError, ValueError):
+            self.scans_per_device = DEFAULT_SCANS_PER_DEVICE
 
     def _calculate_playlist_score(self, playlist: PlaylistInfo) -> float:
         """Calculate weighted score for playlist selection.
@@ -106,6 +126,8 @@ class DiscParse:
         if meta.get('emby', False):
             return discs, meta_discs
 
+        # (disc index, disc path, valid playlists, selected playlists) for each disc that needs scanning
+        pending: list[tuple[int, str, list[PlaylistInfo], list[PlaylistInfo]]] = []
         for i in range(len(discs)):
             bdinfo_text = None
             path = os.path.abspath(discs[i]['path'])
@@ -255,70 +277,31 @@ class DiscParse:
                                 except ValueError:
                                     console.print("[bold red]Invalid input. Please try again.")
 
-                for idx, playlist in enumerate(selected_playlists):
-                    console.print(f"[bold green]Scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds")
-                    playlist_number = playlist['file'].replace(".mpls", "")
-                    playlist_report_path = os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt")
-
-                    if os.path.exists(playlist_report_path):
-                        bdinfo_text = playlist_report_path
-                    else:
-                        try:
-                            bdinfo_executable = None
-                            # Prefer the bundled bdinfo binary for the detected OS/arch
-                            system = platform.system().lower()
-                            machine = platform.machine().lower()
-                            if system == "linux":
-                                if machine in ("x86_64", "amd64"):
-                                    folder = "linux/amd64"
-                                elif machine in ("arm64", "aarch64"):
-                                    folder = "linux/arm64"
-                                else:
-                                    folder = "linux/arm"
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, path, '-m', playlist['file'], save_dir]
-                            elif system == "darwin":
-                                folder = "macos/arm64" if machine in ("arm64",) else "macos/x86_64"
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, path, '-m', playlist['file'], save_dir]
-                            elif system == "windows":
-                                # Windows builds are provided as x64
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/windows/x86_64/bdinfo.exe"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, '-m', playlist['file'], path, save_dir]
-
-                            # Fallback to system-installed commands if bundled binary not present
-                            if bdinfo_executable is None:
-                                if shutil.which("bdinfo"):
-                                    bdinfo_executable = ["bdinfo", path, '-m', playlist['file'], save_dir]
-                                elif shutil.which("BDInfo"):
-                                    bdinfo_executable = ["BDInfo", path, '-m', playlist['file'], save_dir]
-                                else:
-                                    console.print(f"[bold red]BDInfo not found. Please download bdinfo and place it under {base_dir}/bin/bdinfo/ or install a system bdinfo/BDInfo binary[/bold red]")
-                                    continue
-
-                            if bdinfo_executable:
-                                proc = await asyncio.create_subprocess_exec(
-                                    *bdinfo_executable
-                                )
-                                await proc.wait()
+                pending.append((i, path, valid_playlists, selected_playlists))
 
-                                if proc.returncode != 0:
-                                    console.print(f"[bold red]BDInfo failed with return code {proc.returncode}[/bold red]")
-                                    continue
+            else:
+                discs = meta_discs
 
-                                # Rename the output to playlist_report_path
-                                for file in os.listdir(save_dir):
-                                    if file.startswith("BDINFO") and file.endswith(".txt"):
-                                        bdinfo_text = os.path.join(save_dir, file)
-                                        shutil.move(bdinfo_text, playlist_report_path)
-                                        bdinfo_text = playlist_report_path  # Update bdinfo_text to the renamed file
-                                        break
-                        except Exception as e:
-                            console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
-                            continue
+        # Selection is interactive, so every disc's playlists are chosen before any scan starts
+        scan_slots = asyncio.Semaphore(self.parallel_scans)
+        device_slots: dict[int, asyncio.Semaphore] = {}
+        stream_progress = self.parallel_scans > 1 and sum(len(selected) for _, _, _, selected in pending) > 1
+        scans = [
+            [
+                asyncio.ensure_future(self._scan_playlist(i, path, playlist, save_dir, base_dir, scan_slots, device_slots, stream_progress))
+                for playlist in selected
+            ]
+            for i, path, _, selected in pending
+        ]
+        try:
+            for (i, path, valid_playlists, selected_playlists), disc_scans in zip(pending, scans):
+                for idx, playlist in enumerate(selected_playlists):
+                    # Reports are read in selection order while the remaining scans carry on
+                    scanned = await disc_scans[idx]
+                    if scanned is None:
+                        continue
+                    bdinfo_text = scanned
+                    playlist_number = playlist['file'].replace(".mpls", "")
 
                     # Process the BDInfo report in the while True loop
                     while True:
@@ -407,11 +390,142 @@ class DiscParse:
                             await asyncio.sleep(5)
                             continue
                         break
+        finally:
+            for task in itertools.chain.from_iterable(scans):
+                task.cancel()
+
+        return discs, discs[0]['bdinfo']
 
+    def _bdinfo_command(self, base_dir: str, path: str, playlist_file: str, output_dir: str) -> Optional[list[str]]:
+        # Prefer the bundled bdinfo binary for the detected OS/arch
+        system = platform.system().lower()
+        machine = platform.machine().lower()
+        if system == "linux":
+            if machine in ("x86_64", "amd64"):
+                folder = "linux/amd64"
+            elif machine in ("arm64", "aarch64"):
+                folder = "linux/arm64"
             else:
-                discs = meta_discs
+                folder = "linux/arm"
+            bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, path, '-m', playlist_file, output_dir]
+        elif system == "darwin":
+            folder = "macos/arm64" if machine in ("arm64",) else "macos/x86_64"
+            bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, path, '-m', playlist_file, output_dir]
+        elif system == "windows":
+            # Windows builds are provided as x64
+            bdinfo_path = f"{base_dir}/bin/bdinfo/windows/x86_64/bdinfo.exe"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, '-m', playlist_file, path, output_dir]
+
+        # Fallback to system-installed commands if bundled binary not present
+        if shutil.which("bdinfo"):
+            return ["bdinfo", path, '-m', playlist_file, output_dir]
+        if shutil.which("BDInfo"):
+            return ["BDInfo", path, '-m', playlist_file, output_dir]
+        return None
 
-        return discs, discs[0]['bdinfo']
+    async def _scan_playlist(
+        self,
+        i: int,
+        path: str,
+        playlist: PlaylistInfo,
+        save_dir: str,
+        base_dir: str,
+        scan_slots: asyncio.Semaphore,
+        device_slots: dict[int, asyncio.Semaphore],
+        stream_progress: bool,
+    ) -> Optional[str]:
+        """Path of the BDInfo report for one playlist, scanning it if needed; None if the scan failed.
+
+        A scan holds a slot of the overall limit and one of its device, so discs
+        that share a device are read one after another.
+        """
+        playlist_number = playlist['file'].replace(".mpls", "")
+        playlist_report_path = os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt")
+        if os.path.exists(playlist_report_path):
+            return playlist_report_path
+
+        # Keyed by the playlist and every stream file it plays
+        report_key = await media_report_cache.key_for("bdinfo", [playlist['path'], *(item['file'] for item in playlist['items'])])
+        cached_report = await media_report_cache.load(report_key)
+        if cached_report is not None:
+            console.print(f"[green]Using cached BDInfo report for {playlist['file']}")
+            await asyncio.to_thread(Path(playlist_report_path).write_text, str(cached_report), encoding="utf-8")
+            return playlist_report_path
+
+        # Each scan writes to its own directory, so concurrent reports can't be mixed up
+        output_dir = os.path.join(save_dir, f"bdinfo_{i + 1}_{playlist_number}")
+        bdinfo_executable = self._bdinfo_command(base_dir, path, playlist['file'], output_dir)
+        if bdinfo_executable is None:
+            console.print(f"[bold red]BDInfo not found. Please download bdinfo and place it under {base_dir}/bin/bdinfo/ or install a system bdinfo/BDInfo binary[/bold red]")
+            return None
+
+        try:
+            device = os.stat(path).st_dev
+        except OSError:
+            device = -1
+        device_slot = device_slots.setdefault(device, asyncio.Semaphore(self.scans_per_device))
+        try:
+            async with device_slot, scan_slots:
+                console.print(f"[bold green]Scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds")
+                started = time.monotonic()
+                os.makedirs(output_dir, exist_ok=True)
+                returncode = await self._run_bdinfo(bdinfo_executable, f"Disc {i + 1} {playlist['file']}", stream_progress)
+            if returncode != 0:
+                console.print(f"[bold red]BDInfo failed with return code {returncode}[/bold red]")
+                return None
+            if stream_progress:
+                console.print(f"[green]Scanned {playlist['file']} in {time.monotonic() - started:.0f}s")
+
+            # Rename the output to playlist_report_path
+            for file in os.listdir(output_dir):
+                if file.startswith("BDINFO") and file.endswith(".txt"):
+                    shutil.move(os.path.join(output_dir, file), playlist_report_path)
+                    report = await asyncio.to_thread(Path(playlist_report_path).read_text, encoding="utf-8", errors="replace")
+                    await media_report_cache.store(report_key, report)
+                    return playlist_report_path
+            return ""
+        except Exception as e:
+            console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
+            return None
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+    async def _run_bdinfo(self, command: list[str], label: str, stream_progress: bool) -> int:
+        """Run BDInfo and return its exit code.
+
+        With a single scan BDInfo writes to the terminal as usual. Concurrent
+        scans would garble each other's progress, so their output is captured
+        and the latest line of each is printed every PROGRESS_INTERVAL seconds.
+        """
+        if not stream_progress:
+            proc = await asyncio.create_subprocess_exec(*command)
+        else:
+            proc = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+        try:
+            if proc.stdout is not None:
+                tail = b""
+                last_report = time.monotonic()
+                while chunk := await proc.stdout.read(4096):
+                    tail = (tail + chunk)[-4096:]
+                    if time.monotonic() - last_report >= PROGRESS_INTERVAL:
+                        last_report = time.monotonic()
+                        lines = [line.strip() for line in re.split(rb"[\r\n]", tail) if line.strip()]
+                        if lines:
+                            console.print(f"{label}: {lines[-1].decode('utf-8', errors='replace')}", style="cyan", markup=False, highlight=False)
+                returncode = await proc.wait()
+                if returncode != 0:
+                    console.print(tail.decode("utf-8", errors="replace").strip(), markup=False, highlight=False)
+                return returncode
+            return await proc.wait()
+        except asyncio.CancelledError:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            raise
 
     def parse_bdinfo_files(self, files: str) -> list[dict[str, str]]:
         """
@@ -1,14 +1,15 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import functools
 import os
 import re
 from collections.abc import MutableMapping, Sequence
-from typing import Any, Callable, Optional, TypedDict, Union, cast
+from typing import Any, Optional, TypedDict, Union, cast
 
 from typing_extensions import TypeAlias
 
 from cogs.redaction import Redaction
 from src.console import console
-from src.trackers.HUNO import HUNO
+from src.trackersetup import tracker_class_map
 
 Meta: TypeAlias = MutableMapping[str, Any]
 
@@ -32,12 +33,109 @@ class DupeEntry(TypedDict, total=False):
 
 DupeInput: TypeAlias = Union[str, DupeEntry, MutableMapping[str, Any]]
 
+WEB_DL_TERMS = ("web-dl", "web -dl", "webdl", "web dl")
+BLURAY_TERMS = ("blu-ray", "blu ray", "bluray", "blu -ray")
+HIGHER_RESOLUTIONS = ("1080", "720", "2160")
+
+SEASON_NUMBER_RE = re.compile(r'[sS](\d+)')
+EPISODE_MARKER_RE = re.compile(r'[eE]\d{2}')
+FILE_EXTENSION_RE = re.compile(r'\.\w{2,4}$')
+DAILY_EPISODE_RE = re.compile(r'(?<!\d)((?:19|20)\d{2})[.\-_/\s](\d{1,2})[.\-_/\s](\d{1,2})(?!\d)')
+MTV_AUDIO_RES = (
+    (re.compile(r'\.DDP\.(\d)'), r'.DDP\1'),
+    (re.compile(r'\.DD\.(\d)'), r'.DD\1'),
+    (re.compile(r'\.AC3\.(\d)'), r'.AC3\1'),
+    (re.compile(r'\.DTS\.(\d)'), r'.DTS\1'),
+)
+
+
+def _normalize_filename(filename: str) -> str:
+    return filename.lower().replace("-", " -").replace(" ", " ").replace(".", " ")
+
+
+def _refine_hdr_terms(hdr: Optional[str]) -> set[str]:
+    if hdr is None:
+        return set()
+    hdr_upper = str(hdr).upper()
+    terms: set[str] = set()
+    if "DV" in hdr_upper or "DOVI" in hdr_upper:
+        terms.add("DV")
+    if "HDR" in hdr_upper:  # Any HDR-related term is normalized to 'HDR'
+        terms.add("HDR")
+    return terms
+
+
+def _simplify_hdr(hdr_set: set[str], meta_type: str, tracker_name: Optional[str] = None) -> set[str]:
+    """Simplify HDR terms to just HDR and DV."""
+    simplified: set[str] = set()
+    if any(h in hdr_set for h in {"HDR", "HDR10", "HDR10+"}):
+        simplified.add("HDR")
+    if any(h == "DV" or "DV" in h for h in hdr_set):
+        simplified.add("DV")
+        if 'web' not in meta_type:
+            simplified.add("HDR")
+        if tracker_name == "ANT":
+            simplified.add("HDR")
+    return simplified
+
+
+def _hdr_matches(file_hdr: set[str], target_hdr_simple: set[str], meta_type: str, tracker: Optional[str] = None) -> bool:
+    file_hdr_simple = _simplify_hdr(file_hdr, meta_type, tracker)
+    if file_hdr_simple == {"DV", "HDR"}:
+        file_hdr_simple = {"HDR"}
+        if target_hdr_simple == {"DV", "HDR"}:
+            target_hdr_simple = {"HDR"}
+    return file_hdr_simple == target_hdr_simple
+
+
+class SeasonEpisodeMatcher:
+    """Season/episode matching against one target, with its patterns compiled once."""
+
+    def __init__(self, target_season: Optional[Union[str, int]], target_episode: Optional[Union[str, int]]) -> None:
+        season_match = SEASON_NUMBER_RE.search(str(target_season))
+        target_season_value = int(season_match.group(1)) if season_match else None
+
+        # Handle daily-style episodes where the episode value is a date (YYYY-MM-DD / YYYY.MM.DD).
+        self.daily_pattern: Optional[re.Pattern[str]] = None
+        date_match = DAILY_EPISODE_RE.search(str(target_episode or ""))
+        if date_match:
+            year = int(date_match.group(1))
+            month = int(date_match.group(2))
+            day = int(date_match.group(3))
+            self.daily_pattern = re.compile(rf"(?<!\d){year}[.\-_/\s]?{month:02d}[.\-_/\s]?{day:02d}(?!\d)", re.IGNORECASE)
+
+        target_episodes = [int(ep) for ep in re.findall(r'\d+', str(target_episode))] if target_episode else []
+        self.season_pattern = re.compile(rf"[sS]{target_season_value:02}", re.IGNORECASE) if target_season_value is not None else None
+        self.episode_patterns = [re.compile(rf"[eE]{ep:02}", re.IGNORECASE) for ep in target_episodes]
+
+    def match(self, filename: str) -> tuple[bool, bool]:
+        if self.daily_pattern is not None:
+            return (bool(self.daily_pattern.search(filename)), False)
+
+        # Determine if filename represents a season pack (no explicit episode pattern)
+        is_season_pack = not EPISODE_MARKER_RE.search(filename)
 
-class AttributeCheck(TypedDict):
-    key: str
-    uuid_flag: bool
-    condition: Callable[[str], bool]
-    exclude_msg: Callable[[str], str]
+        # If `target_episode` is empty, match only season packs
+        if not self.episode_patterns:
+            season_matches = bool(self.season_pattern and self.season_pattern.search(filename))
+            return (season_matches and is_season_pack, season_matches)
+
+        # If `target_episode` is provided, match both season packs and episode files
+        if self.season_pattern:
+            if is_season_pack:
+                return (bool(self.season_pattern.search(filename)), True)  # Match season pack
+            return (
+                bool(self.season_pattern.search(filename))
+                and any(ep.search(filename) for ep in self.episode_patterns),
+                False,
+            )  # Match episode file
+
+        return (False, False)  # No match
+
+
+@functools.lru_cache(maxsize=32)
+def season_episode_matcher(target_season: Optional[Union[str, int]], target_episode: Optional[Union[str, int]]) -> SeasonEpisodeMatcher:
+    return SeasonEpisodeMatcher(target_season, target_episode)
 
 
 class DupeChecker:
@@ -133,73 +231,105 @@ class DupeChecker:
 
         new_dupes: list[DupeEntry]
 
-        has_repack_in_uuid = "repack" in str(meta.get('uuid', '')).lower()
+        # Everything about the target is worked out once here; each entry is then checked by a plain function
+        debug = bool(meta.get('debug'))
+        is_disc = meta.get('is_disc')
+        uuid_lower = str(meta.get('uuid', '')).lower()
+        has_repack_in_uuid = "repack" in uuid_lower
         video_encode_value = meta.get("video_encode")
         video_encode = str(video_encode_value) if video_encode_value else ""
-        normalized_encoder = await DupeChecker.normalize_filename(video_encode) if video_encode else ""
+        normalized_encoder = _normalize_filename(video_encode) if video_encode else ""
         video_encode_lower = video_encode.lower()
 
         file_size: Optional[int] = None
-        if meta.get('is_disc') != "BDMV":
+        if is_disc != "BDMV":
             mediainfo = cast(dict[str, Any], meta.get('mediainfo', {}))
             tracks = cast(list[dict[str, Any]], mediainfo.get('media', {}).get('track', []))
             if tracks:
                 file_size = coerce_int(tracks[0].get('FileSize'))
 
-        has_is_disc = bool(meta.get('is_disc', False))
-        target_hdr = await DupeChecker.refine_hdr_terms(cast(Optional[str], meta.get("hdr")))
+        has_is_disc = bool(is_disc)
+        meta_type = str(meta.get('type', '')).lower()
+        target_hdr = _refine_hdr_terms(cast(Optional[str], meta.get("hdr")))
+        target_hdr_simple = _simplify_hdr(target_hdr, meta_type, tracker_name)
         target_season = meta.get("season")
         target_episode = meta.get("episode")
         target_resolution = str(meta.get("resolution", ""))
+        target_resolution_lower = target_resolution.lower()
         tag = str(meta.get("tag", "")).lower().replace("-", " ")
-        is_dvd = meta.get('is_disc') == "DVD"
+        tag_stripped = tag.strip()
+        tag_lower = str(meta.get('tag', '')).lower()
+        is_dvd = is_disc == "DVD"
         is_dvdrip = meta.get('type') == "DVDRIP"
         web_dl = meta.get('type') == "WEBDL"
         is_hdtv = meta.get('type') == "HDTV"
+        is_tv = meta.get('category') == "TV"
         target_source = str(meta.get("source", ""))
+        target_source_lower = (target_source or "").lower()
         is_sd = int(meta.get('sd') or 0)
-        is_tv_pack = meta.get('category') == "TV" and (coerce_int(meta.get('tv_pack')) or 0) == 1
-        target_season_match = re.search(r'[sS](\d+)', str(target_season or ""))
+        is_tv_pack = is_tv and (coerce_int(meta.get('tv_pack')) or 0) == 1
+        target_season_match = SEASON_NUMBER_RE.search(str(target_season or ""))
         target_season_number = int(target_season_match.group(1)) if target_season_match else None
+        season_matcher = season_episode_matcher(target_season, target_episode) if is_tv else None
+        source_size = coerce_int(meta.get('source_size'))
+        has_source_size = meta.get('source_size') is not None
+        uuid_has_remux = "remux" in str(meta.get('name', '')).lower()
+        skip_resolution_check = bool(is_dvd or "DVD" in target_source or is_dvdrip)
+        single_dupe = len(dupes) == 1
+        size_check = (
+            single_dupe
+            and is_disc != "BDMV"
+            and tracker_name in ["AITHER", "BHD", "HUNO", "OE", "ULCX"]
+            and file_size is not None
+            and "1080" in target_resolution
+            and 'x264' in video_encode_lower
+        )
 
         filenames: list[str] = []
         filelist_value = meta.get('filelist')
         filelist: list[str] = []
-        if not meta.get('is_disc'):
+        if not is_disc:
             if isinstance(filelist_value, Sequence) and not isinstance(filelist_value, (str, bytes)):
                 filelist = [str(file_path) for file_path in cast(Sequence[Any], filelist_value)]
                 for file_path in filelist:
                     # Extract just the filename without the path
                     filename = os.path.basename(file_path)
                     filenames.append(filename)
-            if meta.get('debug'):
+            if debug:
                 console.log(f"dupe checking filenames: {filenames[:10]}{'...' if len(filenames) > 10 else ''}")
-
-        attribute_checks: list[AttributeCheck] = [
-            {
-                "key": "remux",
-                "uuid_flag": "remux" in str(meta.get('name', '')).lower(),
-                "condition": lambda each: "remux" in each.lower(),
-                "exclude_msg": lambda each: f"Excluding result due to 'remux' mismatch: {each}",
-            },
-            {
-                "key": "uhd",
-                "uuid_flag": "uhd" in str(meta.get('name', '')).lower(),
-                "condition": lambda each: "uhd" in each.lower(),
-                "exclude_msg": lambda each: f"Excluding result due to 'UHD' mismatch: {each}",
-            },
-        ]
-
-        async def log_exclusion(reason: str, item: str) -> None:
-            if meta.get('debug'):
+        filenames_lower = [filename.lower() for filename in filenames]
+
+        exact_name: Optional[str] = None
+        if tracker_name == "MTV":
+            exact_name = str(meta.get('name', '')).replace(' ', '.').replace('DD+', 'DDP')
+            # Handle audio format variations: DDP.5.1 <-> DDP5.1
+            for pattern, replacement in MTV_AUDIO_RES:
+                exact_name = pattern.sub(replacement, exact_name)
+        elif tracker_name == "BHD":
+            exact_name = str(meta.get('name', '')).replace('DD+', 'DDP')
+        elif tracker_name == "HUNO" and processed_dupes:
+            huno = tracker_class_map['HUNO'](config=self.config)
+            huno_name_result: Any = await huno.get_name(cast(dict[str, Any], meta))
+            huno_name_map = cast(dict[str, Any], huno_name_result)
+            exact_name = str(huno_name_map.get('name', huno_name_result)) if isinstance(huno_name_result, dict) else str(huno_name_result)
+
+        internal_groups: list[Any] = []
+        trackers_section: dict[str, Any] = cast(dict[str, Any], self.config.get('TRACKERS', {}))
+        aither_settings: dict[str, Any] = trackers_section.get('AITHER', {})
+        if aither_settings.get('internal') is True and isinstance(aither_settings.get('internal_groups', []), list):
+            internal_groups = cast(list[Any], aither_settings.get('internal_groups', []))
+
+        def log_exclusion(reason: str, item: str) -> None:
+            if debug:
                 console.log(f"[yellow]Excluding result due to {reason}: {item}")
 
-        async def process_exclusion(entry: DupeEntry) -> bool:
+        def process_exclusion(entry: DupeEntry) -> bool:
             """
             Determine if an entry should be excluded.
             Returns True if the entry should be excluded, otherwise allowed as dupe.
             """
             each = str(entry.get('name', ''))
+            each_lower = each.lower()
             sized = entry.get('size')  # This may come as a string, such as "1.5 GB"
 
             files_value = cast(list[Any], entry.get('files') or [])
@@ -212,7 +342,7 @@ class DupeChecker:
 
             file_count_raw = entry.get('file_count', 0)
             file_count = coerce_int(file_count_raw) or 0
-            normalized = await DupeChecker.normalize_filename(each)
+            normalized = _normalize_filename(each)
             type_id = entry.get('type', None)
             res_id = entry.get('res', None)
 
@@ -229,13 +359,13 @@ class DupeChecker:
                         file_hdr.add('DV')
                     elif flag_upper in ['HDR', 'HDR10', 'HDR10+']:
                         file_hdr.add('HDR')
-                if meta.get('debug'):
+                if debug:
                     console.log(f"[debug] Using flags for HDR detection: {flags} -> {file_hdr}")
             else:
                 # Fall back to parsing filename for HDR terms
-                file_hdr = await DupeChecker.refine_hdr_terms(normalized)
+                file_hdr = _refine_hdr_terms(normalized)
 
-            if meta.get('debug'):
+            if debug:
                 console.log(f"[debug] Evaluating dupe: {each}")
                 console.log(f"[debug] Normalized dupe: {normalized}")
                 console.log(f"[debug] Target resolution: {target_resolution}")
@@ -248,7 +378,7 @@ class DupeChecker:
                 console.log(f"[debug] TAG: {tag}")
                 console.log("[debug] Evaluating repack condition:")
                 console.log(f"  has_repack_in_uuid: {has_repack_in_uuid}")
-                console.log(f"  'repack' in each.lower(): {'repack' in each.lower()}")
+                console.log(f"  'repack' in each.lower(): {'repack' in each_lower}")
                 console.log(f"[debug] meta['uuid']: {meta.get('uuid', '')}")
                 console.log(f"[debug] normalized encoder: {normalized_encoder}")
                 console.log(f"[debug] type_id: {type_id}, res_id: {res_id}")
@@ -276,16 +406,34 @@ class DupeChecker:
                 if entry.get('id'):
                     meta[matched_torrent_id] = entry.get('id')
 
+            def check_size() -> Optional[bool]:
+                """Size comparison against the source; False (a dupe) when the sizes are equal."""
+                entry_size = coerce_int(entry.get('size'))
+                if entry_size is not None and source_size is not None:
+                    if debug:
+                        console.log(f"[debug] Comparing sizes: Entry size {entry_size} vs Source size {source_size}")
+                    if entry_size == source_size:
+                        meta['size_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
+                        remember_match('size')
+                        return False
+                elif debug and entry_size is None and has_source_size:
+                    console.log(
+                        f"[debug] Size comparison failed due to ValueError: entry_size={entry.get('size')}, source_size={meta.get('source_size')}"
+                    )
+                return None
+
             # Aither-specific trumping logic - no internal checking, if it's marked trumpable, it's trumpable
             if tracker_name in ["AITHER", "LST"] and entry.get('trumpable', False) and res_id and target_resolution == res_id:
                 meta['trumpable_id'] = entry.get('id')
                 remember_match('trumpable_id')
 
-            if not meta.get('is_disc'):
-                for file in filenames:
+            if not is_disc:
+                files_lower = [f.lower() for f in files]
+                files_lower_set = set(files_lower)
+                for file, file_lower in zip(filenames, filenames_lower):
                     if tracker_name in ["MTV", "AR", "RTF"]:
                         # MTV: check if any dupe file is a substring of our file (ignoring extension)
-                        if any(f.lower() in file.lower() for f in files):
+                        if any(f in file_lower for f in files_lower):
                             meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
                             remember_match('filename')
                             if file_count and file_count == len(filelist):
@@ -293,151 +441,95 @@ class DupeChecker:
                                 remember_match('file_count')
                                 return False
                         entry_size = coerce_int(entry.get('size'))
-                        source_size = coerce_int(meta.get('source_size'))
                         if entry_size is not None and source_size is not None and entry_size == source_size:
                             meta['size_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
                             remember_match('size')
                             return False
-                        if meta.get('debug') and entry_size is None and meta.get('source_size') is not None:
+                        if debug and entry_size is None and has_source_size:
                             console.log(
                                 f"[debug] Size comparison failed due to ValueError: entry_size={entry.get('size')}, source_size={meta.get('source_size')}"
                             )
                     else:
-                        if meta.get('debug'):
+                        if debug:
                             console.log(f"[debug] Comparing file: {file} against dupe files list.")
                             console.log(f"[debug] Dupe files list: {files[:10]}{'...' if len(files) > 10 else files}")
-                        if any(file.lower() == f.lower() for f in files):
+                        if file_lower in files_lower_set:
                             meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                            if meta.get('debug'):
+                            if debug:
                                 console.log(f"[debug] Filename match found: {meta['filename_match']}")
                             remember_match('filename')
                             remember_match('id')
                             if file_count and file_count == len(filelist):
                                 meta['file_count_match'] = file_count
-                                if meta.get('debug'):
+                                if debug:
                                     console.log(f"[debug] File count match found: {meta['file_count_match']}")
                                 remember_match('file_count')
                                 return False
-                if tracker_name in ["BHD"]:
+                if tracker_name in ["BHD"] and check_size() is False:
                     # BHD: compare sizes
-                    entry_size = coerce_int(entry.get('size'))
-                    source_size = coerce_int(meta.get('source_size'))
-                    if entry_size is not None and source_size is not None:
-                        if meta.get('debug'):
-                            console.log(f"[debug] Comparing sizes: Entry size {entry_size} vs Source size {source_size}")
-                        if entry_size == source_size:
-                            meta['size_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                            remember_match('size')
-                            return False
-                    elif meta.get('debug') and entry_size is None and meta.get('source_size') is not None:
-                        console.log(
-                            f"[debug] Size comparison failed due to ValueError: entry_size={entry.get('size')}, source_size={meta.get('source_size')}"
-                        )
+                    return False
 
-            else:
-                entry_size = coerce_int(entry.get('size'))
-                source_size = coerce_int(meta.get('source_size'))
-                if entry_size is not None and source_size is not None:
-                    if meta.get('debug'):
-                        console.log(f"[debug] Comparing sizes: Entry size {entry_size} vs Source size {source_size}")
-                    if entry_size == source_size:
-                        meta['size_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                        remember_match('size')
-                        return False
-                elif meta.get('debug') and entry_size is None and meta.get('source_size') is not None:
-                    console.log(
-                        f"[debug] Size comparison failed due to ValueError: entry_size={entry.get('size')}, source_size={meta.get('source_size')}"
-                    )
+            elif check_size() is False:
+                return False
 
-            if meta.get('is_disc') and file_count and file_count < 2:
-                await log_exclusion("file count less than 2 for disc upload", each)
+            if is_disc and file_count and file_count < 2:
+                log_exclusion("file count less than 2 for disc upload", each)
                 return True
 
-            if has_repack_in_uuid and "repack" not in normalized and str(meta.get('tag', '')).lower() in normalized:
-                await log_exclusion('repack release', each)
+            if has_repack_in_uuid and "repack" not in normalized and tag_lower in normalized:
+                log_exclusion('repack release', each)
                 return True
 
-            if tracker_name == "MTV":
-                target_name = str(meta.get('name', '')).replace(' ', '.').replace('DD+', 'DDP')
-                dupe_name = str(entry.get('name', ''))
-
-                def normalize_mtv_name(name: str) -> str:
-                    # Handle audio format variations: DDP.5.1 <-> DDP5.1
-                    name = re.sub(r'\.DDP\.(\d)', r'.DDP\1', name)
-                    name = re.sub(r'\.DD\.(\d)', r'.DD\1', name)
-                    name = re.sub(r'\.AC3\.(\d)', r'.AC3\1', name)
-                    name = re.sub(r'\.DTS\.(\d)', r'.DTS\1', name)
-                    return name
-
-                normalized_target = normalize_mtv_name(target_name)
-                if normalized_target == dupe_name:
-                    meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                    return False
-
-            if tracker_name == "BHD":
-                target_name = str(meta.get('name', '')).replace('DD+', 'DDP')
-                if str(entry.get('name')) == target_name:
-                    meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                    return False
-
-            if tracker_name == "HUNO":
-                huno = HUNO(config=self.config)
-                huno_name_result: Any = await huno.get_name(cast(dict[str, Any], meta))
-                huno_name_map = cast(dict[str, Any], huno_name_result)
-                huno_name = str(huno_name_map.get('name', huno_name_result)) if isinstance(huno_name_result, dict) else str(huno_name_result)
-                if str(entry.get('name')) == huno_name:
-                    meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                    return False
+            if exact_name is not None and each == exact_name:
+                meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
+                return False
 
             if tracker_name in ["BHD", "MTV", "RTF", "AR"] and (
                 ('2160p' in target_resolution and '2160p' in each)
-                and ('framestor' in each.lower() or 'framestor' in str(meta.get('uuid', '')).lower())
+                and ('framestor' in each_lower or 'framestor' in uuid_lower)
             ):
                 return False
 
-            if has_is_disc and each.lower().endswith(".m2ts"):
+            if has_is_disc and each_lower.endswith(".m2ts"):
                 return False
 
-            if has_is_disc and re.search(r'\.\w{2,4}$', each):
-                await log_exclusion("file extension mismatch (is_disc=True)", each)
+            if has_is_disc and FILE_EXTENSION_RE.search(each):
+                log_exclusion("file extension mismatch (is_disc=True)", each)
                 return True
 
-            if is_sd == 1 and tracker_name in {"BHD", "AITHER"} and any(str(res) in each for res in [1080, 720, 2160]) and not has_is_disc:
+            if is_sd == 1 and tracker_name in {"BHD", "AITHER"} and any(res in each for res in HIGHER_RESOLUTIONS) and not has_is_disc:
                 return False
 
             if target_hdr and '1080p' in target_resolution and '2160p' in each:
-                await log_exclusion("No 1080p HDR when 4K exists", each)
+                log_exclusion("No 1080p HDR when 4K exists", each)
                 return False
 
             if tracker_name in ["AITHER", "LST"] and is_dvd:
                 if len(each) >= 1 and tag == "":
                     return False
-                return not (tag.strip() and tag.strip() in normalized)
+                return not (tag_stripped and tag_stripped in normalized)
 
+            has_web_dl = any(web_term in normalized for web_term in WEB_DL_TERMS)
             if web_dl:
-                if "hdtv" in normalized and not any(web_term in normalized for web_term in ["web-dl", "web -dl", "webdl", "web dl"]):
-                    await log_exclusion("source mismatch: WEB-DL vs HDTV", each)
+                if "hdtv" in normalized and not has_web_dl:
+                    log_exclusion("source mismatch: WEB-DL vs HDTV", each)
                     return True
-                if any(term in normalized for term in ['blu-ray', 'blu ray', 'bluray', 'blu -ray']) and not any(
-                    web_term in normalized for web_term in ["web-dl", "web -dl", "webdl", "web dl"]
-                ):
-                    await log_exclusion("source mismatch: WEB-DL vs BluRay", each)
+                if any(term in normalized for term in BLURAY_TERMS) and not has_web_dl:
+                    log_exclusion("source mismatch: WEB-DL vs BluRay", each)
                     return True
-            if not web_dl and any(web_term in normalized for web_term in ["web-dl", "web -dl", "webdl", "web dl"]):
-                await log_exclusion("source mismatch: non-WEB-DL vs WEB-DL", each)
+            if not web_dl and has_web_dl:
+                log_exclusion("source mismatch: non-WEB-DL vs WEB-DL", each)
                 return True
 
-            skip_resolution_check = bool(is_dvd or "DVD" in target_source or is_dvdrip)
-
             if (
                 tracker_name == "OTW"
                 and not is_tv_pack
-                and meta.get('category') == "TV"
+                and is_tv
                 and target_episode
                 and target_resolution
             ):
-                dupe_season_match = re.search(r'[sS](\d+)', each)
-                dupe_has_episode = bool(re.search(r'[eE]\d{2}', each))
+                dupe_season_match = SEASON_NUMBER_RE.search(each)
+                dupe_has_episode = bool(EPISODE_MARKER_RE.search(each))
                 same_season_episode_dupe = (
                     target_season_number is not None
                     and dupe_season_match is not None
@@ -445,76 +537,61 @@ class DupeChecker:
                     and dupe_has_episode
                 )
 
-                if same_season_episode_dupe and (target_resolution.lower() not in each.lower()):
-                    await log_exclusion(f"OTW same-season episode resolution mismatch: expected '{target_resolution}'", each)
+                if same_season_episode_dupe and (target_resolution_lower not in each_lower):
+                    log_exclusion(f"OTW same-season episode resolution mismatch: expected '{target_resolution}'", each)
                     return False
 
             if not skip_resolution_check:
                 if target_resolution and target_resolution not in each:
-                    await log_exclusion(f"resolution '{target_resolution}' mismatch", each)
+                    log_exclusion(f"resolution '{target_resolution}' mismatch", each)
                     return True
-                if not await DupeChecker.has_matching_hdr(file_hdr, target_hdr, meta, tracker=tracker_name):
-                    await log_exclusion(f"HDR mismatch: Expected {target_hdr}, got {file_hdr}", each)
+                if not _hdr_matches(file_hdr, target_hdr_simple, meta_type, tracker_name):
+                    log_exclusion(f"HDR mismatch: Expected {target_hdr}, got {file_hdr}", each)
                     return True
 
-            if is_dvd and tracker_name != "BHD" and any(str(res) in each for res in [1080, 720, 2160]):
-                await log_exclusion(f"resolution '{target_resolution}' mismatch", each)
+            if is_dvd and tracker_name != "BHD" and any(res in each for res in HIGHER_RESOLUTIONS):
+                log_exclusion(f"resolution '{target_resolution}' mismatch", each)
                 return False
 
-            for check in attribute_checks:
-                if check["key"] == "repack":
-                    if has_repack_in_uuid and "repack" not in normalized and tag and tag in normalized:
-                        await log_exclusion("missing 'repack'", each)
-                        return True
-                elif check["key"] == "remux":
-                    # Bidirectional check: if your upload is a REMUX, dupe must be REMUX
-                    # If your upload is NOT a REMUX (i.e., an encode), dupe must NOT be a REMUX
-                    uuid_has_remux = check["uuid_flag"]
-                    dupe_has_remux = check["condition"](normalized)
-
-                    if meta.get('debug'):
-                        console.log(f"[debug] Remux check: uuid_has_remux={uuid_has_remux}, dupe_has_remux={dupe_has_remux}")
-
-                    if uuid_has_remux and not dupe_has_remux:
-                        await log_exclusion("missing 'remux'", each)
-                        return True
-                    if not uuid_has_remux and dupe_has_remux:
-                        await log_exclusion("dupe is remux but upload is not", each)
-                        return True
+            # Bidirectional check: if your upload is a REMUX, dupe must be REMUX
+            # If your upload is NOT a REMUX (i.e., an encode), dupe must NOT be a REMUX
+            dupe_has_remux = "remux" in normalized
+            if debug:
+                console.log(f"[debug] Remux check: uuid_has_remux={uuid_has_remux}, dupe_has_remux={dupe_has_remux}")
+            if uuid_has_remux and not dupe_has_remux:
+                log_exclusion("missing 'remux'", each)
+                return True
+            if not uuid_has_remux and dupe_has_remux:
+                log_exclusion("dupe is remux but upload is not", each)
+                return True
 
-            if meta.get('category') == "TV":
-                season_episode_match, is_season = await DupeChecker.is_season_episode_match(normalized, target_season, target_episode)
-                if meta.get('debug'):
+            if season_matcher is not None:
+                season_episode_match, is_season = season_matcher.match(normalized)
+                if debug:
                     console.log(f"[debug] Season/Episode match result: {season_episode_match}")
                     console.log(f"[debug] is_season: {is_season}")
                 # Aither episode trumping logic
                 if is_season and tracker_name in ["AITHER", "LST"]:
                     # Null-safe normalization for comparisons
-                    target_source_lower = (target_source or "").lower()
                     type_id_lower = (type_id or "").lower()
                     res_id_safe = res_id or ""
                     target_resolution_safe = target_resolution or ""
 
                     if type_id_lower and res_id_safe:
-                        if meta.get('debug'):
+                        if debug:
                             console.log(
                                 f"[debug] Checking trumping: target_source='{target_source_lower}', type_id='{type_id_lower}', target_res='{target_resolution_safe}', res_id='{res_id_safe}'"
                             )
                         if target_source_lower in type_id_lower and target_resolution_safe == res_id_safe:
-                            if meta.get('debug'):
+                            if debug:
                                 console.log(f"[debug] Episode with matching source and resolution found for trumping: {each}")
 
                             is_internal = False
                             if entry.get('internal', 0) == 1:
-                                trackers_section: dict[str, Any] = cast(dict[str, Any], self.config.get('TRACKERS', {}))
-                                aither_settings: dict[str, Any] = trackers_section.get('AITHER', {})
-                                if aither_settings.get('internal') is True:
-                                    internal_groups = aither_settings.get('internal_groups', [])
-                                    if isinstance(internal_groups, list):
-                                        tag_without_prefix = tag[1:] if tag else ""
-                                        if tag_without_prefix in internal_groups and tag_without_prefix.lower() in normalized:
-                                            is_internal = True
-                                if not is_internal and meta.get('debug'):
+                                tag_without_prefix = tag[1:] if tag else ""
+                                if tag_without_prefix in internal_groups and tag_without_prefix.lower() in normalized:
+                                    is_internal = True
+                                if not is_internal and debug:
                                     console.log("[debug] Skipping internal episode for trumping since you're not the internal uploader.")
 
                             if not entry.get('internal', False) or is_internal:
@@ -545,18 +622,18 @@ class DupeChecker:
                                         'tracker': tracker_name,
                                         'internal': entry.get('internal', 0),
                                     })
-                                    if meta.get('debug'):
+                                    if debug:
                                         console.log(f"[debug] Added episode ID {entry_id} to matched list")
                                     # Ensure this matched dupe is recorded for later use
                                     remember_match('season_pack_contains_episode')
                                     # Don't exclude this entry - it's a valid trump target
                                     return False
-                                if already_exists and meta.get('debug'):
+                                if already_exists and debug:
                                     console.log(f"[debug] Skipping duplicate entry for episode ID {entry_id}")
 
                 # Normal season/episode matching
                 if not season_episode_match:
-                    await log_exclusion("season/episode mismatch", each)
+                    log_exclusion("season/episode mismatch", each)
                     return True
 
                 # Check if uploading an episode but a matching season pack exists
@@ -566,45 +643,38 @@ class DupeChecker:
                     meta['season_pack_name'] = each
                     meta['season_pack_link'] = entry.get('link')
                     meta['season_pack_id'] = entry.get('id')
-                    if meta.get('debug'):
+                    if debug:
                         console.log(f"[yellow]Season pack detected for episode upload: {each}")
                         console.log(f"[yellow]Your episode {target_season}{target_episode} is contained in existing season pack")
                     remember_match('season_pack_contains_episode')
                     return False
 
-            if is_hdtv and any(web_term in normalized for web_term in ["web-dl", "web -dl", "webdl", "web dl"]):
+            if is_hdtv and has_web_dl:
                 return False
 
-            if (
-                len(dupes) == 1
-                and meta.get('is_disc') != "BDMV"
-                and tracker_name in ["AITHER", "BHD", "HUNO", "OE", "ULCX"]
-                and file_size is not None
-                and "1080" in target_resolution
-                and 'x264' in video_encode_lower
-            ):
+            if size_check and file_size is not None:
                 target_size = file_size
                 dupe_size = coerce_int(sized)
 
                 if dupe_size is not None and dupe_size != 0:
                     size_difference = (target_size - dupe_size) / dupe_size
-                    if meta.get('debug'):
+                    if debug:
                         console.print(f"Your size: {target_size}, Dupe size: {dupe_size}, Size difference: {size_difference:.4f}")
                     if size_difference >= 0.20:
-                        await log_exclusion(f"Your file is significantly larger ({size_difference * 100:.2f}%)", each)
+                        log_exclusion(f"Your file is significantly larger ({size_difference * 100:.2f}%)", each)
                         return True
-            if len(dupes) == 1 and meta.get('is_disc') != "BDMV" and tracker_name == "RF":
-                if tag.strip() and tag.strip() in normalized:
+            if single_dupe and is_disc != "BDMV" and tracker_name == "RF":
+                if tag_stripped and tag_stripped in normalized:
                     return False
-                if tag.strip() and tag.strip() not in normalized:
-                    await log_exclusion(f"Tag '{tag}' not found in normalized name", each)
+                if tag_stripped and tag_stripped not in normalized:
+                    log_exclusion(f"Tag '{tag}' not found in normalized name", each)
                     return True
 
-            if meta.get('debug'):
+            if debug:
                 console.log(f"[cyan]Release PASSED all checks: {each}")
             return False
 
-        new_dupes = [each for each in processed_dupes if not await process_exclusion(each)]
+        new_dupes = [each for each in processed_dupes if not process_exclusion(each)]
 
         if new_dupes and not meta.get('unattended', False) and meta.get('debug'):
             if len(processed_dupes) > 1:
@@ -636,9 +706,7 @@ class DupeChecker:
             filename = str(filename.get('name', ''))
         if not isinstance(filename, str):
             raise ValueError(f"Expected a string or a dictionary with a 'name' key, but got: {type(filename)}")
-        normalized = filename.lower().replace("-", " -").replace(" ", " ").replace(".", " ")
-
-        return normalized
+        return _normalize_filename(filename)
 
     @staticmethod
     async def is_season_episode_match(
@@ -649,50 +717,7 @@ class DupeChecker:
         """
         Check if the filename matches the given season and episode.
         """
-        season_match = re.search(r'[sS](\d+)', str(target_season))
-        target_season_value = int(season_match.group(1)) if season_match else None
-
-        # Handle daily-style episodes where the episode value is a date (YYYY-MM-DD / YYYY.MM.DD).
-        target_episode_str = str(target_episode or "")
-        date_match = re.search(r'(?<!\d)((?:19|20)\d{2})[.\-_/\s](\d{1,2})[.\-_/\s](\d{1,2})(?!\d)', target_episode_str)
-        if date_match:
-            year = int(date_match.group(1))
-            month = int(date_match.group(2))
-            day = int(date_match.group(3))
-            daily_date_pattern = rf"(?<!\d){year}[.\-_/\s]?{month:02d}[.\-_/\s]?{day:02d}(?!\d)"
-            if re.search(daily_date_pattern, filename, re.IGNORECASE):
-                return (True, False)
-            return (False, False)
-
-        if target_episode:
-            episode_matches = re.findall(r'\d+', str(target_episode))
-            target_episodes = [int(ep) for ep in episode_matches]
-        else:
-            target_episodes = []
-
-        season_pattern = rf"[sS]{target_season_value:02}" if target_season_value is not None else None
-        episode_patterns = [rf"[eE]{ep:02}" for ep in target_episodes] if target_episodes else []
-
-        # Determine if filename represents a season pack (no explicit episode pattern)
-        is_season_pack = not re.search(r"[eE]\d{2}", filename, re.IGNORECASE)
-
-        # If `target_episode` is empty, match only season packs
-        if not target_episodes:
-            season_matches = bool(season_pattern and re.search(season_pattern, filename, re.IGNORECASE))
-            return (season_matches and is_season_pack, season_matches)
-
-        # If `target_episode` is provided, match both season packs and episode files
-        if season_pattern:
-            if is_season_pack:
-                return (bool(re.search(season_pattern, filename, re.IGNORECASE)), True)  # Match season pack
-            if episode_patterns:
-                return (
-                    bool(re.search(season_pattern, filename, re.IGNORECASE))
-                    and any(re.search(ep, filename, re.IGNORECASE) for ep in episode_patterns),
-                    False,
-                )  # Match episode file
-
-        return (False, False)  # No match
+        return season_episode_matcher(target_season, target_episode).match(filename)
 
     @staticmethod
     async def refine_hdr_terms(hdr: Optional[str]) -> set[str]:
@@ -700,44 +725,15 @@ class DupeChecker:
         Normalize HDR terms for consistent comparison.
         Simplifies all HDR entries to 'HDR' and DV entries to 'DV'.
         """
-        if hdr is None:
-            return set()
-        hdr_upper = str(hdr).upper()
-        terms: set[str] = set()
-        if "DV" in hdr_upper or "DOVI" in hdr_upper:
-            terms.add("DV")
-        if "HDR" in hdr_upper:  # Any HDR-related term is normalized to 'HDR'
-            terms.add("HDR")
-        return terms
+        return _refine_hdr_terms(hdr)
 
     @staticmethod
     async def has_matching_hdr(file_hdr: set[str], target_hdr: set[str], meta: Meta, tracker: Optional[str] = None) -> bool:
         """
         Check if the HDR terms match or are compatible.
         """
-        def simplify_hdr(hdr_set: set[str], tracker_name: Optional[str] = None) -> set[str]:
-            """Simplify HDR terms to just HDR and DV."""
-            simplified: set[str] = set()
-            if any(h in hdr_set for h in {"HDR", "HDR10", "HDR10+"}):
-                simplified.add("HDR")
-            if any(h == "DV" or "DV" in h for h in hdr_set):
-                simplified.add("DV")
-                meta_type = str(meta.get('type', '')).lower()
-                if 'web' not in meta_type:
-                    simplified.add("HDR")
-                if tracker_name == "ANT":
-                    simplified.add("HDR")
-            return simplified
-
-        file_hdr_simple = simplify_hdr(file_hdr, tracker)
-        target_hdr_simple = simplify_hdr(target_hdr, tracker)
-
-        if file_hdr_simple in [{"DV", "HDR"}, {"HDR", "DV"}]:
-            file_hdr_simple = {"HDR"}
-            if target_hdr_simple in [{"DV", "HDR"}, {"HDR", "DV"}]:
-                target_hdr_simple = {"HDR"}
-
-        return file_hdr_simple == target_hdr_simple
+        meta_type = str(meta.get('type', '')).lower()
+        return _hdr_matches(file_hdr, _simplify_hdr(target_hdr, meta_type, tracker), meta_type, tracker)
 
 
 async def filter_dupes(dupes: Sequence[DupeInput], meta: Meta, tracker_name: str, config: dict[str, Any]) -> list[DupeEntry]:
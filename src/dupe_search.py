@@ -0,0 +1,117 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Shared results for tracker dupe searches.
+
+The tracker status checks and the cross-seed pass both search trackers for
+existing torrents, and a queue often holds several releases of the same title.
+Results are kept per tracker and search (TMDB id, category, resolution, type
+and season, as sent to the tracker) for ``dupe_search_cache_ttl`` seconds, so
+repeated searches are answered without another request. Identical searches
+that run at the same time share a single request. Failed searches, and
+searches returned as ``PartialResults`` because part of them failed, are not
+kept. A tracker's results are dropped once something is uploaded to it.
+
+The time each queue item's last search on a tracker took is kept in
+``timings``, keyed by (item, tracker), for the debug summary.
+"""
+import asyncio
+import copy
+import time
+from collections.abc import Awaitable, Hashable
+from dataclasses import dataclass
+from typing import Any, Callable, cast
+
+from src.loop_bound import LoopBound
+
+DEFAULT_TTL = 300.0
+
+
+class PartialResults(list[dict[str, Any]]):
+    """Search results missing a part that failed; returned to callers but never cached."""
+
+
+@dataclass
+class SearchTiming:
+    duration: float = 0.0
+    results: int = 0
+    cached: bool = False
+
+
+class DupeSearchCache(LoopBound):
+    def __init__(self) -> None:
+        self.ttl = DEFAULT_TTL
+        self.timings: dict[tuple[str, str], SearchTiming] = {}
+        self._entries: dict[tuple[str, Hashable], tuple[float, list[dict[str, Any]]]] = {}
+        self._inflight: dict[tuple[str, Hashable], asyncio.Future[list[dict[str, Any]]]] = {}
+
+    def configure(self, config: dict[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get("DEFAULT", {}))
+        try:
+            self.ttl = max(0.0, float(default_cfg.get("dupe_search_cache_ttl", DEFAULT_TTL)))
+        except (TypeError, ValueError):
+            self.ttl = DEFAULT_TTL
+        self.clear()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.timings.clear()
+
+    def invalidate(self, tracker: str) -> None:
+        """Forget a tracker's results, e.g. after uploading to it."""
+        for cache_key in [cache_key for cache_key in self._entries if cache_key[0] == tracker]:
+            del self._entries[cache_key]
+
+    def _reset(self) -> None:
+        self._inflight.clear()
+
+    def _prune(self, now: float) -> None:
+        for cache_key in [cache_key for cache_key, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[cache_key]
+
+    async def search(
+        self,
+        tracker: str,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[list[dict[str, Any]]]],
+        item: str = "",
+    ) -> list[dict[str, Any]]:
+        """Results of fetch() for this tracker and search key, from the cache while fresh.
+
+        item names the queue item searching, for its timing. Callers get their own
+        copy of the results, so they can modify them freely.
+        """
+        self._check_loop()
+        cache_key = (tracker, key)
+        self._prune(time.monotonic())
+        cached = self._entries.get(cache_key)
+        if cached is not None:
+            self.timings[(item, tracker)] = SearchTiming(results=len(cached[1]), cached=True)
+            return copy.deepcopy(cached[1])
+
+        started = time.monotonic()
+        pending = self._inflight.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(cache_key, fetch))
+            # Retrieve the outcome even when every caller has gone away
+            pending.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._inflight[cache_key] = pending
+        # A cancelled caller must not cancel the request other callers are waiting on
+        results = await asyncio.shield(pending)
+        self.timings[(item, tracker)] = SearchTiming(duration=time.monotonic() - started, results=len(results))
+        return copy.deepcopy(results)
+
+    async def _fetch(
+        self,
+        cache_key: tuple[str, Hashable],
+        fetch: Callable[[], Awaitable[list[dict[str, Any]]]],
+    ) -> list[dict[str, Any]]:
+        try:
+            results = await fetch()
+        finally:
+            self._inflight.pop(cache_key, None)
+        if self.ttl > 0 and not isinstance(results, PartialResults):
+            self._entries[cache_key] = (time.monotonic() + self.ttl, results)
+        return results
+
+
+dupe_search = DupeSearchCache()
@@ -12,6 +12,7 @@ from pymediainfo import MediaInfo
 
 from src.console import console
 from src.exceptions import NoAudioMediaError
+from src.media_report_cache import media_report_cache
 
 
 def validate_file_path(file_path: str) -> str:
@@ -411,7 +412,17 @@ async def exportInfo(
     if not isdir:
         os.chdir(os.path.dirname(video))
 
-    if mediainfo_cmd and is_dvd:
+    # Results are cached under the mode that produced them, so a CLI failure is retried next time
+    mode = "cli" if mediainfo_cmd and is_dvd else "library"
+    text_mode = json_mode = mode
+    cache_key = await media_report_cache.key_for("mediainfo", [video], mode)
+    cached = cast(Optional[dict[str, Any]], await media_report_cache.load(cache_key))
+
+    if cached is not None:
+        if debug:
+            console.print("[green]Using cached MediaInfo[/green]")
+        media_info = str(cached["text"])
+    elif mediainfo_cmd and is_dvd:
         result = None
         try:
             # Validate and sanitize the video path
@@ -427,10 +438,12 @@ async def exportInfo(
 
         except subprocess.TimeoutExpired:
             console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
+            text_mode = "library"
             media_info = MediaInfo.parse(video, output="STRING", full=False)
         except ValueError as e:
             console.print(f"[bold red]Path validation error: {e}[/bold red]")
             console.print("[bold yellow]Falling back to standard MediaInfo for text...")
+            text_mode = "library"
             media_info = MediaInfo.parse(video, output="STRING", full=False)
         except (subprocess.CalledProcessError, Exception) as e:
             console.print(f"[bold red]Error getting text from specialized MediaInfo: {e}")
@@ -438,6 +451,7 @@ async def exportInfo(
                 console.print(f"[red]Subprocess stderr: {result.stderr}[/red]")
                 console.print(f"[red]Subprocess returncode: {result.returncode}[/red]")
             console.print("[bold yellow]Falling back to standard MediaInfo for text...")
+            text_mode = "library"
             media_info = MediaInfo.parse(video, output="STRING", full=False)
     else:
         media_info = MediaInfo.parse(video, output="STRING", full=False)
@@ -452,7 +466,9 @@ async def exportInfo(
     if debug:
         console.print("[bold green]MediaInfo Exported.")
 
-    if mediainfo_cmd and is_dvd:
+    if cached is not None:
+        media_info_dict = cast(dict[str, Any], cached["json"])
+    elif mediainfo_cmd and is_dvd:
         result: Optional[subprocess.CompletedProcess[str]] = None
         try:
             # Validate and sanitize the video path
@@ -470,10 +486,12 @@ async def exportInfo(
         except ValueError as e:
             console.print(f"[bold red]Path validation error: {e}[/bold red]")
             console.print("[bold yellow]Falling back to standard MediaInfo for JSON...")
+            json_mode = "library"
             media_info_json = MediaInfo.parse(video, output="JSON")
             media_info_dict = json.loads(media_info_json)
         except subprocess.TimeoutExpired:
             console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
+            json_mode = "library"
             media_info_json = MediaInfo.parse(video, output="JSON")
             media_info_dict = json.loads(media_info_json)
         except (subprocess.CalledProcessError, json.JSONDecodeError, Exception) as e:
@@ -484,6 +502,7 @@ async def exportInfo(
                 if result.stdout:
                     console.print(f"[red]Subprocess stdout preview: {result.stdout[:200]}...[/red]")
             console.print("[bold yellow]Falling back to standard MediaInfo for JSON...[/bold yellow]")
+            json_mode = "library"
             media_info_json = MediaInfo.parse(video, output="JSON")
             media_info_dict = json.loads(media_info_json)
     else:
@@ -491,6 +510,11 @@ async def exportInfo(
         media_info_json = MediaInfo.parse(video, output="JSON")
         media_info_dict = json.loads(media_info_json)
 
+    if cached is None and text_mode == json_mode:
+        if text_mode != mode:
+            cache_key = await media_report_cache.key_for("mediainfo", [video], text_mode)
+        await media_report_cache.store(cache_key, {"text": media_info, "json": media_info_dict})
+
     filtered_info = filter_mediainfo(media_info_dict)
 
     async with aiofiles.open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", "w", encoding="utf-8") as export:
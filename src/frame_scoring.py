@@ -0,0 +1,74 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Cheap quality scores for candidate screenshot frames.
+
+Frames are scored from small grayscale thumbnails: flat, black and mostly dark
+frames (fades, credits) score low, detailed frames score high, and frames in
+the middle of a cut or cross-fade are penalised by comparing each thumbnail
+with the frame that follows it. Scoring needs NumPy, which is in
+requirements.txt; on an install without it ``SCORING_AVAILABLE`` is False and
+callers keep their planned frames, since the statistics in plain Python would
+cost more than the pre-scan saves.
+"""
+import importlib
+from typing import Any, Optional
+
+try:
+    np: Optional[Any] = importlib.import_module("numpy")
+except ImportError:
+    np = None
+
+SCORING_AVAILABLE = np is not None
+
+# Thumbnail size decoded for scoring
+THUMB_WIDTH = 128
+THUMB_HEIGHT = 72
+THUMB_BYTES = THUMB_WIDTH * THUMB_HEIGHT
+
+# Limited-range luma below this counts as black
+BLACK_LEVEL = 28
+
+# Frames with at least this share of black pixels, or less contrast, are unusable
+MAX_DARK_FRACTION = 0.98
+MIN_CONTRAST = 4.0
+
+
+def _stats(frame: bytes, following: bytes) -> tuple[float, float, float, float]:
+    if np is None:
+        raise RuntimeError("Frame scoring needs numpy")
+    a = np.frombuffer(frame, dtype=np.uint8).reshape(THUMB_HEIGHT, THUMB_WIDTH).astype(np.float32)
+    b = np.frombuffer(following, dtype=np.uint8).reshape(THUMB_HEIGHT, THUMB_WIDTH).astype(np.float32)
+    contrast = float(a.std())
+    dark = float((a < BLACK_LEVEL).mean())
+    detail = float(np.abs(np.diff(a, axis=1)).mean() + np.abs(np.diff(a, axis=0)).mean())
+    change = float(np.abs(a - b).mean())
+    return contrast, dark, detail, change
+
+
+def frame_score(frame: bytes, following: bytes) -> float:
+    """Score one THUMB_WIDTH x THUMB_HEIGHT gray8 frame; 0 means do not use it."""
+    if len(frame) != THUMB_BYTES or len(following) != THUMB_BYTES:
+        return 0.0
+    contrast, dark, detail, change = _stats(frame, following)
+    if dark >= MAX_DARK_FRACTION or contrast < MIN_CONTRAST:
+        return 0.0
+    return (contrast + 2 * detail) * (1 - dark) / (1 + change / 8)
+
+
+def candidate_times(ss_times: list[float], length: float, per_slot: int = 3) -> list[list[float]]:
+    """Return per_slot candidate timestamps around each planned screenshot time.
+
+    The planned time comes first so it wins ties; the others are spread either
+    side of it by a quarter of the gap between screenshots (at most 30 seconds).
+    """
+    spacing = length / (len(ss_times) + 1) if ss_times else length
+    step = min(spacing / 4, 30.0)
+    low, high = length * 0.02, length * 0.95
+    slots: list[list[float]] = []
+    for ss_time in ss_times:
+        slot = [ss_time]
+        for k in range(1, per_slot):
+            offset = step * ((k + 1) // 2) * (1 if k % 2 else -1)
+            slot.append(min(max(ss_time + offset, low), high))
+        slots.append(slot)
+    return slots
@@ -3,19 +3,11 @@ import asyncio
 import json
 import traceback
 from pathlib import Path
-from typing import Any, Callable, Optional, cast
-
-import guessit
+from typing import Any, cast
 
 from src.console import console
 from src.exceptions import WeirdSystem
-
-guessit_module: Any = cast(Any, guessit)
-GuessitFn = Callable[[str, Optional[dict[str, Any]]], dict[str, Any]]
-
-
-def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-    return cast(dict[str, Any], guessit_module.guessit(value, options))
+from src.guessit_cache import guessit_fn
 
 
 async def get_source(type: str, video: str, path: str, is_disc: str, meta: dict[str, Any], folder_id: str, base_dir: str) -> tuple[str, str]:
@@ -6,24 +6,17 @@ import sys
 from collections.abc import Mapping
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any, Callable, Optional, cast
+from typing import Any, Optional, cast
 
 import anitopy
-import guessit
-import httpx
 
 from src.console import console
 from src.exceptions import *  # noqa: F403
+from src.guessit_cache import guessit_fn
+from src.http_pool import http_pool
 from src.tags import get_tag
 from src.tmdb import TmdbManager
 
-guessit_module: Any = cast(Any, guessit)
-GuessitFn = Callable[[str, Optional[dict[str, Any]]], dict[str, Any]]
-
-
-def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-    return cast(dict[str, Any], guessit_module.guessit(value, options))
-
 Meta = dict[str, Any]
 
 
@@ -224,7 +217,7 @@ class SeasonEpisodeManager:
                                     'absolute': str(episode_int),
                                 }
                                 url = "https://thexem.info/map/single"
-                                async with httpx.AsyncClient(timeout=30.0) as client:
+                                async with http_pool.session("xem", timeout=30.0) as client:
                                     response = (await client.post(url, params=params)).json()
                                 if response['result'] == "failure":
                                     raise XEMNotFound  # noqa: F405
@@ -239,7 +232,7 @@ class SeasonEpisodeManager:
                                 season_int = 1  # Default to 1 if error occurs
                                 season = "S01"
                                 names_url = f"https://thexem.info/map/names?origin=tvdb&id={str(meta['tvdb_id'])}"
-                                async with httpx.AsyncClient(timeout=30.0) as client:
+                                async with http_pool.session("xem", timeout=30.0) as client:
                                     names_response = (await client.get(names_url)).json()
                                 if meta['debug']:
                                     console.log(f'[cyan]Matching Season Number from TheXEM\n{names_response}')
@@ -0,0 +1,50 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Memoised guessit parsing.
+
+Preparing a release parses the same file and folder names with guessit many
+times over (prep, season/episode, TMDb/IMDb searches, region, edition, tags,
+source and naming), and every parse costs tens of milliseconds. Results are
+kept in a bounded LRU cache keyed by the string and its options.
+
+The cached results are never handed out: each call gets its own copy, so a
+caller that modifies its result can't affect the next one. Lists are copied
+rather than frozen because several callers check ``isinstance(value, list)``.
+"""
+import copy
+import json
+from functools import lru_cache
+from typing import Any, Optional, cast
+
+import guessit
+
+guessit_module: Any = cast(Any, guessit)
+
+CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse(value: str, options_key: Optional[str]) -> dict[str, Any]:
+    options = cast(Optional[dict[str, Any]], json.loads(options_key)) if options_key is not None else None
+    return dict(cast(dict[str, Any], guessit_module.guessit(value, options)))
+
+
+class GuessitCache:
+    def parse(self, value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        options_key = json.dumps(options, sort_keys=True, default=str) if options is not None else None
+        result = _parse(value, options_key)
+        return {key: copy.copy(item) if isinstance(item, (list, dict)) else item for key, item in result.items()}
+
+    def clear(self) -> None:
+        _parse.cache_clear()
+
+    def summary(self) -> str:
+        info = _parse.cache_info()
+        return f"{info.hits} hits, {info.misses} misses, {info.currsize} cached"
+
+
+guessit_cache = GuessitCache()
+
+
+def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    return guessit_cache.parse(value, options)
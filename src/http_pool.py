@@ -0,0 +1,215 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Process-wide registry of pooled HTTP connections.
+
+Call sites used to build a fresh ``httpx.AsyncClient`` for every request, which
+paid a TCP and TLS handshake each time. Clients handed out here are cheap
+wrappers around a long-lived transport per key (a tracker name or a service
+such as ``tmdb``), so keep-alive connections are reused across requests,
+tracker instances and queue items. Closing one of these clients leaves the
+shared transport open; the pool itself is closed when the program exits.
+
+Cookie-auth trackers can bind a cookie jar to their key so every client for
+that tracker sees the same session cookies.
+
+HTTP/2 is only used when ``http2`` is enabled in the config and the optional
+``h2`` package is installed.
+"""
+import asyncio
+import contextlib
+import importlib.util
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from http.cookiejar import CookieJar
+from typing import Any, Optional, cast
+
+import httpx
+
+from src.console import console
+
+# HTTP/2 needs the optional ``h2`` package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+
+
+@dataclass
+class PoolStats:
+    clients: int = 0
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.connections, 0)
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Delegating transport that survives the ``AsyncClient`` wrapping it being closed."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, stats: PoolStats) -> None:
+        self._transport = transport
+        self._stats = stats
+        self._seen: set[int] = set()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        self._stats.requests += 1
+        # httpcore keeps one object per open connection; a new id means a new handshake
+        pool = getattr(self._transport, "_pool", None)
+        for connection in getattr(pool, "connections", []):
+            if id(connection) not in self._seen:
+                self._seen.add(id(connection))
+                self._stats.connections += 1
+        return response
+
+    async def aclose(self) -> None:
+        # Owned by HttpClientPool, closed in HttpClientPool.aclose()
+        return None
+
+    async def close_shared(self) -> None:
+        await self._transport.aclose()
+
+
+class HttpClientPool:
+    def __init__(self) -> None:
+        self._transports: dict[str, _SharedTransport] = {}
+        self._cookie_jars: dict[str, CookieJar] = {}
+        self._limits: dict[str, httpx.Limits] = {}
+        self.stats: dict[str, PoolStats] = {}
+        self.http2 = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: set[asyncio.Task[None]] = set()
+        self._closer: Optional[asyncio.Task[None]] = None
+
+    def configure(self, config: dict[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get("DEFAULT", {}))
+        http2 = bool(default_cfg.get("http2", False))
+        if http2 and not HTTP2_AVAILABLE:
+            console.print("[yellow]http2 is enabled but the h2 package is not installed (pip install httpx[http2]), using HTTP/1.1[/yellow]")
+            http2 = False
+        if http2 != self.http2:
+            # Transports are created with the setting; new ones pick up the change
+            self._retire(list(self._transports.values()))
+            self._transports.clear()
+        self.http2 = http2
+
+    def set_limits(self, key: str, max_connections: int, max_keepalive: Optional[int] = None) -> None:
+        """Override the connection limits for one key (before its first use)."""
+        keepalive = max_keepalive if max_keepalive is not None else max_connections
+        self._limits[key.upper()] = httpx.Limits(max_connections=max_connections, max_keepalive_connections=keepalive, keepalive_expiry=60.0)
+
+    def _check_loop(self) -> None:
+        # Connections belong to the event loop that opened them. A new asyncio.run()
+        # (e.g. the next Web UI job) must not inherit sockets from a finished loop.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._loop is not loop:
+            stale = list(self._transports.values())
+            if stale and self._loop is not None and self._loop.is_running():
+                # The old loop lives on in another thread; close its sockets there
+                asyncio.run_coroutine_threadsafe(self._close_all(stale), self._loop)
+            self._transports = {}
+            self._loop = loop
+            self._closer = loop.create_task(self._close_on_exit(self._transports))
+
+    async def _close_on_exit(self, transports: dict[str, _SharedTransport]) -> None:
+        """Close this loop's transports when the loop cancels its tasks on the way out."""
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            if self._transports is transports:
+                # The next use starts over, whichever loop it runs on
+                self._transports = {}
+                self._loop = None
+            await self._close_all(list(transports.values()))
+
+    def _retire(self, transports: list[_SharedTransport]) -> None:
+        """Close transports that are no longer handed out, in the background."""
+        if not transports:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._close_all(transports))
+        except RuntimeError:
+            return
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(shared: _SharedTransport) -> None:
+        try:
+            await shared.close_shared()
+        except Exception as e:
+            console.print(f"[yellow]Error closing pooled HTTP transport: {e}[/yellow]")
+
+    async def _close_all(self, transports: list[_SharedTransport]) -> None:
+        await asyncio.gather(*(self._close(shared) for shared in transports))
+
+    def transport(self, key: str = "default") -> httpx.AsyncBaseTransport:
+        """Return the shared transport for key, creating it on first use."""
+        self._check_loop()
+        key = key.upper()
+        shared = self._transports.get(key)
+        if shared is None:
+            stats = self.stats.setdefault(key, PoolStats())
+            inner = httpx.AsyncHTTPTransport(
+                http2=self.http2,
+                limits=self._limits.get(key, DEFAULT_LIMITS),
+                retries=1,
+            )
+            shared = _SharedTransport(inner, stats)
+            self._transports[key] = shared
+        return shared
+
+    def cookie_jar(self, key: str) -> CookieJar:
+        return self._cookie_jars.setdefault(key.upper(), CookieJar())
+
+    def client(self, key: str = "default", bind_cookies: bool = False, **kwargs: Any) -> httpx.AsyncClient:
+        """Create an AsyncClient over the shared transport for key.
+
+        Accepts the usual AsyncClient keyword arguments (headers, timeout, cookies,
+        follow_redirects, ...). With bind_cookies, the client uses the cookie jar shared
+        by every client for this key, seeded with any cookies passed in. A client given
+        its own transport uses it as is, outside the pool.
+        """
+        if bind_cookies:
+            jar = self.cookie_jar(key)
+            seed = kwargs.pop("cookies", None)
+            if seed is not None:
+                for cookie in httpx.Cookies(seed).jar:
+                    jar.set_cookie(cookie)
+            kwargs["cookies"] = jar
+        if kwargs.get("transport") is not None:
+            return httpx.AsyncClient(**kwargs)
+        kwargs.pop("transport", None)
+        self.stats.setdefault(key.upper(), PoolStats()).clients += 1
+        return httpx.AsyncClient(transport=self.transport(key), **kwargs)
+
+    @contextlib.asynccontextmanager
+    async def session(self, key: str = "default", bind_cookies: bool = False, **kwargs: Any) -> AsyncIterator[httpx.AsyncClient]:
+        """Drop-in for ``async with httpx.AsyncClient(...)`` that reuses pooled connections."""
+        client = self.client(key, bind_cookies=bind_cookies, **kwargs)
+        try:
+            yield client
+        finally:
+            await client.aclose()
+
+    def summary(self) -> str:
+        parts = [
+            f"{key}: {s.requests} requests over {s.connections} connections"
+            for key, s in sorted(self.stats.items())
+            if s.requests
+        ]
+        return ", ".join(parts) if parts else "no requests"
+
+    async def aclose(self) -> None:
+        transports = list(self._transports.values())
+        self._transports.clear()
+        await self._close_all(transports)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+
+http_pool = HttpClientPool()
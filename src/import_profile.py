@@ -0,0 +1,114 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Per-module import timing for ``--import-profile``.
+
+upload.py starts the profiler before its other imports when the flag is on
+the command line. From then on every module executed by a file-based loader
+is timed: its own time, excluding the modules it imports, and its time
+including them. The report is printed when the program exits, so tracker
+modules loaded lazily during the run are included. Only the standard library
+is imported here, so the profiler does not skew what it measures.
+"""
+import atexit
+import contextlib
+import importlib.machinery
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable, Optional, cast
+
+REPORT_LIMIT = 30
+
+_TIMED_LOADERS = (
+    importlib.machinery.SourceFileLoader,
+    importlib.machinery.SourcelessFileLoader,
+    importlib.machinery.ExtensionFileLoader,
+)
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_time: float
+    total_time: float
+    started: float  # seconds since the profiler started
+
+
+class ImportProfiler:
+    """Meta path finder that times module execution; it never loads anything itself."""
+
+    def __init__(self) -> None:
+        self.timings: list[ImportTiming] = []
+        self._children: list[float] = []  # time spent in nested imports, one slot per module being executed
+        self._started = 0.0
+        self._active = False
+
+    def start(self) -> None:
+        if self._active:
+            return
+        self._active = True
+        self._started = time.perf_counter()
+        sys.meta_path.insert(0, cast(Any, self))
+        atexit.register(self.report)
+
+    def stop(self) -> None:
+        self._active = False
+        with contextlib.suppress(ValueError):
+            sys.meta_path.remove(cast(Any, self))
+
+    def find_spec(self, fullname: str, path: Optional[Sequence[str]], target: Optional[ModuleType] = None) -> Optional[importlib.machinery.ModuleSpec]:
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = cast(Optional[importlib.machinery.ModuleSpec], find_spec(fullname, path, target))
+            if spec is None:
+                continue
+            if isinstance(spec.loader, _TIMED_LOADERS):
+                # File loaders are created per module, so timing this instance times only this module
+                self._wrap(spec.loader, fullname)
+            return spec
+        return None
+
+    def _wrap(self, loader: Any, fullname: str) -> None:
+        exec_module = cast(Callable[[ModuleType], None], loader.exec_module)
+
+        def timed_exec_module(module: ModuleType) -> None:
+            started = time.perf_counter()
+            self._children.append(0.0)
+            try:
+                exec_module(module)
+            finally:
+                total = time.perf_counter() - started
+                children = self._children.pop()
+                if self._children:
+                    self._children[-1] += total
+                self.timings.append(ImportTiming(fullname, total - children, total, started - self._started))
+
+        loader.exec_module = timed_exec_module
+
+    def report(self) -> None:
+        self.stop()
+        if not self.timings:
+            return
+        from src.console import console
+
+        top_level = sum(timing.self_time for timing in self.timings)
+        console.print(f"\n[bold]Import profile:[/bold] {len(self.timings)} modules, {top_level * 1000:.0f} ms importing")
+        console.print("[dim]    self ms   total ms   at ms  module[/dim]")
+        for timing in sorted(self.timings, key=lambda timing: timing.total_time, reverse=True)[:REPORT_LIMIT]:
+            console.print(
+                f"{timing.self_time * 1000:10.1f} {timing.total_time * 1000:10.1f} {timing.started * 1000:7.0f}  {timing.module}",
+                markup=False,
+                highlight=False,
+            )
+        trackers = sorted(timing.module.rsplit(".", 1)[-1] for timing in self.timings if timing.module.startswith("src.trackers."))
+        if trackers:
+            console.print(f"Tracker modules loaded: {', '.join(trackers)}", markup=False, highlight=False)
+
+
+import_profiler = ImportProfiler()
@@ -14,6 +14,7 @@ from bs4 import BeautifulSoup
 from bs4.element import AttributeValueList
 
 from src.console import console
+from src.http_pool import http_pool
 
 
 class SceneManager:
@@ -54,7 +55,7 @@ class SceneManager:
         os.makedirs(search_cache_dir, exist_ok=True)
         os.makedirs(details_cache_dir, exist_ok=True)
 
-        async with httpx.AsyncClient() as client:
+        async with http_pool.session("srrdb") as client:
             if 'scene' not in meta and not lower and not meta.get('emby_debug', False):
                 # Cache file for search
                 search_cache_file = os.path.join(search_cache_dir, f"{quoted_base}.json")
@@ -231,7 +232,7 @@ class SceneManager:
         if meta['debug']:
             console.print("Using predb url", url)
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_pool.session("predb") as client:
                 response = await client.get(url, timeout=10.0)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, "lxml")
@@ -0,0 +1,25 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Module-level singletons that hold asyncio primitives.
+
+Locks, semaphores and futures are tied to the event loop that first uses
+them, but the singletons outlive a loop: the Web UI and tests call
+``asyncio.run`` more than once in the same process. ``LoopBound`` notices
+when a different loop is running and lets the subclass drop its primitives.
+"""
+import asyncio
+from typing import Optional
+
+
+class LoopBound:
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _reset(self) -> None:
+        """Drop every asyncio primitive, so the next use creates them on the running loop."""
+        raise NotImplementedError
+
+    def _check_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._reset()
+            self._loop = loop
@@ -0,0 +1,122 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Persistent cache for MediaInfo and BDInfo output.
+
+Reading MediaInfo from a large file, and above all a BDInfo scan of a Blu-ray
+playlist, is slow, and the results used to live only in ``tmp/<uuid>``. The
+same files are often processed again: a re-run after a failed upload, a
+different tracker, or a ``--cleanup``. Results are therefore stored in
+``media_reports.db`` in the cache directory, keyed by the identity of the
+files they describe: absolute path, size, modification time, inode and a hash
+of the first, middle and last 64 KiB. Replacing or editing a file changes its
+identity, so stale results are never used, and the database is bounded by
+size with least recently used entries evicted first.
+"""
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from typing import Any, Optional, cast
+
+from src.sqlite_cache import SqliteCache
+
+DEFAULT_MAX_MB = 512
+
+# Bytes hashed at the start, middle and end of each file
+SAMPLE_SIZE = 64 * 1024
+
+
+def file_identity(path: str) -> Optional[list[Any]]:
+    """Identity of a regular file, or None if it can't be read."""
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+        if not os.path.isfile(path):
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for offset in sorted({0, max(0, stat.st_size // 2 - SAMPLE_SIZE // 2), max(0, stat.st_size - SAMPLE_SIZE)}):
+                f.seek(offset)
+                digest.update(f.read(SAMPLE_SIZE))
+    except OSError:
+        return None
+    return [path, stat.st_size, stat.st_mtime_ns, stat.st_ino, digest.hexdigest()]
+
+
+class MediaReportCache(SqliteCache):
+    TABLE = "reports"
+    GROUP = "kind"
+    LABEL = "Media report cache"
+
+    def __init__(self) -> None:
+        super().__init__(DEFAULT_MAX_MB)
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, config: dict[str, Any], base_dir: str) -> None:
+        """Apply DEFAULT config settings and open the cache database."""
+        default_cfg = cast(dict[str, Any], config.get("DEFAULT", {}))
+        self.close()
+        cache_dir = str(default_cfg.get("metadata_cache_dir") or os.path.join(base_dir, "data", "cache"))
+        self.path = os.path.join(cache_dir, "media_reports.db")
+        self.enabled = bool(default_cfg.get("media_report_cache", True))
+        if not self.enabled:
+            return
+
+        with contextlib.suppress(TypeError, ValueError):
+            self.max_bytes = int(float(default_cfg.get("media_report_cache_max_mb", DEFAULT_MAX_MB)) * 1024 * 1024)
+        self._open()
+
+    def make_key(self, kind: str, paths: Iterable[str], *parts: Any) -> Optional[str]:
+        """Key for a report on these files; None if any of them can't be identified.
+
+        Blocking, as it reads samples of every file; use key_for from async code.
+        """
+        if not self.enabled:
+            return None
+        identities: list[Any] = []
+        for path in paths:
+            identity = file_identity(path)
+            if identity is None:
+                return None
+            identities.append(identity)
+        raw = json.dumps([identities, parts], default=str, separators=(",", ":"))
+        return f"{kind}:{hashlib.sha1(raw.encode('utf-8'), usedforsecurity=False).hexdigest()}"
+
+    async def key_for(self, kind: str, paths: Iterable[str], *parts: Any) -> Optional[str]:
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.make_key, kind, list(paths), *parts)
+
+    def get(self, key: Optional[str]) -> Optional[Any]:
+        if not self.enabled or key is None:
+            return None
+        row = self._read(key)
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def set(self, key: Optional[str], value: Any) -> None:
+        if not self.enabled or key is None:
+            return
+        self._write(key.split(":", 1)[0], key, value)
+
+    async def load(self, key: Optional[str]) -> Optional[Any]:
+        if not self.enabled or key is None:
+            return None
+        return await asyncio.to_thread(self.get, key)
+
+    async def store(self, key: Optional[str], value: Any) -> None:
+        if not self.enabled or key is None:
+            return
+        await asyncio.to_thread(self.set, key, value)
+
+    def summary(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses"
+
+
+media_report_cache = MediaReportCache()
@@ -0,0 +1,94 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Copy-on-write views of meta for per-tracker work.
+
+Tracker checks run concurrently and each needs a private meta it can modify
+freely. Deep-copying the whole meta for every tracker also copies MediaInfo
+JSON, BDInfo output, image lists and descriptions that most checks only read.
+
+A ``MetaOverlay`` snapshots the top-level keys of the shared meta, which is
+cheap. It copies a container value only when that key is first accessed, and
+it keeps writes in its own layer. The shared meta never changes through the
+overlay. Results go back explicitly with ``merge_into``, and only the keys the
+caller names are merged.
+"""
+import copy
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from typing import Any
+
+# Values of these types can be modified in place, so they are copied before the overlay hands them out
+_MUTABLE_TYPES = (dict, list, set, bytearray)
+
+_MISSING = object()
+
+
+class MetaOverlay(MutableMapping[str, Any]):
+    def __init__(self, base: Mapping[str, Any]) -> None:
+        self._base = dict(base)
+        self._local: dict[str, Any] = {}
+        self._deleted: set[str] = set()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._local:
+            return self._local[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        value = self._base[key]
+        if isinstance(value, _MUTABLE_TYPES):
+            value = copy.deepcopy(value)
+            self._local[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._local[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._local.pop(key, None)
+        self._deleted.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._local or (key not in self._deleted and key in self._base)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._base:
+            if key not in self._deleted:
+                yield key
+        for key in self._local:
+            if key not in self._base:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def copy(self) -> dict[str, Any]:
+        """Return a plain dict with every value, for code that needs a real dict (e.g. json.dumps)."""
+        return {key: self[key] for key in self}
+
+    @property
+    def copied_keys(self) -> list[str]:
+        """Keys that have their own copy in this overlay, because they were written or read as containers."""
+        return list(self._local)
+
+    def changed(self, key: str) -> bool:
+        """True if the overlay's value for key differs from the snapshot it was created from."""
+        if key in self._deleted:
+            return key in self._base
+        if key not in self._local:
+            return False
+        return self._base.get(key, _MISSING) != self._local[key]
+
+    def merge_into(self, target: MutableMapping[str, Any], keys: Iterable[str]) -> list[str]:
+        """Write the listed keys that changed in this overlay back to target; returns the merged keys."""
+        merged: list[str] = []
+        for key in keys:
+            if not self.changed(key):
+                continue
+            if key in self._deleted:
+                target.pop(key, None)
+            else:
+                target[key] = self._local[key]
+            merged.append(key)
+        return merged
@@ -0,0 +1,200 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Checkpointing of meta to ``tmp/<uuid>/meta.json``.
+
+meta is saved at several points while a release is processed, and every save
+used to re-serialise and rewrite all of it, including MediaInfo and BDInfo
+payloads that rarely change. Each top-level key is now serialised on its own
+(with orjson when installed). Large values go to their own file under
+``tmp/<uuid>/meta/``, and ``meta.json`` records those files in ``__split__``. A
+save only writes the split files whose content changed, and it rewrites the
+compact ``meta.json`` only when one of its keys changed. Every file is written
+to a temporary name and renamed into place.
+
+A ``meta.json`` written by anything else, for example a full ``json.dumps``,
+still loads: without ``__split__`` its keys are read as they are, and the next
+save rewrites the files in full.
+"""
+import asyncio
+import contextlib
+import hashlib
+import importlib
+import json
+import os
+import re
+import shutil
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Optional, cast
+
+from src.console import console
+from src.loop_bound import LoopBound
+
+try:
+    orjson: Optional[Any] = importlib.import_module("orjson")
+except ImportError:
+    orjson = None
+
+# Values whose serialised size reaches this are stored in their own file
+SPLIT_THRESHOLD = 64 * 1024
+
+META_FILE = "meta.json"
+SPLIT_DIR = "meta"
+SPLIT_MARKER = "__split__"
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return cast(bytes, orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+        except TypeError:
+            # orjson refuses integers beyond 64 bits, which json handles
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _split_name(key: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", key)[:64]
+    return f"{safe}-{hashlib.blake2b(key.encode('utf-8'), digest_size=4).hexdigest()}.json"
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _signature(path: str) -> Optional[tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class _SavedState:
+    signature: Optional[tuple[int, int]] = None  # meta.json as this store last wrote it
+    hashes: dict[str, bytes] = field(default_factory=lambda: cast(dict[str, bytes], {}))
+    split: dict[str, str] = field(default_factory=lambda: cast(dict[str, str], {}))
+
+
+class MetaStore(LoopBound):
+    def __init__(self) -> None:
+        self._states: dict[str, _SavedState] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._thread_lock = threading.Lock()
+
+    @staticmethod
+    def tmp_dir(meta: dict[str, Any]) -> str:
+        return os.path.join(str(meta['base_dir']), "tmp", str(meta['uuid']))
+
+    def _reset(self) -> None:
+        self._locks.clear()
+
+    def _lock_for(self, directory: str) -> asyncio.Lock:
+        self._check_loop()
+        return self._locks.setdefault(directory, asyncio.Lock())
+
+    async def save(self, meta: dict[str, Any]) -> None:
+        """Checkpoint meta, writing only the parts that changed since the last save."""
+        directory = self.tmp_dir(meta)
+        async with self._lock_for(directory):
+            # Serialise on the event loop, where nothing else can modify meta meanwhile
+            encoded = {str(key): dumps(value) for key, value in meta.items()}
+            await asyncio.to_thread(self._write, directory, encoded)
+
+    def _write(self, directory: str, encoded: dict[str, bytes]) -> None:
+        meta_path = os.path.join(directory, META_FILE)
+        split_dir = os.path.join(directory, SPLIT_DIR)
+        with self._thread_lock:
+            state = self._states.get(directory)
+        if state is None or state.signature is None or state.signature != _signature(meta_path):
+            # First save in this run, or meta.json was rewritten elsewhere
+            state = _SavedState()
+
+        hashes = {key: _digest(data) for key, data in encoded.items()}
+        split = {key: state.split.get(key) or _split_name(key) for key, data in encoded.items() if len(data) >= SPLIT_THRESHOLD}
+        if split:
+            os.makedirs(split_dir, exist_ok=True)
+        for key, name in split.items():
+            if state.split.get(key) != name or state.hashes.get(key) != hashes[key]:
+                _write_atomic(os.path.join(split_dir, name), encoded[key])
+
+        small_keys = [key for key in encoded if key not in split]
+        small_changed = (
+            state.signature is None
+            or split != state.split
+            or set(hashes) != set(state.hashes)
+            or any(state.hashes.get(key) != hashes[key] for key in small_keys)
+        )
+        if small_changed:
+            parts = [dumps(key) + b":" + encoded[key] for key in small_keys]
+            if split:
+                parts.append(dumps(SPLIT_MARKER) + b":" + dumps(split))
+            _write_atomic(meta_path, b"{" + b",".join(parts) + b"}")
+
+        for key, name in state.split.items():
+            if split.get(key) != name:
+                with contextlib.suppress(OSError):
+                    os.remove(os.path.join(split_dir, name))
+
+        with self._thread_lock:
+            self._states[directory] = _SavedState(signature=_signature(meta_path), hashes=hashes, split=split)
+
+    def load(self, directory: str) -> Optional[dict[str, Any]]:
+        """Read a saved meta, including its split files; None if there is none."""
+        meta_path = os.path.join(directory, META_FILE)
+        try:
+            with open(meta_path, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        if not content.strip():
+            return {}
+        data = cast(dict[str, Any], loads(content))
+        split = cast(dict[str, str], data.pop(SPLIT_MARKER, None) or {})
+        state = _SavedState(signature=_signature(meta_path))
+        for key, name in split.items():
+            try:
+                with open(os.path.join(directory, SPLIT_DIR, name), "rb") as f:
+                    part = f.read()
+            except OSError as e:
+                console.print(f"[yellow]Saved meta value '{key}' could not be read: {e}[/yellow]")
+                continue
+            data[key] = loads(part)
+            state.hashes[key] = _digest(part)
+            state.split[key] = name
+        with self._thread_lock:
+            self._states[directory] = state
+        return data
+
+    def delete(self, directory: str) -> bool:
+        """Remove the saved meta and its split files; True if meta.json existed."""
+        with self._thread_lock:
+            self._states.pop(directory, None)
+        shutil.rmtree(os.path.join(directory, SPLIT_DIR), ignore_errors=True)
+        try:
+            os.remove(os.path.join(directory, META_FILE))
+        except FileNotFoundError:
+            return False
+        return True
+
+
+meta_store = MetaStore()
@@ -0,0 +1,260 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Persistent, disk-backed cache for metadata API responses.
+
+TMDb, IMDb, TVDB and TVmaze lookups are keyed by endpoint and parameters and
+stored in a small SQLite database that survives between runs, so a queue of
+episodes from the same series only performs the series lookups once.
+
+Entries are fresh for a per-source TTL. Once that expires they may still be
+served for a further stale window while a background refresh updates them.
+The database is bounded by size; least recently used entries are evicted.
+"""
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import time
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional, cast
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+from src.console import console
+from src.http_pool import http_pool
+from src.sqlite_cache import SqliteCache
+
+# Hours a cached response is considered fresh, per source
+DEFAULT_TTL_HOURS: dict[str, float] = {
+    "tmdb": 72,
+    "imdb": 168,
+    "tvdb": 24,
+    "tvmaze": 24,
+    "bluray": 168,
+    "bluray_search": 12,
+}
+
+# Hours after expiry that a stale response may still be served while it is refreshed
+DEFAULT_STALE_HOURS = 168
+
+DEFAULT_MAX_MB = 256
+
+# API hosts whose responses are cached, mapped to their TTL source
+HOST_SOURCES: dict[str, str] = {
+    "api.themoviedb.org": "tmdb",
+    "api.graphql.imdb.com": "imdb",
+    "api.tvmaze.com": "tvmaze",
+}
+
+# Query parameters that carry credentials and must never become part of a cache key
+_SECRET_PARAMS = {"api_key", "apikey", "token", "access_token"}
+
+# Response headers that no longer apply once the body has been decoded and stored
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class MetadataCache(SqliteCache):
+    TABLE = "entries"
+    GROUP = "source"
+    LABEL = "Metadata cache"
+
+    def __init__(self) -> None:
+        super().__init__(DEFAULT_MAX_MB)
+        self.ttls: dict[str, float] = {source: hours * 3600 for source, hours in DEFAULT_TTL_HOURS.items()}
+        self.stale_window = DEFAULT_STALE_HOURS * 3600
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._refreshing: set[str] = set()
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
+
+    def configure(self, config: dict[str, Any], base_dir: str, enabled: bool = True) -> None:
+        """Apply DEFAULT config settings and open the cache database."""
+        default_cfg = cast(dict[str, Any], config.get("DEFAULT", {}))
+        self.close()
+        # The path is set even when the cache is disabled, so --purge-metadata-cache still works
+        cache_dir = str(default_cfg.get("metadata_cache_dir") or os.path.join(base_dir, "data", "cache"))
+        self.path = os.path.join(cache_dir, "metadata.db")
+        self.enabled = enabled and bool(default_cfg.get("metadata_cache", True))
+        if not self.enabled:
+            return
+
+        ttl_overrides = default_cfg.get("metadata_cache_ttl_hours", {})
+        if isinstance(ttl_overrides, dict):
+            for source, hours in cast(dict[str, Any], ttl_overrides).items():
+                with contextlib.suppress(TypeError, ValueError):
+                    self.ttls[str(source).lower()] = float(hours) * 3600
+        with contextlib.suppress(TypeError, ValueError):
+            self.stale_window = float(default_cfg.get("metadata_cache_stale_hours", DEFAULT_STALE_HOURS)) * 3600
+        with contextlib.suppress(TypeError, ValueError):
+            self.max_bytes = int(float(default_cfg.get("metadata_cache_max_mb", DEFAULT_MAX_MB)) * 1024 * 1024)
+        self._open()
+
+    def close(self) -> None:
+        for task in self._refresh_tasks:
+            # The loop that ran a refresh may already be closed
+            with contextlib.suppress(RuntimeError):
+                task.cancel()
+        self._refresh_tasks.clear()
+        self._refreshing.clear()
+        super().close()
+
+    @staticmethod
+    def make_key(source: str, *parts: Any) -> str:
+        raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+        return f"{source}:{hashlib.sha1(raw.encode('utf-8'), usedforsecurity=False).hexdigest()}"
+
+    def ttl_for(self, source: str) -> float:
+        return self.ttls.get(source, DEFAULT_TTL_HOURS.get(source, 24) * 3600)
+
+    def get(self, key: str) -> Optional[tuple[Any, float]]:
+        """Return (value, age_seconds) for a key, or None if absent or expired past the stale window."""
+        if not self.enabled:
+            return None
+        row = self._read(key, max_age=lambda source: self.ttl_for(source) + self.stale_window)
+        if row is None:
+            return None
+        value, stored_at = row
+        return value, time.time() - stored_at
+
+    def set(self, source: str, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        self._write(source, key, value)
+
+    def summary(self) -> str:
+        return f"{self.hits} hits, {self.stale_hits} stale, {self.misses} misses"
+
+    def _schedule_refresh(self, key: str, refresh: Callable[[], Awaitable[None]]) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def _run() -> None:
+            try:
+                await refresh()
+            except Exception as e:
+                console.print(f"[yellow]Metadata cache background refresh failed: {e}[/yellow]")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(_run())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def cached_call(self, source: str, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return a cached value for key, calling the (blocking) fetch function on a miss.
+
+        Falsy results are not cached, so failed lookups are retried next time.
+        """
+        if not self.enabled:
+            return await asyncio.to_thread(fetch)
+
+        cached = await asyncio.to_thread(self.get, key)
+        if cached is not None:
+            value, age = cached
+            if age <= self.ttl_for(source):
+                self.hits += 1
+                return value
+
+            async def _refresh() -> None:
+                fresh = await asyncio.to_thread(fetch)
+                if fresh:
+                    await asyncio.to_thread(self.set, source, key, fresh)
+
+            self.stale_hits += 1
+            self._schedule_refresh(key, _refresh)
+            return value
+
+        self.misses += 1
+        value = await asyncio.to_thread(fetch)
+        if value:
+            await asyncio.to_thread(self.set, source, key, value)
+        return value
+
+    def client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """Create a pooled httpx.AsyncClient whose metadata API responses go through this cache."""
+        return httpx.AsyncClient(transport=CachingTransport(self), **kwargs)
+
+
+def _request_key(request: httpx.Request, source: str) -> str:
+    params = sorted((k, v) for k, v in parse_qsl(request.url.query.decode("ascii", "ignore"), keep_blank_values=True) if k.lower() not in _SECRET_PARAMS)
+    base = f"{request.url.scheme}://{request.url.host}{request.url.path}"
+    body = hashlib.sha1(request.content, usedforsecurity=False).hexdigest() if request.content else ""
+    return MetadataCache.make_key(source, request.method, base, urlencode(params), body)
+
+
+def _build_response(entry: dict[str, Any], request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        status_code=int(entry["status"]),
+        headers=cast(list[tuple[str, str]], [tuple(h) for h in entry.get("headers", [])]),
+        content=str(entry["body"]).encode("utf-8"),
+        request=request,
+    )
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """httpx transport that serves successful metadata API responses from MetadataCache."""
+
+    def __init__(self, cache: MetadataCache, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        self.cache = cache
+        self._transport = transport or http_pool.transport("metadata")
+
+    async def _fetch(self, request: httpx.Request, transport: httpx.AsyncBaseTransport) -> tuple[httpx.Response, Optional[dict[str, Any]]]:
+        response = await transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        if response.status_code != 200:
+            return response, None
+        try:
+            body = response.content.decode(response.encoding or "utf-8")
+        except (LookupError, UnicodeDecodeError):
+            return response, None
+        headers = [[k, v] for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS]
+        return response, {"status": response.status_code, "headers": headers, "body": body}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        source = HOST_SOURCES.get(request.url.host)
+        if not self.cache.enabled or source is None or request.method not in ("GET", "POST"):
+            return await self._transport.handle_async_request(request)
+
+        await request.aread()
+        key = _request_key(request, source)
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            entry, age = cached
+            if age <= self.cache.ttl_for(source):
+                self.cache.hits += 1
+                return _build_response(cast(dict[str, Any], entry), request)
+
+            async def _refresh() -> None:
+                _, fresh = await self._fetch(request, self._transport)
+                if fresh is not None:
+                    await asyncio.to_thread(self.cache.set, source, key, fresh)
+
+            self.cache.stale_hits += 1
+            self.cache._schedule_refresh(key, _refresh)
+            return _build_response(cast(dict[str, Any], entry), request)
+
+        self.cache.misses += 1
+        response, entry = await self._fetch(request, self._transport)
+        if entry is None:
+            return httpx.Response(
+                status_code=response.status_code,
+                headers=[(k, v) for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS],
+                content=response.content,
+                request=request,
+                extensions=response.extensions,
+            )
+        await asyncio.to_thread(self.cache.set, source, key, entry)
+        return _build_response(entry, request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+metadata_cache = MetadataCache()
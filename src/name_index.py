@@ -0,0 +1,400 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Persistent file name index for the Discord search commands and Web UI search.
+
+Walking a large library for every query is slow, so each search root is
+indexed once: every directory is stored with its mtime and the names it
+contains, and names are split into tokens in an inverted index. Queries only
+look at the entries sharing the query's tokens.
+
+The index is kept current by re-stating the indexed directories. A directory
+whose mtime changed is listed again and only its entries are replaced, so a
+refresh costs one stat per directory instead of listing the whole tree.
+Refreshes run in the background at most every ``search_index_interval``
+seconds; the directory listings are stored in SQLite so the index survives
+restarts. When UA itself has written files (links, copies into a watch folder),
+``invalidate()`` records that in the database, and the next query in any process
+refreshes before answering instead of returning results up to an interval old.
+"""
+import contextlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, cast
+
+from src.console import console
+
+DEFAULT_INTERVAL = 300
+
+# Separators between name tokens (same set the Web UI search splits on)
+SEPARATOR_RE = re.compile(r"[\s.\-_]+")
+
+
+def name_tokens(name: str) -> list[str]:
+    return [token for token in SEPARATOR_RE.split(name.lower()) if token]
+
+
+@dataclass
+class DirRecord:
+    mtime: int
+    hidden: bool
+    # name -> entry id for everything listed in the directory
+    children: dict[str, int] = field(default_factory=dict)
+    # subdirectories that are descended into (symlinked directories are listed, not followed)
+    subdirs: list[str] = field(default_factory=list)
+
+
+@dataclass
+class SearchHit:
+    path: str
+    name: str
+    is_dir: bool
+
+
+class NameIndex:
+    """Index of every name below one root directory."""
+
+    def __init__(self, root: str, manager: "NameIndexManager") -> None:
+        self.root = root
+        self.manager = manager
+        self.dirs: dict[str, DirRecord] = {}
+        self.names: list[Optional[str]] = []
+        self.parents: list[str] = []
+        self.is_dir: list[bool] = []
+        self.hidden: list[bool] = []
+        self.postings: dict[str, set[int]] = {}
+        self.refreshed = 0.0
+        # Wall clock time the last refresh started, compared against invalidations
+        self.refreshed_at = 0.0
+        self._free: list[int] = []
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def refreshing(self) -> bool:
+        return self._refresh_lock.locked()
+
+    # Entries
+
+    def _add_entry(self, parent: str, name: str, is_dir: bool, hidden: bool) -> int:
+        if self._free:
+            entry = self._free.pop()
+            self.names[entry] = name
+            self.parents[entry] = parent
+            self.is_dir[entry] = is_dir
+            self.hidden[entry] = hidden
+        else:
+            entry = len(self.names)
+            self.names.append(name)
+            self.parents.append(parent)
+            self.is_dir.append(is_dir)
+            self.hidden.append(hidden)
+        for token in set(name_tokens(name)):
+            self.postings.setdefault(token, set()).add(entry)
+        return entry
+
+    def _remove_entry(self, entry: int) -> None:
+        name = self.names[entry]
+        if name is None:
+            return
+        for token in set(name_tokens(name)):
+            ids = self.postings.get(token)
+            if ids is not None:
+                ids.discard(entry)
+                if not ids:
+                    del self.postings[token]
+        self.names[entry] = None
+        self._free.append(entry)
+
+    def _drop_dir(self, path: str, removed: list[str]) -> None:
+        record = self.dirs.pop(path, None)
+        if record is None:
+            return
+        removed.append(path)
+        for entry in record.children.values():
+            self._remove_entry(entry)
+        for subdir in record.subdirs:
+            self._drop_dir(os.path.join(path, subdir), removed)
+
+    def _apply(self, path: str, mtime: int, hidden: bool, listing: list[tuple[str, bool, bool]], removed: list[str]) -> DirRecord:
+        """Replace the stored listing of path; listing holds (name, is_dir, descend)."""
+        old = self.dirs.get(path)
+        record = DirRecord(mtime=mtime, hidden=hidden)
+        old_children = old.children if old is not None else {}
+        for name, is_dir, descend in listing:
+            entry = old_children.pop(name, None)
+            if entry is not None and self.is_dir[entry] != is_dir:
+                self._remove_entry(entry)
+                entry = None
+            if entry is None:
+                entry = self._add_entry(path, name, is_dir, hidden or name.startswith("."))
+            record.children[name] = entry
+            if descend:
+                record.subdirs.append(name)
+        for entry in old_children.values():
+            self._remove_entry(entry)
+        if old is not None:
+            kept = set(record.subdirs)
+            for subdir in old.subdirs:
+                if subdir not in kept:
+                    self._drop_dir(os.path.join(path, subdir), removed)
+        self.dirs[path] = record
+        return record
+
+    # Refreshing
+
+    @staticmethod
+    def _list_dir(path: str) -> list[tuple[str, bool, bool]]:
+        listing: list[tuple[str, bool, bool]] = []
+        with os.scandir(path) as it:
+            for dir_entry in it:
+                try:
+                    is_dir = dir_entry.is_dir()
+                    descend = is_dir and not dir_entry.is_symlink()
+                except OSError:
+                    is_dir = descend = False
+                listing.append((dir_entry.name, is_dir, descend))
+        return listing
+
+    def refresh(self) -> None:
+        """Bring the index up to date, re-listing only directories whose mtime changed."""
+        with self._refresh_lock:
+            started = time.monotonic()
+            started_at = time.time()
+            changed: dict[str, DirRecord] = {}
+            removed: list[str] = []
+            stack: list[tuple[str, bool]] = [(self.root, False)]
+            while stack:
+                path, hidden = stack.pop()
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                    record = self.dirs.get(path)
+                    if record is None or record.mtime != mtime:
+                        listing = self._list_dir(path)
+                        with self._lock:
+                            record = self._apply(path, mtime, hidden, listing, removed)
+                        changed[path] = record
+                except OSError:
+                    with self._lock:
+                        self._drop_dir(path, removed)
+                    continue
+                stack.extend((os.path.join(path, subdir), hidden or subdir.startswith(".")) for subdir in record.subdirs)
+            self.refreshed = time.monotonic()
+            self.refreshed_at = started_at
+            if changed or removed:
+                self.manager.store(self, changed, removed)
+                if self.manager.debug:
+                    console.print(f"[cyan]Search index for {self.root}: {len(changed)} directories updated, {len(removed)} removed in {self.refreshed - started:.2f}s[/cyan]")
+
+    def load(self, rows: list[tuple[str, int, int, str]]) -> None:
+        with self._lock:
+            for path, mtime, hidden, entries in rows:
+                listing = [(item[1:], item[0] != "f", item[0] == "d") for item in entries.split("\0") if item]
+                self._apply(path, int(mtime), bool(hidden), listing, [])
+
+    def serialize(self, record: DirRecord) -> str:
+        parts: list[str] = []
+        descend = set(record.subdirs)
+        for name, entry in record.children.items():
+            kind = ("d" if name in descend else "l") if self.is_dir[entry] else "f"
+            parts.append(kind + name)
+        return "\0".join(parts)
+
+    # Querying
+
+    def _candidates(self, words: list[str], exact_tokens: bool) -> Optional[set[int]]:
+        """Entry ids that can match every word (None means every entry)."""
+        result: Optional[set[int]] = None
+        for word in words:
+            for part in name_tokens(word):
+                ids: set[int] = set()
+                if exact_tokens:
+                    ids = self.postings.get(part, ids)
+                else:
+                    # A separator-free substring of a name always lies inside a single token
+                    for token, token_ids in self.postings.items():
+                        if part in token:
+                            ids |= token_ids
+                result = set(ids) if result is None else result & ids
+                if not result:
+                    return result
+        return result
+
+    def search(self, words: list[str], exact_tokens: bool, include_hidden: bool) -> list[SearchHit]:
+        with self._lock:
+            candidates = self._candidates(words, exact_tokens)
+            ids = candidates if candidates is not None else range(len(self.names))
+            hits: list[SearchHit] = []
+            for entry in ids:
+                name = self.names[entry]
+                if name is None or (self.hidden[entry] and not include_hidden):
+                    continue
+                if exact_tokens:
+                    if not _ordered_tokens(name_tokens(name), words):
+                        continue
+                else:
+                    lowered = name.lower()
+                    if not all(word in lowered for word in words):
+                        continue
+                hits.append(SearchHit(path=os.path.join(self.parents[entry], name), name=name, is_dir=self.is_dir[entry]))
+        return hits
+
+
+def _ordered_tokens(tokens: list[str], wanted: list[str]) -> bool:
+    """True if every wanted token appears in tokens, in order."""
+    remaining = iter(tokens)
+    return all(token in remaining for token in wanted)
+
+
+class NameIndexManager:
+    def __init__(self) -> None:
+        self.interval = float(DEFAULT_INTERVAL)
+        self.debug = False
+        self.path: Optional[str] = None
+        self.indexes: dict[str, NameIndex] = {}
+        self.invalidated = 0.0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._configured = False
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+
+    def configure(self, config: dict[str, Any], base_dir: str) -> None:
+        default_cfg = cast(dict[str, Any], config.get("DEFAULT", {}))
+        try:
+            self.interval = max(0.0, float(default_cfg.get("search_index_interval", DEFAULT_INTERVAL)))
+        except (TypeError, ValueError):
+            self.interval = float(DEFAULT_INTERVAL)
+        self.debug = bool(default_cfg.get("debug", False))
+        cache_dir = str(default_cfg.get("metadata_cache_dir") or os.path.join(base_dir, "data", "cache"))
+        with self._lock:
+            self._open(cache_dir)
+            self.indexes.clear()
+            self._configured = True
+
+    def _open(self, cache_dir: str) -> None:
+        if self._conn is not None:
+            with contextlib.suppress(sqlite3.Error):
+                self._conn.close()
+            self._conn = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.path = os.path.join(cache_dir, "name_index.db")
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, mtime INTEGER, hidden INTEGER, entries TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value REAL)")
+            conn.commit()
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            console.print(f"[yellow]Search index will not be saved: {e}[/yellow]")
+            self._conn = None
+
+    def _ensure_configured(self) -> None:
+        # The Web UI can run without upload.py configuring us first
+        if not self._configured:
+            with self._lock:
+                if not self._configured:
+                    self._open(os.path.join(str(Path(__file__).resolve().parent.parent), "data", "cache"))
+                    self._configured = True
+
+    def _rows(self, root: str) -> list[tuple[str, int, int, str]]:
+        if self._conn is None:
+            return []
+        # Every path below root sorts between "root/" and "root0" ("0" follows "/")
+        prefix = root.rstrip(os.sep) + os.sep
+        try:
+            with self._db_lock:
+                return self._conn.execute(
+                    "SELECT path, mtime, hidden, entries FROM dirs WHERE path = ? OR (path >= ? AND path < ?) ORDER BY path",
+                    (root, prefix, prefix[:-1] + chr(ord(os.sep) + 1)),
+                ).fetchall()
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Could not load search index: {e}[/yellow]")
+            return []
+
+    def store(self, index: NameIndex, changed: dict[str, DirRecord], removed: list[str]) -> None:
+        if self._conn is None:
+            return
+        try:
+            with self._db_lock, self._conn:
+                self._conn.executemany("DELETE FROM dirs WHERE path = ?", [(path,) for path in removed])
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?)",
+                    [(path, record.mtime, int(record.hidden), index.serialize(record)) for path, record in changed.items()],
+                )
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Could not save search index: {e}[/yellow]")
+
+    def invalidate(self) -> None:
+        """Make the next query refresh first, in this process and any other using the same database."""
+        self._ensure_configured()
+        self.invalidated = time.time()
+        if self._conn is None:
+            return
+        try:
+            with self._db_lock, self._conn:
+                self._conn.execute("INSERT OR REPLACE INTO state VALUES ('invalidated', ?)", (self.invalidated,))
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Could not save search index state: {e}[/yellow]")
+
+    def _last_invalidated(self) -> float:
+        if self._conn is None:
+            return self.invalidated
+        try:
+            with self._db_lock:
+                row = self._conn.execute("SELECT value FROM state WHERE key = 'invalidated'").fetchone()
+        except sqlite3.Error:
+            return self.invalidated
+        return max(self.invalidated, float(row[0]) if row is not None else 0.0)
+
+    def index_for(self, root: str) -> NameIndex:
+        """Return the up-to-date index of root, refreshing it in the background when stale."""
+        self._ensure_configured()
+        root = os.path.abspath(root)
+        with self._lock:
+            index = self.indexes.get(root)
+            created = index is None
+            if index is None:
+                index = NameIndex(root, self)
+                self.indexes[root] = index
+        if created:
+            index.load(self._rows(root))
+        if not index.dirs or self.interval == 0 or index.refreshed_at < self._last_invalidated():
+            # Nothing indexed yet, or UA wrote files since the last refresh: refresh now so this query sees them
+            index.refresh()
+        elif time.monotonic() - index.refreshed >= self.interval and not index.refreshing:
+            threading.Thread(target=index.refresh, name=f"name-index:{root}", daemon=True).start()
+        return index
+
+    def search(
+        self,
+        roots: list[str],
+        words: list[str],
+        exact_tokens: bool = False,
+        include_hidden: bool = True,
+    ) -> list[SearchHit]:
+        """Find names below roots matching every word.
+
+        With exact_tokens the words must be whole name tokens in order (Web UI
+        search); otherwise each word must be a substring of the name.
+        """
+        words = [word.lower() for word in words if word]
+        if not words:
+            return []
+        hits: dict[str, SearchHit] = {}
+        for root in roots:
+            if not os.path.isdir(root):
+                continue
+            try:
+                for hit in self.index_for(root).search(words, exact_tokens, include_hidden):
+                    hits.setdefault(hit.path, hit)
+            except OSError as e:
+                console.print(f"[yellow]Could not search {root}: {e}[/yellow]")
+        return sorted(hits.values(), key=lambda hit: hit.path)
+
+
+name_index = NameIndexManager()
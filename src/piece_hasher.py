@@ -0,0 +1,191 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Parallel piece hashing for torrents built with torf.
+
+torf reads the content on a single thread, which caps hashing well below
+what fast storage can deliver. Here the piece list is split into ranges that
+are hashed by a pool of worker threads, each reading its range sequentially
+into a reusable buffer. Both the reads and hashlib release the GIL, so the
+threads hash in parallel without forking the (threaded) uploader process.
+The resulting ``pieces`` value is identical to what ``torf.Torrent.generate``
+produces for the same torrent.
+"""
+import bisect
+import hashlib
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Optional, cast
+
+import torf
+
+from src.console import console
+
+# Target amount of data hashed per worker task
+TASK_BYTES = 64 * 1024 * 1024
+
+# (path, offset into file, length) segments making up one task's byte range
+Segment = tuple[str, int, int]
+
+
+def _hash_segments(segments: list[Segment], piece_size: int, piece_count: int) -> bytes:
+    """Hash piece_count consecutive pieces whose data is the concatenation of segments."""
+    buffer = bytearray(piece_size)
+    view = memoryview(buffer)
+    digests: list[bytes] = []
+    filled = 0
+
+    for path, offset, length in segments:
+        with open(path, "rb", buffering=0) as f:
+            fadvise = getattr(os, "posix_fadvise", None)
+            if fadvise is not None:
+                fadvise(f.fileno(), offset, length, os.POSIX_FADV_SEQUENTIAL)
+            f.seek(offset)
+            remaining = length
+            while remaining > 0:
+                want = min(piece_size - filled, remaining)
+                got = f.readinto(view[filled:filled + want])
+                if not got:
+                    raise OSError(f"Unexpected end of file while hashing: {path}")
+                filled += got
+                remaining -= got
+                if filled == piece_size:
+                    digests.append(hashlib.sha1(view, usedforsecurity=False).digest())
+                    filled = 0
+
+    # Only the final piece of the torrent may be short
+    if filled:
+        digests.append(hashlib.sha1(view[:filled], usedforsecurity=False).digest())
+
+    if len(digests) != piece_count:
+        raise RuntimeError(f"Hashed {len(digests)} pieces, expected {piece_count}")
+    return b"".join(digests)
+
+
+def content_files(torrent: torf.Torrent) -> list[tuple[str, int]]:
+    """Return (absolute path, size) for every file in torrent, in piece order."""
+    info = torrent.metainfo["info"]
+    if torrent.mode == "singlefile":
+        return [(str(torrent.path), int(info["length"]))]
+    base = str(torrent.path)
+    return [(os.path.join(base, *entry["path"]), int(entry["length"])) for entry in info["files"]]
+
+
+def _segments(files: list[tuple[str, int]], starts: list[int], offset: int, length: int) -> list[Segment]:
+    """Map the content byte range [offset, offset + length) onto file segments."""
+    segments: list[Segment] = []
+    index = bisect.bisect_right(starts, offset) - 1
+    while length > 0 and index < len(files):
+        path, size = files[index]
+        within = offset - starts[index]
+        take = min(size - within, length)
+        if take > 0:
+            segments.append((path, within, take))
+            offset += take
+            length -= take
+        index += 1
+    return segments
+
+
+def plan_tasks(
+    files: list[tuple[str, int]],
+    piece_size: int,
+    needed: Optional[list[int]] = None,
+) -> list[tuple[int, int, list[Segment]]]:
+    """Group pieces into (first piece, piece count, file segments) tasks.
+
+    Only the pieces listed in needed are planned (all pieces by default); runs of
+    consecutive pieces are split so each task hashes roughly TASK_BYTES.
+    """
+    total = sum(size for _, size in files)
+    piece_total = -(-total // piece_size)
+    starts: list[int] = []
+    position = 0
+    for _, size in files:
+        starts.append(position)
+        position += size
+
+    pieces_per_task = max(1, TASK_BYTES // piece_size)
+    indices = needed if needed is not None else range(piece_total)
+    tasks: list[tuple[int, int, list[Segment]]] = []
+    first = previous = -1
+    for piece in [*indices, -1]:
+        if piece >= 0 and previous >= 0 and piece == previous + 1 and piece - first < pieces_per_task:
+            previous = piece
+            continue
+        if first >= 0:
+            offset = first * piece_size
+            length = min((previous + 1) * piece_size, total) - offset
+            tasks.append((first, previous - first + 1, _segments(files, starts, offset, length)))
+        first = previous = piece
+    return tasks
+
+
+def generate(
+    torrent: torf.Torrent,
+    workers: int = 0,
+    callback: Optional[Callable[[torf.Torrent, str, int, int], Any]] = None,
+    interval: float = 0,
+    known: Optional[list[Optional[bytes]]] = None,
+    verify: Optional[set[int]] = None,
+) -> bool:
+    """Hash torrent's pieces in parallel and store them in its metainfo.
+
+    callback has the same signature torf.Torrent.generate uses. known may supply
+    digests for some pieces (None for the rest), which are then not re-read; any
+    index in verify is hashed anyway and must match its known digest. Returns False
+    if parallel hashing could not be used, so the caller can fall back to torf.
+    """
+    piece_size = int(torrent.piece_size or 0)
+    piece_total = int(torrent.pieces or 0)
+    if torrent.path is None or piece_size <= 0 or piece_total <= 0:
+        return False
+
+    files = [(path, size) for path, size in content_files(torrent) if size > 0]
+    digests: list[Optional[bytes]] = list(known) if known is not None else [None] * piece_total
+    if len(digests) != piece_total:
+        return False
+    checks = {index for index in (verify or set()) if digests[index] is not None}
+    needed = [index for index, digest in enumerate(digests) if digest is None or index in checks]
+    tasks = plan_tasks(files, piece_size, needed)
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    workers = max(1, min(workers, len(tasks) or 1))
+
+    pieces_done = piece_total - len(needed)
+    last_report = 0.0
+    try:
+        if callback is not None:
+            callback(torrent, files[0][0], 0, piece_total)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="piece-hasher") as executor:
+            futures: dict[Future[bytes], int] = {
+                executor.submit(_hash_segments, segments, piece_size, count): index
+                for index, (_first, count, segments) in enumerate(tasks)
+            }
+            for future in as_completed(futures):
+                first, count, segments = tasks[futures[future]]
+                result = future.result()
+                for offset in range(count):
+                    digest = result[offset * 20:(offset + 1) * 20]
+                    if first + offset in checks and digests[first + offset] != digest:
+                        console.print(f"[yellow]Reused piece {first + offset} does not match the files on disk, rehashing everything[/yellow]")
+                        for pending in futures:
+                            pending.cancel()
+                        return False
+                    digests[first + offset] = digest
+                pieces_done += count
+                now = time.monotonic()
+                if callback is not None and (now - last_report >= interval or pieces_done == piece_total):
+                    last_report = now
+                    if callback(torrent, segments[-1][0], pieces_done, piece_total) is not None:
+                        for pending in futures:
+                            pending.cancel()
+                        return False
+    except Exception as e:
+        console.print(f"[yellow]Parallel hashing unavailable ({e}), falling back to torf[/yellow]")
+        return False
+
+    if any(digest is None for digest in digests):
+        console.print("[yellow]Parallel hashing produced an unexpected piece count, falling back to torf[/yellow]")
+        return False
+    torrent.metainfo["info"]["pieces"] = b"".join(cast(list[bytes], digests))
+    return True
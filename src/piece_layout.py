@@ -0,0 +1,295 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Reuse piece hashes from torrents that were already created for the same files.
+
+Every .torrent UA reads from a client or writes itself is recorded in a local
+index (infohash -> piece size, file layout and piece hashes). When a new torrent
+is created for files found in the index with the same piece size, pieces whose
+bytes map onto identical file ranges in the indexed torrent keep their hash, and
+only the remaining pieces (where the file set or order differs) are read from
+disk. Reused hashes are spot checked before they are trusted: the first, middle
+and last reused piece of every file plus a random sample of the rest are rehashed,
+and any mismatch discards the reuse. The feature is opt-in (``piece_hash_reuse``).
+
+SHA-1 piece hashes cannot be combined or split, so a torrent with a different
+piece size never contributes hashes.
+"""
+import bisect
+import contextlib
+import os
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional, cast
+
+from torf import Torrent
+
+from src.console import console
+
+# Torrents kept in the index; the oldest are dropped beyond this
+MAX_ENTRIES = 5000
+
+# Reused pieces rehashed at random on top of the first, middle and last of each file
+VERIFY_FRACTION = 0.01
+VERIFY_MIN = 8
+VERIFY_MAX = 256
+
+# (path relative to the torrent root, size); single-file torrents use the file name
+FileEntry = tuple[str, int]
+
+
+@dataclass
+class TorrentLayout:
+    infohash: str
+    piece_size: int
+    files: list[FileEntry]
+    pieces: bytes
+
+    @property
+    def total_size(self) -> int:
+        return sum(size for _, size in self.files)
+
+
+def torrent_files(torrent: Torrent) -> list[FileEntry]:
+    """Return the torrent's files in piece order, relative to its root."""
+    info = torrent.metainfo.get("info", {})
+    if "files" in info:
+        return [("/".join(str(part) for part in entry["path"]), int(entry["length"])) for entry in info["files"]]
+    return [(str(info.get("name", "")), int(info.get("length", 0)))]
+
+
+def layout_from_torrent(torrent: Torrent) -> Optional[TorrentLayout]:
+    """Describe a torrent's piece layout, or None if it has no piece hashes yet."""
+    info = torrent.metainfo.get("info", {})
+    pieces = info.get("pieces")
+    piece_size = info.get("piece length")
+    if not pieces or not piece_size:
+        return None
+    return TorrentLayout(infohash=str(torrent.infohash), piece_size=int(piece_size), files=torrent_files(torrent), pieces=bytes(pieces))
+
+
+def _file_starts(files: list[FileEntry]) -> list[int]:
+    starts: list[int] = []
+    position = 0
+    for _, size in files:
+        starts.append(position)
+        position += size
+    return starts
+
+
+def _match_files(source: TorrentLayout, target: list[FileEntry]) -> dict[int, int]:
+    """Map target file indexes to source file indexes holding the same file."""
+    by_path = {(path, size): index for index, (path, size) in enumerate(source.files)}
+    by_name: dict[FileEntry, list[int]] = {}
+    for index, (path, size) in enumerate(source.files):
+        by_name.setdefault((os.path.basename(path), size), []).append(index)
+
+    matches: dict[int, int] = {}
+    for index, (path, size) in enumerate(target):
+        if size <= 0:
+            continue
+        exact = by_path.get((path, size))
+        if exact is not None:
+            matches[index] = exact
+            continue
+        candidates = by_name.get((os.path.basename(path), size), [])
+        if len(candidates) == 1:
+            matches[index] = candidates[0]
+    return matches
+
+
+def translate(source: TorrentLayout, target: list[FileEntry], piece_size: int) -> tuple[list[Optional[bytes]], set[int]]:
+    """Derive the target's piece hashes from source where the byte ranges are identical.
+
+    Returns one entry per target piece (None where the piece must be hashed) and
+    the piece indexes to spot check against the data on disk.
+    """
+    total = sum(size for _, size in target)
+    piece_total = -(-total // piece_size) if piece_size > 0 else 0
+    known: list[Optional[bytes]] = [None] * piece_total
+    verify: set[int] = set()
+    if source.piece_size != piece_size or piece_total == 0:
+        return known, verify
+
+    matches = _match_files(source, target)
+    if not matches:
+        return known, verify
+    target_starts = _file_starts(target)
+    source_starts = _file_starts(source.files)
+    source_total = source.total_size
+    reused_by_file: dict[int, list[int]] = {}
+
+    for piece in range(piece_total):
+        start = piece * piece_size
+        end = min(start + piece_size, total)
+        # Walk the files covered by this piece; every one must map to the same
+        # run of bytes in the source, which must itself start on a piece boundary
+        source_start: Optional[int] = None
+        expected = -1
+        reusable = True
+        files_in_piece: list[int] = []
+        for index in range(max(bisect.bisect_right(target_starts, start) - 1, 0), len(target)):
+            file_start = target_starts[index]
+            if file_start >= end:
+                break
+            size = target[index][1]
+            file_end = file_start + size
+            if size <= 0 or file_end <= start:
+                continue
+            source_index = matches.get(index)
+            if source_index is None:
+                reusable = False
+                break
+            position = source_starts[source_index] + max(start, file_start) - file_start
+            if source_start is None:
+                source_start = position
+            elif position != expected:
+                reusable = False
+                break
+            expected = position + min(end, file_end) - max(start, file_start)
+            files_in_piece.append(index)
+        if not reusable or source_start is None or source_start % piece_size:
+            continue
+        source_piece = source_start // piece_size
+        # The piece must span the same length in the source (only the last may be short)
+        if min(source_start + piece_size, source_total) != expected:
+            continue
+        known[piece] = source.pieces[source_piece * 20:(source_piece + 1) * 20]
+        for index in files_in_piece:
+            reused_by_file.setdefault(index, []).append(piece)
+
+    for pieces in reused_by_file.values():
+        verify.update((pieces[0], pieces[len(pieces) // 2], pieces[-1]))
+    reused = [piece for piece, digest in enumerate(known) if digest is not None and piece not in verify]
+    sample = min(len(reused), max(VERIFY_MIN, min(VERIFY_MAX, int(len(reused) * VERIFY_FRACTION))))
+    verify.update(random.sample(reused, sample))  # nosec B311
+    return known, verify
+
+
+class LayoutIndex:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.path: Optional[str] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def configure(self, config: dict[str, Any], base_dir: str) -> None:
+        default_cfg = cast(dict[str, Any], config.get("DEFAULT", {}))
+        self.close()
+        self.enabled = bool(default_cfg.get("piece_hash_reuse", False))
+        if not self.enabled:
+            return
+        cache_dir = str(default_cfg.get("metadata_cache_dir") or os.path.join(base_dir, "data", "cache"))
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.path = os.path.join(cache_dir, "layouts.db")
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS torrents ("
+                "infohash TEXT PRIMARY KEY, piece_size INTEGER, files TEXT, pieces BLOB, stored_at REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "infohash TEXT, name TEXT, size INTEGER, PRIMARY KEY (infohash, name, size))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS files_lookup ON files (name, size)")
+            conn.commit()
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            console.print(f"[yellow]Torrent layout index unavailable: {e}[/yellow]")
+            self.enabled = False
+            self._conn = None
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with contextlib.suppress(sqlite3.Error):
+                self._conn.close()
+            self._conn = None
+
+    def record(self, torrent: Torrent) -> None:
+        """Add a torrent's layout to the index."""
+        if not self.enabled or self._conn is None:
+            return
+        layout = layout_from_torrent(torrent)
+        if layout is None:
+            return
+        files = "\n".join(f"{size}\t{path}" for path, size in layout.files)
+        names = {(os.path.basename(path), size) for path, size in layout.files if size > 0}
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO torrents VALUES (?, ?, ?, ?, ?)",
+                    (layout.infohash, layout.piece_size, files, layout.pieces, time.time()),
+                )
+                self._conn.execute("DELETE FROM files WHERE infohash = ?", (layout.infohash,))
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO files VALUES (?, ?, ?)",
+                    [(layout.infohash, name, size) for name, size in names],
+                )
+                self._conn.execute(
+                    "DELETE FROM files WHERE infohash IN (SELECT infohash FROM torrents ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (MAX_ENTRIES,),
+                )
+                self._conn.execute(
+                    "DELETE FROM torrents WHERE infohash IN (SELECT infohash FROM torrents ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (MAX_ENTRIES,),
+                )
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Could not record torrent layout: {e}[/yellow]")
+
+    def record_file(self, torrent_path: str) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.record(Torrent.read(torrent_path))
+        except Exception as e:
+            console.print(f"[yellow]Could not index {torrent_path}: {e}[/yellow]")
+
+    def _load(self, infohash: str) -> Optional[TorrentLayout]:
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            "SELECT piece_size, files, pieces FROM torrents WHERE infohash = ?", (infohash,)
+        ).fetchone()
+        if row is None:
+            return None
+        files: list[FileEntry] = []
+        for line in str(row[1]).split("\n"):
+            size, _, path = line.partition("\t")
+            files.append((path, int(size)))
+        return TorrentLayout(infohash=infohash, piece_size=int(row[0]), files=files, pieces=bytes(row[2]))
+
+    def find(self, target: list[FileEntry], piece_size: int) -> Optional[tuple[TorrentLayout, list[Optional[bytes]], set[int]]]:
+        """Return the indexed torrent contributing the most reusable pieces, if any."""
+        if not self.enabled or self._conn is None:
+            return None
+        names = {(os.path.basename(path), size) for path, size in target if size > 0}
+        try:
+            with self._lock:
+                infohashes: set[str] = set()
+                for name, size in names:
+                    rows = self._conn.execute(
+                        "SELECT files.infohash FROM files JOIN torrents ON torrents.infohash = files.infohash "
+                        "WHERE files.name = ? AND files.size = ? AND torrents.piece_size = ?",
+                        (name, size, piece_size),
+                    ).fetchall()
+                    infohashes.update(str(row[0]) for row in rows)
+                layouts = [layout for layout in (self._load(infohash) for infohash in infohashes) if layout is not None]
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Torrent layout lookup failed: {e}[/yellow]")
+            return None
+
+        best: Optional[tuple[TorrentLayout, list[Optional[bytes]], set[int]]] = None
+        best_count = 0
+        for layout in layouts:
+            known, verify = translate(layout, target, piece_size)
+            count = sum(1 for digest in known if digest is not None)
+            if count > best_count:
+                best, best_count = (layout, known, verify), count
+        return best
+
+
+layout_index = LayoutIndex()
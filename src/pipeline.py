@@ -0,0 +1,214 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Small dependency-graph scheduler for the per-release preparation stages.
+
+Each stage is an async callable with a list of stages it must wait for. A stage
+starts as soon as all of its dependencies have finished, so independent work
+(hashing, ffmpeg capture, image uploads) overlaps instead of running back to
+back. A stage that returns False stops the stages depending on it. If a stage
+raises, the remaining stages are cancelled and the exception is re-raised.
+
+Sequential sections can be wrapped in ``timed()`` so the timing report covers
+the whole release, not just the concurrent part.
+"""
+import asyncio
+import contextlib
+import contextvars
+import time
+from collections.abc import AsyncIterator, Awaitable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from rich.console import ConsoleRenderable, RenderHook
+
+from src.console import console
+
+
+class _StageOutput:
+    """Console output of a buffered stage, held until the stage may print directly."""
+
+    def __init__(self) -> None:
+        self.held: list[ConsoleRenderable] = []
+        self.live = False
+
+    def release(self) -> None:
+        self.live = True
+        held, self.held = self.held, []
+        for renderable in held:
+            console.print(renderable)
+
+
+# Output of the buffered stage running in the current context, if any
+_stage_output: contextvars.ContextVar[Optional[_StageOutput]] = contextvars.ContextVar("stage_output", default=None)
+
+
+def output_buffered() -> bool:
+    """True while the current stage's output is held back, so live progress output should be skipped."""
+    output = _stage_output.get()
+    return output is not None and not output.live
+
+
+class _BufferHook(RenderHook):
+    def process_renderables(self, renderables: list[ConsoleRenderable]) -> list[ConsoleRenderable]:
+        output = _stage_output.get()
+        if output is None or output.live:
+            return renderables
+        output.held.extend(renderables)
+        return []
+
+
+@dataclass
+class Stage:
+    name: str
+    func: Optional[Callable[[], Awaitable[Any]]] = None
+    after: tuple[str, ...] = ()
+    required: bool = False
+    buffered: bool = False
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    status: str = "pending"
+    result: Any = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    output: Optional[_StageOutput] = None
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+class StagePipeline:
+    def __init__(self, label: str = "") -> None:
+        self.label = label
+        self.stages: dict[str, Stage] = {}
+        self.origin = time.perf_counter()
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        after: Sequence[str] = (),
+        required: bool = False,
+        buffered: bool = False,
+    ) -> None:
+        """Register a stage that runs once every stage in after has finished.
+
+        If a required stage returns False, the other stages are cancelled. A buffered
+        stage's console output is printed once it finishes.
+        """
+        for dependency in after:
+            if dependency not in self.stages:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dependency}'")
+        self.stages[name] = Stage(name=name, func=func, after=tuple(after), required=required, buffered=buffered)
+
+    @contextlib.asynccontextmanager
+    async def timed(self, name: str) -> AsyncIterator[None]:
+        """Record the duration of a block of sequential code as a stage."""
+        stage = Stage(name=name, started=time.perf_counter(), status="running")
+        self.stages[name] = stage
+        try:
+            yield
+            stage.status = "done"
+        except BaseException:
+            stage.status = "failed"
+            raise
+        finally:
+            stage.finished = time.perf_counter()
+            stage.done.set()
+
+    async def _run_stage(self, stage: Stage) -> None:
+        try:
+            for dependency in stage.after:
+                upstream = self.stages[dependency]
+                await upstream.done.wait()
+                if upstream.status != "done" or upstream.result is False:
+                    stage.status = "skipped"
+                    return
+            stage.status = "running"
+            stage.started = time.perf_counter()
+            if stage.func is not None:
+                stage.result = await self._call(stage.func, stage.output)
+            stage.status = "done"
+        except asyncio.CancelledError:
+            stage.status = "cancelled"
+            raise
+        except Exception:
+            stage.status = "failed"
+            raise
+        finally:
+            if stage.started is not None:
+                stage.finished = time.perf_counter()
+            stage.done.set()
+
+    @staticmethod
+    async def _call(func: Callable[[], Awaitable[Any]], output: Optional[_StageOutput]) -> Any:
+        if output is None:
+            return await func()
+        # Tasks and threads started by the stage inherit the buffer through the context
+        token = _stage_output.set(output)
+        try:
+            return await func()
+        finally:
+            _stage_output.reset(token)
+            output.release()
+
+    @staticmethod
+    def _release_output(running: list[Stage]) -> None:
+        # Once no unbuffered stage is left, the first buffered one prints directly
+        if any(stage.output is None for stage in running):
+            return
+        if running and running[0].output is not None and not running[0].output.live:
+            running[0].output.release()
+
+    async def run(self) -> dict[str, Any]:
+        """Run every pending stage and return their results by name."""
+        pending = [stage for stage in self.stages.values() if stage.status == "pending"]
+        for stage in pending:
+            stage.output = _StageOutput() if stage.buffered else None
+        buffering = any(stage.buffered for stage in pending)
+        if buffering:
+            console.push_render_hook(_BufferHook())
+        tasks = {asyncio.create_task(self._run_stage(stage), name=f"stage:{stage.name}"): stage for stage in pending}
+        try:
+            remaining = set(tasks)
+            while remaining:
+                self._release_output([tasks[task] for task in tasks if task in remaining])
+                finished, remaining = await asyncio.wait(remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    task.result()
+                    stage = tasks[task]
+                    if stage.required and stage.status == "done" and stage.result is False:
+                        # Nothing downstream can use the other stages' work any more
+                        for other in remaining:
+                            other.cancel()
+                        await asyncio.gather(*remaining, return_exceptions=True)
+                        remaining = set()
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            if buffering:
+                console.pop_render_hook()
+        return {stage.name: stage.result for stage in pending}
+
+    def report(self) -> str:
+        lines = [f"Stage timings{f' for {self.label}' if self.label else ''}:"]
+        busy = 0.0
+        end = self.origin
+        for stage in self.stages.values():
+            if stage.started is None:
+                lines.append(f"  {stage.name:<14} {stage.status}")
+                continue
+            start = stage.started - self.origin
+            busy += stage.elapsed
+            end = max(end, stage.finished or stage.started)
+            lines.append(f"  {stage.name:<14} {stage.elapsed:8.2f}s  (+{start:.2f}s, {stage.status})")
+        wall = end - self.origin
+        lines.append(f"  {'total':<14} {wall:8.2f}s  (stages sum {busy:.2f}s, {max(busy - wall, 0.0):.2f}s overlapped)")
+        return "\n".join(lines)
+
+    def print_report(self) -> None:
+        console.print(f"[cyan]{self.report()}[/cyan]", highlight=False)
@@ -0,0 +1,199 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Lossless PNG optimisation for screenshots, run just before they are uploaded.
+
+All images are recompressed at once in a thread pool sized to the CPU count.
+Results are cached by content hash in ``data/cache/png``: an image whose bytes
+were optimised before is restored from the cache, and an image that already is
+the output of an optimisation is left alone, so reused or retaken screenshots
+are never compressed twice.
+
+Optimisation needs oxipng (pip install pyoxipng) and is skipped without it.
+oxipng is lossless for every PNG flavour (16-bit, palettes, colour profiles),
+which a re-encode through Pillow is not. The smaller of the original and the
+result is kept.
+"""
+import asyncio
+import contextlib
+import hashlib
+import importlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, cast
+
+from src.console import console
+
+try:
+    oxipng: Optional[Any] = importlib.import_module("oxipng")
+except ImportError:
+    oxipng = None
+
+DEFAULT_CACHE_MB = 512
+
+# Most "already optimised" markers kept; they are empty files, so only their count is limited
+MAX_MARKERS = 20000
+
+# Marker suffix for hashes of images that need no further optimisation
+_DONE = ".done"
+
+
+def _content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _compress(data: bytes) -> bytes:
+    """Return the losslessly recompressed PNG."""
+    if oxipng is None:
+        raise RuntimeError("oxipng is not installed")
+    level = 2 if len(data) >= 16_000_000 else 3
+    return cast(bytes, oxipng.optimize_from_memory(data, level=level))
+
+
+def _optimize_file(path: str) -> tuple[int, int, str, str]:
+    """Optimise one file in place; returns (old size, new size, input hash, output hash)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    compressed = _compress(data)
+    input_hash = _content_hash(data)
+    if len(compressed) >= len(data):
+        return len(data), len(data), input_hash, input_hash
+    tmp_path = f"{path}.opt"
+    with open(tmp_path, "wb") as f:
+        f.write(compressed)
+    os.replace(tmp_path, path)
+    return len(data), len(compressed), input_hash, _content_hash(compressed)
+
+
+class PngOptimizer:
+    def __init__(self) -> None:
+        self.enabled = True
+        self.cache_dir: Optional[str] = None
+        self.max_bytes = DEFAULT_CACHE_MB * 1024 * 1024
+
+    def configure(self, config: dict[str, Any], base_dir: str) -> None:
+        default_cfg = cast(dict[str, Any], config.get("DEFAULT", {}))
+        self.enabled = bool(default_cfg.get("optimize_images", True))
+        if self.enabled and oxipng is None:
+            console.print("[yellow]optimize_images needs oxipng (pip install -r requirements.txt), screenshots are uploaded as captured[/yellow]")
+            self.enabled = False
+        try:
+            self.max_bytes = max(0, int(default_cfg.get("optimize_images_cache_mb", DEFAULT_CACHE_MB))) * 1024 * 1024
+        except (TypeError, ValueError):
+            self.max_bytes = DEFAULT_CACHE_MB * 1024 * 1024
+        cache_root = str(default_cfg.get("metadata_cache_dir") or os.path.join(base_dir, "data", "cache"))
+        self.cache_dir = os.path.join(cache_root, "png")
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            console.print(f"[yellow]PNG optimisation cache unavailable: {e}[/yellow]")
+            self.cache_dir = None
+
+    def _cached(self, path: str) -> Optional[tuple[int, int]]:
+        """Apply a cached result to path; returns (old size, new size) or None on a miss."""
+        if self.cache_dir is None:
+            return None
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = _content_hash(data)
+        if os.path.exists(os.path.join(self.cache_dir, digest + _DONE)):
+            return len(data), len(data)
+        cached = os.path.join(self.cache_dir, f"{digest}.png")
+        if not os.path.exists(cached):
+            return None
+        tmp_path = f"{path}.opt"
+        with open(cached, "rb") as src, open(tmp_path, "wb") as dst:
+            dst.write(src.read())
+        os.replace(tmp_path, path)
+        os.utime(cached)
+        return len(data), os.path.getsize(path)
+
+    def _store(self, path: str, input_hash: str, output_hash: str) -> None:
+        if self.cache_dir is None or self.max_bytes <= 0:
+            return
+        with contextlib.suppress(OSError):
+            open(os.path.join(self.cache_dir, output_hash + _DONE), "wb").close()
+            if input_hash != output_hash:
+                cached = os.path.join(self.cache_dir, f"{input_hash}.png")
+                with open(path, "rb") as src, open(cached, "wb") as dst:
+                    dst.write(src.read())
+
+    def _evict(self) -> None:
+        """Drop the least recently used cached images beyond the size limit."""
+        if self.cache_dir is None:
+            return
+        entries: list[tuple[float, int, str]] = []
+        markers: list[tuple[float, str]] = []
+        with contextlib.suppress(OSError), os.scandir(self.cache_dir) as it:
+            for entry in it:
+                stat = entry.stat()
+                if entry.name.endswith(".png"):
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                elif entry.name.endswith(_DONE):
+                    markers.append((stat.st_mtime, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                os.remove(path)
+                total -= size
+        for _, path in sorted(markers)[:max(0, len(markers) - MAX_MARKERS)]:
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+    async def optimize(self, images: list[str], meta: dict[str, Any]) -> None:
+        """Losslessly shrink the given PNG files in place before they are uploaded."""
+        if not self.enabled:
+            return
+        images = [image for image in images if image.lower().endswith(".png")]
+        if not images:
+            return
+        started = time.monotonic()
+        before = after = cached_count = 0
+        pending: list[str] = []
+        for image in images:
+            try:
+                sizes = await asyncio.to_thread(self._cached, image)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                console.print(f"[yellow]Could not read {image}: {e}[/yellow]")
+                continue
+            if sizes is None:
+                pending.append(image)
+            else:
+                before += sizes[0]
+                after += sizes[1]
+                cached_count += 1
+
+        if pending:
+            workers = max(1, min(len(pending), os.cpu_count() or 1))
+            loop = asyncio.get_running_loop()
+            # oxipng spreads the work on each image across cores itself; threads keep it off the
+            # event loop without forking the (threaded) uploader process
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="png-optimizer") as executor:
+                results = await asyncio.gather(
+                    *[loop.run_in_executor(executor, _optimize_file, image) for image in pending],
+                    return_exceptions=True,
+                )
+            for image, result in zip(pending, results):
+                if isinstance(result, BaseException):
+                    console.print(f"[yellow]Image optimization failed for {image}: {result}[/yellow]")
+                    continue
+                old_size, new_size, input_hash, output_hash = result
+                before += old_size
+                after += new_size
+                await asyncio.to_thread(self._store, image, input_hash, output_hash)
+            await asyncio.to_thread(self._evict)
+
+        if meta.get('debug', False) or before - after > 0:
+            saved = before - after
+            percent = (saved / before * 100) if before else 0.0
+            console.print(
+                f"[green]Optimized {cached_count + len(pending)} image(s) in {time.monotonic() - started:.2f}s "
+                f"({cached_count} from cache), saved {saved / 1024 / 1024:.2f} MiB ({percent:.1f}%)[/green]"
+            )
+
+
+png_optimizer = PngOptimizer()
@@ -1,5 +1,5 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
-from typing import Any, Callable, Optional, cast
+from typing import Any, Optional, cast
 
 console: Any = None
 
@@ -14,7 +14,6 @@ try:
 
     import aiofiles
     import cli_ui
-    import guessit
 
     from src.apply_overrides import ApplyOverrides
     from src.audio import AudioManager
@@ -30,6 +29,7 @@ try:
     from src.get_source import get_source
     from src.get_tracker_data import TrackerDataManager
     from src.getseasonep import SeasonEpisodeManager
+    from src.guessit_cache import guessit_fn
     from src.imdb import imdb_manager
     from src.is_scene import SceneManager
     from src.languages import languages_manager
@@ -44,11 +44,6 @@ try:
     from src.tvmaze import tvmaze_manager
     from src.video import video_manager
 
-    guessit_module: Any = cast(Any, guessit)
-    GuessitFn = Callable[[str, Optional[dict[str, Any]]], dict[str, Any]]
-
-    def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-        return cast(dict[str, Any], guessit_module.guessit(value, options))
 
 except ModuleNotFoundError:
     if console is not None:
@@ -0,0 +1,87 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Durable per-item state for queue runs.
+
+The processed-files log only learns about an item once it has fully
+finished. This file records each item as it moves through the queue
+(running, done, failed) together with the trackers it was already uploaded
+to, so an interrupted run resumes an item without uploading it twice and
+keeps the item's cached tmp data instead of starting over.
+"""
+import asyncio
+import contextlib
+import json
+import os
+import time
+from typing import Any, Optional, cast
+
+from src.console import console
+
+
+class QueueState:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.items: dict[str, dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def load(cls, log_file: str) -> "QueueState":
+        """Open the state file that sits next to a queue's processed-files log."""
+        state = cls(f"{os.path.splitext(log_file)[0]}_state.json")
+        if await asyncio.to_thread(os.path.exists, state.path):
+            try:
+                data = await asyncio.to_thread(state._read)
+                if isinstance(data, dict):
+                    state.items = {str(k): cast(dict[str, Any], v) for k, v in cast(dict[str, Any], data).items() if isinstance(v, dict)}
+            except (OSError, ValueError) as e:
+                console.print(f"[yellow]Could not read queue state {state.path}: {e}[/yellow]")
+        return state
+
+    def _read(self) -> Any:
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def get(self, item: str) -> dict[str, Any]:
+        return self.items.get(item, {})
+
+    def interrupted(self, item: str) -> bool:
+        """True if a previous run started this item but never finished it."""
+        return self.get(item).get("status") in ("running", "failed")
+
+    def uploaded_trackers(self, item: str) -> list[str]:
+        return [str(t) for t in self.get(item).get("uploaded", [])]
+
+    async def mark(self, item: str, status: str, uploaded: Optional[list[str]] = None) -> None:
+        async with self._lock:
+            entry = self.items.setdefault(item, {})
+            entry["status"] = status
+            entry["updated"] = time.time()
+            if uploaded:
+                entry["uploaded"] = sorted(set(entry.get("uploaded", [])) | set(uploaded))
+            await asyncio.to_thread(self._write)
+
+    def _write(self) -> None:
+        # Write to a temporary file first so a crash never leaves a truncated state file
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.items, f, indent=4)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            console.print(f"[yellow]Could not save queue state: {e}[/yellow]")
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+
+def uploaded_trackers(meta: dict[str, Any]) -> list[str]:
+    """Trackers that accepted this release, according to meta['tracker_status']."""
+    uploaded: list[str] = []
+    for tracker, status in cast(dict[str, Any], meta.get("tracker_status") or {}).items():
+        if not isinstance(status, dict):
+            continue
+        status_dict = cast(dict[str, Any], status)
+        message = str(status_dict.get("status_message", ""))
+        if "torrent_id" in status_dict or (status_dict.get("upload") is True and message and "data error" not in message):
+            uploaded.append(str(tracker))
+    return uploaded
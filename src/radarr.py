@@ -5,6 +5,7 @@ from typing import Any, Optional, cast
 import httpx
 
 from src.console import console
+from src.http_pool import http_pool
 
 MovieInfo = dict[str, Any]
 
@@ -66,7 +67,7 @@ class RadarrManager:
                 console.print(f"[blue]Radarr URL:[/blue] {url}")
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with http_pool.session("radarr") as client:
                     response = await client.get(url, headers=headers, timeout=10.0)
 
                     if response.status_code == 200:
@@ -0,0 +1,60 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Process-wide budgets for the expensive parts of processing a release.
+
+When several queue items run at once, each kind of work is limited
+separately: ``disk`` (torrent hashing), ``cpu`` (ffmpeg screenshots) and
+``network`` (tracker checks and uploads). Items therefore overlap on
+different resources instead of all hashing or all capturing at once.
+Uploads to each tracker are paced by ``src.upload_scheduler``.
+"""
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable
+from typing import Any, Callable, TypeVar, cast
+
+from src.loop_bound import LoopBound
+
+T = TypeVar("T")
+
+DEFAULT_BUDGETS: dict[str, int] = {"disk": 1, "cpu": 1, "network": 2}
+
+
+class ResourceBudgets(LoopBound):
+    def __init__(self) -> None:
+        self.limits: dict[str, int] = dict(DEFAULT_BUDGETS)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def configure(self, config: dict[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get("DEFAULT", {}))
+        self.limits = dict(DEFAULT_BUDGETS)
+        budgets = default_cfg.get("queue_budgets")
+        if isinstance(budgets, dict):
+            for kind, value in cast(dict[str, Any], budgets).items():
+                with contextlib.suppress(TypeError, ValueError):
+                    self.limits[str(kind)] = max(1, int(value))
+        self._reset()
+
+    def _reset(self) -> None:
+        self._semaphores.clear()
+
+    @contextlib.asynccontextmanager
+    async def slot(self, kind: str) -> AsyncIterator[None]:
+        """Hold one unit of the given budget for the duration of the block."""
+        self._check_loop()
+        semaphore = self._semaphores.get(kind)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.limits.get(kind, 1))
+            self._semaphores[kind] = semaphore
+        async with semaphore:
+            yield
+
+    def limit(self, kind: str, func: Callable[[], Awaitable[T]]) -> Callable[[], Awaitable[T]]:
+        """Wrap a no-argument coroutine function so it runs inside a budget slot."""
+        async def wrapped() -> T:
+            async with self.slot(kind):
+                return await func()
+        return wrapped
+
+
+resource_budgets = ResourceBudgets()
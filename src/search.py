@@ -1,8 +1,9 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
-import os
+import asyncio
 from typing import Any, Optional, cast
 
 from src.console import console
+from src.name_index import name_index
 
 
 class Search:
@@ -31,19 +32,11 @@ class Search:
             return None
         words = filename.split()
 
-        async def search_file(search_dir: str) -> list[str]:
-            files_total_search: list[str] = []
-            console.print(f"Searching {search_dir}")
-            for root, _dirs, files in os.walk(search_dir, topdown=False):
-                for name in files:
-                    if not name.endswith('.nfo'):
-                        l_name = name.lower()
-                        if await self.file_search(l_name, words):
-                            files_total_search.append(os.path.join(root, name))
-            return files_total_search
-        for each in self._get_search_dirs():
-            files = await search_file(each)
-            files_total.extend(files)
+        search_dirs = self._get_search_dirs()
+        for each in search_dirs:
+            console.print(f"Searching {each}")
+        hits = await asyncio.to_thread(name_index.search, search_dirs, words)
+        files_total.extend(hit.path for hit in hits if not hit.is_dir and not hit.name.endswith('.nfo'))
         return files_total
 
     async def searchFolder(self, foldername: str) -> Optional[list[str]]:
@@ -54,28 +47,9 @@ class Search:
             return None
         words = foldername.split()
 
-        async def search_dir(search_dir: str) -> list[str]:
-            console.print(f"Searching {search_dir}")
-            folders_total_search: list[str] = []
-            for root, dirs, _files in os.walk(search_dir, topdown=False):
-
-                for name in dirs:
-                    l_name = name.lower()
-
-                    if await self.file_search(l_name, words):
-                        folders_total_search.append(os.path.join(root, name))
-
-            return folders_total_search
-        for each in self._get_search_dirs():
-            folders = await search_dir(each)
-            folders_total.extend(folders)
-
+        search_dirs = self._get_search_dirs()
+        for each in search_dirs:
+            console.print(f"Searching {each}")
+        hits = await asyncio.to_thread(name_index.search, search_dirs, words)
+        folders_total.extend(hit.path for hit in hits if hit.is_dir)
         return folders_total
-
-    async def file_search(self, name: str, name_words: list[str]) -> bool:
-        check = True
-        for word in name_words:
-            if word not in name:
-                check = False
-                break
-        return check
@@ -5,6 +5,7 @@ from typing import Any, Optional, cast
 import httpx
 
 from src.console import console
+from src.http_pool import http_pool
 
 ShowInfo = dict[str, Any]
 
@@ -72,7 +73,7 @@ class SonarrManager:
                 console.print(f"[blue]Sonarr URL:[/blue] {url}")
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with http_pool.session("sonarr") as client:
                     response = await client.get(url, headers=headers, timeout=10.0)
 
                     if response.status_code == 200:
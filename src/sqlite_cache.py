@@ -0,0 +1,136 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+SQLite store shared by the persistent caches.
+
+Each cache keeps JSON payloads in one table of its own database, with the
+group a row belongs to (an API source, a report kind) for purging by group.
+The table is bounded by size: once the payloads exceed the limit, least
+recently used rows are evicted. Reads and writes are serialised by a lock so
+the caches can be used from worker threads.
+"""
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional, cast
+
+from src.console import console
+
+
+class SqliteCache:
+    # Set by subclasses: table name, name of the group column, and the name used in messages
+    TABLE = "entries"
+    GROUP = "source"
+    LABEL = "Cache"
+
+    def __init__(self, max_mb: int) -> None:
+        self.enabled = False
+        self.path: Optional[str] = None
+        self.max_bytes = max_mb * 1024 * 1024
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> None:
+        """Create the cache directory and database; disables the cache if that fails."""
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with self._lock:
+                self._connect()
+        except (OSError, sqlite3.Error) as e:
+            console.print(f"[yellow]{self.LABEL} disabled, unable to open {self.path}: {e}[/yellow]")
+            self.enabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if not self.path:
+                raise sqlite3.OperationalError(f"{self.LABEL.lower()} path is not configured")
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} ("
+                f"key TEXT PRIMARY KEY, {self.GROUP} TEXT NOT NULL, stored_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, size INTEGER NOT NULL, payload BLOB NOT NULL)"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.TABLE}_accessed ON {self.TABLE} (accessed_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                with contextlib.suppress(sqlite3.Error):
+                    self._conn.close()
+                self._conn = None
+
+    def _read(self, key: str, max_age: Optional[Callable[[str], float]] = None) -> Optional[tuple[Any, float]]:
+        """Return (value, stored_at) for a key and mark it used.
+
+        With max_age, a row older than max_age(group) seconds is deleted and
+        treated as absent.
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(f"SELECT {self.GROUP}, stored_at, payload FROM {self.TABLE} WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                group, stored_at, payload = cast(tuple[str, float, bytes], row)
+                if max_age is not None and now - stored_at > max_age(group):
+                    conn.execute(f"DELETE FROM {self.TABLE} WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+                conn.execute(f"UPDATE {self.TABLE} SET accessed_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+            return json.loads(payload), stored_at
+        except (sqlite3.Error, ValueError) as e:
+            console.print(f"[yellow]{self.LABEL} read failed: {e}[/yellow]")
+            return None
+
+    def _write(self, group: str, key: str, value: Any) -> None:
+        now = time.time()
+        try:
+            payload = json.dumps(value, separators=(",", ":")).encode("utf-8")
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self.TABLE} (key, {self.GROUP}, stored_at, accessed_at, size, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, group, now, now, len(payload), payload),
+                )
+                conn.commit()
+                self._evict(conn)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            console.print(f"[yellow]{self.LABEL} write failed: {e}[/yellow]")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = cast(int, conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.TABLE}").fetchone()[0])
+        if total <= self.max_bytes:
+            return
+        # Trim to 90% of the limit so eviction doesn't run on every insert
+        target = int(self.max_bytes * 0.9)
+        rows = cast(list[tuple[str, int]], conn.execute(f"SELECT key, size FROM {self.TABLE} ORDER BY accessed_at ASC").fetchall())
+        doomed: list[tuple[str]] = []
+        for key, size in rows:
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany(f"DELETE FROM {self.TABLE} WHERE key = ?", doomed)
+        conn.commit()
+
+    def purge(self, group: Optional[str] = None) -> int:
+        """Delete cached rows (optionally only one group). Returns the number removed."""
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute(f"DELETE FROM {self.TABLE} WHERE {self.GROUP} = ?", (group,)) if group else conn.execute(f"DELETE FROM {self.TABLE}")
+            conn.commit()
+            conn.execute("VACUUM")
+            return cursor.rowcount
@@ -1,5 +1,6 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import contextlib
 import gc
 import glob
 import json
@@ -20,6 +21,7 @@ from pymediainfo import MediaInfo
 
 from src.cleanup import cleanup_manager
 from src.console import console
+from src.frame_scoring import SCORING_AVAILABLE, THUMB_BYTES, THUMB_HEIGHT, THUMB_WIDTH, candidate_times, frame_score
 
 default_config: dict[str, Any] = {}
 task_limit = 1
@@ -197,6 +199,8 @@ async def disc_screenshots(
         hdr_tonemap = False
 
     ss_times = await valid_ss_time([], num_screens, length, frame_rate or 24.0, meta, retake=force_screenshots)
+    if not use_vs and file_path:
+        ss_times = await prescan_ss_times(file_path, ss_times, length, meta)
 
     if meta.get('frame_overlay', False):
         console.print("[yellow]Getting frame information for overlays...")
@@ -983,6 +987,7 @@ async def screenshots(
 
     if not ss_times:
         ss_times = await valid_ss_time([], num_capture, length, frame_rate, meta, retake=force_screenshots)
+        ss_times = await prescan_ss_times(path, ss_times, length, meta)
 
     if meta.get('frame_overlay', False):
         if meta['debug']:
@@ -1052,19 +1057,36 @@ async def screenshots(
         async with semaphore:
             return await capture_screenshot(args)
 
-    capture_tasks: list[Awaitable[Optional[tuple[int, Optional[str]]]]] = []
+    pending_captures: list[tuple[int, float, str]] = []
     for i in range(num_capture):
         image_index = existing_images_count + i
         image_path = os.path.abspath(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-{image_index}.png")
         if not os.path.exists(image_path) or meta.get('retake', False):
-            capture_tasks.append(
-                capture_with_semaphore(
-                    (i, path, float(ss_times[i]), image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
-                )
-            )
+            pending_captures.append((i, float(ss_times[i]), image_path))
 
     try:
-        results = cast(list[object], await asyncio.gather(*capture_tasks, return_exceptions=True))
+        results: list[object] = []
+        # Frame overlays need per-frame probing, so they keep using one ffmpeg run per screenshot
+        if default_config.get('ffmpeg_batch_screens', True) and not meta.get('frame_overlay', False) and len(pending_captures) > 1:
+            batches = [pending_captures[n::num_workers] for n in range(num_workers)]
+            batch_results = await asyncio.gather(*[
+                capture_screenshot_batch(batch, path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
+                for batch in batches if batch
+            ])
+            for captured in batch_results:
+                results.extend((index, image_path) for index, image_path in captured.items())
+            done = {cast(tuple[int, str], r)[0] for r in results}
+            if meta['debug']:
+                console.print(f"[cyan]Batch capture produced {len(done)} of {len(pending_captures)} screenshot(s)[/cyan]")
+            pending_captures = [capture for capture in pending_captures if capture[0] not in done]
+
+        capture_tasks: list[Awaitable[Optional[tuple[int, Optional[str]]]]] = [
+            capture_with_semaphore(
+                (i, path, ss_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
+            )
+            for i, ss_time, image_path in pending_captures
+        ]
+        results.extend(cast(list[object], await asyncio.gather(*capture_tasks, return_exceptions=True)))
         # Log any error strings that were returned (these indicate exceptions in capture_screenshot)
         for r in results:
             if isinstance(r, Exception):
@@ -1259,6 +1281,102 @@ async def screenshots(
     return valid_results if valid_results else None
 
 
+async def capture_screenshot_batch(
+    captures: list[tuple[int, float, str]],
+    path: str,
+    width: float,
+    height: float,
+    w_sar: float,
+    h_sar: float,
+    loglevel: str,
+    hdr_tonemap: bool,
+    meta: dict[str, Any],
+) -> dict[int, str]:
+    """Capture several (index, ss_time, image_path) frames with a single ffmpeg process.
+
+    Each timestamp becomes its own fast-seeked input of the same ffmpeg run, so
+    the process start-up, probing and tonemap device set-up happen once per
+    batch instead of once per screenshot. Returns the images that were written,
+    even if ffmpeg failed part way; anything missing is left for
+    capture_screenshot to retry one at a time.
+    """
+    # Negative times are invalid, capture_screenshot rejects them as well
+    captures = [capture for capture in captures if capture[1] >= 0]
+    if not captures or width <= 0 or height <= 0:
+        return {}
+
+    def source_file() -> Optional[str]:
+        source = os.path.normpath(path)
+        if os.path.isdir(source):
+            filelist = cast(list[str], meta.get('filelist') or [])
+            if not filelist:
+                return None
+            source = filelist[0]
+        return source if os.path.exists(source) else None
+
+    source = await asyncio.to_thread(source_file)
+    if source is None:
+        return {}
+
+    use_placebo = hdr_tonemap and bool(meta.get('libplacebo', False))
+    if use_placebo and default_config.get('ffmpeg_warmup', False) and not meta.get('_libplacebo_warmed'):
+        await libplacebo_warmup(source, meta, loglevel)
+
+    vf_filters: list[str] = []
+    if w_sar != 1 or h_sar != 1:
+        vf_filters.append(f"scale={round_to_even(width * w_sar)}:{round_to_even(height * h_sar)}")
+    if hdr_tonemap:
+        if use_placebo:
+            vf_filters.append("libplacebo=tonemapping=hable:colorspace=bt709:color_primaries=bt709:color_trc=bt709:range=tv")
+        else:
+            vf_filters.extend([
+                "zscale=transfer=linear",
+                f"tonemap=tonemap={algorithm}:desat={desat}",
+                "zscale=transfer=bt709",
+            ])
+    vf_filters.append("format=rgb24")
+    vf_chain = ",".join(vf_filters)
+
+    ffmpeg_module = cast(Any, ffmpeg)
+    outputs: list[Any] = []
+    for _index, ss_time, image_path in captures:
+        inp = ffmpeg_module.input(source, ss=str(ss_time))
+        outputs.append(inp['v:0'].output(image_path, vframes=1, vf=vf_chain, compression_level=ffmpeg_compression, pred='mixed'))
+    global_args = ['-y', '-loglevel', loglevel, '-hide_banner', '-an', '-sn']
+    if use_placebo:
+        global_args += ['-init_hw_device', 'vulkan']
+    if ffmpeg_limit:
+        global_args += ['-threads', '1']
+    cmd = ffmpeg_module.merge_outputs(*outputs).global_args(*global_args)
+    if loglevel == 'verbose' or meta.get('debug', False):
+        console.print(f"[cyan]Batch FFmpeg command ({len(captures)} frames): {' '.join(cmd.compile())}[/cyan]", emoji=False)
+
+    def remove_stale() -> None:
+        for _index, _ss_time, image_path in captures:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(image_path)
+
+    def written() -> dict[int, str]:
+        captured: dict[int, str] = {}
+        for index, _ss_time, image_path in captures:
+            with contextlib.suppress(OSError):
+                if os.path.getsize(image_path) > 0:
+                    captured[index] = image_path
+        return captured
+
+    await asyncio.to_thread(remove_stale)
+    try:
+        returncode, _stdout, stderr = await asyncio.wait_for(run_ffmpeg(cmd), timeout=140 + 20 * len(captures))
+    except asyncio.TimeoutError:
+        returncode, stderr = -1, b"Timeout"
+
+    # Frames written before a failure are complete, only the missing ones are retried
+    captured = await asyncio.to_thread(written)
+    if returncode != 0 and (loglevel == 'verbose' or meta.get('debug', False)):
+        console.print(f"[yellow]Batch capture failed after {len(captured)} of {len(captures)} frame(s) ({(stderr or b'').decode(errors='replace').strip()}), retrying the rest individually[/yellow]")
+    return captured
+
+
 async def capture_screenshot(args: tuple[int, str, float, str, float, float, float, float, str, bool, dict[str, Any]]) -> Optional[tuple[int, Optional[str]]]:
     index, path, ss_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta = args
 
@@ -1597,6 +1715,73 @@ async def valid_ss_time(ss_times: list[str], num_screens: int, length: float, fr
     return result_times
 
 
+async def prescan_ss_times(path: str, ss_times: list[str], length: float, meta: dict[str, Any]) -> list[str]:
+    """Replace each planned screenshot time with the best-scoring nearby frame.
+
+    Small grayscale thumbnails of a few candidates around every planned time are
+    decoded in one ffmpeg run and scored, so black, flat and credit frames are
+    skipped before any full resolution capture instead of being retaken later.
+    Returns ss_times unchanged if the pre-scan fails or numpy is not installed.
+    """
+    if not default_config.get('screens_prescan', True) or not ss_times or length <= 0:
+        return ss_times
+    if not SCORING_AVAILABLE:
+        # The decode pass only pays off when the frames can be scored quickly
+        console.print("[yellow]Screenshot pre-scan needs numpy (pip install -r requirements.txt), using planned times[/yellow]")
+        return ss_times
+    try:
+        planned = [float(t) for t in ss_times]
+    except ValueError:
+        return ss_times
+    if await asyncio.to_thread(os.path.isdir, path):
+        filelist = cast(list[str], meta.get('filelist') or [])
+        if not filelist:
+            return ss_times
+        path = filelist[0]
+
+    slots = candidate_times(planned, length)
+    candidates = [t for slot in slots for t in slot]
+    ffmpeg_module = cast(Any, ffmpeg)
+    streams: list[Any] = []
+    for ss_time in candidates:
+        stream = ffmpeg_module.input(path, ss=f"{ss_time:.3f}")['v:0']
+        stream = stream.filter('scale', THUMB_WIDTH, THUMB_HEIGHT).filter('setsar', 1).filter('format', 'gray')
+        streams.append(stream.trim(end_frame=2).setpts('PTS-STARTPTS'))
+    cmd = (
+        ffmpeg_module.concat(*streams, v=1, a=0)
+        .output('pipe:', format='rawvideo', pix_fmt='gray')
+        .global_args('-loglevel', 'error', '-hide_banner', '-an', '-sn')
+    )
+    started = time.time()
+    try:
+        returncode, stdout, stderr = await asyncio.wait_for(run_ffmpeg(cmd), timeout=60 + 5 * len(candidates))
+    except asyncio.TimeoutError:
+        returncode, stdout, stderr = -1, b"", b"Timeout"
+    frame_bytes = THUMB_BYTES
+    if returncode != 0 or len(stdout) != 2 * frame_bytes * len(candidates):
+        if meta.get('debug', False):
+            console.print(f"[yellow]Screenshot pre-scan unavailable ({(stderr or b'').decode(errors='replace').strip() or 'unexpected output size'}), using planned times[/yellow]")
+        return ss_times
+
+    scores = await asyncio.to_thread(
+        lambda: [
+            frame_score(stdout[2 * i * frame_bytes:(2 * i + 1) * frame_bytes], stdout[(2 * i + 1) * frame_bytes:(2 * i + 2) * frame_bytes])
+            for i in range(len(candidates))
+        ]
+    )
+    chosen: list[str] = []
+    position = 0
+    for original, slot in zip(ss_times, slots):
+        slot_scores = scores[position:position + len(slot)]
+        position += len(slot)
+        best = max(range(len(slot)), key=lambda k: (slot_scores[k], -k))
+        chosen.append(original if best == 0 else str(slot[best]))
+    if meta.get('debug', False):
+        moved = sum(1 for before, after in zip(ss_times, chosen) if before != after)
+        console.print(f"[cyan]Screenshot pre-scan scored {len(candidates)} frames in {time.time() - started:.2f}s, moved {moved} of {len(chosen)} screenshot(s)[/cyan]")
+    return chosen
+
+
 async def kill_all_child_processes() -> None:
     """Ensures all child processes are terminated."""
     try:
@@ -0,0 +1,170 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Local mirror of a qBittorrent client's torrent list.
+
+Searching the client used to fetch the complete torrent list (``torrents/info``)
+for every lookup and scan it in Python. The mirror fetches the list once through
+``sync/maindata`` and afterwards applies only the deltas qBittorrent reports for
+the last response id, keeping a dictionary by torrent name so the name lookups
+of the client searches are dictionary hits.
+
+The mirror is saved in the cache directory between runs. qBittorrent tracks
+response ids per Web UI session, so after a fresh login the first sync is
+usually a full update again; within a run (queues, multiple lookups per
+upload) every later sync is a small delta.
+"""
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional, cast
+
+import qbittorrentapi
+
+from src.console import console
+
+# Fields kept for each torrent; everything the client searches read
+KEEP_FIELDS = {
+    "name", "content_path", "save_path", "tracker", "comment", "size", "total_size",
+    "category", "tags", "num_complete", "state", "progress", "infohash_v1", "infohash_v2",
+    "added_on", "amount_left",
+}
+
+# Seconds a sync result is reused before asking qBittorrent for the next delta
+MIN_SYNC_INTERVAL = 2.0
+
+
+def _norm(value: Any) -> str:
+    return str(value or "").rstrip("/\\").lower()
+
+
+class QbitMirror:
+    def __init__(self, path: Optional[str]) -> None:
+        self.path = path
+        self.rid = 0
+        self.torrents: dict[str, dict[str, Any]] = {}
+        self.by_name: dict[str, set[str]] = {}
+        self.synced = 0.0
+        self._lock = asyncio.Lock()
+
+    # Name index
+
+    def _unindex(self, infohash: str) -> None:
+        torrent = self.torrents.get(infohash)
+        if torrent is None:
+            return
+        key = _norm(torrent.get("name"))
+        hashes = self.by_name.get(key)
+        if hashes is not None:
+            hashes.discard(infohash)
+            if not hashes:
+                del self.by_name[key]
+
+    def _index(self, infohash: str) -> None:
+        key = _norm(self.torrents[infohash].get("name"))
+        if key:
+            self.by_name.setdefault(key, set()).add(infohash)
+
+    def _rebuild(self) -> None:
+        self.by_name.clear()
+        for infohash in self.torrents:
+            self._index(infohash)
+
+    def apply(self, data: dict[str, Any]) -> int:
+        """Apply one sync/maindata response; returns how many torrents changed."""
+        if data.get("full_update"):
+            self.torrents = {}
+        changed = cast(dict[str, dict[str, Any]], data.get("torrents") or {})
+        for infohash, fields in changed.items():
+            infohash = infohash.lower()
+            self._unindex(infohash)
+            torrent = self.torrents.setdefault(infohash, {"hash": infohash})
+            torrent.update({key: value for key, value in fields.items() if key in KEEP_FIELDS})
+        for infohash in cast(list[str], data.get("torrents_removed") or []):
+            self._unindex(infohash.lower())
+            self.torrents.pop(infohash.lower(), None)
+        if data.get("full_update"):
+            self._rebuild()
+        else:
+            for infohash in changed:
+                self._index(infohash.lower())
+        self.rid = int(data.get("rid", self.rid) or 0)
+        return len(changed) + len(data.get("torrents_removed") or [])
+
+    def find_by_name(self, name: str) -> list[dict[str, Any]]:
+        """Torrents with this name, as plain dicts shaped like torrents/info entries."""
+        return [dict(self.torrents[infohash]) for infohash in sorted(self.by_name.get(_norm(name), ()))]
+
+    # Syncing and persistence
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = cast(dict[str, Any], json.load(f))
+            self.torrents = cast(dict[str, dict[str, Any]], data.get("torrents") or {})
+            self.rid = int(data.get("rid", 0) or 0)
+            self._rebuild()
+        except (OSError, ValueError, TypeError) as e:
+            console.print(f"[yellow]Could not load qBittorrent mirror {self.path}: {e}[/yellow]")
+            self.torrents, self.rid = {}, 0
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"rid": self.rid, "torrents": self.torrents}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            console.print(f"[yellow]Could not save qBittorrent mirror: {e}[/yellow]")
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+    async def sync(self, qbt_client: qbittorrentapi.Client, debug: bool = False) -> None:
+        """Bring the mirror up to date with the client using sync/maindata deltas."""
+        async with self._lock:
+            if time.monotonic() - self.synced < MIN_SYNC_INTERVAL:
+                return
+            started = time.monotonic()
+            response = await asyncio.to_thread(qbt_client.sync_maindata, rid=self.rid)
+            data = cast(dict[str, Any], dict(response))
+            changed = self.apply(data)
+            self.synced = time.monotonic()
+            if changed or data.get("full_update"):
+                await asyncio.to_thread(self.save)
+            if debug:
+                kind = "full update" if data.get("full_update") else "delta"
+                console.print(f"[cyan]qBittorrent mirror {kind}: {changed} torrent(s) changed, {len(self.torrents)} total ({self.synced - started:.2f}s)[/cyan]")
+
+
+class QbitMirrorRegistry:
+    def __init__(self) -> None:
+        self.cache_dir = os.path.join(str(Path(__file__).resolve().parent.parent.parent), "data", "cache")
+        self.mirrors: dict[tuple[str, int, str], QbitMirror] = {}
+
+    def configure(self, config: dict[str, Any], base_dir: str) -> None:
+        default_cfg = cast(dict[str, Any], config.get("DEFAULT", {}))
+        self.cache_dir = str(default_cfg.get("metadata_cache_dir") or os.path.join(base_dir, "data", "cache"))
+        self.mirrors.clear()
+
+    def mirror_for(self, client_key: tuple[str, int, str]) -> QbitMirror:
+        mirror = self.mirrors.get(client_key)
+        if mirror is None:
+            digest = hashlib.sha1(repr(client_key).encode(), usedforsecurity=False).hexdigest()[:16]
+            path: Optional[str] = None
+            with contextlib.suppress(OSError):
+                os.makedirs(self.cache_dir, exist_ok=True)
+                path = os.path.join(self.cache_dir, f"qbit_mirror_{digest}.json")
+            mirror = QbitMirror(path)
+            mirror.load()
+            self.mirrors[client_key] = mirror
+        return mirror
+
+
+qbit_mirrors = QbitMirrorRegistry()
@@ -18,6 +18,7 @@ from torf import Torrent
 
 from cogs.redaction import Redaction
 from src.console import console
+from src.torrent_clients.qbit_mirror import qbit_mirrors
 from src.torrentcreate import TorrentCreator
 
 # These have to be global variables to be shared across all instances since a new instance is made every time
@@ -344,6 +345,8 @@ class QbittorrentClientMixin:
             # **Step 1: Find correct torrents using content_path**
             best_match: Optional[dict[str, Any]] = None
             matching_torrents: list[dict[str, Any]] = []
+            # What the loop below checks: the whole client, or a prefiltered subset
+            torrents_source = "total torrents in qBittorrent"
 
             try:
                 if proxy_url:
@@ -389,6 +392,7 @@ class QbittorrentClientMixin:
                                     console.print("[cyan]No matching torrents found via proxy search")
 
                             torrents = self._build_mock_torrents(torrents_data)
+                            torrents_source = "torrents returned by the qBittorrent proxy search"
                         else:
                             if response.status == 404:
                                 if meta.get('debug'):
@@ -400,11 +404,16 @@ class QbittorrentClientMixin:
                     if qbt_client is None:
                         console.print("[bold red]qBittorrent client not initialized")
                         return None
-                    torrents = await self.retry_qbt_operation(
-                        lambda: asyncio.to_thread(qbt_client.torrents_info),
-                        "Get torrents list",
-                        initial_timeout=14.0
-                    )
+                    mirrored = await self._mirror_torrents(qbt_client, client, [str(meta['uuid'])], meta)
+                    if mirrored is not None:
+                        torrents = mirrored
+                        torrents_source = "torrents with a matching name from the qBittorrent mirror"
+                    else:
+                        torrents = await self.retry_qbt_operation(
+                            lambda: asyncio.to_thread(qbt_client.torrents_info),
+                            "Get torrents list",
+                            initial_timeout=14.0
+                        )
             except asyncio.TimeoutError:
                 console.print("[bold red]Getting torrents list timed out after retries")
                 return None
@@ -431,7 +440,7 @@ class QbittorrentClientMixin:
 
                 matching_torrents.append({'hash': torrent.hash, 'name': torrent.name})
 
-            console.print(f"[cyan]DEBUG: Checked {torrent_count} total torrents in qBittorrent[/cyan]")
+            console.print(f"[cyan]DEBUG: Checked {torrent_count} {torrents_source}[/cyan]")
             if not matching_torrents:
                 console.print("[yellow]No matching torrents found in qBittorrent.")
                 return None
@@ -1142,6 +1151,27 @@ class QbittorrentClientMixin:
         query_string = "&".join(query_parts)
         return f"{qbt_proxy_url}/api/v2/torrents/search?{query_string}"
 
+    async def _mirror_torrents(self, qbt_client: qbittorrentapi.Client, client: dict[str, Any], names: list[str], meta: dict[str, Any]) -> Optional[list[Any]]:
+        """Torrents with one of the given names, read from the synced client mirror.
+
+        Returns None when the mirror is disabled or cannot be synced, so callers
+        fall back to listing every torrent in the client.
+        """
+        if not client.get('qbit_state_mirror', True):
+            return None
+        mirror = qbit_mirrors.mirror_for((client['qbit_url'], client['qbit_port'], client['qbit_user']))
+        try:
+            await asyncio.wait_for(mirror.sync(qbt_client, debug=bool(meta.get('debug'))), timeout=30.0)
+        except Exception as e:
+            if meta.get('debug'):
+                console.print(f"[yellow]qBittorrent mirror sync failed, listing all torrents instead: {e}")
+            return None
+        torrents_data: dict[str, dict[str, Any]] = {}
+        for name in names:
+            for torrent in mirror.find_by_name(name):
+                torrents_data[torrent['hash']] = torrent
+        return self._build_mock_torrents(list(torrents_data.values()))
+
     def _build_mock_torrents(self, torrents_data: list[dict[str, Any]]) -> list[Any]:
         class MockTorrent:
             def __init__(self, data: dict[str, Any]):
@@ -1336,11 +1366,18 @@ class QbittorrentClientMixin:
                 else:
                     if qbt_client is None:
                         return []
-                    torrents = await self.retry_qbt_operation(
-                        lambda: asyncio.to_thread(qbt_client.torrents_info),
-                        "Get torrents list",
-                        initial_timeout=14.0
-                    )
+                    names = [str(meta['uuid'])]
+                    if meta.get('is_disc', "") in ("", None) and len(meta.get('filelist', [])) == 1:
+                        names.append(os.path.basename(meta['filelist'][0]))
+                    mirrored = await self._mirror_torrents(qbt_client, client_config, names, meta)
+                    if mirrored is not None:
+                        torrents = mirrored
+                    else:
+                        torrents = await self.retry_qbt_operation(
+                            lambda: asyncio.to_thread(qbt_client.torrents_info),
+                            "Get torrents list",
+                            initial_timeout=14.0
+                        )
             except asyncio.TimeoutError:
                 console.print("[bold red]Getting torrents list timed out after retries")
                 if qbt_session:
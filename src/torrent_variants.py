@@ -0,0 +1,163 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Write per-tracker copies of a .torrent without re-parsing or re-encoding it.
+
+Every tracker upload writes its own ``[TRACKER].torrent`` from ``BASE.torrent``
+with a different announce URL, source flag, comment or entropy. The torrent is
+parsed once and kept (keyed by path, size and mtime), and its ``pieces`` string,
+which is most of the file, is never encoded again. Each variant is written as
+a list of byte segments that share the same pieces buffer, and its infohash is
+hashed from those segments while they are written, so it never has to be read
+back.
+"""
+import contextlib
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union, cast
+
+import bencodepy
+
+_bencode = cast(Any, bencodepy)
+_encode = cast(Callable[[Any], bytes], _bencode.encode)
+_decode = cast(Callable[[bytes], Any], _bencode.decode)
+
+# Parsed torrents kept in memory; a handful covers BASE plus the torrent being edited
+MAX_CACHED = 4
+
+Segment = Union[bytes, memoryview]
+
+
+@dataclass
+class ParsedTorrent:
+    metainfo: dict[bytes, Any]  # top-level keys except b'info'
+    info: dict[bytes, Any]  # info keys except b'pieces'
+    pieces: Optional[bytes]  # None for torrents without v1 piece hashes
+
+
+@dataclass
+class TorrentVariant:
+    out_path: str
+    # Top-level and info keys to set; a value of None removes the key
+    metainfo: dict[str, Any] = field(default_factory=lambda: cast(dict[str, Any], {}))
+    info: dict[str, Any] = field(default_factory=lambda: cast(dict[str, Any], {}))
+    # Top-level keys copied from the source torrent; None keeps them all
+    keep: Optional[tuple[str, ...]] = None
+
+
+def _apply(base: dict[bytes, Any], updates: dict[str, Any], keep: Optional[tuple[str, ...]] = None) -> dict[bytes, Any]:
+    if keep is None:
+        result = dict(base)
+    else:
+        wanted = {key.encode() for key in keep}
+        result = {key: value for key, value in base.items() if key in wanted}
+    for key, value in updates.items():
+        if value is None:
+            result.pop(key.encode(), None)
+        else:
+            result[key.encode()] = value
+    return result
+
+
+def _dict_segments(entries: dict[bytes, Any], placeholder: bytes, inner: list[Segment]) -> list[Segment]:
+    """Bencode a dict whose placeholder key's value is given as pre-encoded segments."""
+    segments: list[Segment] = [b"d"]
+    for key in sorted([*entries, placeholder]):
+        segments.append(_encode(key))
+        if key == placeholder:
+            segments.extend(inner)
+        else:
+            segments.append(_encode(entries[key]))
+    segments.append(b"e")
+    return segments
+
+
+class TorrentVariantFactory:
+    def __init__(self) -> None:
+        self._parsed: OrderedDict[str, tuple[tuple[int, int], ParsedTorrent]] = OrderedDict()
+        self._hashes: dict[str, tuple[tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _signature(path: str) -> tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self, path: str) -> ParsedTorrent:
+        """Parse a .torrent, reusing the previous result while the file is unchanged."""
+        signature = self._signature(path)
+        with self._lock:
+            cached = self._parsed.get(path)
+            if cached is not None and cached[0] == signature:
+                self._parsed.move_to_end(path)
+                return cached[1]
+        with open(path, "rb") as f:
+            data = _decode(f.read())
+        if not isinstance(data, dict) or not isinstance(cast(dict[bytes, Any], data).get(b"info"), dict):
+            raise ValueError(f"{path} is not a valid torrent file")
+        metainfo = dict(cast(dict[bytes, Any], data))
+        info = dict(cast(dict[bytes, Any], metainfo.pop(b"info")))
+        pieces = info.pop(b"pieces", None)
+        parsed = ParsedTorrent(metainfo=metainfo, info=info, pieces=bytes(pieces) if pieces is not None else None)
+        with self._lock:
+            self._parsed[path] = (signature, parsed)
+            while len(self._parsed) > MAX_CACHED:
+                self._parsed.popitem(last=False)
+        return parsed
+
+    @staticmethod
+    def _info_segments(parsed: ParsedTorrent, info_updates: dict[str, Any]) -> list[Segment]:
+        if parsed.pieces is None:
+            return [_encode(_apply(parsed.info, info_updates))]
+        pieces = memoryview(parsed.pieces)
+        return _dict_segments(_apply(parsed.info, info_updates), b"pieces", [b"%d:" % len(pieces), pieces])
+
+    @staticmethod
+    def _digest(segments: list[Segment]) -> str:
+        sha1 = hashlib.sha1(usedforsecurity=False)  # SHA1 required for torrent info hash
+        for segment in segments:
+            sha1.update(segment)
+        return sha1.hexdigest()
+
+    def variant_infohash(self, source_path: str, info_updates: dict[str, Any]) -> str:
+        """Infohash the source torrent would have with info_updates applied."""
+        return self._digest(self._info_segments(self.load(source_path), info_updates))
+
+    def write_variants(self, source_path: str, variants: list[TorrentVariant]) -> dict[str, str]:
+        """Write every variant of source_path in one pass; returns {out_path: infohash}."""
+        parsed = self.load(source_path)
+        written: dict[str, str] = {}
+        for variant in variants:
+            info_segments = self._info_segments(parsed, variant.info)
+            infohash = self._digest(info_segments)
+            segments = _dict_segments(_apply(parsed.metainfo, variant.metainfo, variant.keep), b"info", info_segments)
+            tmp_path = f"{variant.out_path}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.writelines(segments)
+                os.replace(tmp_path, variant.out_path)
+            except OSError:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+                raise
+            with self._lock:
+                self._hashes[variant.out_path] = (self._signature(variant.out_path), infohash)
+            written[variant.out_path] = infohash
+        return written
+
+    def infohash(self, path: str) -> str:
+        """Infohash of a .torrent file, without reading it when this factory wrote it."""
+        signature = self._signature(path)
+        with self._lock:
+            known = self._hashes.get(path)
+        if known is not None and known[0] == signature:
+            return known[1]
+        infohash = self._digest(self._info_segments(self.load(path), {}))
+        with self._lock:
+            self._hashes[path] = (signature, infohash)
+        return infohash
+
+
+torrent_variants = TorrentVariantFactory()
@@ -11,6 +11,7 @@ import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
 from collections.abc import Mapping, MutableMapping, Sequence
 from datetime import datetime, timezone
@@ -21,7 +22,10 @@ import torf
 from torf import Torrent
 from typing_extensions import TypeAlias
 
+from src import piece_hasher
 from src.console import console
+from src.piece_layout import layout_index, torrent_files
+from src.pipeline import output_buffered
 
 PIECE_SIZE_MIN = 32 * 1024  # 32 KiB
 PIECE_SIZE_MAX = 134_217_728  # 128 MiB
@@ -267,8 +271,15 @@ class TorrentCreator:
                     exclude = ["*.*", "*sample.mkv", "!sample*.*"] if not meta['is_disc'] else []
                     include = ["*.mkv", "*.mp4", "*.ts"] if not meta['is_disc'] else []
 
+                # Reuse piece hashes from an indexed torrent covering the same files, if any
+                reuse: Optional[tuple[CustomTorrent, list[Optional[bytes]], set[int]]] = None
+                try:
+                    reuse = await asyncio.to_thread(cls.find_reusable_layout, meta, path, include, exclude, piece_size)
+                except Exception as e:
+                    console.print(f"[yellow]Skipping piece hash reuse: {e}[/yellow]")
+
                 # If using mkbrr, run the external application
-                if meta.get('mkbrr'):
+                if meta.get('mkbrr') and reuse is None:
                     try:
                         # Validate input path to prevent potential command injection
                         if not os.path.exists(path):
@@ -354,7 +365,8 @@ class TorrentCreator:
                                         else:
                                             eta = "--:--"  # Placeholder if we can't estimate yet
 
-                                    cli_ui.info_progress(f"mkbrr hashing... {speed} | ETA: {eta}", pieces_done, total_pieces)
+                                    if not output_buffered():
+                                        cli_ui.info_progress(f"mkbrr hashing... {speed} | ETA: {eta}", pieces_done, total_pieces)
 
                                 # Detect final output line
                                 if "Wrote" in line and ".torrent" in line and meta['debug']:
@@ -374,6 +386,7 @@ class TorrentCreator:
                             console.print("[bold red]mkbrr did not create a torrent file!")
                             raise FileNotFoundError(f"Expected torrent file {output_path} was not created")
                         else:
+                            layout_index.record_file(output_path)
                             return output_path
 
                     except subprocess.CalledProcessError as e:
@@ -386,42 +399,40 @@ class TorrentCreator:
                         meta['mkbrr'] = False
                 overall_start_time = time.time()
 
-                # Calculate initial size
-                def calculate_size() -> int:
-                    size = 0
-                    if os.path.isfile(path):
-                        size = os.path.getsize(path)
-                    elif os.path.isdir(path):
-                        for root, _dirs, files in os.walk(path):
-                            size += sum(os.path.getsize(os.path.join(root, f)) for f in files if os.path.isfile(os.path.join(root, f)))
-                    return size
-
-                initial_size = await asyncio.to_thread(calculate_size)
-
-                piece_size = cls.calculate_piece_size(initial_size, 32768, 134217728, meta, piece_size=piece_size)
-
-                # Fallback to CustomTorrent if mkbrr is not used
-                torrent = CustomTorrent(
-                    meta=meta,
-                    path=path,
-                    trackers=["https://fake.tracker"],
-                    source="UA",
-                    private=True,
-                    exclude_globs=exclude or [],
-                    include_globs=include or [],
-                    creation_date=datetime.now(timezone.utc),
-                    comment="Created by Upload Assistant",
-                    created_by="Upload Assistant",
-                    piece_size=piece_size
-                )
+                known: Optional[list[Optional[bytes]]] = None
+                verify: Optional[set[int]] = None
+                if reuse is not None:
+                    torrent, known, verify = reuse
+                else:
+                    torrent = await asyncio.to_thread(cls.build_custom_torrent, meta, path, include, exclude, piece_size)
+
+                # The hashing thread can't be interrupted, so a cancelled caller stops it via the progress callback
+                cancelled = threading.Event()
+
+                def progress(torrent: Torrent, filepath: str, pieces_done: int, pieces_total: int) -> Optional[bool]:
+                    if cancelled.is_set():
+                        return True
+                    cls.torf_cb(torrent, filepath, pieces_done, pieces_total)
+                    return None
 
                 # Run torrent generation in thread to avoid blocking the event loop
                 def generate_torrent() -> None:
-                    torrent.generate(callback=cls.torf_cb, interval=5)
+                    # Hash pieces across worker threads, falling back to torf's single reader
+                    threads = str(meta.get('mkbrr_threads', '0'))
+                    workers = int(threads) if threads.isdigit() else 0
+                    if not piece_hasher.generate(torrent, workers=workers, callback=progress, interval=5, known=known, verify=verify) and (
+                        cancelled.is_set() or not torrent.generate(callback=progress, interval=5)
+                    ):
+                        return
                     torrent.write(f"{meta['base_dir']}/tmp/{meta['uuid']}/{output_filename}.torrent", overwrite=True)
                     torrent.verify_filesize(path)
+                    layout_index.record(torrent)
 
-                await asyncio.to_thread(generate_torrent)
+                try:
+                    await asyncio.to_thread(generate_torrent)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
 
                 total_elapsed_time = time.time() - overall_start_time
                 formatted_time = time.strftime("%H:%M:%S", time.gmtime(total_elapsed_time))
@@ -438,8 +449,62 @@ class TorrentCreator:
                 if meta.get('debug', False):
                     console.print(f"[cyan]create_torrent end | in-flight={cls._create_torrent_inflight}[/cyan]")
 
+    @classmethod
+    def build_custom_torrent(
+        cls,
+        meta: Meta,
+        path: Union[str, os.PathLike[str]],
+        include: list[str],
+        exclude: list[str],
+        piece_size: int,
+    ) -> CustomTorrent:
+        # Piece size is derived from everything under path, matching mkbrr's view of the content
+        size = 0
+        if os.path.isfile(path):
+            size = os.path.getsize(path)
+        elif os.path.isdir(path):
+            for root, _dirs, files in os.walk(path):
+                size += sum(os.path.getsize(os.path.join(root, f)) for f in files if os.path.isfile(os.path.join(root, f)))
+
+        return CustomTorrent(
+            meta=meta,
+            path=path,
+            trackers=["https://fake.tracker"],
+            source="UA",
+            private=True,
+            exclude_globs=exclude or [],
+            include_globs=include or [],
+            creation_date=datetime.now(timezone.utc),
+            comment="Created by Upload Assistant",
+            created_by="Upload Assistant",
+            piece_size=cls.calculate_piece_size(size, 32768, 134217728, meta, piece_size=piece_size)
+        )
+
+    @classmethod
+    def find_reusable_layout(
+        cls,
+        meta: Meta,
+        path: Union[str, os.PathLike[str]],
+        include: list[str],
+        exclude: list[str],
+        piece_size: int,
+    ) -> Optional[tuple[CustomTorrent, list[Optional[bytes]], set[int]]]:
+        if not layout_index.enabled:
+            return None
+        torrent = cls.build_custom_torrent(meta, path, include, exclude, piece_size)
+        match = layout_index.find(torrent_files(torrent), torrent.piece_size)
+        if match is None:
+            return None
+        layout, known, verify = match
+        reused = sum(1 for digest in known if digest is not None)
+        console.print(f"[green]Reusing {reused}/{len(known)} piece hashes from known torrent [bold yellow]{layout.infohash}")
+        return torrent, known, verify
+
     @staticmethod
     def torf_cb(torrent: Torrent, _filepath: str, pieces_done: int, pieces_total: int) -> None:
+        if output_buffered():
+            # Another stage owns the console, a progress bar would break up its output
+            return
         if pieces_done == 0:
             TorrentCreator._torf_start_time = time.time()  # Reset start time when hashing starts
 
@@ -481,6 +546,7 @@ class TorrentCreator:
     async def create_base_from_existing_torrent(torrentpath: str, base_dir: str, uuid: str) -> None:
         if os.path.exists(torrentpath):
             base_torrent = Torrent.read(torrentpath)
+            layout_index.record(base_torrent)
             base_torrent.trackers = ['https://fake.tracker']
             base_torrent.comment = "Created by Upload Assistant"
             base_torrent.created_by = "Created by Upload Assistant"
@@ -1,7 +1,6 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
 import sys
-import time
 import traceback
 from collections.abc import Mapping, Sequence
 from typing import Any, Optional, cast
@@ -11,11 +10,11 @@ from typing_extensions import TypeAlias
 
 from cogs.redaction import Redaction
 from src.cleanup import cleanup_manager
+from src.dupe_search import dupe_search
 from src.get_desc import DescriptionBuilder
 from src.manualpackage import ManualPackageManager
-from src.trackers.PTP import PTP
-from src.trackers.THR import THR
 from src.trackersetup import TRACKER_SETUP
+from src.upload_scheduler import UploadResult, tracker_host, upload_scheduler
 
 Meta: TypeAlias = dict[str, Any]
 StatusDict: TypeAlias = dict[str, Any]
@@ -63,11 +62,12 @@ async def process_trackers(
     tracker_class_map: Mapping[str, Any],
     http_trackers: Sequence[str],
     other_api_trackers: Sequence[str],
-) -> None:
+) -> list[UploadResult]:
     tracker_setup = TRACKER_SETUP(config=config)
     tracker_setup_any = cast(Any, tracker_setup)
     enabled_trackers = list(cast(Sequence[str], tracker_setup_any.trackers_enabled(meta)))
     manual_packager = ManualPackageManager(config)
+    retry_budget = upload_scheduler.new_budget()
 
     def print_tracker_result(
         tracker: str,
@@ -114,7 +114,7 @@ async def process_trackers(
         except Exception as e:
             console.print(f"[red]Error printing {tracker} result: {e}[/red]")
 
-    async def process_single_tracker(tracker: str) -> None:
+    async def process_single_tracker(tracker: str, result: UploadResult) -> None:
         tracker_class: Any = None
         if tracker not in {"MANUAL", "THR", "PTP"}:
             tracker_class = tracker_class_map[tracker](config=config)
@@ -137,10 +137,11 @@ async def process_trackers(
                         console.print(f"{tracker} (draft: {draft})")
                     is_uploaded = False
                     try:
-                        upload_start_time = time.time()
-                        is_uploaded = await tracker_class.upload(meta, disctype_value)
-                        upload_duration = time.time() - upload_start_time
-                        meta[f'{tracker}_upload_duration'] = upload_duration
+                        is_uploaded = await upload_scheduler.upload(
+                            result, tracker_host(tracker, tracker_class), retry_budget,
+                            lambda: tracker_class.upload(meta, disctype_value),
+                        )
+                        meta[f'{tracker}_upload_duration'] = result.duration
                     except Exception as e:
                         console.print(f"[red]Upload failed: {e}")
                         console.print(traceback.format_exc())
@@ -154,63 +155,32 @@ async def process_trackers(
                     is_uploaded = False
 
                 status = cast(StatusDict, meta.get('tracker_status') or {}).get(tracker_class.tracker, {})
+                result.status = dict(status)
                 if is_uploaded and 'status_message' in status and "data error" not in str(status['status_message']):
+                    result.uploaded = True
+                    await upload_scheduler.settle(tracker)
                     await client.add_to_client(meta, tracker_class.tracker)
                     print_tracker_result(tracker, tracker_class, status, True)
                 else:
                     print_tracker_result(tracker, tracker_class, status, False)
                     console.print(f"[red]{tracker} upload failed or returned data error.[/red]")
 
-        elif tracker in other_api_trackers:
+        elif tracker in other_api_trackers or tracker in http_trackers:
             tracker_status = cast(StatusDict, meta.get('tracker_status') or {})
             upload_status = cast(Mapping[str, Any], tracker_status.get(tracker, {})).get('upload', False)
             if upload_status:
                 try:
                     is_uploaded = False
                     try:
-                        upload_start_time = time.time()
-                        is_uploaded = await tracker_class.upload(meta, disctype_value)
-                        upload_duration = time.time() - upload_start_time
-                        meta[f'{tracker}_upload_duration'] = upload_duration
+                        is_uploaded = await upload_scheduler.upload(
+                            result, tracker_host(tracker, tracker_class), retry_budget,
+                            lambda: tracker_class.upload(meta, disctype_value),
+                        )
+                        meta[f'{tracker}_upload_duration'] = result.duration
                     except Exception as e:
                         console.print(f"[red]Upload failed: {e}")
                         console.print(traceback.format_exc())
                         return
-                    if tracker == 'SN':
-                        await asyncio.sleep(16)
-                except Exception:
-                    console.print(traceback.format_exc())
-                    return
-
-                # Detect and handle None return value from upload method
-                if is_uploaded is None:
-                    console.print(f"[yellow]Warning: {tracker_class.tracker} upload method returned None instead of boolean. Treating as failed upload.[/yellow]")
-                    is_uploaded = False
-
-                status = cast(StatusDict, meta.get('tracker_status') or {}).get(tracker_class.tracker, {})
-                if is_uploaded and 'status_message' in status and "data error" not in str(status['status_message']):
-                    await client.add_to_client(meta, tracker_class.tracker)
-                    print_tracker_result(tracker, tracker_class, status, True)
-                else:
-                    print_tracker_result(tracker, tracker_class, status, False)
-                    console.print(f"[red]{tracker} upload failed or returned data error.[/red]")
-
-        elif tracker in http_trackers:
-            tracker_status = cast(StatusDict, meta.get('tracker_status') or {})
-            upload_status = cast(Mapping[str, Any], tracker_status.get(tracker, {})).get('upload', False)
-            if upload_status:
-                try:
-                    is_uploaded = False
-                    try:
-                        upload_start_time = time.time()
-                        is_uploaded = await tracker_class.upload(meta, disctype_value)
-                        upload_duration = time.time() - upload_start_time
-                        meta[f'{tracker}_upload_duration'] = upload_duration
-                    except Exception as e:
-                        console.print(f"[red]Upload failed: {e}")
-                        console.print(traceback.format_exc())
-                        return
-
                 except Exception:
                     console.print(traceback.format_exc())
                     return
@@ -221,7 +191,10 @@ async def process_trackers(
                     is_uploaded = False
 
                 status = cast(StatusDict, meta.get('tracker_status') or {}).get(tracker_class.tracker, {})
+                result.status = dict(status)
                 if is_uploaded and 'status_message' in status and "data error" not in str(status['status_message']):
+                    result.uploaded = True
+                    await upload_scheduler.settle(tracker)
                     await client.add_to_client(meta, tracker_class.tracker)
                     print_tracker_result(tracker, tracker_class, status, True)
                 else:
@@ -259,24 +232,27 @@ async def process_trackers(
             tracker_status = cast(StatusDict, meta.get('tracker_status') or {})
             upload_status = cast(Mapping[str, Any], tracker_status.get(tracker, {})).get('upload', False)
             if upload_status:
-                thr = THR(config=config)
+                thr = tracker_class_map['THR'](config=config)
                 thr_any = cast(Any, thr)
                 is_uploaded = False
                 try:
-                    upload_start_time = time.time()
-                    is_uploaded = await thr_any.upload(meta, disctype_value)
-                    upload_duration = time.time() - upload_start_time
-                    meta[f'{tracker}_upload_duration'] = upload_duration
+                    is_uploaded = await upload_scheduler.upload(
+                        result, tracker_host(tracker, thr), retry_budget,
+                        lambda: thr_any.upload(meta, disctype_value),
+                    )
+                    meta[f'{tracker}_upload_duration'] = result.duration
                 except Exception as e:
                     console.print(f"[red]Upload failed: {e}")
                     console.print(traceback.format_exc())
                     return
+                status = cast(StatusDict, meta.get('tracker_status') or {}).get('THR', {})
+                result.status = dict(status)
                 if is_uploaded:
+                    result.uploaded = True
+                    await upload_scheduler.settle(tracker)
                     await client.add_to_client(meta, "THR")
-                    status = cast(StatusDict, meta.get('tracker_status') or {}).get('THR', {})
                     print_tracker_result(tracker, thr, status, True)
                 else:
-                    status = cast(StatusDict, meta.get('tracker_status') or {}).get('THR', {})
                     print_tracker_result(tracker, thr, status, False)
                     console.print(f"[red]{tracker} upload failed or returned data error.[/red]")
 
@@ -285,22 +261,25 @@ async def process_trackers(
             upload_status = cast(Mapping[str, Any], tracker_status.get(tracker, {})).get('upload', False)
             if upload_status:
                 try:
-                    ptp = PTP(config=config)
+                    ptp = tracker_class_map['PTP'](config=config)
                     groupID = meta.get('ptp_groupID', None)
                     ptpUrl, ptpData = await ptp.fill_upload_form(groupID, meta)
                     is_uploaded = False
                     try:
-                        upload_start_time = time.time()
-                        is_uploaded = await ptp.upload(meta, ptpUrl, ptpData, disctype_value)
-                        upload_duration = time.time() - upload_start_time
-                        meta[f'{tracker}_upload_duration'] = upload_duration
-                        await asyncio.sleep(5)
+                        is_uploaded = await upload_scheduler.upload(
+                            result, tracker_host(tracker, ptp), retry_budget,
+                            lambda: ptp.upload(meta, ptpUrl, ptpData, disctype_value),
+                        )
+                        meta[f'{tracker}_upload_duration'] = result.duration
                     except Exception as e:
                         console.print(f"[red]Upload failed: {e}")
                         console.print(traceback.format_exc())
                         return
                     status = cast(StatusDict, meta.get('tracker_status') or {}).get(ptp.tracker, {})
+                    result.status = dict(status)
                     if is_uploaded and 'status_message' in status and "data error" not in str(status['status_message']):
+                        result.uploaded = True
+                        await upload_scheduler.settle(tracker)
                         await client.add_to_client(meta, "PTP")
                         print_tracker_result(tracker, ptp, status, True)
                     else:
@@ -310,6 +289,20 @@ async def process_trackers(
                     console.print(traceback.format_exc())
                     return
 
+    results: dict[str, UploadResult] = {}
+
+    async def run_tracker(tracker: str) -> None:
+        result = results.setdefault(tracker, UploadResult(tracker.replace(" ", "").upper().strip()))
+        try:
+            await process_single_tracker(tracker, result)
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+            raise
+        finally:
+            if result.attempted:
+                # Later searches must see this release on the tracker
+                dupe_search.invalidate(result.tracker)
+
     multi_screens = int(config['DEFAULT'].get('multiScreens', 2))
     discs = cast(list[Any], meta.get('discs') or [])
     one_disc = True
@@ -322,21 +315,27 @@ async def process_trackers(
         # Run all tracker tasks concurrently with individual error handling
         tasks: list[tuple[str, asyncio.Task[None]]] = []
         for tracker in enabled_trackers:
-            task = asyncio.create_task(process_single_tracker(tracker))
+            task = asyncio.create_task(run_tracker(tracker))
             tasks.append((tracker, task))
 
         # Wait for all tasks to complete, but don't let one tracker's failure stop others
-        results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
+        outcomes = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
 
         # Log any exceptions that occurred
-        for (tracker, _), result in zip(tasks, results):
-            if isinstance(result, Exception):
-                console.print(f"[red]{tracker} encountered an error: {result}[/red]")
+        for (tracker, _), outcome in zip(tasks, outcomes):
+            if isinstance(outcome, Exception):
+                console.print(f"[red]{tracker} encountered an error: {outcome}[/red]")
                 if meta.get('debug'):
-                    console.print(traceback.format_exception(type(result), result, result.__traceback__))
+                    console.print(traceback.format_exception(type(outcome), outcome, outcome.__traceback__))
     else:
         # Process each tracker sequentially
         for tracker in enabled_trackers:
-            await process_single_tracker(tracker)
+            await run_tracker(tracker)
 
+    if meta.get('debug'):
+        for result in results.values():
+            if result.attempted:
+                outcome = "uploaded" if result.uploaded else f"failed ({result.error})" if result.error else "not uploaded"
+                console.print(f"[cyan]{result.tracker}: {outcome} after {result.attempts} attempt(s), {result.duration:.2f}s[/cyan]")
     console.print("[green]All tracker uploads processed.[/green]")
+    return list(results.values())
@@ -14,6 +14,7 @@ import httpx
 from src.bbcode import BBCODE
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.torrentcreate import TorrentCreator
 from src.trackers.COMMON import COMMON
 
@@ -259,7 +260,7 @@ class ANT:
 
         try:
             if not meta['debug']:
-                async with httpx.AsyncClient(timeout=40) as client:
+                async with http_pool.session("ANT", timeout=40) as client:
                     response = await client.post(url=self.upload_url, files=files, data=data, headers=headers)
                     try:
                         response_data: dict[str, Any] = response.json()
@@ -429,7 +430,7 @@ class ANT:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with http_pool.session("ANT", timeout=15.0) as client:
                 response = await client.get(url=self.search_url, params=params, headers=headers)
                 if response.status_code == 200:
                     try:
@@ -516,7 +517,7 @@ class ANT:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with http_pool.session("ANT", timeout=15.0) as client:
                 response = await client.get(url=self.search_url, params=params, headers=headers)
                 if response.status_code == 200:
                     try:
@@ -20,6 +20,7 @@ from cogs.redaction import Redaction
 from src.console import console
 from src.cookie_auth import CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.languages import languages_manager
 from src.trackers.COMMON import COMMON
 
@@ -41,7 +42,7 @@ class AZTrackerBase:
         self.source_flag: str = tracker_config.get('source_flag') or ''
         self.torrent_url: str = f'{self.base_url}/torrent/' if self.base_url else ''
 
-        self.session = httpx.AsyncClient(headers={
+        self.session = http_pool.client(self.tracker, headers={
             'User-Agent': f"Upload Assistant/2.3 ({platform.system()} {platform.release()})"
         }, timeout=60.0)
         self.media_code = ''
@@ -10,6 +10,7 @@ import cli_ui
 import httpx
 
 from src.console import console
+from src.http_pool import http_pool
 from src.rehostimages import RehostImagesManager
 from src.trackers.COMMON import COMMON
 
@@ -135,7 +136,7 @@ class BHD:
         details_link: Union[str, None] = None
         if meta['debug'] is False:
             try:
-                async with httpx.AsyncClient(timeout=60) as client:
+                async with http_pool.session("BHD", timeout=60) as client:
                     response = await client.post(url=url, files=files, data=data, headers=headers)
                     response_json = cast(dict[str, Any], response.json())
                     if int(response_json['status_code']) == 0:
@@ -404,7 +405,7 @@ class BHD:
 
         url = f"https://beyond-hd.me/api/torrents/{str(self.tracker_config.get('api_key', '')).strip()}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with http_pool.session("BHD", timeout=5.0) as client:
                 response = await client.post(url, params=data)
                 if response.status_code == 200:
                     response_data = cast(dict[str, Any], response.json())
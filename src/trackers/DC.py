@@ -9,6 +9,7 @@ import httpx
 from cogs.redaction import Redaction
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.rehostimages import RehostImagesManager
 from src.trackers.COMMON import COMMON
 
@@ -26,7 +27,7 @@ class DC:
         self.banned_groups = ['']
         self.approved_image_hosts = ['imgbox', 'imgbb', 'bhd', 'imgur', 'postimg', 'sharex']
         self.api_key = self.config['TRACKERS'][self.tracker].get('api_key')
-        self.session = httpx.AsyncClient(headers={'X-API-KEY': self.api_key}, timeout=30.0)
+        self.session = http_pool.client("DC", headers={'X-API-KEY': self.api_key}, timeout=30.0)
 
     async def mediainfo(self, meta: Meta) -> str:
         if meta.get('is_disc') == 'BDMV':
@@ -7,13 +7,13 @@ import re
 from typing import Any, Optional, Union, cast
 
 import aiofiles
-import httpx
 from bs4 import BeautifulSoup
 
 from src.bbcode import BBCODE
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.languages import languages_manager
 
 
@@ -29,7 +29,7 @@ class FF:
         self.torrent_url = f"{self.base_url}/details.php?id="
         self.requests_url = f"{self.base_url}/requests.php"
         self.auth_token = None
-        self.session = httpx.AsyncClient(headers={
+        self.session = http_pool.client("FF", headers={
             'User-Agent': f"Upload Assistant/2.3 ({platform.system()} {platform.release()})"
         }, timeout=30.0)
 
@@ -563,7 +563,7 @@ class FF:
 
         poster_file = None
         if poster_url:
-            async with httpx.AsyncClient() as client:
+            async with http_pool.session("FF") as client:
                 response = await client.get(poster_url)
                 if response.status_code == 200:
                     poster_ext = os.path.splitext(poster_url)[1] or ".jpg"
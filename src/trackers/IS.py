@@ -6,13 +6,13 @@ import re
 from typing import Any, Union, cast
 
 import aiofiles
-import httpx
 from bs4 import BeautifulSoup
 
 from src.bbcode import BBCODE
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 
 Meta = dict[str, Any]
 Config = dict[str, Any]
@@ -28,7 +28,7 @@ class IS:
         self.banned_groups = ['']
         self.base_url = 'https://immortalseed.me'
         self.torrent_url = 'https://immortalseed.me/details.php?hash='
-        self.session = httpx.AsyncClient(headers={
+        self.session = http_pool.client("IS", headers={
             'User-Agent': f"Upload Assistant/2.3 ({platform.system()} {platform.release()})"
         }, timeout=30)
 
@@ -14,6 +14,7 @@ import pyotp
 from defusedxml import ElementTree as ET
 
 from src.console import console
+from src.http_pool import http_pool
 from src.rehostimages import RehostImagesManager
 from src.torrentcreate import TorrentCreator
 from src.trackers.COMMON import COMMON
@@ -159,7 +160,7 @@ class MTV:
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
                 }
 
-                async with httpx.AsyncClient(
+                async with http_pool.session("MTV",
                     cookies=cookies,
                     timeout=10.0,
                     follow_redirects=True,
@@ -529,7 +530,7 @@ class MTV:
                     data = await cf.read()
                     cookies_dict = await self.async_json_loads(data)
 
-                async with httpx.AsyncClient(cookies=cookies_dict, timeout=10) as client:
+                async with http_pool.session("MTV", cookies=cookies_dict, timeout=10) as client:
                     try:
                         resp = await client.get(url=url)
                         if meta['debug']:
@@ -567,7 +568,7 @@ class MTV:
                     data = await cf.read()
                     cookies = await self.async_json_loads(data)
 
-                async with httpx.AsyncClient(cookies=cookies, timeout=10) as client:
+                async with http_pool.session("MTV", cookies=cookies, timeout=10) as client:
                     try:
                         resp = await client.get(url=url)
                         if "authkey=" in resp.text:
@@ -588,7 +589,7 @@ class MTV:
 
     async def login(self, cookiefile: str) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=25, follow_redirects=True) as client:
+            async with http_pool.session("MTV", timeout=25, follow_redirects=True) as client:
                 url = 'https://www.morethantv.me/login'
                 payload = {
                     'username': self.config['TRACKERS'][self.tracker].get('username'),
@@ -746,7 +747,7 @@ class MTV:
             params['q'] = meta['title'].replace(': ', ' ').replace('’', '').replace("'", '')
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with http_pool.session("MTV", timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
 
                 if response.status_code == 200 and response.text:
@@ -22,6 +22,8 @@ from src.bbcode import BBCODE
 from src.console import console
 from src.cookie_auth import CookieValidator
 from src.exceptions import *  # noqa F403
+from src.http_pool import http_pool
+from src.meta_store import meta_store
 from src.rehostimages import RehostImagesManager
 from src.takescreens import TakeScreensManager
 from src.torrentcreate import TorrentCreator
@@ -123,7 +125,7 @@ class PTP:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with http_pool.session("PTP", timeout=30.0, follow_redirects=True) as client:
                 response = await client.get(url=url, headers=headers, params=params)
             await asyncio.sleep(1)
 
@@ -178,7 +180,7 @@ class PTP:
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with http_pool.session("PTP", timeout=30.0, follow_redirects=True) as client:
             response = await client.get(url, params=params, headers=headers)
         await asyncio.sleep(1)
         try:
@@ -213,7 +215,7 @@ class PTP:
         }
         url = 'https://passthepopcorn.me/torrents.php'
         console.print(f"[yellow]Requesting description from {url} with ID {ptp_torrent_id}")
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with http_pool.session("PTP", timeout=30.0, follow_redirects=True) as client:
             response = await client.get(url, params=params, headers=headers)
         await asyncio.sleep(1)
 
@@ -264,7 +266,7 @@ class PTP:
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with http_pool.session("PTP", timeout=30.0, follow_redirects=True) as client:
             response = await client.get(url=url, headers=headers, params=params)
         await asyncio.sleep(1)
         try:
@@ -359,7 +361,7 @@ class PTP:
             'User-Agent': self.user_agent
         }
         url = "https://passthepopcorn.me/ajax.php"
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with http_pool.session("PTP", timeout=30.0, follow_redirects=True) as client:
             response = await client.get(url=url, params=params, headers=headers)
         await asyncio.sleep(1)
         tinfo = {}
@@ -427,7 +429,7 @@ class PTP:
         url = 'https://passthepopcorn.me/torrents.php'
 
         try:
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
+            async with http_pool.session("PTP", timeout=10.0, follow_redirects=True) as client:
                 response = await client.get(url, headers=headers, params=params)
                 await asyncio.sleep(1)  # Mimic server-friendly delay
                 if response.status_code == 200:
@@ -464,7 +466,7 @@ class PTP:
         headers = {'referer': 'https://ptpimg.me/index.php'}
         url = "https://ptpimg.me/upload.php"
 
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with http_pool.session("PTP", timeout=30.0, follow_redirects=True) as client:
             response = await client.post(url, headers=headers, data=payload)
         try:
             response = response.json()
@@ -945,9 +947,7 @@ class PTP:
                                 raw_url = str(img.get('raw_url', ''))
                                 desc.write(f"[img]{raw_url}[/img]\n")
 
-                        meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                        async with aiofiles.open(meta_filename, 'w', encoding='utf-8') as f:
-                            await f.write(json.dumps(meta, indent=4))
+                        await meta_store.save(meta)
 
         # Handle multiple discs case
         elif len(discs) > 1:
@@ -1024,9 +1024,7 @@ class PTP:
                                     desc.write(f"[img]{raw_url}[/img]\n")
                                 desc.write("\n")
 
-                            meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                            async with aiofiles.open(meta_filename, 'w', encoding='utf-8') as f:
-                                await f.write(json.dumps(meta, indent=4))
+                            await meta_store.save(meta)
 
                 elif each['type'] == "DVD":
                     if i == 0:
@@ -1093,9 +1091,7 @@ class PTP:
                                     desc.write(f"[img]{raw_url}[/img]\n")
                                 desc.write("\n")
 
-                        meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                        async with aiofiles.open(meta_filename, 'w', encoding='utf-8') as f:
-                            await f.write(json.dumps(meta, indent=4))
+                        await meta_store.save(meta)
 
         # Handle single file case
         elif len(filelist) == 1:
@@ -1223,9 +1219,7 @@ class PTP:
                                 desc.write(f"[img]{raw_url}[/img]\n")
                             desc.write("\n")
 
-                    meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                    async with aiofiles.open(meta_filename, 'w', encoding='utf-8') as f:
-                        await f.write(json.dumps(meta, indent=4))
+                    await meta_store.save(meta)
 
         async with aiofiles.open(
             f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt",
@@ -1312,7 +1306,7 @@ class PTP:
         if os.path.exists(cookiefile):
             raw_cookies = self.cookie_validator._load_cookies_dict_secure(cookiefile)  # pyright: ignore[reportPrivateUsage]
             cookies = {name: str(data.get('value', '')) for name, data in raw_cookies.items()}
-            async with httpx.AsyncClient(cookies=cookies, timeout=30.0, follow_redirects=True) as client:
+            async with http_pool.session("PTP", cookies=cookies, timeout=30.0, follow_redirects=True) as client:
                 uploadresponse = await client.get("https://passthepopcorn.me/upload.php")
                 loggedIn = await self.validate_login(uploadresponse)
                 if loggedIn is True:
@@ -1339,7 +1333,7 @@ class PTP:
             "keeplogged": "1",
         }
         headers = {"User-Agent": self.user_agent}
-        async with httpx.AsyncClient(cookies=cookies, timeout=30.0, follow_redirects=True) as client:
+        async with http_pool.session("PTP", cookies=cookies, timeout=30.0, follow_redirects=True) as client:
             loginresponse = await client.post("https://passthepopcorn.me/ajax.php?action=login", data=data, headers=headers)
             await asyncio.sleep(2)
             try:
@@ -1592,7 +1586,7 @@ class PTP:
             cookiefile = f"{meta['base_dir']}/data/cookies/PTP.json"
             raw_cookies = self.cookie_validator._load_cookies_dict_secure(cookiefile)  # pyright: ignore[reportPrivateUsage]
             cookies = {name: str(data.get('value', '')) for name, data in raw_cookies.items()}
-            async with httpx.AsyncClient(cookies=cookies, timeout=60.0, follow_redirects=True) as client:
+            async with http_pool.session("PTP", cookies=cookies, timeout=60.0, follow_redirects=True) as client:
                 response = await client.post(url=url, data=data, headers=headers, files=files)
             console.print(f"[cyan]{response.url}")
             responsetext = response.text
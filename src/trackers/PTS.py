@@ -5,12 +5,12 @@ import re
 from typing import Any, Optional, cast
 
 import aiofiles
-import httpx
 from bs4 import BeautifulSoup
 from pymediainfo import MediaInfo
 
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
+from src.http_pool import http_pool
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -30,7 +30,7 @@ class PTS:
         self.torrent_url = "https://www.ptskit.org/details.php?id="
         self.announce = str(self.config['TRACKERS'][self.tracker]['announce_url'])
         self.auth_token: Optional[str] = None
-        self.session = httpx.AsyncClient(headers={
+        self.session = http_pool.client("PTS", headers={
             'User-Agent': f"Upload Assistant/2.3 ({platform.system()} {platform.release()})"
         }, timeout=60.0)
 
@@ -10,6 +10,7 @@ import httpx
 
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.trackers.COMMON import COMMON
 
 
@@ -97,7 +98,7 @@ class RTF:
 
         if meta['debug'] is False:
             try:
-                async with httpx.AsyncClient(timeout=40.0) as client:
+                async with http_pool.session("RTF", timeout=40.0) as client:
                     response = await client.post(url=self.upload_url, json=json_data, headers=headers)
 
                     # Handle successful upload (201)
@@ -319,7 +320,7 @@ class RTF:
             return torrent_url
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with http_pool.session("RTF", timeout=5.0) as client:
                 response = await client.get(self.search_url, params=params, headers=headers)
                 if response.status_code == 200:
                     data = cast(list[dict[str, Any]], response.json())
@@ -365,7 +366,7 @@ class RTF:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_pool.session("RTF", timeout=10.0) as client:
                 response = await client.get('https://retroflix.club/api/test', headers=headers)
 
                 if response.status_code != 200:
@@ -408,7 +409,7 @@ class RTF:
         config_path = f"{base_dir}/data/config.py"
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_pool.session("RTF") as client:
                 response = await client.post('https://retroflix.club/api/login', headers=headers, json=json_data)
 
             if response.status_code == 201:
@@ -1,5 +1,6 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import contextlib
 import glob
 import json
 import os
@@ -12,7 +13,9 @@ import httpx
 from typing_extensions import TypeAlias
 
 from src.console import console
+from src.dupe_search import PartialResults, dupe_search
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.trackers.COMMON import COMMON
 
 QueryValue: TypeAlias = Union[str, int, float, bool, None]
@@ -63,11 +66,48 @@ class UNIT3D:
             meta["skipping"] = f"{self.tracker}"
             return dupes
 
-        headers = {
-            "authorization": f"Bearer {self.api_key}",
-            "accept": "application/json",
-        }
+        request_params = await self.get_search_params(meta)
+
+        try:
+            dupes = await dupe_search.search(
+                self.tracker,
+                (tuple(request_params), bool(meta["is_disc"])),
+                lambda: self.fetch_existing(meta, request_params),
+                item=str(meta.get("uuid") or ""),
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 302:
+                meta["tracker_status"][self.tracker][
+                    "status_message"
+                ] = "data error: Redirect (302). This may indicate a problem with authentication. Please verify that your API key is valid."
+            else:
+                meta["tracker_status"][self.tracker][
+                    "status_message"
+                ] = f"data error: HTTP {e.response.status_code} - {e.response.text}"
+        except httpx.TimeoutException:
+            console.print("[bold red]Request timed out after 10 seconds")
+        except httpx.RequestError as e:
+            console.print(f"[bold red]Unable to search for existing torrents: {e}")
+        except Exception as e:
+            console.print(f"[bold red]Unexpected error: {e}")
+            await asyncio.sleep(5)
+
+        return dupes
 
+    async def prefetch_existing(self, meta: dict[str, Any]) -> None:
+        """Start this tracker's dupe search early, so search_existing finds it shared or cached."""
+        if not self.api_key or type(self).search_existing is not UNIT3D.search_existing:
+            return
+        with contextlib.suppress(Exception):
+            request_params = await self.get_search_params(meta)
+            await dupe_search.search(
+                self.tracker,
+                (tuple(request_params), bool(meta["is_disc"])),
+                lambda: self.fetch_existing(meta, request_params),
+                item=str(meta.get("uuid") or ""),
+            )
+
+    async def get_search_params(self, meta: dict[str, Any]) -> ParamsList:
         category_id = str((await self.get_category_id(meta))['category_id'])
         params_dict: dict[str, str] = {
             "tmdbId": str(meta['tmdb']),
@@ -105,83 +145,89 @@ class UNIT3D:
             else:
                 params_dict["name"] = params_dict["name"] + season_value
 
-        request_params: ParamsList
-        request_params = params_list if params_list is not None else list(params_dict.items())
+        return params_list if params_list is not None else list(params_dict.items())
+
+    async def fetch_existing(self, meta: dict[str, Any], request_params: ParamsList) -> list[dict[str, Any]]:
+        """Query the search API and, when the tracker has one, the pending queue.
+
+        Errors of the search request are raised. If only the pending queue fails, the
+        search results are returned as PartialResults, so they are not cached.
+        """
+        headers = {
+            "authorization": f"Bearer {self.api_key}",
+            "accept": "application/json",
+        }
 
         urls_to_check = [self.search_url]
         if getattr(self, "pending_url", None):
             urls_to_check.append(self.pending_url)
 
-        try:
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                for url in urls_to_check:
-                    check_pending = False
-                    if "api/torrents/pending" in url:
-                        check_pending = True
-                    response = await client.get(url=url, headers=headers, params=request_params)
-                    response.raise_for_status()
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        for each in data.get("data", []):
-                            if check_pending:
-                                entry_tmdb = str(each.get("tmdb_id") or "")
-                                if entry_tmdb != str(meta.get("tmdb", "")):
-                                    continue
-                            torrent_id = each.get("id", None)
-                            attributes = each if check_pending else each.get("attributes", {})
-                            name = attributes.get("name", "")
-                            size = attributes.get("size", 0)
-                            result: dict[str, Any]
-                            if not meta["is_disc"]:
-                                result = {
-                                    "name": name,
-                                    "size": size,
-                                    "files": [file["name"] for file in attributes.get("files", []) if isinstance(file, dict) and "name" in file],
-                                    "file_count": (len(attributes.get("files", [])) if isinstance(attributes.get("files"), list) else 0),
-                                    "trumpable": attributes.get("trumpable", False),
-                                    "link": f"{self.base_url}/torrents/pending" if check_pending else attributes.get("details_link", None),
-                                    "download": attributes.get("download_link", None),
-                                    "id": torrent_id,
-                                    "type": attributes.get("type", None),
-                                    "res": attributes.get("resolution", None),
-                                    "internal": attributes.get("internal", False),
-                                }
-                            else:
-                                result = {
-                                    "name": name,
-                                    "size": size,
-                                    "files": [],
-                                    "file_count": (len(attributes.get("files", [])) if isinstance(attributes.get("files"), list) else 0),
-                                    "trumpable": attributes.get("trumpable", False),
-                                    "link": f"{self.base_url}/torrents/pending" if check_pending else attributes.get("details_link", None),
-                                    "download": attributes.get("download_link", None),
-                                    "id": torrent_id,
-                                    "type": attributes.get("type", None),
-                                    "res": attributes.get("resolution", None),
-                                    "internal": attributes.get("internal", False),
-                                    "bd_info": attributes.get("bd_info", ""),
-                                    "description": attributes.get("description", ""),
-                                }
-                            dupes.append(result)
-                    else:
-                        console.print(f"[bold red]Failed to search torrents. HTTP Status: {response.status_code}")
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 302:
-                meta["tracker_status"][self.tracker][
-                    "status_message"
-                ] = "data error: Redirect (302). This may indicate a problem with authentication. Please verify that your API key is valid."
-            else:
-                meta["tracker_status"][self.tracker][
-                    "status_message"
-                ] = f"data error: HTTP {e.response.status_code} - {e.response.text}"
-        except httpx.TimeoutException:
-            console.print("[bold red]Request timed out after 10 seconds")
-        except httpx.RequestError as e:
-            console.print(f"[bold red]Unable to search for existing torrents: {e}")
-        except Exception as e:
-            console.print(f"[bold red]Unexpected error: {e}")
-            await asyncio.sleep(5)
+        dupes: list[dict[str, Any]] = []
+        async with http_pool.session(self.tracker, timeout=10.0, follow_redirects=True) as client:
+
+            async def get(url: str) -> httpx.Response:
+                response = await client.get(url=url, headers=headers, params=request_params)
+                response.raise_for_status()
+                return response
+
+            responses = await asyncio.gather(*[get(url) for url in urls_to_check], return_exceptions=True)
+            for url, response in zip(urls_to_check, responses):
+                check_pending = False
+                if "api/torrents/pending" in url:
+                    check_pending = True
+                if isinstance(response, BaseException):
+                    if not check_pending or not isinstance(response, Exception):
+                        raise response
+                    # The pending queue is an extra; keep what the search found
+                    console.print(f"[yellow]{self.tracker}: Could not check the pending queue: {response}[/yellow]")
+                    dupes = PartialResults(dupes)
+                    continue
+
+                if response.status_code == 200:
+                    data = response.json()
+                    for each in data.get("data", []):
+                        if check_pending:
+                            entry_tmdb = str(each.get("tmdb_id") or "")
+                            if entry_tmdb != str(meta.get("tmdb", "")):
+                                continue
+                        torrent_id = each.get("id", None)
+                        attributes = each if check_pending else each.get("attributes", {})
+                        name = attributes.get("name", "")
+                        size = attributes.get("size", 0)
+                        result: dict[str, Any]
+                        if not meta["is_disc"]:
+                            result = {
+                                "name": name,
+                                "size": size,
+                                "files": [file["name"] for file in attributes.get("files", []) if isinstance(file, dict) and "name" in file],
+                                "file_count": (len(attributes.get("files", [])) if isinstance(attributes.get("files"), list) else 0),
+                                "trumpable": attributes.get("trumpable", False),
+                                "link": f"{self.base_url}/torrents/pending" if check_pending else attributes.get("details_link", None),
+                                "download": attributes.get("download_link", None),
+                                "id": torrent_id,
+                                "type": attributes.get("type", None),
+                                "res": attributes.get("resolution", None),
+                                "internal": attributes.get("internal", False),
+                            }
+                        else:
+                            result = {
+                                "name": name,
+                                "size": size,
+                                "files": [],
+                                "file_count": (len(attributes.get("files", [])) if isinstance(attributes.get("files"), list) else 0),
+                                "trumpable": attributes.get("trumpable", False),
+                                "link": f"{self.base_url}/torrents/pending" if check_pending else attributes.get("details_link", None),
+                                "download": attributes.get("download_link", None),
+                                "id": torrent_id,
+                                "type": attributes.get("type", None),
+                                "res": attributes.get("resolution", None),
+                                "internal": attributes.get("internal", False),
+                                "bd_info": attributes.get("bd_info", ""),
+                                "description": attributes.get("description", ""),
+                            }
+                        dupes.append(result)
+                else:
+                    console.print(f"[bold red]Failed to search torrents. HTTP Status: {response.status_code}")
 
         return dupes
 
@@ -474,7 +520,7 @@ class UNIT3D:
 
             for attempt in range(max_retries):
                 try:  # noqa: PERF203
-                    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+                    async with http_pool.session(self.tracker, timeout=timeout, follow_redirects=True) as client:
                         response = await client.post(
                             url=self.upload_url, files=files, data=data, headers=headers
                         )
@@ -1,6 +1,5 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
-import copy
 import os
 import sys
 from collections.abc import Mapping, MutableMapping
@@ -14,9 +13,10 @@ from src.cleanup import cleanup_manager
 from src.clients import Clients
 from src.console import console
 from src.dupe_checking import DupeChecker
+from src.dupe_search import dupe_search
 from src.imdb import imdb_manager
+from src.meta_overlay import MetaOverlay
 from src.torrentcreate import TorrentCreator
-from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP, tracker_class_map
 from src.uphelper import UploadHelper
 
@@ -44,7 +44,8 @@ class TrackerStatusManager:
 
         async def process_single_tracker(tracker_name: str, shared_meta: Meta) -> tuple[str, dict[str, bool]]:
             nonlocal successful_trackers
-            local_meta = copy.deepcopy(shared_meta)  # Ensure each task gets its own copy of meta
+            # Each task gets its own copy-on-write view of meta; shared keys are merged back explicitly below
+            local_meta = MetaOverlay(shared_meta)
             local_tracker_status = {'banned': False, 'skipped': False, 'dupe': False, 'upload': False, 'other': False}
             disctype = local_meta.get('disctype', None)
             we_already_asked = False
@@ -111,7 +112,7 @@ class TrackerStatusManager:
                         if local_meta['tracker_status'][tracker_name].get('other', False):
                             local_tracker_status['other'] = True
                     elif tracker_name == "PTP":
-                        ptp: Any = PTP(config=self.config)
+                        ptp: Any = tracker_class_map['PTP'](config=self.config)
                         groupID = await ptp.get_group_by_imdb(local_meta['imdb'])
                         async with meta_lock:
                             meta['ptp_groupID'] = groupID
@@ -131,31 +132,13 @@ class TrackerStatusManager:
                         if is_dupe:
                             local_tracker_status['dupe'] = True
 
-                        matched_episode_ids = local_meta.get(f'{tracker_name}_matched_episode_ids', [])
-                        trumpable_id = local_meta.get('trumpable_id')
-                        cross_seed_key = f'{tracker_name}_cross_seed'
-                        cross_seed_value = local_meta.get(cross_seed_key) if cross_seed_key in local_meta else None
+                        shared_keys = [f'{tracker_name}_matched_episode_ids', 'trumpable_id', f'{tracker_name}_cross_seed']
+                        if tracker_name in ["AITHER", "LST"]:
+                            shared_keys += ['were_trumping', 'trump_reason', f'{tracker_name}_trumpable_id']
 
-                        # Only shared-state writes go under the lock
+                        # Only shared-state writes go under the lock, and only values the checks actually set
                         async with meta_lock:
-                            if matched_episode_ids:
-                                meta[f'{tracker_name}_matched_episode_ids'] = matched_episode_ids
-                            if trumpable_id:
-                                meta['trumpable_id'] = trumpable_id
-                            if cross_seed_key in local_meta and cross_seed_value:
-                                meta[cross_seed_key] = cross_seed_value
-
-                        if tracker_name in ["AITHER", "LST"]:
-                            were_trumping = local_meta.get('were_trumping', False)
-                            trump_reason = local_meta.get('trump_reason')
-                            trumpable_id_after_dupe_check = local_meta.get(f'{tracker_name}_trumpable_id')
-                            async with meta_lock:
-                                if were_trumping:
-                                    meta['were_trumping'] = were_trumping
-                                if trump_reason:
-                                    meta['trump_reason'] = trump_reason
-                                if trumpable_id_after_dupe_check:
-                                    meta[f'{tracker_name}_trumpable_id'] = trumpable_id_after_dupe_check
+                            local_meta.merge_into(meta, [key for key in shared_keys if local_meta.get(key)])
 
                     elif 'skipping' in local_meta:
                         local_tracker_status['skipped'] = True
@@ -257,14 +240,26 @@ class TrackerStatusManager:
             if passed_trackers:
                 console.print(f"[bold green]Trackers passed all checks: [bold yellow]{', '.join(passed_trackers)}")
         else:
+            # Trackers are checked one at a time here because of the prompts, so run their searches ahead
+            prefetches = [
+                asyncio.create_task(tracker_class_map[tracker_name](config=self.config).prefetch_existing(meta))
+                for tracker_name in meta['trackers']
+                if tracker_name in tracker_class_map and hasattr(tracker_class_map[tracker_name], 'prefetch_existing')
+                and not meta['tracker_status'][tracker_name].get('skip_upload')
+            ]
             passed_trackers: list[str] = []
-            for tracker_name in meta['trackers']:
-                if tracker_name in tracker_class_map:
-                    console.print(f"[yellow]Searching for existing torrents on {tracker_name}...")
-                tracker_name, status = await process_single_tracker(tracker_name, meta)
-                tracker_status[tracker_name] = status
-                if not status['banned'] and not status['skipped'] and not status['dupe']:
-                    passed_trackers.append(tracker_name)
+            try:
+                for tracker_name in meta['trackers']:
+                    if tracker_name in tracker_class_map:
+                        console.print(f"[yellow]Searching for existing torrents on {tracker_name}...")
+                    tracker_name, status = await process_single_tracker(tracker_name, meta)
+                    tracker_status[tracker_name] = status
+                    if not status['banned'] and not status['skipped'] and not status['dupe']:
+                        passed_trackers.append(tracker_name)
+            finally:
+                for task in prefetches:
+                    task.cancel()
+                await asyncio.gather(*prefetches, return_exceptions=True)
 
         if meta['debug']:
             console.print("\n[bold]Tracker Processing Summary:[/bold]")
@@ -273,7 +268,9 @@ class TrackerStatusManager:
                 skipped_status = 'Yes' if status['skipped'] else 'No'
                 dupe_status = 'Yes' if status['dupe'] else 'No'
                 upload_status = 'Yes' if status['upload'] else 'No'
-                console.print(f"Tracker: {t_name} | Banned: {banned_status} | Skipped: {skipped_status} | Dupe: {dupe_status} | [yellow]Upload:[/yellow] {upload_status}")
+                timing = dupe_search.timings.get((str(meta.get('uuid') or ""), t_name))
+                search_status = "" if timing is None else f" | Search: {'cached' if timing.cached else f'{timing.duration:.2f}s'} ({timing.results})"
+                console.print(f"Tracker: {t_name} | Banned: {banned_status} | Skipped: {skipped_status} | Dupe: {dupe_status}{search_status} | [yellow]Upload:[/yellow] {upload_status}")
             console.print(f"\n[bold]Trackers Passed all Checks:[/bold] {successful_trackers}")
             console.print("", markup=False)
             console.print("[bold red]DEBUG MODE does not upload to sites")
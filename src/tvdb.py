@@ -14,6 +14,7 @@ from urllib.error import URLError
 from tvdb_v4_official import TVDB
 
 from src.console import console
+from src.metadata_cache import metadata_cache
 
 YEAR_PATTERN = re.compile(r'\((19\d\d|20[0-3]\d)\)')
 
@@ -183,7 +184,11 @@ class tvdb_data:
         if client is None:
             return None, None
 
-        results = _as_dict_list(cast(Any, client).search({filename}, year=year, type="series", lang="eng"))
+        results = _as_dict_list(await metadata_cache.cached_call(
+            "tvdb",
+            metadata_cache.make_key("tvdb", "search", filename, year),
+            lambda: cast(Any, client).search({filename}, year=year, type="series", lang="eng"),
+        ))
         await asyncio.sleep(0.1)
         try:
             if results and len(results) > 0:
@@ -532,7 +537,11 @@ class tvdb_data:
                 if debug:
                     console.print(f"[cyan]Trying TVDB lookup with IMDB ID: {imdb_formatted}[/cyan]")
 
-                results = _as_dict_list(cast(Any, client).search_by_remote_id(imdb_formatted))
+                results = _as_dict_list(await metadata_cache.cached_call(
+                    "tvdb",
+                    metadata_cache.make_key("tvdb", "remote_id", imdb_formatted),
+                    lambda: cast(Any, client).search_by_remote_id(imdb_formatted),
+                ))
                 await asyncio.sleep(0.1)
 
                 if results and len(results) > 0:
@@ -585,7 +594,11 @@ class tvdb_data:
                 if debug:
                     console.print(f"[cyan]Trying TVDB lookup with TMDB ID: {tmdb_str}[/cyan]")
 
-                results = _as_dict_list(cast(Any, client).search_by_remote_id(tmdb_str))
+                results = _as_dict_list(await metadata_cache.cached_call(
+                    "tvdb",
+                    metadata_cache.make_key("tvdb", "remote_id", tmdb_str),
+                    lambda: cast(Any, client).search_by_remote_id(tmdb_str),
+                ))
                 await asyncio.sleep(0.1)
 
                 if results and len(results) > 0:
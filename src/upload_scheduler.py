@@ -0,0 +1,244 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Scheduling for tracker uploads.
+
+All trackers of a release upload concurrently, within a global limit
+(``upload_concurrency``) and a per-tracker limit that also applies across
+concurrently processed queue items. Each tracker host has a token bucket
+(``interval`` seconds per upload, ``burst`` uploads at once), so pacing a
+tracker never delays the others. Trackers sharing a host share its bucket,
+which follows the strictest limits among them.
+
+An upload is retried with exponential backoff only when the tracker cannot
+have accepted it: the connection could not be opened, or the server answered
+429 or 503. Retries draw on a per-release budget. Other errors, including
+timeouts, dropped responses and other 5xx statuses, are never retried, because
+the torrent may already be on the site. Only errors that a tracker's upload()
+lets escape are seen here; trackers that catch their own request errors (such
+as the UNIT3D base class) handle them themselves.
+
+Some trackers need a moment after an upload before the torrent is usable.
+The per-tracker ``settle`` delay covers that. It runs after the upload slot is
+released.
+"""
+import asyncio
+import contextlib
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, TypeVar, cast
+from urllib.parse import urlparse
+
+import aiohttp
+import httpx
+
+from src.console import console
+from src.loop_bound import LoopBound
+
+T = TypeVar("T")
+
+# Built-in per-tracker settings; upload_tracker_limits in the config overrides them
+DEFAULT_TRACKER_LIMITS: dict[str, dict[str, float]] = {
+    "PTP": {"settle": 5},
+    "SN": {"settle": 16},
+}
+
+BACKOFF_BASE = 2.0
+BACKOFF_MAX = 30.0
+
+
+@dataclass
+class TrackerLimits:
+    concurrency: int = 1
+    interval: float = 0.0
+    burst: int = 1
+    retries: int = 2
+    settle: float = 0.0
+
+
+@dataclass
+class UploadResult:
+    tracker: str
+    attempted: bool = False
+    uploaded: bool = False
+    attempts: int = 0
+    duration: float = 0.0
+    error: Optional[str] = None
+    status: dict[str, Any] = field(default_factory=lambda: cast(dict[str, Any], {}))
+
+
+class RetryBudget:
+    """Retries left for one release, shared by all of its trackers."""
+
+    def __init__(self, total: int) -> None:
+        self.remaining = total
+
+    def take(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
+
+
+class TokenBucket:
+    def __init__(self, interval: float, burst: int) -> None:
+        self.rate = 1.0 / interval if interval > 0 else 0.0
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def tighten(self, interval: float, burst: int) -> None:
+        """Apply another tracker's limits to this host, keeping the stricter of each."""
+        if interval > 0:
+            rate = 1.0 / interval
+            self.rate = min(self.rate, rate) if self.rate > 0 else rate
+        self.burst = min(self.burst, max(1, burst))
+        self.tokens = min(self.tokens, float(self.burst))
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# Statuses meaning the server turned the request away without processing it
+RETRY_STATUSES = {429, 503}
+
+
+def is_transient(error: BaseException) -> bool:
+    """True for failures where the tracker cannot have accepted the upload."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRY_STATUSES
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRY_STATUSES
+    return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, aiohttp.ClientConnectorError))
+
+
+def tracker_host(tracker: str, tracker_class: Any = None) -> str:
+    """Host a tracker uploads to, falling back to its name when the class does not say."""
+    for attribute in ("upload_url", "torrent_url", "base_url"):
+        url = getattr(tracker_class, attribute, None) if tracker_class is not None else None
+        if isinstance(url, str) and url:
+            with contextlib.suppress(ValueError):
+                host = urlparse(url).hostname
+                if host:
+                    return host.lower()
+    return tracker
+
+
+class UploadScheduler(LoopBound):
+    def __init__(self) -> None:
+        self.concurrency = 0
+        self.retry_budget = 6
+        self.default_limits = TrackerLimits()
+        self.tracker_limits: dict[str, TrackerLimits] = {}
+        self._global: Optional[asyncio.Semaphore] = None
+        self._trackers: dict[str, asyncio.Semaphore] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        # Trackers whose limits the host's bucket already includes
+        self._bucket_trackers: dict[str, set[str]] = {}
+
+    def configure(self, config: dict[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get("DEFAULT", {}))
+        try:
+            self.concurrency = max(0, int(default_cfg.get("upload_concurrency", 0) or 0))
+            self.retry_budget = max(0, int(default_cfg.get("upload_retry_budget", 6)))
+            self.default_limits = TrackerLimits(
+                interval=max(0.0, float(default_cfg.get("queue_tracker_interval", 0) or 0)),
+                retries=max(0, int(default_cfg.get("upload_retries", 2))),
+            )
+        except (TypeError, ValueError):
+            self.concurrency, self.retry_budget, self.default_limits = 0, 6, TrackerLimits()
+        overrides: dict[str, Any] = {tracker: dict(values) for tracker, values in DEFAULT_TRACKER_LIMITS.items()}
+        configured = default_cfg.get("upload_tracker_limits")
+        if isinstance(configured, dict):
+            for tracker, values in cast(dict[str, Any], configured).items():
+                if isinstance(values, dict):
+                    overrides.setdefault(str(tracker).upper(), {}).update(cast(dict[str, Any], values))
+        self.tracker_limits = {}
+        for tracker, values in overrides.items():
+            limits = TrackerLimits(**vars(self.default_limits))
+            for key, value in cast(dict[str, Any], values).items():
+                if hasattr(limits, key):
+                    with contextlib.suppress(TypeError, ValueError):
+                        setattr(limits, key, type(getattr(limits, key))(value))
+            self.tracker_limits[tracker] = limits
+        self._reset()
+
+    def _reset(self) -> None:
+        self._global = None
+        self._trackers.clear()
+        self._buckets.clear()
+        self._bucket_trackers.clear()
+
+    def limits(self, tracker: str) -> TrackerLimits:
+        return self.tracker_limits.get(tracker, self.default_limits)
+
+    def new_budget(self) -> RetryBudget:
+        return RetryBudget(self.retry_budget)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, tracker: str, host: str) -> AsyncIterator[None]:
+        """Hold a per-tracker and a global upload slot and take a token from the host's bucket."""
+        self._check_loop()
+        limits = self.limits(tracker)
+        if self._global is None and self.concurrency > 0:
+            self._global = asyncio.Semaphore(self.concurrency)
+        tracker_semaphore = self._trackers.setdefault(tracker, asyncio.Semaphore(max(1, limits.concurrency)))
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(limits.interval, limits.burst)
+        elif tracker not in self._bucket_trackers.get(host, set()):
+            # Another tracker on the same host got here first; its limits must not loosen ours
+            bucket.tighten(limits.interval, limits.burst)
+        self._bucket_trackers.setdefault(host, set()).add(tracker)
+        async with contextlib.AsyncExitStack() as stack:
+            # The global slot is taken last, so a tracker waiting on its own limits never holds one
+            await stack.enter_async_context(tracker_semaphore)
+            await bucket.acquire()
+            if self._global is not None:
+                await stack.enter_async_context(self._global)
+            yield
+
+    async def upload(self, result: UploadResult, host: str, budget: RetryBudget, func: Callable[[], Awaitable[T]]) -> T:
+        """Run one tracker upload in its slots, retrying transient failures with backoff.
+
+        result.duration is the time of the final attempt alone, without waiting for slots.
+        """
+        limits = self.limits(result.tracker)
+        result.attempted = True
+        while True:
+            result.attempts += 1
+            try:
+                async with self.slot(result.tracker, host):
+                    started = time.monotonic()
+                    try:
+                        value = await func()
+                    finally:
+                        result.duration = time.monotonic() - started
+                result.error = None
+                return value
+            except Exception as e:
+                result.error = str(e) or type(e).__name__
+                if not is_transient(e) or result.attempts > limits.retries or not budget.take():
+                    raise
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (result.attempts - 1)) + random.uniform(0, 1)  # noqa: S311
+                console.print(f"[yellow]{result.tracker}: {result.error}; retrying in {delay:.1f}s (attempt {result.attempts + 1})[/yellow]")
+                await asyncio.sleep(delay)
+
+    async def settle(self, tracker: str) -> None:
+        """Wait the tracker's settle time after an upload, outside any upload slot."""
+        delay = self.limits(tracker).settle
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+upload_scheduler = UploadScheduler()
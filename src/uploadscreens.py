@@ -17,6 +17,8 @@ import pyimgbox
 from typing_extensions import TypeAlias
 
 from src.console import console
+from src.http_pool import http_pool
+from src.png_optimizer import png_optimizer
 
 Meta: TypeAlias = dict[str, Any]
 ImageDict: TypeAlias = dict[str, Any]
@@ -90,7 +92,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 return {'status': 'failed', 'reason': 'Missing ptpimg API key in config'}
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with http_pool.session("imghost") as client:
                     async with aiofiles.open(image, 'rb') as file:
                         files = {'file-upload[0]': (os.path.basename(image), await file.read())}
                         headers = {'referer': 'https://ptpimg.me/index.php'}
@@ -140,7 +142,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'image': encoded_image,
                 }
 
-                async with httpx.AsyncClient() as client:
+                async with http_pool.session("imghost") as client:
                     response = await client.post(url, data=data, timeout=timeout)
                     response_data = response.json()
                     if response.status_code != 200 or not response_data.get('success'):
@@ -178,7 +180,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'key': config['DEFAULT']['dalexni_api'],
                     'image': encoded_image,
                 }
-                async with httpx.AsyncClient() as client:
+                async with http_pool.session("imghost") as client:
                     response = await client.post(url, data=data, timeout=timeout)
                     response_data = response.json()
                     if response.status_code != 200 or not response_data.get('success'):
@@ -213,7 +215,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': config['DEFAULT']['ptscreens_api']
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as file:
+                async with http_pool.session("imghost") as client, aiofiles.open(image, 'rb') as file:
                     files = {
                         'source': ('file-upload[0]', await file.read())
                     }
@@ -255,7 +257,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': config['DEFAULT']['utppm_api'],
                 }
 
-                async with httpx.AsyncClient() as client:
+                async with http_pool.session("imghost") as client:
                     response = await client.post(url, data=data, headers=headers, timeout=timeout)
                     response_data = response.json()
 
@@ -293,7 +295,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': config['DEFAULT']['onlyimage_api'],
                 }
 
-                async with httpx.AsyncClient() as client:
+                async with http_pool.session("imghost") as client:
                     response = await client.post(url, data=data, headers=headers, timeout=timeout)
                     response_data = response.json()
 
@@ -326,7 +328,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'max_th_size': 350
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as file:
+                async with http_pool.session("imghost") as client, aiofiles.open(image, 'rb') as file:
                     files = {
                         'img': ('file-upload[0]', await file.read())
                     }
@@ -372,7 +374,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 headers = {
                     'X-API-Key': config['DEFAULT']['lensdump_api']
                 }
-                async with httpx.AsyncClient() as client:
+                async with http_pool.session("imghost") as client:
                     response = await client.post(url, data=data, headers=headers, timeout=timeout)
                     response_data = response.json()
                     if response_data.get('status_code') == 200:
@@ -405,7 +407,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'Authorization': f'{api_key}',
                 }
 
-                async with httpx.AsyncClient() as client:
+                async with http_pool.session("imghost") as client:
                     response = await client.post(url, files={'file': (filename, file_bytes)}, headers=headers, timeout=timeout)
                     if response.status_code == 200:
                         response_data = response.json()
@@ -448,7 +450,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': pass_api_key
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
+                async with http_pool.session("imghost") as client, aiofiles.open(image, 'rb') as img_file:
                     files = {'source': (os.path.basename(image), await img_file.read())}
                     response = await client.post(url, headers=headers, files=files, timeout=timeout)
 
@@ -499,7 +501,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
             try:
                 headers = {'Authorization': f'Bearer {api_key}'}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
+                async with http_pool.session("imghost") as client, aiofiles.open(image, 'rb') as img_file:
                     files = {'files[]': (os.path.basename(image), await img_file.read())}
 
                     response = await client.post(url, headers=headers, files=files, timeout=timeout)
@@ -559,7 +561,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 headers = {'Authorization': f'{api_key}'}
                 data = {'title': 'Upload-Assistant screenshot'}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
+                async with http_pool.session("imghost") as client, aiofiles.open(image, 'rb') as img_file:
                     files = {'file': (os.path.basename(image), await img_file.read())}
                     response = await client.post(url, headers=headers, data=data, files=files, timeout=timeout)
 
@@ -731,6 +733,9 @@ async def _upload_screens(
         console.print(f"[yellow]Skipping upload: {existing_count} existing, {total_screens} required.")
         return image_list, total_screens
 
+    if not using_custom_img_list:
+        await png_optimizer.optimize(image_glob[:images_needed], meta)
+
     upload_tasks: list[tuple[int, str, str, dict[str, Any], dict[str, Any]]] = [
         (index, image, img_host, config, meta)
         for index, image in enumerate(image_glob[:images_needed])
@@ -34,32 +34,7 @@ def CustomFrameInfo(clip: Any, _text: str) -> Any:
     return core.std.FrameEval(clip, partial(FrameProps, clip=clip), prop_src=clip)
 
 
-def optimize_images(image: str, config: dict[str, Any]) -> None:
-    import platform  # Ensure platform is imported here
-    if config.get('optimize_images', True) and os.path.exists(image):
-        oxipng: Any | None
-        try:
-            pyver = platform.python_version_tuple()
-            if int(pyver[0]) == 3 and int(pyver[1]) >= 7:
-                import oxipng  # pyright: ignore[reportMissingImports]
-                oxipng = oxipng
-            else:
-                oxipng = None
-            if oxipng is None:
-                return
-            if os.path.getsize(image) >= 16000000:
-                oxipng.optimize(image, level=6)
-            else:
-                oxipng.optimize(image, level=3)
-        except Exception as e:
-            console.print(f"Image optimization failed: {e}", markup=False)
-    return
-
-
-def vs_screengn(source: str, encode: str | None = None, num: int = 5, dir: str = ".", config: dict[str, Any] | None = None) -> None:
-    if config is None:
-        config = {'optimize_images': True}  # Default configuration
-
+def vs_screengn(source: str, encode: str | None = None, num: int = 5, dir: str = ".") -> None:
     screens_file = os.path.join(dir, "screens.txt")
 
     # Check if screens.txt already exists and use it if valid
@@ -150,7 +125,4 @@ def vs_screengn(source: str, encode: str | None = None, num: int = 5, dir: str =
         enc = CustomFrameInfo(enc, "Encode (Tonemapped)")
         ScreenGen(enc, dir, "b")
 
-    # Optimize images
-    for i in range(1, num + 1):
-        image_path = os.path.join(dir, f"{str(i).zfill(2)}a.png")
-        optimize_images(image_path, config)
+    # Images are optimized in parallel just before upload (src/png_optimizer.py)
@@ -1,7 +1,16 @@
 #!/usr/bin/env python3
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import sys
+
+# Started before anything else is imported, so every import is measured
+if "--import-profile" in sys.argv:
+    from src.import_profile import import_profiler
+
+    import_profiler.start()
+
 import asyncio
 import contextlib
+import copy
 import filecmp
 import gc
 import json
@@ -10,17 +19,15 @@ import platform
 import re
 import shutil
 import signal
-import sys
 import threading
 import time
 import traceback
-from collections.abc import Iterable, Mapping
+from collections.abc import Awaitable, Iterable, Mapping
 from pathlib import Path
-from typing import Any, Optional, cast
+from typing import Any, Callable, Optional, cast
 
 import aiofiles
 import cli_ui
-import discord
 import requests
 from packaging import version
 from torf import Torrent
@@ -28,30 +35,42 @@ from typing_extensions import TypeAlias
 
 from bin.get_mkbrr import MkbrrBinaryManager
 from cogs.redaction import Redaction
-from discordbot import DiscordNotifier
 from src.add_comparison import ComparisonManager
 from src.args import Args
+from src.bluray_fetch import bluray_fetcher
 from src.cleanup import cleanup_manager
 from src.clients import Clients
 from src.console import console
 from src.disc_menus import process_disc_menus
 from src.dupe_checking import DupeChecker
+from src.dupe_search import dupe_search
 from src.get_desc import gen_desc
 from src.get_name import NameManager
 from src.get_tracker_data import TrackerDataManager
+from src.guessit_cache import guessit_cache
+from src.http_pool import http_pool
 from src.languages import languages_manager
+from src.media_report_cache import media_report_cache
+from src.meta_store import meta_store
+from src.metadata_cache import metadata_cache
+from src.name_index import name_index
 from src.nfo_link import NfoLinkManager
+from src.piece_layout import layout_index
+from src.pipeline import StagePipeline
+from src.png_optimizer import png_optimizer
 from src.qbitwait import Wait
+from src.queue_state import QueueState, uploaded_trackers
 from src.queuemanage import QueueManager
+from src.resource_budget import resource_budgets
 from src.takescreens import TakeScreensManager
+from src.torrent_clients.qbit_mirror import qbit_mirrors
 from src.torrentcreate import TorrentCreator
 from src.trackerhandle import process_trackers
-from src.trackers.AR import AR
 from src.trackers.COMMON import COMMON
-from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP, api_trackers, http_trackers, other_api_trackers, tracker_class_map
 from src.trackerstatus import TrackerStatusManager
 from src.uphelper import UploadHelper
+from src.upload_scheduler import upload_scheduler
 from src.uploadscreens import UploadScreensManager
 
 cli_ui.setup(color='always', title="Upload Assistant")
@@ -431,6 +450,8 @@ async def validate_tracker_logins(meta: Meta, trackers: Optional[list[str]] = No
 async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
     """Process the metadata for each queued path."""
     if use_discord and bot:
+        from discordbot import DiscordNotifier
+
         await DiscordNotifier.send_discord_notification(
             config, bot, f"Starting upload process for: {meta['path']}", debug=meta.get('debug', False), meta=meta
         )
@@ -456,8 +477,10 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
             meta['unattended'] = True
             console.print("[yellow]Running in Auto Mode")
     prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
+    pipeline = StagePipeline(label=os.path.basename(str(meta.get('path', ''))))
     try:
-        meta = await prep.gather_prep(meta=meta, mode='cli')
+        async with pipeline.timed('gather_prep'):
+            meta = await prep.gather_prep(meta=meta, mode='cli')
     except Exception as e:
         console.print(f"Error in gather_prep: {e}")
         console.print(traceback.format_exc())
@@ -504,8 +527,7 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
 
         if meta['debug']:
             console.print(f"Trackers list before editing: {meta['trackers']}")
-        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(meta, indent=4))
+        await meta_store.save(meta)
 
     if meta.get('emby_debug', False):
         meta['original_imdb'] = meta.get('imdb_id', None)
@@ -636,8 +658,7 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                         meta['tracker_status'][tracker]['skip_upload'] = False
 
         await asyncio.sleep(0.2)
-        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(meta, indent=4))
+        await meta_store.save(meta)
         await asyncio.sleep(0.2)
 
         try:
@@ -646,7 +667,8 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
         except Exception as e:
             console.print(f"[yellow]Warning: Tracker validation encountered an error: {e}[/yellow]")
 
-        successful_trackers = await TrackerStatusManager(config=config).process_all_trackers(meta)
+        async with pipeline.timed('tracker_checks'), resource_budgets.slot('network'):
+            successful_trackers = await TrackerStatusManager(config=config).process_all_trackers(meta)
 
         if meta.get('trackers_pass') is not None:
             meta['skip_uploading'] = meta.get('trackers_pass')
@@ -735,444 +757,461 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                 await common.get_bdmv_mediainfo(meta)
                 bdmv_mi_created = True
 
-        progress_task = asyncio.create_task(print_progress("[yellow]Still processing, please wait...", interval=10))
-        try:
-            if 'manual_frames' not in meta:
-                meta['manual_frames'] = ""
-            manual_frames = meta['manual_frames']
+        async def screenshots_stage() -> bool:
+            progress_task = asyncio.create_task(print_progress("[yellow]Still processing, please wait...", interval=10))
+            try:
+                if 'manual_frames' not in meta:
+                    meta['manual_frames'] = ""
+                manual_frames = meta['manual_frames']
 
-            if meta.get('comparison', False):
-                await ComparisonManager(meta, config).add_comparison()
+                if meta.get('comparison', False):
+                    await ComparisonManager(meta, config).add_comparison()
 
-            else:
-                image_data_file = f"{meta['base_dir']}/tmp/{meta['uuid']}/image_data.json"
-                if os.path.exists(image_data_file) and not meta.get('image_list'):
+                else:
+                    image_data_file = f"{meta['base_dir']}/tmp/{meta['uuid']}/image_data.json"
+                    if os.path.exists(image_data_file) and not meta.get('image_list'):
+                        try:
+                            async with aiofiles.open(image_data_file, encoding='utf-8') as img_file:
+                                content = await img_file.read()
+                                image_data = cast(dict[str, Any], json.loads(content)) if content.strip() else {}
+
+                                if 'image_list' in image_data and not meta.get('image_list'):
+                                    meta['image_list'] = image_data['image_list']
+                                    if meta.get('debug'):
+                                        console.print(f"[cyan]Loaded {len(image_data['image_list'])} previously saved image links")
+
+                                if 'image_sizes' in image_data and not meta.get('image_sizes'):
+                                    meta['image_sizes'] = image_data['image_sizes']
+                                    if meta.get('debug'):
+                                        console.print("[cyan]Loaded previously saved image sizes")
+
+                                if 'tonemapped' in image_data and not meta.get('tonemapped'):
+                                    meta['tonemapped'] = image_data['tonemapped']
+                                    if meta.get('debug'):
+                                        console.print("[cyan]Loaded previously saved tonemapped status[/cyan]")
+
+                        except Exception as e:
+                            console.print(f"[yellow]Could not load saved image data: {str(e)}")
+
+                    if meta.get('is_disc', ""):
+                        menus_data_file = f"{meta['base_dir']}/tmp/{meta['uuid']}/menu_images.json"
+                        if os.path.exists(menus_data_file):
+                            try:
+                                async with aiofiles.open(menus_data_file, encoding='utf-8') as menus_file:
+                                    content = await menus_file.read()
+                                    menu_image_file = cast(dict[str, Any], json.loads(content)) if content.strip() else {}
+
+                                    if 'menu_images' in menu_image_file and not meta.get('menu_images'):
+                                        meta['menu_images'] = menu_image_file['menu_images']
+                                        if meta.get('debug'):
+                                            console.print(f"[cyan]Loaded {len(menu_image_file['menu_images'])} previously saved disc menus")
+
+                            except Exception as e:
+                                console.print(f"[yellow]Could not load saved menu image data: {str(e)}")
+                        elif meta.get('path_to_menu_screenshots', ""):
+                            await process_disc_menus(meta, config)
+
+                    # Take Screenshots
                     try:
-                        async with aiofiles.open(image_data_file, encoding='utf-8') as img_file:
-                            content = await img_file.read()
-                            image_data = cast(dict[str, Any], json.loads(content)) if content.strip() else {}
+                        if meta['is_disc'] == "BDMV":
+                            use_vs = meta.get('vapoursynth', False)
+                            try:
+                                await takescreens_manager.disc_screenshots(
+                                    meta, bdmv_filename, bdinfo, meta['uuid'], base_dir, use_vs,
+                                    meta.get('image_list', []), meta.get('ffdebug', False), 0
+                                )
+                            except asyncio.CancelledError as e:
+                                await cleanup_screenshot_temp_files(meta)
+                                await asyncio.sleep(0.1)
+                                await cleanup_manager.cleanup()
+                                gc.collect()
+                                cleanup_manager.reset_terminal()
+                                raise Exception("Error during screenshot capture") from e
+                            except Exception as e:
+                                await cleanup_screenshot_temp_files(meta)
+                                await asyncio.sleep(0.1)
+                                await cleanup_manager.cleanup()
+                                gc.collect()
+                                cleanup_manager.reset_terminal()
+                                raise Exception(f"Error during screenshot capture: {e}") from e
+
+                        elif meta['is_disc'] == "DVD":
+                            try:
+                                await takescreens_manager.dvd_screenshots(
+                                    meta,
+                                    disc_num=0,
+                                    num_screens=0,
+                                    retry_cap=False
+                                )
+                            except asyncio.CancelledError as e:
+                                await cleanup_screenshot_temp_files(meta)
+                                await asyncio.sleep(0.1)
+                                await cleanup_manager.cleanup()
+                                gc.collect()
+                                cleanup_manager.reset_terminal()
+                                raise Exception("Error during screenshot capture") from e
+                            except Exception as e:
+                                await cleanup_screenshot_temp_files(meta)
+                                await asyncio.sleep(0.1)
+                                await cleanup_manager.cleanup()
+                                gc.collect()
+                                cleanup_manager.reset_terminal()
+                                raise Exception(f"Error during screenshot capture: {e}") from e
 
-                            if 'image_list' in image_data and not meta.get('image_list'):
-                                meta['image_list'] = image_data['image_list']
-                                if meta.get('debug'):
-                                    console.print(f"[cyan]Loaded {len(image_data['image_list'])} previously saved image links")
+                        else:
+                            try:
+                                if meta['debug']:
+                                    console.print(f"videopath: {videopath}, filename: {filename}, meta: {meta['uuid']}, base_dir: {base_dir}, manual_frames: {manual_frames}")
+
+                                await takescreens_manager.screenshots(
+                                    videopath, filename, meta['uuid'], base_dir, meta,
+                                    manual_frames=manual_frames  # Pass additional kwargs directly
+                                )
+                            except asyncio.CancelledError as e:
+                                await cleanup_screenshot_temp_files(meta)
+                                await asyncio.sleep(0.1)
+                                await cleanup_manager.cleanup()
+                                gc.collect()
+                                cleanup_manager.reset_terminal()
+                                raise Exception("Error during screenshot capture") from e
+                            except Exception as e:
+                                console.print(traceback.format_exc())
+                                await cleanup_screenshot_temp_files(meta)
+                                await asyncio.sleep(0.1)
+                                await cleanup_manager.cleanup()
+                                gc.collect()
+                                cleanup_manager.reset_terminal()
+                                if "workers" in str(e):
+                                    console.print("[red]max workers issue, see https://github.com/Audionut/Upload-Assistant/wiki/ffmpeg---max-workers-issues[/red]")
+                                raise Exception(f"Error during screenshot capture: {e}") from e
+
+                    except asyncio.CancelledError as e:
+                        await cleanup_screenshot_temp_files(meta)
+                        await asyncio.sleep(0.1)
+                        await cleanup_manager.cleanup()
+                        gc.collect()
+                        cleanup_manager.reset_terminal()
+                        raise Exception("Error during screenshot capture") from e
+                    except Exception as e:
+                        await cleanup_screenshot_temp_files(meta)
+                        await asyncio.sleep(0.1)
+                        await cleanup_manager.cleanup()
+                        gc.collect()
+                        cleanup_manager.reset_terminal()
+                        raise Exception("Error during screenshot capture") from e
+                    finally:
+                        await asyncio.sleep(0.1)
+                        await cleanup_manager.cleanup()
+                        gc.collect()
+                        cleanup_manager.reset_terminal()
+
+                    if 'image_list' not in meta:
+                        meta['image_list'] = []
+                    manual_frames_str = meta.get('manual_frames', '')
+                    if isinstance(manual_frames_str, str):
+                        manual_frames_list = [f.strip() for f in manual_frames_str.split(',') if f.strip()]
+                        manual_frames_count = len(manual_frames_list)
+                        if meta['debug']:
+                            console.print(f"Manual frames entered: {manual_frames_count}")
+                    else:
+                        manual_frames_count = 0
+                    if manual_frames_count > 0:
+                        meta['screens'] = manual_frames_count
+                    cutoff = int(meta.get('cutoff') or 1)
+                    if len(meta.get('image_list', [])) < cutoff and meta.get('skip_imghost_upload', False) is False:
+                        # Validate and (if needed) rehost images to tracker-approved hosts before uploading any new screenshots.
+                        trackers_with_image_host_requirements = {'A4K', 'BHD', 'DC', 'GPW', 'HUNO', 'MTV', 'OE', 'PTP', 'STC', 'TVC'}
+
+                        relevant_trackers = [
+                            t for t in cast(list[Any], meta.get('trackers', []))
+                            if isinstance(t, str) and t in trackers_with_image_host_requirements and t in tracker_class_map
+                        ]
+
+                        # If all relevant trackers share exactly one common approved host that the user has configured,
+                        # and it's not the initially selected host, switch meta['imghost'] to that common host.
+                        # If multiple common hosts exist, pick the first by config priority (img_host_1..img_host_9).
+                        allowed_hosts: Optional[list[str]] = None
+                        if relevant_trackers:
+                            try:
+                                tracker_instances = {
+                                    tracker_name: tracker_class_map[tracker_name](config=config)
+                                    for tracker_name in relevant_trackers
+                                }
 
-                            if 'image_sizes' in image_data and not meta.get('image_sizes'):
-                                meta['image_sizes'] = image_data['image_sizes']
                                 if meta.get('debug'):
-                                    console.print("[cyan]Loaded previously saved image sizes")
+                                    console.print(f"[cyan]Image host debug: meta['imghost']={meta.get('imghost')} img_host_1={config['DEFAULT'].get('img_host_1')}[/cyan]")
+                                    console.print(f"[cyan]Image host debug: relevant_trackers={relevant_trackers}[/cyan]")
+
+                                default_cfg_obj = config.get('DEFAULT', {})
+                                default_cfg: dict[str, Any] = cast(dict[str, Any], default_cfg_obj) if isinstance(default_cfg_obj, dict) else {}
+                                configured_hosts: list[str] = []
+                                for host_index in range(1, 10):
+                                    host_key = f'img_host_{host_index}'
+                                    if host_key in default_cfg:
+                                        host = default_cfg.get(host_key)
+                                        if host and host not in configured_hosts:
+                                            configured_hosts.append(str(host))
 
-                            if 'tonemapped' in image_data and not meta.get('tonemapped'):
-                                meta['tonemapped'] = image_data['tonemapped']
                                 if meta.get('debug'):
-                                    console.print("[cyan]Loaded previously saved tonemapped status[/cyan]")
+                                    console.print(f"[cyan]Image host debug: configured_hosts={configured_hosts}[/cyan]")
+
+                                approved_sets: list[set[str]] = []
+                                all_known = True
+                                for tracker_name in relevant_trackers:
+                                    tracker_instance = tracker_instances[tracker_name]
+                                    approved_hosts = getattr(tracker_instance, 'approved_image_hosts', None)
+                                    if not approved_hosts:
+                                        all_known = False
+                                        break
+                                    if isinstance(approved_hosts, (list, set, tuple)):
+                                        approved_hosts_list = [
+                                            str(host)
+                                            for host in cast(Iterable[Any], approved_hosts)
+                                        ]
+                                        approved_sets.append(set(approved_hosts_list))
+                                    else:
+                                        all_known = False
+                                        break
 
-                    except Exception as e:
-                        console.print(f"[yellow]Could not load saved image data: {str(e)}")
+                                    if meta.get('debug'):
+                                        console.print(
+                                            f"[cyan]Image host debug: {tracker_name}.approved_image_hosts={approved_hosts_list}[/cyan]"
+                                        )
 
-                if meta.get('is_disc', ""):
-                    menus_data_file = f"{meta['base_dir']}/tmp/{meta['uuid']}/menu_images.json"
-                    if os.path.exists(menus_data_file):
-                        try:
-                            async with aiofiles.open(menus_data_file, encoding='utf-8') as menus_file:
-                                content = await menus_file.read()
-                                menu_image_file = cast(dict[str, Any], json.loads(content)) if content.strip() else {}
+                                if all_known and approved_sets and configured_hosts:
+                                    common_hosts: set[str] = set()
+                                    for host_set in approved_sets:
+                                        if not common_hosts:
+                                            common_hosts = set(host_set)
+                                        else:
+                                            common_hosts &= host_set
+                                    common_configured_hosts = [h for h in configured_hosts if h in common_hosts]
 
-                                if 'menu_images' in menu_image_file and not meta.get('menu_images'):
-                                    meta['menu_images'] = menu_image_file['menu_images']
                                     if meta.get('debug'):
-                                        console.print(f"[cyan]Loaded {len(menu_image_file['menu_images'])} previously saved disc menus")
-
-                        except Exception as e:
-                            console.print(f"[yellow]Could not load saved menu image data: {str(e)}")
-                    elif meta.get('path_to_menu_screenshots', ""):
-                        await process_disc_menus(meta, config)
+                                        console.print(f"[cyan]Image host debug: common_hosts={sorted(common_hosts)}[/cyan]")
+                                        console.print(f"[cyan]Image host debug: common_configured_hosts={common_configured_hosts}[/cyan]")
+
+                                    # If we have any common hosts, use them as allowed_hosts for upload_screens
+                                    if common_configured_hosts:
+                                        allowed_hosts = common_configured_hosts
+                                    elif common_hosts:
+                                        allowed_hosts = sorted(common_hosts)
+
+                                    # Prefer the user-selected host if it's valid for all relevant trackers; otherwise
+                                    # fall back to the first common configured host by config priority (img_host_1..img_host_9).
+                                    current_img_host = str(meta.get('imghost') or config['DEFAULT'].get('img_host_1') or "")
+                                    preferred_host: Optional[str] = None
+
+                                    if common_configured_hosts and current_img_host not in common_configured_hosts:
+                                        preferred_host = common_configured_hosts[0]
+                                    elif common_hosts and current_img_host not in common_hosts:
+                                        preferred_host = sorted(common_hosts)[0]
+
+                                    if preferred_host and preferred_host != meta.get('imghost'):
+                                        if meta.get('debug'):
+                                            console.print(
+                                                f"[cyan]Image host debug: current host '{current_img_host}' is not common to all trackers; "
+                                                f"switching meta['imghost'] from '{meta.get('imghost')}' to '{preferred_host}'.[/cyan]"
+                                            )
+                                        meta['imghost'] = preferred_host
+
+                                elif meta.get('debug'):
+                                    console.print(
+                                        f"[cyan]Image host debug: cannot compute common host (all_known={all_known}, approved_sets={len(approved_sets)}, configured_hosts={len(configured_hosts)}).[/cyan]"
+                                    )
 
-                # Take Screenshots
-                try:
-                    if meta['is_disc'] == "BDMV":
-                        use_vs = meta.get('vapoursynth', False)
-                        try:
-                            await takescreens_manager.disc_screenshots(
-                                meta, bdmv_filename, bdinfo, meta['uuid'], base_dir, use_vs,
-                                meta.get('image_list', []), meta.get('ffdebug', False), 0
-                            )
-                        except asyncio.CancelledError as e:
-                            await cleanup_screenshot_temp_files(meta)
-                            await asyncio.sleep(0.1)
-                            await cleanup_manager.cleanup()
-                            gc.collect()
-                            cleanup_manager.reset_terminal()
-                            raise Exception("Error during screenshot capture") from e
-                        except Exception as e:
-                            await cleanup_screenshot_temp_files(meta)
-                            await asyncio.sleep(0.1)
-                            await cleanup_manager.cleanup()
-                            gc.collect()
-                            cleanup_manager.reset_terminal()
-                            raise Exception(f"Error during screenshot capture: {e}") from e
+                            except Exception as e:
+                                if meta.get('debug'):
+                                    console.print(f"[yellow]Could not determine a common approved image host: {e}[/yellow]")
 
-                    elif meta['is_disc'] == "DVD":
-                        try:
-                            await takescreens_manager.dvd_screenshots(
-                                meta,
-                                disc_num=0,
-                                num_screens=0,
-                                retry_cap=False
+                        if meta.get('debug'):
+                            image_list_for_debug = cast(list[Any], meta.get('image_list') or [])
+                            console.print(
+                                f"[cyan]Image host debug: pre-upload_screens meta['imghost']={meta.get('imghost')} image_list={len(image_list_for_debug)} cutoff={meta.get('cutoff')} screens={meta.get('screens')}[/cyan]"  # noqa: E501
                             )
-                        except asyncio.CancelledError as e:
-                            await cleanup_screenshot_temp_files(meta)
-                            await asyncio.sleep(0.1)
-                            await cleanup_manager.cleanup()
-                            gc.collect()
-                            cleanup_manager.reset_terminal()
-                            raise Exception("Error during screenshot capture") from e
-                        except Exception as e:
-                            await cleanup_screenshot_temp_files(meta)
-                            await asyncio.sleep(0.1)
-                            await cleanup_manager.cleanup()
-                            gc.collect()
-                            cleanup_manager.reset_terminal()
-                            raise Exception(f"Error during screenshot capture: {e}") from e
-
-                    else:
-                        try:
-                            if meta['debug']:
-                                console.print(f"videopath: {videopath}, filename: {filename}, meta: {meta['uuid']}, base_dir: {base_dir}, manual_frames: {manual_frames}")
 
-                            await takescreens_manager.screenshots(
-                                videopath, filename, meta['uuid'], base_dir, meta,
-                                manual_frames=manual_frames  # Pass additional kwargs directly
-                            )
-                        except asyncio.CancelledError as e:
-                            await cleanup_screenshot_temp_files(meta)
-                            await asyncio.sleep(0.1)
-                            await cleanup_manager.cleanup()
-                            gc.collect()
-                            cleanup_manager.reset_terminal()
-                            raise Exception("Error during screenshot capture") from e
-                        except Exception as e:
-                            console.print(traceback.format_exc())
-                            await cleanup_screenshot_temp_files(meta)
-                            await asyncio.sleep(0.1)
-                            await cleanup_manager.cleanup()
-                            gc.collect()
-                            cleanup_manager.reset_terminal()
-                            if "workers" in str(e):
-                                console.print("[red]max workers issue, see https://github.com/Audionut/Upload-Assistant/wiki/ffmpeg---max-workers-issues[/red]")
-                            raise Exception(f"Error during screenshot capture: {e}") from e
-
-                except asyncio.CancelledError as e:
-                    await cleanup_screenshot_temp_files(meta)
-                    await asyncio.sleep(0.1)
-                    await cleanup_manager.cleanup()
-                    gc.collect()
-                    cleanup_manager.reset_terminal()
-                    raise Exception("Error during screenshot capture") from e
-                except Exception as e:
-                    await cleanup_screenshot_temp_files(meta)
-                    await asyncio.sleep(0.1)
-                    await cleanup_manager.cleanup()
-                    gc.collect()
-                    cleanup_manager.reset_terminal()
-                    raise Exception("Error during screenshot capture") from e
-                finally:
-                    await asyncio.sleep(0.1)
-                    await cleanup_manager.cleanup()
-                    gc.collect()
-                    cleanup_manager.reset_terminal()
-
-                if 'image_list' not in meta:
-                    meta['image_list'] = []
-                manual_frames_str = meta.get('manual_frames', '')
-                if isinstance(manual_frames_str, str):
-                    manual_frames_list = [f.strip() for f in manual_frames_str.split(',') if f.strip()]
-                    manual_frames_count = len(manual_frames_list)
-                    if meta['debug']:
-                        console.print(f"Manual frames entered: {manual_frames_count}")
-                else:
-                    manual_frames_count = 0
-                if manual_frames_count > 0:
-                    meta['screens'] = manual_frames_count
-                cutoff = int(meta.get('cutoff') or 1)
-                if len(meta.get('image_list', [])) < cutoff and meta.get('skip_imghost_upload', False) is False:
-                    # Validate and (if needed) rehost images to tracker-approved hosts before uploading any new screenshots.
-                    trackers_with_image_host_requirements = {'A4K', 'BHD', 'DC', 'GPW', 'HUNO', 'MTV', 'OE', 'PTP', 'STC', 'TVC'}
-
-                    relevant_trackers = [
-                        t for t in cast(list[Any], meta.get('trackers', []))
-                        if isinstance(t, str) and t in trackers_with_image_host_requirements and t in tracker_class_map
-                    ]
-
-                    # If all relevant trackers share exactly one common approved host that the user has configured,
-                    # and it's not the initially selected host, switch meta['imghost'] to that common host.
-                    # If multiple common hosts exist, pick the first by config priority (img_host_1..img_host_9).
-                    allowed_hosts: Optional[list[str]] = None
-                    if relevant_trackers:
+                        return_dict: dict[str, Any] = {}
                         try:
-                            tracker_instances = {
-                                tracker_name: tracker_class_map[tracker_name](config=config)
-                                for tracker_name in relevant_trackers
-                            }
-
-                            if meta.get('debug'):
-                                console.print(f"[cyan]Image host debug: meta['imghost']={meta.get('imghost')} img_host_1={config['DEFAULT'].get('img_host_1')}[/cyan]")
-                                console.print(f"[cyan]Image host debug: relevant_trackers={relevant_trackers}[/cyan]")
-
                             default_cfg_obj = config.get('DEFAULT', {})
-                            default_cfg: dict[str, Any] = cast(dict[str, Any], default_cfg_obj) if isinstance(default_cfg_obj, dict) else {}
-                            configured_hosts: list[str] = []
+                            default_cfg = cast(dict[str, Any], default_cfg_obj) if isinstance(default_cfg_obj, dict) else {}
+                            min_successful_uploads = int(default_cfg.get('min_successful_image_uploads', 3))
+                            host_order: list[str] = []
                             for host_index in range(1, 10):
                                 host_key = f'img_host_{host_index}'
-                                if host_key in default_cfg:
-                                    host = default_cfg.get(host_key)
-                                    if host and host not in configured_hosts:
-                                        configured_hosts.append(str(host))
-
-                            if meta.get('debug'):
-                                console.print(f"[cyan]Image host debug: configured_hosts={configured_hosts}[/cyan]")
-
-                            approved_sets: list[set[str]] = []
-                            all_known = True
-                            for tracker_name in relevant_trackers:
-                                tracker_instance = tracker_instances[tracker_name]
-                                approved_hosts = getattr(tracker_instance, 'approved_image_hosts', None)
-                                if not approved_hosts:
-                                    all_known = False
-                                    break
-                                if isinstance(approved_hosts, (list, set, tuple)):
-                                    approved_hosts_list = [
-                                        str(host)
-                                        for host in cast(Iterable[Any], approved_hosts)
-                                    ]
-                                    approved_sets.append(set(approved_hosts_list))
-                                else:
-                                    all_known = False
-                                    break
-
+                                host = default_cfg.get(host_key)
+                                if host and host not in host_order:
+                                    host_str = str(host)
+                                    if allowed_hosts is None or host_str in allowed_hosts:
+                                        host_order.append(host_str)
+
+                            current_img_host = str(meta.get('imghost') or default_cfg.get('img_host_1') or '')
+                            if (
+                                current_img_host
+                                and current_img_host not in host_order
+                                and (allowed_hosts is None or current_img_host in allowed_hosts)
+                            ):
+                                host_order.insert(0, current_img_host)
+
+                            if not host_order and allowed_hosts:
+                                host_order = list(allowed_hosts)
+
+                            start_index = host_order.index(current_img_host) if current_img_host in host_order else 0
+                            image_list_count = 0
+
+                            for idx in range(start_index, len(host_order)):
+                                meta['imghost'] = host_order[idx]
+                                await uploadscreens_manager.upload_screens(
+                                    meta, meta['screens'], 1, 0, meta['screens'], [], return_dict=return_dict, allowed_hosts=allowed_hosts
+                                )
+                                image_list_count = len(meta.get('image_list', []) or [])
                                 if meta.get('debug'):
                                     console.print(
-                                        f"[cyan]Image host debug: {tracker_name}.approved_image_hosts={approved_hosts_list}[/cyan]"
+                                        f"[cyan]Image host debug: post-upload_screens image_list={image_list_count}[/cyan]"
                                     )
 
-                            if all_known and approved_sets and configured_hosts:
-                                common_hosts: set[str] = set()
-                                for host_set in approved_sets:
-                                    if not common_hosts:
-                                        common_hosts = set(host_set)
-                                    else:
-                                        common_hosts &= host_set
-                                common_configured_hosts = [h for h in configured_hosts if h in common_hosts]
+                                if image_list_count >= min_successful_uploads:
+                                    break
 
-                                if meta.get('debug'):
-                                    console.print(f"[cyan]Image host debug: common_hosts={sorted(common_hosts)}[/cyan]")
-                                    console.print(f"[cyan]Image host debug: common_configured_hosts={common_configured_hosts}[/cyan]")
-
-                                # If we have any common hosts, use them as allowed_hosts for upload_screens
-                                if common_configured_hosts:
-                                    allowed_hosts = common_configured_hosts
-                                elif common_hosts:
-                                    allowed_hosts = sorted(common_hosts)
-
-                                # Prefer the user-selected host if it's valid for all relevant trackers; otherwise
-                                # fall back to the first common configured host by config priority (img_host_1..img_host_9).
-                                current_img_host = str(meta.get('imghost') or config['DEFAULT'].get('img_host_1') or "")
-                                preferred_host: Optional[str] = None
-
-                                if common_configured_hosts and current_img_host not in common_configured_hosts:
-                                    preferred_host = common_configured_hosts[0]
-                                elif common_hosts and current_img_host not in common_hosts:
-                                    preferred_host = sorted(common_hosts)[0]
-
-                                if preferred_host and preferred_host != meta.get('imghost'):
-                                    if meta.get('debug'):
-                                        console.print(
-                                            f"[cyan]Image host debug: current host '{current_img_host}' is not common to all trackers; "
-                                            f"switching meta['imghost'] from '{meta.get('imghost')}' to '{preferred_host}'.[/cyan]"
-                                        )
-                                    meta['imghost'] = preferred_host
+                                if idx + 1 < len(host_order):
+                                    console.print(
+                                        f"[yellow]Only {image_list_count} images uploaded; minimum is {min_successful_uploads}. "
+                                        f"Switching to next host: {host_order[idx + 1]}[/yellow]"
+                                    )
 
-                            elif meta.get('debug'):
-                                console.print(
-                                    f"[cyan]Image host debug: cannot compute common host (all_known={all_known}, approved_sets={len(approved_sets)}, configured_hosts={len(configured_hosts)}).[/cyan]"
+                            if image_list_count < min_successful_uploads:
+                                raise Exception(
+                                    f"Minimum of {min_successful_uploads} successful image uploads required, but only "
+                                    f"{image_list_count} were uploaded."
                                 )
 
+                            # Now that image_list exists, populate tracker-specific keys (and only reupload if required)
+                            for tracker_name in relevant_trackers:
+                                tracker_instance = tracker_class_map[tracker_name](config=config)
+                                if meta.get('debug'):
+                                    key = f"{tracker_name}_images_key"
+                                    console.print(
+                                        f"[cyan]Image host debug: post-upload before {tracker_name}.check_image_hosts() image_list={len(meta.get('image_list', []) or [])} {key}={len(meta.get(key, []) or [])}[/cyan]"  # noqa: E501
+                                    )
+                                await tracker_instance.check_image_hosts(meta)
+                                if meta.get('debug'):
+                                    key = f"{tracker_name}_images_key"
+                                    console.print(
+                                        f"[cyan]Image host debug: post-upload after  {tracker_name}.check_image_hosts() image_list={len(meta.get('image_list', []) or [])} {key}={len(meta.get(key, []) or [])}[/cyan]"  # noqa: E501
+                                    )
+                        except asyncio.CancelledError:
+                            console.print("\n[red]Upload process interrupted! Cancelling tasks...[/red]")
+                            return False
                         except Exception as e:
-                            if meta.get('debug'):
-                                console.print(f"[yellow]Could not determine a common approved image host: {e}[/yellow]")
-
-                    if meta.get('debug'):
-                        image_list_for_debug = cast(list[Any], meta.get('image_list') or [])
-                        console.print(
-                            f"[cyan]Image host debug: pre-upload_screens meta['imghost']={meta.get('imghost')} image_list={len(image_list_for_debug)} cutoff={meta.get('cutoff')} screens={meta.get('screens')}[/cyan]"  # noqa: E501
-                        )
+                            raise e
+                        finally:
+                            cleanup_manager.reset_terminal()
+                            if meta['debug']:
+                                console.print("[yellow]Cleaning up resources...[/yellow]")
+                            gc.collect()
 
-                    return_dict: dict[str, Any] = {}
-                    try:
-                        default_cfg_obj = config.get('DEFAULT', {})
-                        default_cfg = cast(dict[str, Any], default_cfg_obj) if isinstance(default_cfg_obj, dict) else {}
-                        min_successful_uploads = int(default_cfg.get('min_successful_image_uploads', 3))
-                        host_order: list[str] = []
-                        for host_index in range(1, 10):
-                            host_key = f'img_host_{host_index}'
-                            host = default_cfg.get(host_key)
-                            if host and host not in host_order:
-                                host_str = str(host)
-                                if allowed_hosts is None or host_str in allowed_hosts:
-                                    host_order.append(host_str)
-
-                        current_img_host = str(meta.get('imghost') or default_cfg.get('img_host_1') or '')
-                        if (
-                            current_img_host
-                            and current_img_host not in host_order
-                            and (allowed_hosts is None or current_img_host in allowed_hosts)
-                        ):
-                            host_order.insert(0, current_img_host)
-
-                        if not host_order and allowed_hosts:
-                            host_order = list(allowed_hosts)
-
-                        start_index = host_order.index(current_img_host) if current_img_host in host_order else 0
-                        image_list_count = 0
-
-                        for idx in range(start_index, len(host_order)):
-                            meta['imghost'] = host_order[idx]
-                            await uploadscreens_manager.upload_screens(
-                                meta, meta['screens'], 1, 0, meta['screens'], [], return_dict=return_dict, allowed_hosts=allowed_hosts
-                            )
-                            image_list_count = len(meta.get('image_list', []) or [])
-                            if meta.get('debug'):
-                                console.print(
-                                    f"[cyan]Image host debug: post-upload_screens image_list={image_list_count}[/cyan]"
-                                )
+                    elif meta.get('skip_imghost_upload', False) is True and meta.get('image_list', False) is False:
+                        meta['image_list'] = []
 
-                            if image_list_count >= min_successful_uploads:
-                                break
+                    await meta_store.save(meta)
 
-                            if idx + 1 < len(host_order):
-                                console.print(
-                                    f"[yellow]Only {image_list_count} images uploaded; minimum is {min_successful_uploads}. "
-                                    f"Switching to next host: {host_order[idx + 1]}[/yellow]"
-                                )
+                    if 'image_list' in meta and meta['image_list']:
+                        try:
+                            image_list = cast(list[Any], meta.get('image_list') or [])
+                            image_data = {
+                                "image_list": image_list,
+                                "image_sizes": meta.get('image_sizes', {}),
+                                "tonemapped": meta.get('tonemapped', False)
+                            }
 
-                        if image_list_count < min_successful_uploads:
-                            raise Exception(
-                                f"Minimum of {min_successful_uploads} successful image uploads required, but only "
-                                f"{image_list_count} were uploaded."
-                            )
+                            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/image_data.json", 'w', encoding='utf-8') as img_file:
+                                await img_file.write(json.dumps(image_data, indent=4))
 
-                        # Now that image_list exists, populate tracker-specific keys (and only reupload if required)
-                        for tracker_name in relevant_trackers:
-                            tracker_instance = tracker_class_map[tracker_name](config=config)
                             if meta.get('debug'):
-                                key = f"{tracker_name}_images_key"
-                                console.print(
-                                    f"[cyan]Image host debug: post-upload before {tracker_name}.check_image_hosts() image_list={len(meta.get('image_list', []) or [])} {key}={len(meta.get(key, []) or [])}[/cyan]"  # noqa: E501
-                                )
-                            await tracker_instance.check_image_hosts(meta)
-                            if meta.get('debug'):
-                                key = f"{tracker_name}_images_key"
-                                console.print(
-                                    f"[cyan]Image host debug: post-upload after  {tracker_name}.check_image_hosts() image_list={len(meta.get('image_list', []) or [])} {key}={len(meta.get(key, []) or [])}[/cyan]"  # noqa: E501
-                                )
-                    except asyncio.CancelledError:
-                        console.print("\n[red]Upload process interrupted! Cancelling tasks...[/red]")
-                        return
-                    except Exception as e:
-                        raise e
-                    finally:
-                        cleanup_manager.reset_terminal()
-                        if meta['debug']:
-                            console.print("[yellow]Cleaning up resources...[/yellow]")
-                        gc.collect()
-
-                elif meta.get('skip_imghost_upload', False) is True and meta.get('image_list', False) is False:
-                    meta['image_list'] = []
+                                console.print(f"[cyan]Saved {len(image_list)} images to image_data.json")
+                        except Exception as e:
+                            console.print(f"[yellow]Failed to save image data: {str(e)}")
+            finally:
+                progress_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await progress_task
+            return True
+
+        async def torrent_stage() -> bool:
+            torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
+            if meta.get('force_recheck', False):
+                waiter = Wait(config)
+                await waiter.select_and_recheck_best_torrent(meta, meta['path'], check_interval=5)
+            if not os.path.exists(torrent_path):
+                reuse_torrent = None
+                if meta.get('rehash', False) is False and not meta['base_torrent_created'] and not meta['we_checked_them_all']:
+                    reuse_torrent = await client.find_existing_torrent(meta)
+                    if reuse_torrent is not None:
+                        await TorrentCreator.create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
+
+                if meta['nohash'] is False and reuse_torrent is None:
+                    await TorrentCreator.create_torrent(meta, Path(meta['path']), "BASE")
+                if meta['nohash']:
+                    meta['client'] = "none"
+
+            elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
+                await TorrentCreator.create_torrent(meta, Path(meta['path']), "BASE")
 
-                async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w', encoding='utf-8') as f:
-                    await f.write(json.dumps(meta, indent=4))
+            if os.path.exists(torrent_path):
+                raw_trackers = meta.get('trackers')
+                if isinstance(raw_trackers, str):
+                    trackers_list = [raw_trackers]
+                elif isinstance(raw_trackers, list):
+                    trackers_list = [str(t) for t in cast(list[Any], raw_trackers) if str(t).strip()]
+                else:
+                    trackers_list = []
+                trackers_upper = [str(t).strip().upper() for t in trackers_list if str(t).strip()]
 
-                if 'image_list' in meta and meta['image_list']:
+                base_piece_mb: Optional[int] = cast(Optional[int], meta.get('base_torrent_piece_mb'))
+                if base_piece_mb is None and any(t in {"HDB", "MTV", "PTP"} for t in trackers_upper):
                     try:
-                        image_list = cast(list[Any], meta.get('image_list') or [])
-                        image_data = {
-                            "image_list": image_list,
-                            "image_sizes": meta.get('image_sizes', {}),
-                            "tonemapped": meta.get('tonemapped', False)
-                        }
-
-                        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/image_data.json", 'w', encoding='utf-8') as img_file:
-                            await img_file.write(json.dumps(image_data, indent=4))
-
-                        if meta.get('debug'):
-                            console.print(f"[cyan]Saved {len(image_list)} images to image_data.json")
+                        torrent = await asyncio.to_thread(Torrent.read, torrent_path)
+                        base_piece_mb = int(torrent.piece_size // (1024 * 1024))
+                        meta['base_torrent_piece_mb'] = base_piece_mb
                     except Exception as e:
-                        console.print(f"[yellow]Failed to save image data: {str(e)}")
-        finally:
-            progress_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await progress_task
-
-        torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
-        if meta.get('force_recheck', False):
-            waiter = Wait(config)
-            await waiter.select_and_recheck_best_torrent(meta, meta['path'], check_interval=5)
-        if not os.path.exists(torrent_path):
-            reuse_torrent = None
-            if meta.get('rehash', False) is False and not meta['base_torrent_created'] and not meta['we_checked_them_all']:
-                reuse_torrent = await client.find_existing_torrent(meta)
-                if reuse_torrent is not None:
-                    await TorrentCreator.create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
-
-            if meta['nohash'] is False and reuse_torrent is None:
-                await TorrentCreator.create_torrent(meta, Path(meta['path']), "BASE")
-            if meta['nohash']:
-                meta['client'] = "none"
-
-        elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
-            await TorrentCreator.create_torrent(meta, Path(meta['path']), "BASE")
-
-        if os.path.exists(torrent_path):
-            raw_trackers = meta.get('trackers')
-            if isinstance(raw_trackers, str):
-                trackers_list = [raw_trackers]
-            elif isinstance(raw_trackers, list):
-                trackers_list = [str(t) for t in cast(list[Any], raw_trackers) if str(t).strip()]
-            else:
-                trackers_list = []
-            trackers_upper = [str(t).strip().upper() for t in trackers_list if str(t).strip()]
-
-            base_piece_mb: Optional[int] = cast(Optional[int], meta.get('base_torrent_piece_mb'))
-            if base_piece_mb is None and any(t in {"HDB", "MTV", "PTP"} for t in trackers_upper):
-                try:
-                    torrent = await asyncio.to_thread(Torrent.read, torrent_path)
-                    base_piece_mb = int(torrent.piece_size // (1024 * 1024))
-                    meta['base_torrent_piece_mb'] = base_piece_mb
-                except Exception as e:
-                    if meta.get('debug', False):
-                        console.print(f"[yellow]Unable to cache BASE.torrent piece size: {e}")
-                    base_piece_mb = None
-
-            if "MTV" in trackers_upper:
-                mtv_cfg = config.get('TRACKERS', {}).get('MTV', {})
-                if str(mtv_cfg.get('skip_if_rehash', 'false')).lower() == 'true' and base_piece_mb and base_piece_mb > 8:
-                    meta['trackers'] = [t for t in trackers_list if str(t).strip().upper() != "MTV"]
-                    trackers_list = [str(t) for t in cast(list[Any], meta.get('trackers') or []) if str(t).strip()]
-                    trackers_upper = [str(t).strip().upper() for t in trackers_list if str(t).strip()]
-                    if meta.get('debug', False):
-                        console.print("[yellow]Removed MTV from trackers due to skip_if_rehash config and 8 MiB limit.[/yellow]")
-                    if not meta['trackers']:
-                        console.print("[red]No trackers remain after removing MTV for skip_if_rehash.[/red]")
-                        meta['we_are_uploading'] = False
-                        return
+                        if meta.get('debug', False):
+                            console.print(f"[yellow]Unable to cache BASE.torrent piece size: {e}")
+                        base_piece_mb = None
+
+                if "MTV" in trackers_upper:
+                    mtv_cfg = config.get('TRACKERS', {}).get('MTV', {})
+                    if str(mtv_cfg.get('skip_if_rehash', 'false')).lower() == 'true' and base_piece_mb and base_piece_mb > 8:
+                        meta['trackers'] = [t for t in trackers_list if str(t).strip().upper() != "MTV"]
+                        trackers_list = [str(t) for t in cast(list[Any], meta.get('trackers') or []) if str(t).strip()]
+                        trackers_upper = [str(t).strip().upper() for t in trackers_list if str(t).strip()]
+                        if meta.get('debug', False):
+                            console.print("[yellow]Removed MTV from trackers due to skip_if_rehash config and 8 MiB limit.[/yellow]")
+                        if not meta['trackers']:
+                            console.print("[red]No trackers remain after removing MTV for skip_if_rehash.[/red]")
+                            meta['we_are_uploading'] = False
+                            return False
+
+            if int(meta.get('randomized', 0)) >= 1 and not meta['mkbrr']:
+                TorrentCreator.create_random_torrents(meta['base_dir'], meta['uuid'], meta['randomized'], meta['path'])
+            return True
+
+        # Screenshot capture/upload and torrent hashing don't depend on each other, run them side by side.
+        # The torrent stage prints once screenshots are done, and cancels them if no tracker is left.
+        pipeline.add('screenshots', resource_budgets.limit('cpu', screenshots_stage))
+        pipeline.add('torrent', resource_budgets.limit('disk', torrent_stage), required=True, buffered=True)
+        async with cleanup_manager.deferred():
+            results = await pipeline.run()
+        if not all(results.values()):
+            if meta['debug']:
+                pipeline.print_report()
+            return
 
-        if int(meta.get('randomized', 0)) >= 1 and not meta['mkbrr']:
-            TorrentCreator.create_random_torrents(meta['base_dir'], meta['uuid'], meta['randomized'], meta['path'])
+        async with pipeline.timed('description'):
+            meta = await gen_desc(meta, takescreens_manager, uploadscreens_manager)
 
-        meta = await gen_desc(meta, takescreens_manager, uploadscreens_manager)
+        await meta_store.save(meta)
 
-        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(meta, indent=4))
+        if meta['debug']:
+            pipeline.print_report()
 
 
 async def cleanup_screenshot_temp_files(meta: Meta) -> None:
@@ -1345,8 +1384,6 @@ async def do_the_thing(base_dir: str) -> None:
             if os.name != 'nt':
                 os.chmod(subdir_path, 0o700)
 
-    bot: Any = None
-    connect_task: Optional[asyncio.Task[None]] = None
     meta: Meta = {}
     paths: list[str] = []
     for each in sys.argv[1:]:
@@ -1364,7 +1401,7 @@ async def do_the_thing(base_dir: str) -> None:
     meta['ua_signature'] = signature
     meta['base_dir'] = base_dir
 
-    cleanup_only = any(arg in ('--cleanup', '-cleanup') for arg in sys.argv) and len(sys.argv) <= 2
+    cleanup_only = any(arg in ('--cleanup', '-cleanup', '--purge-metadata-cache', '-pmc', '--purge-media-cache', '-pmr') for arg in sys.argv) and len(sys.argv) <= 2
     sanitize_meta = config['DEFAULT'].get('sanitize_meta', True)
 
     try:
@@ -1493,6 +1530,30 @@ async def do_the_thing(base_dir: str) -> None:
             if not meta.get('path') or cleanup_only:
                 exit(0)
 
+        metadata_cache.configure(config, base_dir, enabled=not meta.get('no_metadata_cache', False))
+        media_report_cache.configure(config, base_dir)
+        layout_index.configure(config, base_dir)
+        resource_budgets.configure(config)
+        upload_scheduler.configure(config)
+        http_pool.configure(config)
+        bluray_fetcher.configure(config)
+        dupe_search.configure(config)
+        name_index.configure(config, base_dir)
+        png_optimizer.configure(config, base_dir)
+        qbit_mirrors.configure(config, base_dir)
+        if meta.get('purge_metadata_cache'):
+            removed = metadata_cache.purge()
+            console.print(f"[yellow]Removed {removed} entries from the metadata cache[/yellow]")
+            console.print()
+            if not meta.get('path') or cleanup_only:
+                exit(0)
+        if meta.get('purge_media_cache'):
+            removed = media_report_cache.purge()
+            console.print(f"[yellow]Removed {removed} reports from the MediaInfo/BDInfo cache[/yellow]")
+            console.print()
+            if not meta.get('path') or cleanup_only:
+                exit(0)
+
         if not meta.get('path'):
             exit(0)
 
@@ -1522,14 +1583,25 @@ async def do_the_thing(base_dir: str) -> None:
         skipped_files_count = 0
         base_meta = dict(meta.items())
 
-        for queue_item in queue_list:
+        queue_state: Optional[QueueState] = None
+        if meta.get('queue') and log_file:
+            queue_state = await QueueState.load(log_file)
+
+        async def process_queue_item(queue_item: Any, discord_clients: list[tuple[Any, Optional[asyncio.Task[None]]]]) -> bool:
+            """Process one queue item; returns False once the queue should stop.
+
+            A Discord client started for the item is added to discord_clients, for the caller to close.
+            """
+            nonlocal processed_files_count, skipped_files_count
+            path = ""
             total_files = len(queue_list)
-            bot = None
+            bot: Any = None
             current_item_path = ""
             tmp_path = ""
+            resumed = False
+            # Concurrent items must not share nested values such as tracker lists
+            meta = copy.deepcopy(base_meta)
             try:
-                meta = base_meta.copy()
-
                 if meta.get('site_upload_queue'):
                     # Extract path and metadata from site upload queue item
                     queue_item_mapping = cast(Mapping[str, Any], queue_item)
@@ -1546,12 +1618,21 @@ async def do_the_thing(base_dir: str) -> None:
                 if not path:
                     raise ValueError("The 'path' variable is not defined or is empty.")
 
+                if queue_state is not None:
+                    # An item a previous run started but never finished keeps its tmp data and skips trackers it already reached
+                    resumed = queue_state.interrupted(current_item_path)
+                    already_uploaded = queue_state.uploaded_trackers(current_item_path)
+                    if already_uploaded:
+                        console.print(f"[yellow]Resuming {os.path.basename(path)}, already uploaded to: {', '.join(already_uploaded)}[/yellow]")
+                        meta['trackers_remove'] = ','.join(t for t in [str(meta.get('trackers_remove') or ''), *already_uploaded] if t)
+                    await queue_state.mark(current_item_path, 'running')
+
                 tmp_path = os.path.join(base_dir, "tmp", os.path.basename(path))
 
                 # Ensure tmp subdirectory exists with secure permissions
                 ensure_secure_tmp_subdir(tmp_path)
 
-                if meta.get('delete_tmp', False) and os.path.exists(tmp_path):
+                if meta.get('delete_tmp', False) and not resumed and os.path.exists(tmp_path):
                     try:
                         shutil.rmtree(tmp_path)
                         if os.name != 'nt':
@@ -1564,26 +1645,24 @@ async def do_the_thing(base_dir: str) -> None:
                     except Exception as e:
                         console.print(f"[bold red]Failed to delete temp directory: {str(e)}")
 
-                meta_file = os.path.join(base_dir, "tmp", os.path.basename(path), "meta.json")
+                meta_dir = os.path.join(base_dir, "tmp", os.path.basename(path))
+                meta_file = os.path.join(meta_dir, "meta.json")
 
-                keep_meta = config['DEFAULT'].get('keep_meta', False)
+                keep_meta = config['DEFAULT'].get('keep_meta', False) or resumed
 
                 if not keep_meta or meta.get('delete_meta', False):
-                    if os.path.exists(meta_file):
-                        try:
-                            os.remove(meta_file)
+                    try:
+                        if await asyncio.to_thread(meta_store.delete, meta_dir):
                             if meta['debug']:
                                 console.print(f"[bold yellow]Found and deleted existing metadata file: {meta_file}")
-                        except Exception as e:
-                            console.print(f"[bold red]Failed to delete metadata file {meta_file}: {str(e)}")
-                    else:
-                        if meta['debug']:
+                        elif meta['debug']:
                             console.print(f"[yellow]No metadata file found at {meta_file}")
+                    except Exception as e:
+                        console.print(f"[bold red]Failed to delete metadata file {meta_file}: {str(e)}")
 
-                if keep_meta and os.path.exists(meta_file):
-                    async with aiofiles.open(meta_file, encoding='utf-8') as f:
-                        content = await f.read()
-                        saved_meta = cast(dict[str, Any], json.loads(content)) if content.strip() else {}
+                if keep_meta:
+                    saved_meta = await asyncio.to_thread(meta_store.load, meta_dir)
+                    if saved_meta is not None:
                         console.print("[yellow]Existing metadata file found, it holds cached values")
                         await merge_meta(meta, saved_meta)
 
@@ -1602,23 +1681,28 @@ async def do_the_thing(base_dir: str) -> None:
                 and not meta['debug']
                 and ((only_unattended and meta.get('unattended', False)) or not only_unattended)
             ):
+                # discord.py is slow to import, so it is only loaded when the bot is used
+                import discord
+
                 try:
                     console.print("[cyan]Starting Discord bot initialization...")
                     intents = discord.Intents.default()
                     intents.message_content = True
-                    bot = discord.Client(intents=intents)
+                    client = discord.Client(intents=intents)
+                    discord_clients.append((client, None))
                     token = discord_bot_token
-                    await asyncio.wait_for(bot.login(token), timeout=10)
-                    connect_task = asyncio.create_task(bot.connect())
+                    await asyncio.wait_for(client.login(token), timeout=10)
+                    connect_task = asyncio.create_task(client.connect())
+                    discord_clients[-1] = (client, connect_task)
 
                     try:
-                        await asyncio.wait_for(bot.wait_until_ready(), timeout=20)
+                        await asyncio.wait_for(client.wait_until_ready(), timeout=20)
+                        bot = client
                         console.print("[green]Discord Bot is ready!")
                     except asyncio.TimeoutError:
                         console.print("[bold red]Bot failed to connect within timeout period.")
                         console.print("[yellow]Continuing without Discord integration...")
-                        if 'connect_task' in locals():
-                            connect_task.cancel()
+                        connect_task.cancel()
                 except discord.LoginFailure:
                     console.print("[bold red]Discord bot token is invalid. Please check your configuration.")
                 except discord.ClientException as e:
@@ -1718,17 +1802,22 @@ async def do_the_thing(base_dir: str) -> None:
                 if successful_trackers < skip_uploading_int and not meta['debug']:
                     console.print(f"[red]Not enough successful trackers ({successful_trackers}/{skip_uploading_int}). No uploads being processed.[/red]")
                 else:
-                    await process_trackers(
-                        meta,
-                        config,
-                        client,
-                        console,
-                        list(api_trackers),
-                        tracker_class_map,
-                        list(http_trackers),
-                        list(other_api_trackers),
-                    )
+                    async with resource_budgets.slot('network'):
+                        await process_trackers(
+                            meta,
+                            config,
+                            client,
+                            console,
+                            list(api_trackers),
+                            tracker_class_map,
+                            list(http_trackers),
+                            list(other_api_trackers),
+                        )
+                    if queue_state is not None and not meta['debug']:
+                        await queue_state.mark(current_item_path, 'running', uploaded=uploaded_trackers(meta))
                     if use_discord and bot:
+                        from discordbot import DiscordNotifier
+
                         await DiscordNotifier.send_upload_status_notification(config, bot, meta)
 
                     if config['DEFAULT'].get('cross_seeding', True):
@@ -1749,6 +1838,14 @@ async def do_the_thing(base_dir: str) -> None:
             if meta['debug']:
                 finish_time = time.time()
                 console.print(f"Uploads processed in {finish_time - start_time:.4f} seconds")
+                if metadata_cache.enabled:
+                    console.print(f"[cyan]Metadata cache: {metadata_cache.summary()}[/cyan]")
+                if media_report_cache.enabled:
+                    console.print(f"[cyan]MediaInfo/BDInfo cache: {media_report_cache.summary()}[/cyan]")
+                console.print(f"[cyan]Guessit cache: {guessit_cache.summary()}[/cyan]")
+                if bluray_fetcher.requests:
+                    console.print(f"[cyan]Blu-ray.com: {bluray_fetcher.summary()}[/cyan]")
+                console.print(f"[cyan]HTTP connection reuse: {http_pool.summary()}[/cyan]")
 
             def build_tracker_status_line(tracker: str, status: Any) -> str:
                 try:
@@ -1780,6 +1877,8 @@ async def do_the_thing(base_dir: str) -> None:
                     return f"Error printing {tracker} data: {exc}\n"
 
             if use_discord and bot:
+                from discordbot import DiscordNotifier
+
                 send_upload_links = bool(discord_config.get('send_upload_links', False)) if discord_config is not None else False
                 if send_upload_links:
                     try:
@@ -1842,7 +1941,7 @@ async def do_the_thing(base_dir: str) -> None:
                 await cleanup_manager.cleanup()
                 gc.collect()
                 cleanup_manager.reset_terminal()
-                break
+                return False
 
             if sanitize_meta and not meta.get('emby', False):
                 try:
@@ -1853,6 +1952,42 @@ async def do_the_thing(base_dir: str) -> None:
             await cleanup_manager.cleanup()
             gc.collect()
             cleanup_manager.reset_terminal()
+            if queue_state is not None:
+                await queue_state.mark(current_item_path, 'done')
+            return True
+
+        async def run_queue_item(queue_item: Any) -> bool:
+            discord_clients: list[tuple[Any, Optional[asyncio.Task[None]]]] = []
+            try:
+                return await process_queue_item(queue_item, discord_clients)
+            except BaseException:
+                if queue_state is not None:
+                    item_path = queue_item if isinstance(queue_item, str) else str(cast(Mapping[str, Any], queue_item).get('path', ''))
+                    if queue_state.get(item_path).get('status') == 'running':
+                        await asyncio.shield(queue_state.mark(item_path, 'failed'))
+                raise
+            finally:
+                # Each item talks to Discord through its own client, so workers can't cross notifications
+                for client, connect_task in discord_clients:
+                    await close_discord_client(client, connect_task)
+                # Linked or copied files should show up in searches right away
+                await asyncio.to_thread(name_index.invalidate)
+
+        queue_workers = int(meta.get('queue_workers') or config['DEFAULT'].get('queue_workers', 1) or 1)
+        if queue_workers > 1 and not meta.get('unattended', False):
+            console.print("[yellow]Concurrent queue processing needs --unattended, processing one item at a time.[/yellow]")
+            queue_workers = 1
+        queue_workers = max(1, min(queue_workers, len(queue_list)))
+
+        if queue_workers == 1:
+            for queue_item in queue_list:
+                if not await run_queue_item(queue_item):
+                    break
+        else:
+            console.print(f"[cyan]Processing the queue with {queue_workers} concurrent workers[/cyan]")
+            # Per-item cleanups would cancel the other items' tasks and kill their child processes
+            async with cleanup_manager.deferred():
+                await run_concurrent_queue(queue_list, queue_workers, run_queue_item)
 
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred: {e}")
@@ -1862,16 +1997,47 @@ async def do_the_thing(base_dir: str) -> None:
         cleanup_manager.reset_terminal()
 
     finally:
-        if bot is not None:
-            await bot.close()
-        if connect_task is not None:
-            connect_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await connect_task
         if not sys.stdin.closed:
             cleanup_manager.reset_terminal()
 
 
+async def close_discord_client(client: Any, connect_task: Optional[asyncio.Task[None]]) -> None:
+    try:
+        await client.close()
+    except Exception as e:
+        console.print(f"[yellow]Error closing Discord client: {e}")
+    if connect_task is not None:
+        connect_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await connect_task
+
+
+async def run_concurrent_queue(queue_list: list[Any], workers: int, run_item: Callable[[Any], Awaitable[bool]]) -> None:
+    """Feed queue items to a fixed number of workers until the queue is empty or an item asks to stop."""
+    pending: asyncio.Queue[Any] = asyncio.Queue()
+    for queue_item in queue_list:
+        pending.put_nowait(queue_item)
+    stop = asyncio.Event()
+
+    async def worker() -> None:
+        while not stop.is_set():
+            try:
+                queue_item = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            if not await run_item(queue_item):
+                stop.set()
+
+    tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 async def process_cross_seeds(meta: Meta) -> None:
     all_trackers: set[str] = set(api_trackers) | set(http_trackers) | set(other_api_trackers)
 
@@ -1949,7 +2115,7 @@ async def process_cross_seeds(meta: Meta) -> None:
                 if tracker != "PTP":
                     dupes = await tracker_class.search_existing(meta, disctype)
                 else:
-                    ptp = PTP(config=config)
+                    ptp = tracker_class_map['PTP'](config=config)
                     group_id = meta.get('ptp_groupID')
                     if not group_id:
                         group_id = await ptp.get_group_by_imdb(meta['imdb'])
@@ -2023,7 +2189,7 @@ async def process_cross_seeds(meta: Meta) -> None:
 
         if tracker == "AR" and download_url:
             try:
-                ar = AR(config=config)
+                ar = tracker_class_map['AR'](config=config)
                 auth_key = await ar.get_auth_key(meta)
 
                 # Extract torrent_pass from announce_url
@@ -2097,6 +2263,9 @@ async def main() -> None:
     except Exception as e:
         if not _shutdown_requested:
             console.print(f"[bold red]Unexpected error: {e}[/bold red]")
+    finally:
+        metadata_cache.close()
+        await http_pool.aclose()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,170 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Streaming of a child process's output to a Web UI session.
+
+Each pipe is read by its own thread in chunks straight from the file
+descriptor, decoded incrementally, and queued. ``frames()`` coalesces what
+arrives into frames: complete lines are sent at most every ``FRAME_INTERVAL``
+seconds, or as soon as ``FRAME_MAX_CHARS`` are waiting, and a trailing partial
+line (a prompt, or a progress line rewritten with carriage returns) is held
+for up to ``PARTIAL_LINE_DELAY`` seconds in case the rest follows. When nothing
+has been sent for ``KEEPALIVE_INTERVAL`` seconds a keepalive (``None``) is
+yielded.
+
+``\r\n`` becomes ``\n``, but a lone ``\r`` is kept for the HTML renderer, which
+collapses the rewritten line.
+"""
+import codecs
+import os
+import queue
+import re
+import subprocess
+import threading
+import time
+from collections.abc import Iterator
+from typing import IO, Any, Optional
+
+READ_SIZE = 64 * 1024
+FRAME_INTERVAL = 0.1
+FRAME_MAX_CHARS = 32 * 1024
+PARTIAL_LINE_DELAY = 0.5
+# Idle sessions get a keepalive this often, well below the idle timeouts of common reverse proxies
+KEEPALIVE_INTERVAL = 15.0
+# Seconds to wait for the pipes to close once the process has exited; a
+# detached grandchild may keep them open indefinitely
+EXIT_DRAIN_TIMEOUT = 2.0
+# Upper bound on a single wait, so process exit is noticed promptly
+POLL_INTERVAL = 0.5
+
+# An escape sequence cut off at the end of a chunk
+_PARTIAL_ESCAPE_RE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*)?$")
+
+
+class _Pending:
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+        self.size = 0
+        self.since = 0.0  # when the oldest unsent output arrived
+        self.held_since: Optional[float] = None  # when a partial line was first held back
+
+    def add(self, text: str, now: float) -> None:
+        if not self.parts:
+            self.since = now
+        self.parts.append(text)
+        self.size += len(text)
+
+    def take(self, now: float, final: bool) -> str:
+        """Remove and return the output that is ready to send."""
+        text = "".join(self.parts)
+        self.parts = []
+        self.size = 0
+        if final:
+            return text
+        end = text.rfind("\n") + 1
+        if end < len(text):
+            if self.held_since is None or end > 0:
+                # A new partial line
+                self.held_since = now
+            if now - self.held_since >= PARTIAL_LINE_DELAY or len(text) >= FRAME_MAX_CHARS:
+                end = len(text)
+                match = _PARTIAL_ESCAPE_RE.search(text)
+                if match:
+                    end = match.start()
+        if end == len(text):
+            self.held_since = None
+        else:
+            self.parts = [text[end:]]
+            self.size = len(text) - end
+            self.since = now
+        return text[:end]
+
+
+class OutputPump:
+    def __init__(self, streams: dict[str, Optional[IO[Any]]], process: Optional["subprocess.Popen[Any]"] = None) -> None:
+        self._streams = {origin: stream for origin, stream in streams.items() if stream is not None}
+        self._process = process
+        self._queue: queue.Queue[tuple[str, Optional[str]]] = queue.Queue()
+        self.threads: dict[str, threading.Thread] = {}
+
+    def start(self) -> None:
+        for origin, stream in self._streams.items():
+            thread = threading.Thread(target=self._read, args=(origin, stream.fileno()), daemon=True, name=f"output-{origin}")
+            self.threads[origin] = thread
+            thread.start()
+
+    def _read(self, origin: str, fd: int) -> None:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        carry = ""
+        try:
+            while True:
+                try:
+                    data = os.read(fd, READ_SIZE)
+                except OSError:
+                    # The pipe was closed under us, e.g. when the session was stopped
+                    break
+                text = carry + decoder.decode(data, final=not data)
+                carry = ""
+                # Hold back a trailing \r, in case the \n of a \r\n follows in the next read
+                if data and text.endswith("\r"):
+                    carry = "\r"
+                    text = text[:-1]
+                text = text.replace("\r\n", "\n")
+                if text:
+                    self._queue.put((origin, text))
+                if not data:
+                    break
+        finally:
+            self._queue.put((origin, None))
+
+    def frames(self) -> Iterator[Optional[tuple[str, str]]]:
+        """Yield (origin, text) frames until every pipe has closed, and None as keepalives."""
+        pending: dict[str, _Pending] = {origin: _Pending() for origin in self._streams}
+        open_streams = len(self.threads)
+        last_sent = time.monotonic()
+        exited_at: Optional[float] = None
+        while open_streams:
+            now = time.monotonic()
+            if exited_at is None and self._process is not None and self._process.poll() is not None:
+                exited_at = now
+            if exited_at is not None and now - exited_at >= EXIT_DRAIN_TIMEOUT:
+                break
+
+            waiting = [state for state in pending.values() if state.parts]
+            deadline = min(state.since + FRAME_INTERVAL for state in waiting) if waiting else last_sent + KEEPALIVE_INTERVAL
+            try:
+                item = self._queue.get(timeout=min(max(0.0, deadline - now), POLL_INTERVAL))
+                while True:
+                    origin, text = item
+                    if text is None:
+                        open_streams -= 1
+                    else:
+                        pending[origin].add(text, time.monotonic())
+                        if pending[origin].size >= FRAME_MAX_CHARS:
+                            break
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            for origin, state in pending.items():
+                if state.parts and (now - state.since >= FRAME_INTERVAL or state.size >= FRAME_MAX_CHARS):
+                    text = state.take(now, final=False)
+                    if text:
+                        last_sent = now
+                        yield origin, text
+            if now - last_sent >= KEEPALIVE_INTERVAL:
+                last_sent = now
+                yield None
+
+        # Anything still queued arrived before the pipes closed
+        while True:
+            try:
+                origin, text = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if text is not None:
+                pending[origin].add(text, time.monotonic())
+        for origin, state in pending.items():
+            text = state.take(time.monotonic(), final=True)
+            if text:
+                yield origin, text
@@ -34,13 +34,9 @@ from flask_session import Session
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Helper to convert ANSI -> HTML using Rich (optional)
-try:
-    from src.console import ansi_to_html
-except Exception:
-    ansi_to_html = None
-
-from src.console import console
+from src.console import AnsiHtmlStream, console
+from src.name_index import name_index
+from web_ui.output_stream import OutputPump
 
 cfg_dir = auth_mod.get_config_dir()
 cfg_dir.mkdir(parents=True, exist_ok=True)
@@ -2864,76 +2860,25 @@ def browse_search():
     if not query_tokens:
         return jsonify({"success": True, "items": [], "query": query})
 
-    def name_matches(name: str) -> bool:
-        """Check if query tokens appear as whole-word ordered subsequence in the name."""
-        name_tokens = [t for t in _BROWSE_SEARCH_SEP_RE.split(name.lower()) if t]
-        pos = 0
-        for qt in query_tokens:
-            found = False
-            while pos < len(name_tokens):
-                if name_tokens[pos] == qt:
-                    pos += 1
-                    found = True
-                    break
-                pos += 1
-            if not found:
-                return False
-        return True
-
     allowed_exts = SUPPORTED_DESC_EXTS if file_filter == "desc" else SUPPORTED_VIDEO_EXTS
     items: list[BrowseItem] = []
 
     try:
-        for root in roots:
-            root_abs = os.path.abspath(root)
-            if not os.path.isdir(root_abs):
-                continue
+        # Query tokens must appear as whole words, in order; hidden entries are skipped
+        hits = name_index.search(roots, query_tokens, exact_tokens=True, include_hidden=False)
+        for hit in hits:
+            if not hit.is_dir:
+                _, ext = os.path.splitext(hit.name.lower())
+                if ext not in allowed_exts:
+                    continue
             try:
-                for dirpath, dirnames, filenames in os.walk(root_abs):
-                    # Skip hidden dirs
-                    dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-
-                    # Check dirs
-                    for dirname in dirnames:
-                        if name_matches(dirname):
-                            full_path = os.path.join(dirpath, dirname)
-                            try:
-                                _assert_safe_resolved_path(full_path)
-                            except ValueError:
-                                continue
-                            items.append({"name": dirname, "path": full_path, "type": "folder", "children": []})
-                            if len(items) >= max_results:
-                                break
-
-                    if len(items) >= max_results:
-                        break
-
-                    # Check files
-                    for filename in filenames:
-                        if filename.startswith("."):
-                            continue
-                        if not name_matches(filename):
-                            continue
-                        _, ext = os.path.splitext(filename.lower())
-                        if ext not in allowed_exts:
-                            continue
-                        full_path = os.path.join(dirpath, filename)
-                        try:
-                            _assert_safe_resolved_path(full_path)
-                        except ValueError:
-                            continue
-                        items.append({"name": filename, "path": full_path, "type": "file", "children": None})
-                        if len(items) >= max_results:
-                            break
-
-                    if len(items) >= max_results:
-                        break
-            except PermissionError:
+                _assert_safe_resolved_path(hit.path)
+            except ValueError:
                 continue
-            except Exception as e:
-                console.print(f"Error searching in {root}: {e}", markup=False)
-                continue
-
+            if hit.is_dir:
+                items.append({"name": hit.name, "path": hit.path, "type": "folder", "children": []})
+            else:
+                items.append({"name": hit.name, "path": hit.path, "type": "file", "children": None})
             if len(items) >= max_results:
                 break
 
@@ -3530,116 +3475,40 @@ def execute_command():
 
                     # Wrap subprocess handling in try/finally to guarantee cleanup
                     try:
-                        # Thread to read stdout - stream raw output with ANSI codes
-                        def read_stdout():
-                            try:
-                                if process.stdout is None:
-                                    return
-                                while True:
-                                    # Read in small chunks for real-time streaming
-                                    chunk = process.stdout.read(1)
-                                    if not chunk:
-                                        break
-                                    output_queue.put(("stdout", chunk))
-                            except Exception as e:
-                                console.print(f"stdout read error: {e}", markup=False)
-
-                        # Thread to read stderr - stream raw output
-                        def read_stderr():
-                            try:
-                                if process.stderr is None:
-                                    return
-                                while True:
-                                    chunk = process.stderr.read(1)
-                                    if not chunk:
-                                        break
-                                    output_queue.put(("stderr", chunk))
-                            except Exception as e:
-                                console.print(f"stderr read error: {e}", markup=False)
-
-                        output_queue: queue.Queue[tuple[str, str]] = queue.Queue()
+                        # Pipes are read in chunks by background threads and the
+                        # output is coalesced into frames of complete lines
+                        pump = OutputPump({"stdout": process.stdout, "stderr": process.stderr}, process)
+                        pump.start()
 
-                        # Start threads (no input thread needed - we write directly)
-                        stdout_thread = threading.Thread(target=read_stdout, daemon=True)
-                        stderr_thread = threading.Thread(target=read_stderr, daemon=True)
-
-                        stdout_thread.start()
-                        stderr_thread.start()
-
-                        # Record threads and output queue for debugging/cleanup
+                        # Record threads and output pump for debugging/cleanup
                         try:
                             if session_id in active_processes:
                                 info = cast(Any, active_processes[session_id])
-                                info["stdout_thread"] = stdout_thread
-                                info["stderr_thread"] = stderr_thread
-                                info["output_queue"] = output_queue
+                                info["stdout_thread"] = pump.threads.get("stdout")
+                                info["stderr_thread"] = pump.threads.get("stderr")
+                                info["output_pump"] = pump
                         except Exception:
                             pass
 
-                        console.print(f"Started subprocess reader threads for session {session_id}: stdout={stdout_thread.name}, stderr={stderr_thread.name}", markup=False)
-
-                        def _read_output(q: queue.Queue[tuple[str, str]]) -> tuple[bool, Union[tuple[str, str], None]]:
-                            try:
-                                return True, q.get(timeout=0.1)
-                            except queue.Empty:
-                                return False, None
-
-                        # Stream output as buffered chunks and always emit HTML fragments
-                        # If we are running the upload as a subprocess, stream ANSI->HTML as before.
-                        buffers: dict[str, str] = {"stdout": "", "stderr": ""}
-
-                        while process.poll() is None or not output_queue.empty():
-                            has_output, output = _read_output(output_queue)
-                            if has_output and output is not None:
-                                output_type, char = output
-                                if output_type not in buffers:
-                                    buffers[output_type] = ""
-                                buffers[output_type] += char
-
-                                # Flush on newline or when buffer grows large
-                                if char == "\n" or len(buffers[output_type]) > 512:
-                                    chunk = buffers[output_type]
-                                    buffers[output_type] = ""
-
-                                    # Convert to HTML fragment. If helper missing, escape and wrap in <pre>
-                                    try:
-                                        if ansi_to_html:
-                                            html_fragment = ansi_to_html(chunk)
-                                        else:
-                                            import html as _html
-
-                                            html_fragment = f"<pre>{_html.escape(chunk)}</pre>"
-
-                                        yield f"data: {json.dumps({'type': 'html', 'data': html_fragment, 'origin': output_type})}\n\n"
-                                    except Exception as e:
-                                        console.print(f"HTML conversion error: {e}", markup=False)
-                                        import html as _html
+                        console.print(f"Started subprocess reader threads for session {session_id}: {', '.join(thread.name for thread in pump.threads.values())}", markup=False)
 
-                                        html_fragment = f"<pre>{_html.escape(chunk)}</pre>"
-                                        yield f"data: {json.dumps({'type': 'html', 'data': html_fragment, 'origin': output_type})}\n\n"
-                            else:
+                        # Stream each frame as HTML fragments, keeping ANSI state per pipe
+                        renderers = {origin: AnsiHtmlStream() for origin in ("stdout", "stderr")}
+                        for frame in pump.frames():
+                            if frame is None:
                                 # keepalive to keep the SSE connection alive
                                 yield f"data: {json.dumps({'type': 'keepalive'})}\n\n"
+                                continue
+                            output_type, chunk = frame
+                            try:
+                                fragments = renderers[output_type].feed(chunk)
+                            except Exception as e:
+                                console.print(f"HTML conversion error: {e}", markup=False)
+                                import html as _html
 
-                        # Flush remaining buffers as HTML
-                        for t, remaining in list(buffers.items()):
-                            if remaining:
-                                try:
-                                    if ansi_to_html:
-                                        html_fragment = ansi_to_html(remaining)
-                                    else:
-                                        import html as _html
-
-                                        html_fragment = f"<pre>{_html.escape(remaining)}</pre>"
-
-                                    yield f"data: {json.dumps({'type': 'html', 'data': html_fragment, 'origin': t})}\n\n"
-
-                                except Exception as e:
-                                    console.print(f"HTML flush error: {e}", markup=False)
-                                    import html as _html
-
-                                    html_fragment = f"<pre>{_html.escape(remaining)}</pre>"
-                                    yield f"data: {json.dumps({'type': 'html', 'data': html_fragment, 'origin': t})}\n\n"
+                                fragments = [(f"<pre>{_html.escape(chunk)}</pre>", False)]
+                            for html_fragment, replace in fragments:
+                                yield f"data: {json.dumps({'type': 'html', 'data': html_fragment, 'origin': output_type, 'replace': replace})}\n\n"
 
                         # Wait for process to finish
                         process.wait()
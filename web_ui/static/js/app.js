@@ -360,6 +360,8 @@ function AudionutsUAGUI() {
   
   const richOutputRef = useRef(null);
   const lastFullHashRef = useRef('');
+  // Last fragment appended per output stream, for lines rewritten in place
+  const lastFragmentRef = useRef({});
   const inputRef = useRef(null);
   const sseAbortControllerRef = useRef(null);
   
@@ -527,13 +529,20 @@ function AudionutsUAGUI() {
     setCustomArgs(prev => updateArgValue(prev, '--desclink', url));
   };
 
-  const appendHtmlFragment = (rawHtml) => {
+  const appendHtmlFragment = (rawHtml, origin = null, replace = false) => {
     const container = richOutputRef.current;
     if (container) {
       const clean = sanitizeHtml((rawHtml || '').trim());
+      // A fragment marked replace rewrites the open line sent last on the same stream
+      const previous = origin ? lastFragmentRef.current[origin] : null;
+      if (replace && previous && previous.parentNode === container) {
+        previous.innerHTML = clean;
+        return;
+      }
       const wrapper = document.createElement('div');
       wrapper.innerHTML = clean;
       container.appendChild(wrapper);
+      if (origin) lastFragmentRef.current[origin] = wrapper;
       // Use scrollIntoView to avoid clipping of the last line
       setTimeout(() => {
         const last = container.lastElementChild;
@@ -1081,7 +1090,7 @@ function AudionutsUAGUI() {
                 return;
               }
               // delegate to shared helper for fragments
-              appendHtmlFragment(clean);
+              appendHtmlFragment(clean, data.origin || null, Boolean(data.replace));
             } catch (e) {
               console.error('Failed to render HTML fragment:', e);
             }